@@ -244,6 +244,33 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Compute WAV sample peak meter readings for stems.",
     )
+    scan_parser.add_argument(
+        "--previous-report",
+        dest="previous_report",
+        default=None,
+        help="Rescan incrementally: reuse unchanged stems from this earlier report.",
+    )
+    scan_parser.add_argument(
+        "--previous-lock",
+        dest="previous_lock",
+        default=None,
+        help="Lockfile taken with --previous-report; stems must also match its sha256/size.",
+    )
+    scan_parser.add_argument(
+        "--preview",
+        action="store_true",
+        help=(
+            "Meter a seeded sample of windows per stem; measurements are approximate."
+            " Implies --meters truth unless --meters is given."
+        ),
+    )
+    scan_parser.add_argument(
+        "--preview-seed",
+        dest="preview_seed",
+        type=int,
+        default=0,
+        help="Seed for the --preview window positions (default: 0).",
+    )
 
     analyze_parser = subparsers.add_parser(
         "analyze", help="Run scan + pipeline + exports for a stems directory."
@@ -4522,6 +4549,10 @@ def main(argv: list[str] | None = None) -> int:
             strict=args.strict,
             dry_run=args.dry_run,
             summary=args.summary,
+            previous_report=Path(args.previous_report) if args.previous_report else None,
+            previous_lock=Path(args.previous_lock) if args.previous_lock else None,
+            preview=args.preview,
+            preview_seed=args.preview_seed,
         )
     if args.command == "stems":
         if args.stems_command == "scan":
@@ -54,6 +54,10 @@ def _run_scan(
     strict: bool = False,
     dry_run: bool = False,
     summary: bool = False,
+    previous_report: "Path | None" = None,
+    previous_lock: "Path | None" = None,
+    preview: bool = False,
+    preview_seed: int = 0,
 ) -> int:
     del tools_dir
     command = [
@@ -74,6 +78,12 @@ def _run_scan(
         command.append("--dry-run")
     if summary:
         command.append("--summary")
+    if previous_report is not None:
+        command.extend(["--previous-report", str(previous_report)])
+    if previous_lock is not None:
+        command.extend(["--previous-lock", str(previous_lock)])
+    if preview:
+        command.extend(["--preview", "--preview-seed", str(preview_seed)])
     return _run_command(command)
 
 
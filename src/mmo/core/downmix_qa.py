@@ -18,7 +18,7 @@ from mmo.resources import ontology_dir
 from mmo.dsp.backends.ffmpeg_decode import iter_ffmpeg_float64_samples
 from mmo.dsp.backends.ffmpeg_discovery import resolve_ffmpeg_cmd
 from mmo.dsp.backends.ffprobe_meta import find_ffprobe
-from mmo.dsp.correlation import OnlineCorrelationAccumulator
+from mmo.dsp.correlation import CorrelationMatrixAccumulator, OnlineCorrelationAccumulator
 from mmo.dsp.decoders import read_metadata
 from mmo.dsp.downmix import (
     load_downmix_registry,
@@ -103,22 +103,6 @@ class _AlignedChunkIterator:
         )
 
 
-def _compute_stereo_correlation_from_interleaved(samples: List[float]) -> float:
-    accumulator = OnlineCorrelationAccumulator()
-    total = len(samples) - (len(samples) % 2)
-    for index in range(0, total, 2):
-        accumulator.update(samples[index], samples[index + 1])
-    return accumulator.correlation()
-
-
-def _update_stereo_correlation_from_interleaved(
-    accumulator: OnlineCorrelationAccumulator, samples: List[float]
-) -> None:
-    total = len(samples) - (len(samples) % 2)
-    for index in range(0, total, 2):
-        accumulator.update(samples[index], samples[index + 1])
-
-
 def _compute_basic_metrics_from_chunks(chunks: Iterable[List[float]]) -> Dict[str, float]:
     peak = 0.0
     total_sq = 0.0
@@ -180,7 +164,9 @@ def _truth_metrics_from_interleaved(samples: List[float], sample_rate_hz: int) -
         method_id=DEFAULT_LOUDNESS_METHOD_ID,
     )
     true_peak = meters_truth.compute_true_peak_dbtp_float64(array, sample_rate_hz)
-    correlation = _compute_stereo_correlation_from_interleaved(clipped)
+    correlation_matrix = CorrelationMatrixAccumulator(2)
+    correlation_matrix.update(array)
+    correlation = correlation_matrix.matrix()[0, 1]
     return {
         "lufs": float(lufs),
         "true_peak": float(true_peak),
@@ -745,7 +731,7 @@ def run_downmix_qa(
                 method_id=DEFAULT_LOUDNESS_METHOD_ID,
             )
             fold_tp = meters_truth.OnlineTruePeak(src_sample_rate, channels=2)
-            fold_corr = OnlineCorrelationAccumulator()
+            fold_corr = CorrelationMatrixAccumulator(2)
             for chunk in folded_chunks:
                 if not chunk:
                     continue
@@ -756,7 +742,7 @@ def run_downmix_qa(
                 array = np.asarray(clipped, dtype=np.float64).reshape(-1, 2)
                 fold_lufs.update(array)
                 fold_tp.update(array)
-                _update_stereo_correlation_from_interleaved(fold_corr, clipped)
+                fold_corr.update(array)
 
             ref_lufs = meters_truth.OnlineLufsIntegrated(
                 src_sample_rate,
@@ -766,7 +752,7 @@ def run_downmix_qa(
                 method_id=DEFAULT_LOUDNESS_METHOD_ID,
             )
             ref_tp = meters_truth.OnlineTruePeak(src_sample_rate, channels=2)
-            ref_corr = OnlineCorrelationAccumulator()
+            ref_corr = CorrelationMatrixAccumulator(2)
             for chunk in ref_aligned:
                 if not chunk:
                     continue
@@ -777,17 +763,17 @@ def run_downmix_qa(
                 array = np.asarray(clipped, dtype=np.float64).reshape(-1, 2)
                 ref_lufs.update(array)
                 ref_tp.update(array)
-                _update_stereo_correlation_from_interleaved(ref_corr, clipped)
+                ref_corr.update(array)
 
             fold_metrics = {
                 "lufs": float(fold_lufs.finalize()),
                 "true_peak": float(fold_tp.finalize()),
-                "correlation": float(fold_corr.correlation()),
+                "correlation": float(fold_corr.matrix()[0, 1]),
             }
             ref_metrics = {
                 "lufs": float(ref_lufs.finalize()),
                 "true_peak": float(ref_tp.finalize()),
-                "correlation": float(ref_corr.correlation()),
+                "correlation": float(ref_corr.matrix()[0, 1]),
             }
         else:
             raise ValueError(f"Unsupported meter pack: {meters}")
@@ -8,6 +8,12 @@ from pathlib import Path
 from typing import Any
 
 from mmo.dsp.backends.ffmpeg_discovery import resolve_ffmpeg_cmd, resolve_ffprobe_cmd
+from mmo.dsp.decode_cache import decode_cache_dir, decode_cache_enabled
+from mmo.dsp.metadata_cache import (
+    metadata_cache_dir,
+    metadata_cache_enabled,
+    metadata_cache_persistent,
+)
 from mmo.resources import (
     data_root,
     default_cache_dir,
@@ -91,6 +97,45 @@ def _temp_root_selection_text(*, source: str, root: Path, fallback: bool) -> str
     return f"source={source};root={_normalize_path(root)};fallback={fallback_text}"
 
 
+def _cache_dir_usage(root: Path, entry_pattern: str) -> tuple[int, int]:
+    # On-disk state only: a fresh doctor process has not decoded or probed
+    # anything, so in-process hit counters would always read zero.
+    entries = 0
+    total_bytes = 0
+    try:
+        paths = list(root.iterdir()) if root.is_dir() else []
+    except OSError:
+        return 0, 0
+    for path in paths:
+        try:
+            if not path.is_file():
+                continue
+            total_bytes += path.stat().st_size
+        except OSError:
+            continue
+        if path.match(entry_pattern):
+            entries += 1
+    return entries, total_bytes
+
+
+def _cache_stats_payload() -> dict[str, Any]:
+    metadata_entries, metadata_bytes = _cache_dir_usage(metadata_cache_dir(), "*.json")
+    decode_entries, decode_bytes = _cache_dir_usage(decode_cache_dir(), "*.pcm")
+    return {
+        "metadata": {
+            "enabled": metadata_cache_enabled(),
+            "persistent": metadata_cache_persistent(),
+            "entries": metadata_entries,
+            "bytes": metadata_bytes,
+        },
+        "decode": {
+            "enabled": decode_cache_enabled(),
+            "entries": decode_entries,
+            "bytes": decode_bytes,
+        },
+    }
+
+
 def build_env_doctor_report() -> dict[str, Any]:
     resolved_data_root = data_root()
     resolved_schemas_dir = schemas_dir()
@@ -135,6 +180,7 @@ def build_env_doctor_report() -> dict[str, Any]:
             "reportlab_available": _module_available("reportlab"),
         },
         "env_overrides": env_overrides,
+        "caches": _cache_stats_payload(),
     }
 
 
@@ -153,6 +199,9 @@ def render_env_doctor_text(report: dict[str, Any]) -> str:
     paths_payload = report.get("paths", {})
     checks_payload = report.get("checks", {})
     overrides_payload = report.get("env_overrides", {})
+    caches_payload = report.get("caches", {})
+    metadata_cache = caches_payload.get("metadata", {})
+    decode_cache = caches_payload.get("decode", {})
 
     lines: list[str] = [
         f"python.version={_as_text(python_payload.get('version'))}",
@@ -181,4 +230,16 @@ def render_env_doctor_text(report: dict[str, Any]) -> str:
         )
         lines.append(f"env_overrides.{name}.path={_as_text(item.get('path'))}")
 
+    lines.extend(
+        [
+            f"caches.metadata.enabled={_as_bool_text(metadata_cache.get('enabled'))}",
+            f"caches.metadata.persistent={_as_bool_text(metadata_cache.get('persistent'))}",
+            f"caches.metadata.entries={_as_text(metadata_cache.get('entries'))}",
+            f"caches.metadata.bytes={_as_text(metadata_cache.get('bytes'))}",
+            f"caches.decode.enabled={_as_bool_text(decode_cache.get('enabled'))}",
+            f"caches.decode.entries={_as_text(decode_cache.get('entries'))}",
+            f"caches.decode.bytes={_as_text(decode_cache.get('bytes'))}",
+        ]
+    )
+
     return "\n".join(lines) + "\n"
@@ -236,13 +236,38 @@ def audit_lfe_channels(
     lfe_high_hz: float = LFE_DEFAULT_HIGH_HZ,
 ) -> Dict[str, Any]:
     """Audit multiple LFE channels and return per-channel rows + aggregate metrics."""
+    return audit_lfe_channel_samples(
+        {
+            lfe_index: _extract_channel(interleaved, channels, lfe_index)
+            for lfe_index in sorted({int(index) for index in lfe_indices})
+        },
+        sample_rate_hz=sample_rate_hz,
+        mains_samples=mains_samples,
+        lfe_low_hz=lfe_low_hz,
+        lfe_high_hz=lfe_high_hz,
+    )
+
+
+def audit_lfe_channel_samples(
+    lfe_channels: Dict[int, List[float]],
+    *,
+    sample_rate_hz: int,
+    mains_samples: Optional[List[float]] = None,
+    lfe_low_hz: float = LFE_DEFAULT_LOW_HZ,
+    lfe_high_hz: float = LFE_DEFAULT_HIGH_HZ,
+) -> Dict[str, Any]:
+    """Same as ``audit_lfe_channels`` for LFE channels already split out.
+
+    ``lfe_channels`` maps channel index to that channel's mono samples, so a
+    streaming caller can keep only the LFE (and summed mains) channels.
+    """
     rows: List[Dict[str, Any]] = []
     inband_linear_sum = 0.0
     out_of_band_linear_sum = 0.0
     out_of_band_any = False
 
-    for lfe_index in sorted({int(index) for index in lfe_indices}):
-        lfe_mono = _extract_channel(interleaved, channels, lfe_index)
+    for lfe_index in sorted(lfe_channels):
+        lfe_mono = lfe_channels[lfe_index]
         if not lfe_mono:
             continue
         audit = audit_lfe_channel(
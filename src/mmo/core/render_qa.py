@@ -15,11 +15,23 @@ from mmo.core.qa_states import (
     classify_measurement_state,
 )
 from mmo.core.render_clarity import enrich_issue_list_for_user
-from mmo.dsp.backends.ffmpeg_decode import iter_ffmpeg_float64_samples
+from mmo.dsp.backends.ffmpeg_decode import (
+    iter_ffmpeg_float64_samples,
+    iter_ffmpeg_frames_ndarray,
+)
 from mmo.dsp.backends.ffmpeg_discovery import resolve_ffmpeg_cmd
 from mmo.dsp.decoders import detect_format_from_path, read_metadata
 from mmo.dsp.io import sha256_file
-from mmo.dsp.meters import compute_basic_stats_from_float64, iter_wav_float64_samples
+from mmo.dsp.loudness_timeline import (
+    loudness_timeline_path,
+    loudness_timeline_sidecars_enabled,
+    save_loudness_timeline,
+)
+from mmo.dsp.meters import (
+    compute_basic_stats_from_float64,
+    iter_wav_float64_samples,
+    iter_wav_frames_ndarray,
+)
 
 __all__ = [
     "build_render_qa_payload",
@@ -30,7 +42,6 @@ __all__ = [
 _WAV_EXTENSIONS = frozenset({".wav", ".wave"})
 _STEREO_CHANNELS = 2
 _EPSILON = 1e-12
-_SHORT_TERM_WINDOW_SECONDS = 3.0
 _SHORT_TERM_HOP_SECONDS = 1.0
 _SPECTRAL_WINDOW_SIZE = 4096
 _SPECTRAL_HOP_SIZE = 2048
@@ -337,23 +348,25 @@ def _decode_frames_float64(
     np_module: Any,
 ) -> Any:
     blocks: list[Any] = []
-    carry: list[float] = []
-    for chunk in _iter_file_samples(
-        path,
-        ffmpeg_cmd=ffmpeg_cmd,
-        error_context="render QA decode",
-    ):
-        merged = carry + chunk
-        remainder = len(merged) % channels
-        if remainder:
-            carry = merged[-remainder:]
-            merged = merged[:-remainder]
-        else:
-            carry = []
-        if not merged:
-            continue
-        block = np_module.asarray(merged, dtype=np_module.float64).reshape(-1, channels)
-        blocks.append(block)
+    if path.suffix.lower() in _WAV_EXTENSIONS:
+        for block in iter_wav_frames_ndarray(path, error_context="render QA decode"):
+            if block.shape[1] != channels:
+                raise ValueError("decoded WAV channel count does not match metadata")
+            blocks.append(block)
+        if not blocks:
+            return np_module.zeros((0, channels), dtype=np_module.float64)
+        return np_module.concatenate(blocks, axis=0)
+
+    if not ffmpeg_cmd:
+        raise ValueError(
+            (
+                "ffmpeg is required to decode non-WAV files for render QA metrics: "
+                f"{path.as_posix()}"
+            )
+        )
+    for block in iter_ffmpeg_frames_ndarray(path, ffmpeg_cmd, channels=channels):
+        # Stream blocks are views of a reused pipe buffer; keep a copy.
+        blocks.append(block.copy())
     if not blocks:
         return np_module.zeros((0, channels), dtype=np_module.float64)
     return np_module.concatenate(blocks, axis=0)
@@ -435,51 +448,20 @@ def _compute_loudness_range(short_term_lufs_values: list[float]) -> float | None
 
 
 def _short_term_lufs_distribution(
-    *,
-    frames: Any,
-    sample_rate_hz: int,
-    channels: int,
-    channel_mask: int | None,
-    channel_layout: str | None,
+    timeline: Any | None,
 ) -> tuple[float | None, float | None, float | None, float | None]:
-    if frames.size == 0:
-        return (None, None, None, None)
-
-    try:
-        from mmo.dsp.meters_truth import compute_lufs_shortterm_float64  # noqa: WPS433
-    except (ImportError, ValueError):
+    if timeline is None:
         return (None, None, None, None)
 
-    window_frames = int(round(_SHORT_TERM_WINDOW_SECONDS * sample_rate_hz))
-    hop_frames = int(round(_SHORT_TERM_HOP_SECONDS * sample_rate_hz))
-    if window_frames <= 0 or hop_frames <= 0:
-        return (None, None, None, None)
-
-    values: list[float] = []
-    if frames.shape[0] < window_frames:
-        candidate = compute_lufs_shortterm_float64(
-            frames,
-            sample_rate_hz,
-            channels,
-            channel_mask=channel_mask,
-            channel_layout=channel_layout,
-            method_id=DEFAULT_LOUDNESS_METHOD_ID,
-        )
-        if math.isfinite(candidate):
-            values.append(float(candidate))
-    else:
-        for start in range(0, frames.shape[0] - window_frames + 1, hop_frames):
-            window = frames[start : start + window_frames, :]
-            candidate = compute_lufs_shortterm_float64(
-                window,
-                sample_rate_hz,
-                channels,
-                channel_mask=channel_mask,
-                channel_layout=channel_layout,
-                method_id=DEFAULT_LOUDNESS_METHOD_ID,
-            )
-            if math.isfinite(candidate):
-                values.append(float(candidate))
+    # The timeline hops every 100 ms; keep the short-term windows on the
+    # render QA hop.
+    hop_frames = int(round(_SHORT_TERM_HOP_SECONDS * timeline.sample_rate_hz))
+    step = max(1, int(round(hop_frames / float(timeline.hop_frames))))
+    values = [
+        float(value)
+        for value in timeline.shortterm_lufs[::step]
+        if math.isfinite(float(value))
+    ]
 
     if not values:
         return (None, None, None, None)
@@ -739,6 +721,8 @@ def _metrics_from_numpy_frames(
     channel_mask: int | None,
     channel_layout: str | None,
     np_module: Any,
+    timeline_path: Path | None = None,
+    source_sha256: str | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
     metrics = _empty_metrics()
     spectral = _empty_spectral()
@@ -777,31 +761,35 @@ def _metrics_from_numpy_frames(
 
     try:
         from mmo.dsp.meters_truth import (  # noqa: WPS433
-            compute_lufs_integrated_float64,
+            OnlineLufsIntegrated,
             compute_true_peak_dbtp_float64,
         )
     except (ImportError, ValueError):
-        compute_lufs_integrated_float64 = None
+        OnlineLufsIntegrated = None
         compute_true_peak_dbtp_float64 = None
 
-    if compute_lufs_integrated_float64 is not None:
-        integrated_lufs = compute_lufs_integrated_float64(
-            frames,
+    timeline = None
+    if OnlineLufsIntegrated is not None:
+        # One K-weighted pass yields integrated loudness and the short-term
+        # series the distribution metrics read.
+        loudness = OnlineLufsIntegrated(
             sample_rate_hz,
             channels,
-            channel_mask=channel_mask,
-            channel_layout=channel_layout,
+            channel_mask,
+            channel_layout,
             method_id=DEFAULT_LOUDNESS_METHOD_ID,
+            timeline=True,
         )
-        metrics["integrated_lufs"] = _round_or_none(integrated_lufs)
+        loudness.update(frames)
+        metrics["integrated_lufs"] = _round_or_none(loudness.finalize())
+        timeline = loudness.timeline(source_sha256=source_sha256)
+        if timeline_path is not None:
+            try:
+                save_loudness_timeline(timeline, timeline_path)
+            except OSError:
+                pass
 
-    p10, p50, p90, lra = _short_term_lufs_distribution(
-        frames=frames,
-        sample_rate_hz=sample_rate_hz,
-        channels=channels,
-        channel_mask=channel_mask,
-        channel_layout=channel_layout,
-    )
+    p10, p50, p90, lra = _short_term_lufs_distribution(timeline)
     metrics["short_term_lufs_p10"] = p10
     metrics["short_term_lufs_p50"] = p50
     metrics["short_term_lufs_p90"] = p90
@@ -900,6 +888,8 @@ def _compute_file_metrics(
     channel_mask: int | None,
     channel_layout: str | None,
     ffmpeg_cmd: Sequence[str] | None,
+    timeline_path: Path | None = None,
+    source_sha256: str | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
     metrics = _empty_metrics()
     spectral = _empty_spectral()
@@ -933,6 +923,8 @@ def _compute_file_metrics(
         channel_mask=channel_mask,
         channel_layout=channel_layout,
         np_module=np_module,
+        timeline_path=timeline_path,
+        source_sha256=source_sha256,
     )
 
 
@@ -960,6 +952,7 @@ def _file_entry(
         sample_rate_hz = None
     channel_mask = _coerce_int(metadata.get("channel_mask"))
     channel_layout = _normalize_channel_layout(metadata.get("channel_layout"))
+    sha256 = sha256_file(resolved)
 
     metrics, spectral = _compute_file_metrics(
         path=resolved,
@@ -968,6 +961,12 @@ def _file_entry(
         channel_mask=channel_mask,
         channel_layout=channel_layout,
         ffmpeg_cmd=ffmpeg_cmd,
+        timeline_path=(
+            loudness_timeline_path(resolved)
+            if loudness_timeline_sidecars_enabled()
+            else None
+        ),
+        source_sha256=sha256,
     )
     correlation_lr = _coerce_float(metrics.get("correlation_lr"))
     polarity_threshold = thresholds["polarity_error_correlation_lte"]
@@ -979,7 +978,7 @@ def _file_entry(
 
     return {
         "path": resolved.as_posix(),
-        "sha256": sha256_file(resolved),
+        "sha256": sha256,
         "format": detect_format_from_path(resolved),
         "channel_count": channels,
         "sample_rate_hz": sample_rate_hz,
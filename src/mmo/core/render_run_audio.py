@@ -26,7 +26,12 @@ from mmo.dsp.backends.ffmpeg_decode import (
 )
 from mmo.dsp.backends.ffmpeg_discovery import resolve_ffmpeg_cmd
 from mmo.dsp.decoders import read_metadata
-from mmo.dsp.io import read_wav_metadata, sha256_file, write_wav_ixml_chunk
+from mmo.dsp.io import (
+    hashed_wav_writer,
+    read_wav_metadata,
+    sha256_file,
+    write_wav_ixml_chunk,
+)
 from mmo.dsp.meters import iter_wav_float64_samples
 from mmo.dsp.plugins.base import (
     PluginContext,
@@ -2427,10 +2432,13 @@ def _write_stereo_pcm_wav_from_audio_buffer(
     pcm_bytes = _float_samples_to_pcm_bytes(audio_buffer.data, bit_depth)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with wave.open(str(output_path), "wb") as handle:
-        handle.setnchannels(2)
-        handle.setsampwidth(bit_depth // 8)
-        handle.setframerate(audio_buffer.sample_rate_hz)
+    with hashed_wav_writer(
+        output_path,
+        channels=2,
+        sample_width=bit_depth // 8,
+        sample_rate_hz=audio_buffer.sample_rate_hz,
+        frame_count=len(pcm_bytes) // (2 * (bit_depth // 8)),
+    ) as handle:
         handle.writeframes(pcm_bytes)
 
 
@@ -8,7 +8,7 @@ from mmo.core.stem_identity import (
     source_file_id_from_rel_path,
 )
 from mmo.core.source_locator import resolve_session_stems
-from mmo.dsp.decoders import detect_format_from_path, read_metadata
+from mmo.dsp.decoders import detect_format_from_path, read_metadata_many
 from mmo.dsp.io import sha256_file
 
 
@@ -41,7 +41,11 @@ def discover_stem_files(stems_dir: Path) -> list[Path]:
     return stems
 
 
-def build_session_from_stems_dir(stems_dir: Path) -> dict:
+def build_session_from_stems_dir(
+    stems_dir: Path,
+    *,
+    probe_workers: int | None = None,
+) -> dict:
     resolved_stems_dir = stems_dir.resolve()
     stems = discover_stem_files(resolved_stems_dir)
     rel_paths_by_source: list[tuple[Path, str]] = []
@@ -58,8 +62,9 @@ def build_session_from_stems_dir(stems_dir: Path) -> dict:
         rel_path for _, rel_path in rel_paths_by_source
     )
     stem_entries = []
+    probe_results = read_metadata_many(stems, max_workers=probe_workers)
 
-    for path, file_path in rel_paths_by_source:
+    for (path, file_path), probe_result in zip(rel_paths_by_source, probe_results):
         stem_entry = {
             "stem_id": stem_ids_by_rel_path.get(file_path, "stem"),
             "file_path": file_path,
@@ -67,12 +72,9 @@ def build_session_from_stems_dir(stems_dir: Path) -> dict:
             "sha256": sha256_file(path),
         }
         format_id = detect_format_from_path(path)
-        try:
-            metadata = read_metadata(path)
-        except (ValueError, NotImplementedError):
-            # Metadata gaps should not block session creation. Later validation
-            # and locator passes can still work from ids, hashes, and file paths.
-            metadata = None
+        # Metadata gaps should not block session creation. Later validation
+        # and locator passes can still work from ids, hashes, and file paths.
+        metadata = None if isinstance(probe_result, Exception) else probe_result
         if metadata:
             source_metadata = source_metadata_from_probe(metadata)
             stem_entry.update(
@@ -11,7 +11,7 @@ from mmo.core.stem_identity import (
     canonical_stem_ids_for_rel_paths,
     source_file_id_from_rel_path,
 )
-from mmo.dsp.decoders import read_metadata
+from mmo.dsp.decoders import read_metadata_many
 
 STEMS_INDEX_VERSION = "0.1.0"
 _SET_ID_PREFIX = "STEMSET."
@@ -106,10 +106,8 @@ def _validated_root(root: Path) -> Path:
     return resolved
 
 
-def _source_metadata_for_file(path: Path) -> dict[str, Any]:
-    try:
-        metadata = read_metadata(path)
-    except (ValueError, NotImplementedError):
+def _source_metadata_from_probe_result(metadata: dict | Exception) -> dict[str, Any]:
+    if isinstance(metadata, Exception):
         # Leave the file in the index even when probe metadata is missing.
         # Intake needs a stable row and a warning, not a silent drop.
         return {
@@ -203,7 +201,12 @@ def pick_best_stem_set(stem_sets: list[dict[str, Any]]) -> dict[str, Any] | None
     return ranked[0]
 
 
-def build_stems_index(root: Path, *, root_dir: str | None = None) -> dict[str, Any]:
+def build_stems_index(
+    root: Path,
+    *,
+    root_dir: str | None = None,
+    probe_workers: int | None = None,
+) -> dict[str, Any]:
     resolved_root = _validated_root(root)
     stem_sets = _collect_stem_sets(resolved_root)
     public_sets = [
@@ -226,6 +229,14 @@ def build_stems_index(root: Path, *, root_dir: str | None = None) -> dict[str, A
         for file_path in stem_set["_files"]
     ]
     stem_ids_by_rel_path = canonical_stem_ids_for_rel_paths(rel_paths)
+    # Probe every discovered file in one concurrent stage up front; results
+    # come back in discovery order, so the index stays deterministic.
+    probe_results = iter(
+        read_metadata_many(
+            [file_path for stem_set in stem_sets for file_path in stem_set["_files"]],
+            max_workers=probe_workers,
+        )
+    )
     for stem_set in stem_sets:
         set_id = stem_set["set_id"]
         folder_tokens = list(stem_set["_folder_tokens"])
@@ -242,7 +253,9 @@ def build_stems_index(root: Path, *, root_dir: str | None = None) -> dict[str, A
                     "ext": file_path.suffix.lower(),
                     "tokens": _tokenize_value(basename),
                     "folder_tokens": folder_tokens,
-                    "source_metadata": _source_metadata_for_file(file_path),
+                    "source_metadata": _source_metadata_from_probe_result(
+                        next(probe_results)
+                    ),
                 }
             )
     # Sort once here so later classifiers and planners inherit one file order
@@ -38,6 +38,7 @@ from mmo.resources import ontology_dir, presets_dir as _presets_dir, schemas_dir
 from mmo.core.deliverables import summarize_deliverables
 from mmo.core.media_tags import summarize_stem_source_tags
 from mmo.core.recommendations import normalize_recommendation_scope
+from mmo.dsp.io import sha256_file
 
 
 def _numeric_value(value: Any) -> float | None:
@@ -60,14 +61,8 @@ def _path_to_posix(path: Path) -> str:
 
 
 def _sha256_of_file(path: Path) -> str:
-    hasher = hashlib.sha256()
-    with open(path, "rb") as fh:
-        while True:
-            chunk = fh.read(65536)
-            if not chunk:
-                break
-            hasher.update(chunk)
-    return hasher.hexdigest()
+    # Render writers record their output digest; reuse it while the file is unchanged.
+    return sha256_file(path)
 
 
 def _render_artifact_pointer(path: Path) -> dict[str, Any]:
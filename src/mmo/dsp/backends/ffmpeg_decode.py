@@ -4,22 +4,40 @@ import subprocess
 import sys
 from array import array
 from pathlib import Path
-from typing import Iterator, Sequence
+from typing import Any, Iterator, Sequence
+
+_FLOAT64_BYTES = 8
+DEFAULT_PIPE_READ_BYTES = 1 << 20
 
 
 def _path_arg(path: Path) -> str:
     return path.resolve().as_posix()
 
 
-def build_ffmpeg_decode_command(path: Path, ffmpeg_cmd: Sequence[str]) -> list[str]:
-    """Build deterministic ffmpeg decode command for float64 PCM streaming."""
+def build_ffmpeg_decode_command(
+    path: Path,
+    ffmpeg_cmd: Sequence[str],
+    *,
+    start_s: float | None = None,
+    duration_s: float | None = None,
+) -> list[str]:
+    """Build deterministic ffmpeg decode command for float64 PCM streaming.
+
+    ``start_s`` seeks the input before decoding and ``duration_s`` stops the
+    output after that many seconds, so a window can be read without
+    decoding the file up to it.
+    """
     # Decode to float64 PCM on every path so later DSP stages do not depend on
     # codec-specific sample width or FFmpeg's default output format.
+    seek = ["-ss", repr(float(start_s))] if start_s is not None else []
+    limit = ["-t", repr(float(duration_s))] if duration_s is not None else []
     return list(ffmpeg_cmd) + [
         "-v",
         "error",
+        *seek,
         "-i",
         _path_arg(path),
+        *limit,
         "-f",
         "f64le",
         "-acodec",
@@ -28,26 +46,134 @@ def build_ffmpeg_decode_command(path: Path, ffmpeg_cmd: Sequence[str]) -> list[s
     ]
 
 
-def iter_ffmpeg_float64_samples(
-    path: Path, ffmpeg_cmd: Sequence[str], chunk_frames: int = 4096
-) -> Iterator[list[float]]:
-    if chunk_frames <= 0:
-        raise ValueError("chunk_frames must be positive")
-
-    cmd = build_ffmpeg_decode_command(path, ffmpeg_cmd)
-
+def _spawn_ffmpeg_decode(
+    path: Path,
+    ffmpeg_cmd: Sequence[str],
+    *,
+    bufsize: int = -1,
+    start_s: float | None = None,
+    duration_s: float | None = None,
+) -> subprocess.Popen:
+    cmd = build_ffmpeg_decode_command(
+        path, ffmpeg_cmd, start_s=start_s, duration_s=duration_s
+    )
     try:
         proc = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
+            bufsize=bufsize,
         )
     except OSError as exc:
         raise ValueError(f"ffmpeg failed: {exc}") from exc
 
     if proc.stdout is None or proc.stderr is None:
         raise ValueError("ffmpeg stdout/stderr not available")
+    return proc
+
+
+def _finish_ffmpeg_decode(proc: subprocess.Popen) -> None:
+    # Drain stderr after stdout closes so the process can finish and report one
+    # final failure reason instead of truncating decode output mid-stream.
+    stderr_payload = proc.stderr.read()
+    proc.stderr.close()
+    returncode = proc.wait()
+    if returncode != 0:
+        message = stderr_payload.decode("utf-8", errors="replace").strip()
+        if message:
+            raise ValueError(f"ffmpeg failed: {message}")
+        raise ValueError(f"ffmpeg failed with exit code {returncode}")
+
+
+def iter_ffmpeg_frames_ndarray(
+    path: Path,
+    ffmpeg_cmd: Sequence[str],
+    *,
+    channels: int,
+    read_size_bytes: int = DEFAULT_PIPE_READ_BYTES,
+    start_s: float | None = None,
+    duration_s: float | None = None,
+) -> Iterator[Any]:
+    """Yield frame-aligned ``(frames, channels)`` float64 ndarrays from ffmpeg.
+
+    Pipe data is read with ``readinto`` into one preallocated buffer and each
+    block is an ``np.frombuffer`` view of it. Views share that buffer, so a
+    block is only valid until the generator is resumed and writing to it
+    changes the buffer; callers that keep or modify blocks must copy them.
+    ``start_s``/``duration_s`` decode one window, as in
+    ``build_ffmpeg_decode_command``. Requires numpy.
+    """
+    import numpy as np
+
+    if channels <= 0:
+        raise ValueError("channels must be positive")
+    if read_size_bytes <= 0:
+        raise ValueError("read_size_bytes must be positive")
+
+    frame_bytes = _FLOAT64_BYTES * channels
+    capacity = max(1, read_size_bytes // frame_bytes) * frame_bytes
+    buffer = bytearray(capacity)
+    view = memoryview(buffer)
+    proc = _spawn_ffmpeg_decode(
+        path, ffmpeg_cmd, bufsize=capacity, start_s=start_s, duration_s=duration_s
+    )
 
+    filled = 0
+    try:
+        while True:
+            count = proc.stdout.readinto(view[filled:])
+            if count:
+                filled += count
+                if filled < capacity:
+                    continue
+            usable = filled - (filled % frame_bytes)
+            if usable > 0:
+                frame_count = usable // frame_bytes
+                block = np.frombuffer(
+                    buffer, dtype="<f8", count=frame_count * channels
+                ).reshape(frame_count, channels)
+                yield block
+                del block
+            # Carry the partial trailing frame to the front of the buffer so
+            # every yielded block starts on a frame boundary.
+            remainder = filled - usable
+            if remainder:
+                view[:remainder] = view[usable:filled]
+            filled = remainder
+            if not count:
+                break
+        if filled:
+            raise ValueError("ffmpeg returned non-frame-aligned sample data")
+    finally:
+        view.release()
+        proc.stdout.close()
+
+    _finish_ffmpeg_decode(proc)
+
+
+def iter_ffmpeg_float64_samples(
+    path: Path, ffmpeg_cmd: Sequence[str], chunk_frames: int = 4096
+) -> Iterator[list[float]]:
+    if chunk_frames <= 0:
+        raise ValueError("chunk_frames must be positive")
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        # One float64 per "frame" keeps the old contract: whole values only,
+        # with frame alignment left to callers that know the channel count.
+        for block in iter_ffmpeg_frames_ndarray(
+            path,
+            ffmpeg_cmd,
+            channels=1,
+            read_size_bytes=chunk_frames * _FLOAT64_BYTES,
+        ):
+            yield block.ravel().tolist()
+        return
+
+    proc = _spawn_ffmpeg_decode(path, ffmpeg_cmd)
     buffer = b""
     try:
         while True:
@@ -71,13 +197,4 @@ def iter_ffmpeg_float64_samples(
     finally:
         proc.stdout.close()
 
-    # Drain stderr after stdout closes so the process can finish and report one
-    # final failure reason instead of truncating decode output mid-stream.
-    stderr_payload = proc.stderr.read()
-    proc.stderr.close()
-    returncode = proc.wait()
-    if returncode != 0:
-        message = stderr_payload.decode("utf-8", errors="replace").strip()
-        if message:
-            raise ValueError(f"ffmpeg failed: {message}")
-        raise ValueError(f"ffmpeg failed with exit code {returncode}")
+    _finish_ffmpeg_decode(proc)
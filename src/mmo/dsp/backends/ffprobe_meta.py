@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any, Dict
 
 from mmo.core.media_tags import RawTag, canonicalize_tag_bag, tag_bag_to_mapping
+from mmo.dsp.metadata_cache import cached_metadata
 
 
 def find_ffprobe() -> Path | None:
@@ -124,6 +125,14 @@ def _extract_ffprobe_tags(payload: Dict[str, Any], *, container: str) -> dict[st
 
 
 def read_metadata_ffprobe(path: Path) -> Dict[str, Any]:
+    ffprobe = find_ffprobe()
+    if ffprobe is None:
+        raise ValueError("ffprobe not available")
+    # Keyed by the resolved ffprobe too, so switching binaries re-probes.
+    return cached_metadata(path, f"ffprobe:{ffprobe}", _read_metadata_ffprobe_uncached)
+
+
+def _read_metadata_ffprobe_uncached(path: Path) -> Dict[str, Any]:
     ffprobe = find_ffprobe()
     if ffprobe is None:
         raise ValueError("ffprobe not available")
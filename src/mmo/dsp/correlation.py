@@ -1,19 +1,16 @@
 from __future__ import annotations
 
 import math
-import wave
 from pathlib import Path
-from typing import Dict, Iterator, Sequence
+from typing import Any, Dict, Iterable, Iterator, Sequence
 
-from mmo.dsp.float64 import (
-    bytes_to_float_samples_ieee,
-    bytes_to_int_samples_pcm,
-    pcm_int_to_float64,
-)
 from mmo.dsp.io import read_wav_metadata
-from mmo.dsp.backends.ffmpeg_decode import iter_ffmpeg_float64_samples
+from mmo.dsp.meters import iter_wav_frames_ndarray
+from mmo.dsp.backends.ffmpeg_decode import iter_ffmpeg_frames_ndarray
 
-_CHUNK_FRAMES = 4096
+# A channel whose spread is below this fraction of its DC level is treated as
+# constant; block means of a constant are only exact up to rounding.
+_RELATIVE_VARIANCE_FLOOR = 1e-20
 
 
 class OnlineCorrelationAccumulator:
@@ -83,6 +80,144 @@ class PairCorrelationAccumulator:
         return {name: acc.correlation() for name, acc in self.accumulators.items()}
 
 
+def _correlation_from_comoments(comoments: Any, mean: Any, count: int) -> Any:
+    import numpy as np
+
+    channels = comoments.shape[0]
+    if count < 2:
+        return np.zeros((channels, channels), dtype=np.float64)
+    variances = np.diagonal(comoments).copy()
+    valid = variances > count * _RELATIVE_VARIANCE_FLOOR * mean * mean
+    scale = np.zeros(channels, dtype=np.float64)
+    scale[valid] = 1.0 / np.sqrt(variances[valid])
+    matrix = comoments * scale[:, None] * scale[None, :]
+    np.clip(matrix, -1.0, 1.0, out=matrix)
+    return np.where(valid[:, None] & valid[None, :], matrix, 0.0)
+
+
+class _ComomentState:
+    """Running count, channel means, and centered co-moment matrix."""
+
+    def __init__(self, channels: int) -> None:
+        import numpy as np
+
+        self.count = 0
+        self.mean = np.zeros(channels, dtype=np.float64)
+        self.comoments = np.zeros((channels, channels), dtype=np.float64)
+
+    def update(self, frames: Any) -> None:
+        count = int(frames.shape[0])
+        if count == 0:
+            return
+        mean = frames.mean(axis=0)
+        centered = frames - mean
+        comoments = centered.T @ centered
+        if self.count == 0:
+            self.count = count
+            self.mean = mean
+            self.comoments = comoments
+            return
+        # Chan et al. pairwise merge keeps the result independent of how the
+        # stream was chunked, up to rounding, without large raw-moment sums.
+        total = self.count + count
+        delta = mean - self.mean
+        self.comoments = (
+            self.comoments
+            + comoments
+            + delta[:, None] * delta[None, :] * (self.count * count / float(total))
+        )
+        self.mean = self.mean + delta * (count / float(total))
+        self.count = total
+
+
+class CorrelationMatrixAccumulator:
+    """Streaming Pearson correlation between every pair of channels.
+
+    Each ``(frames, channels)`` chunk costs one ``centered.T @ centered``
+    product, folded into running co-moments, so all ``C * (C - 1) / 2`` pairs
+    of an immersive layout are measured together. ``window_frames`` also
+    records one correlation matrix per complete non-overlapping window.
+    Requires numpy.
+    """
+
+    def __init__(self, channels: int, *, window_frames: int | None = None) -> None:
+        if channels <= 0:
+            raise ValueError("channels must be positive")
+        if window_frames is not None and window_frames < 2:
+            raise ValueError("window_frames must be at least 2")
+        self.channels = channels
+        self.window_frames = window_frames
+        self._total = _ComomentState(channels)
+        self._window = _ComomentState(channels) if window_frames is not None else None
+        self._windows: list[Any] = []
+        self._remainder: list[float] = []
+
+    @property
+    def count(self) -> int:
+        return self._total.count
+
+    def update(self, chunk_frames: Any) -> None:
+        import numpy as np
+
+        frames = np.asarray(chunk_frames, dtype=np.float64)
+        if frames.size == 0:
+            return
+        if frames.ndim != 2 or frames.shape[1] != self.channels:
+            raise ValueError("chunk_frames channel count mismatch")
+        self._total.update(frames)
+        if self._window is None or self.window_frames is None:
+            return
+        offset = 0
+        while offset < frames.shape[0]:
+            take = min(self.window_frames - self._window.count, frames.shape[0] - offset)
+            self._window.update(frames[offset : offset + take])
+            offset += take
+            if self._window.count == self.window_frames:
+                self._windows.append(
+                    _correlation_from_comoments(
+                        self._window.comoments, self._window.mean, self._window.count
+                    )
+                )
+                self._window = _ComomentState(self.channels)
+
+    def update_chunk(self, chunk: list[float]) -> None:
+        """Accept an interleaved chunk, carrying partial frames to the next call."""
+        import numpy as np
+
+        if not chunk:
+            return
+        buffer = self._remainder + list(chunk) if self._remainder else chunk
+        total = len(buffer) - (len(buffer) % self.channels)
+        self._remainder = list(buffer[total:])
+        if total <= 0:
+            return
+        self.update(np.asarray(buffer[:total], dtype=np.float64).reshape(-1, self.channels))
+
+    def matrix(self) -> Any:
+        """Return the ``(channels, channels)`` correlation matrix.
+
+        Channels with no variance correlate as 0.0 with everything, matching
+        ``OnlineCorrelationAccumulator``.
+        """
+        return _correlation_from_comoments(
+            self._total.comoments, self._total.mean, self._total.count
+        )
+
+    def correlations(self, pairs: Dict[str, tuple[int, int]]) -> Dict[str, float]:
+        matrix = self.matrix()
+        return {name: float(matrix[idx_a, idx_b]) for name, (idx_a, idx_b) in pairs.items()}
+
+    def windowed(self) -> Any:
+        """Return ``(windows, channels, channels)`` per-window correlation matrices."""
+        import numpy as np
+
+        if self.window_frames is None:
+            raise ValueError("windowed correlation was not requested")
+        if not self._windows:
+            return np.zeros((0, self.channels, self.channels), dtype=np.float64)
+        return np.stack(self._windows)
+
+
 def compute_pair_correlations_from_chunks(
     chunks: Iterator[list[float]],
     channels: int,
@@ -94,46 +229,15 @@ def compute_pair_correlations_from_chunks(
     return accumulator.correlations()
 
 
-def _iter_wav_float64_samples(
-    path: Path, *, error_context: str
-) -> Iterator[list[float]]:
-    metadata = read_wav_metadata(path)
-    audio_format = metadata["audio_format_resolved"]
-    bits_per_sample = metadata["bits_per_sample"]
-    channels = metadata["channels"]
-
-    if audio_format == 1:
-        if bits_per_sample not in (16, 24, 32):
-            raise ValueError(f"Unsupported bits per sample: {bits_per_sample}")
-    elif audio_format == 3:
-        if bits_per_sample not in (32, 64):
-            raise ValueError(f"Unsupported bits per sample: {bits_per_sample}")
-    else:
-        raise ValueError(f"Unsupported WAV format: {audio_format}")
-
-    try:
-        with wave.open(str(path), "rb") as handle:
-            while True:
-                frames = handle.readframes(_CHUNK_FRAMES)
-                if not frames:
-                    break
-                if audio_format == 1:
-                    int_samples = bytes_to_int_samples_pcm(
-                        frames, bits_per_sample, channels
-                    )
-                    if not int_samples:
-                        continue
-                    float_samples = pcm_int_to_float64(int_samples, bits_per_sample)
-                    yield float_samples
-                elif audio_format == 3:
-                    float_samples = bytes_to_float_samples_ieee(
-                        frames, bits_per_sample, channels
-                    )
-                    if not float_samples:
-                        continue
-                    yield float_samples
-    except (OSError, wave.Error) as exc:
-        raise ValueError(f"Failed to read WAV for {error_context}: {path}") from exc
+def _pair_correlations_from_frames(
+    blocks: Iterable[Any],
+    channels: int,
+    pairs: Dict[str, tuple[int, int]],
+) -> Dict[str, float]:
+    accumulator = CorrelationMatrixAccumulator(channels)
+    for block in blocks:
+        accumulator.update(block)
+    return accumulator.correlations(pairs)
 
 
 def compute_pair_correlations_wav(
@@ -141,8 +245,8 @@ def compute_pair_correlations_wav(
 ) -> Dict[str, float]:
     metadata = read_wav_metadata(path)
     channels = metadata["channels"]
-    return compute_pair_correlations_from_chunks(
-        _iter_wav_float64_samples(path, error_context="correlation meter"),
+    return _pair_correlations_from_frames(
+        iter_wav_frames_ndarray(path, error_context="correlation meter"),
         channels,
         pairs,
     )
@@ -155,8 +259,8 @@ def compute_pair_correlations_ffmpeg(
     channels: int,
     pairs: Dict[str, tuple[int, int]],
 ) -> Dict[str, float]:
-    return compute_pair_correlations_from_chunks(
-        iter_ffmpeg_float64_samples(path, ffmpeg_cmd, chunk_frames=_CHUNK_FRAMES),
+    return _pair_correlations_from_frames(
+        iter_ffmpeg_frames_ndarray(path, ffmpeg_cmd, channels=channels),
         channels,
         pairs,
     )
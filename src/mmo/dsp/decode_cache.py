@@ -0,0 +1,347 @@
+"""Opt-in on-disk cache of decoded PCM for FFmpeg-decoded stems.
+
+Every meter, detector, and render pass over a FLAC/WavPack/APE stem would
+otherwise spawn FFmpeg again. When ``MMO_DECODE_CACHE`` is set, the first
+decode is teed into ``<cache dir>/decoded_pcm`` as raw interleaved float
+samples plus a JSON sidecar, and later passes map that file with
+``np.memmap`` instead.
+
+Entries are keyed by the source content sha256 (the digest recorded in
+lockfiles and sessions), the decoded sample rate, and the channel count, so an
+edited stem never hits a stale entry and a reader expecting a different frame
+width misses instead of reading scrambled PCM. The directory is size-capped with least-recently-used
+eviction; a hit refreshes the entry's mtime.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Iterator, Mapping
+
+from mmo.resources import default_cache_dir
+
+DECODE_CACHE_ENV = "MMO_DECODE_CACHE"
+DECODE_CACHE_MAX_MB_ENV = "MMO_DECODE_CACHE_MAX_MB"
+DECODE_CACHE_DTYPE_ENV = "MMO_DECODE_CACHE_DTYPE"
+DEFAULT_DECODE_CACHE_MAX_BYTES = 4 * 1024 * 1024 * 1024
+
+_CACHE_SUBDIR = "decoded_pcm"
+_CACHE_FORMAT_VERSION = 2
+_SUPPORTED_DTYPES = ("float64", "float32")
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_STAT_KEYS = ("hits", "misses", "stores", "evictions")
+
+_STATS: dict[str, int] = {key: 0 for key in _STAT_KEYS}
+
+
+def decode_cache_stats() -> dict[str, int]:
+    """Return this process's cumulative decode-cache counters."""
+    return dict(_STATS)
+
+
+def record_decode_cache_stats(delta: Mapping[str, Any] | None) -> None:
+    """Fold counters reported by a worker process into this process."""
+    if not isinstance(delta, Mapping):
+        return
+    for key in _STAT_KEYS:
+        value = delta.get(key)
+        if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+            _STATS[key] += value
+
+
+def decode_cache_stats_since(before: Mapping[str, int]) -> dict[str, int]:
+    """Return counters accumulated since an earlier ``decode_cache_stats()``."""
+    return {key: _STATS[key] - int(before.get(key, 0)) for key in _STAT_KEYS}
+
+
+def _bump(key: str) -> None:
+    _STATS[key] += 1
+
+
+class DecodeCache:
+    """Size-capped store of decoded ``(frames, channels)`` PCM blocks."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_bytes: int = DEFAULT_DECODE_CACHE_MAX_BYTES,
+        dtype: str = "float64",
+    ) -> None:
+        if dtype not in _SUPPORTED_DTYPES:
+            raise ValueError(f"Unsupported decode cache dtype: {dtype}")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        self.dtype = dtype
+
+    def entry_key(
+        self,
+        source_sha256: str,
+        sample_rate_hz: int | None,
+        variant: str | None = None,
+        *,
+        channels: int,
+    ) -> str:
+        rate_token = "native" if sample_rate_hz is None else f"{int(sample_rate_hz)}hz"
+        if variant:
+            # Resampled entries made by a non-default method keep their own key.
+            rate_token = f"{rate_token}-{variant}"
+        return (
+            f"{source_sha256.lower()}.{rate_token}.{int(channels)}ch"
+            f".{self.dtype}.v{_CACHE_FORMAT_VERSION}"
+        )
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.root / f"{key}.pcm", self.root / f"{key}.json"
+
+    def load(
+        self,
+        source_sha256: str,
+        sample_rate_hz: int | None = None,
+        *,
+        channels: int,
+        variant: str | None = None,
+    ) -> Any | None:
+        """Return a read-only memmapped ``(frames, channels)`` array, or None."""
+        import numpy as np
+
+        data_path, meta_path = self._paths(
+            self.entry_key(source_sha256, sample_rate_hz, variant, channels=channels)
+        )
+        try:
+            sidecar = json.loads(meta_path.read_text(encoding="utf-8"))
+            stored_channels = int(sidecar["channels"])
+            frames = int(sidecar["frames"])
+            size_bytes = data_path.stat().st_size
+        except (OSError, ValueError, KeyError, TypeError):
+            _bump("misses")
+            return None
+        itemsize = np.dtype(self.dtype).itemsize
+        if (
+            stored_channels != channels
+            or channels <= 0
+            or frames < 0
+            or size_bytes != frames * channels * itemsize
+        ):
+            # A torn or foreign entry is treated as absent and overwritten.
+            _bump("misses")
+            return None
+
+        try:
+            os.utime(data_path)
+        except OSError:
+            pass
+        _bump("hits")
+        if frames == 0:
+            return np.zeros((0, channels), dtype=self.dtype)
+        return np.memmap(data_path, dtype=self.dtype, mode="r", shape=(frames, channels))
+
+    def iter_blocks(
+        self,
+        source_sha256: str,
+        sample_rate_hz: int | None = None,
+        *,
+        channels: int,
+        chunk_frames: int = 4096,
+        variant: str | None = None,
+    ) -> Iterator[Any] | None:
+        """Return an iterator of float64 blocks for a cached entry, or None."""
+        cached = self.load(source_sha256, sample_rate_hz, channels=channels, variant=variant)
+        if cached is None:
+            return None
+        return _iter_cached_blocks(cached, chunk_frames)
+
+    def store_blocks(
+        self,
+        source_sha256: str,
+        sample_rate_hz: int | None,
+        blocks: Iterator[Any],
+        *,
+        channels: int,
+        variant: str | None = None,
+    ) -> Iterator[Any]:
+        """Yield ``blocks`` unchanged while teeing them into the cache.
+
+        The entry is only committed once the source iterator is exhausted, so
+        an aborted decode (consumer stops early, decoder error) leaves no
+        partial file behind.
+        """
+        import numpy as np
+
+        key = self.entry_key(source_sha256, sample_rate_hz, variant, channels=channels)
+        data_path, _meta_path = self._paths(key)
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            # A unique name per writer, so concurrent decodes of one stem in
+            # threads or processes never share a temp file.
+            fd, tmp_name = tempfile.mkstemp(
+                prefix=f"{data_path.name}.", suffix=".tmp", dir=self.root
+            )
+            tmp_path = Path(tmp_name)
+            handle = os.fdopen(fd, "wb")
+        except OSError:
+            # An unwritable cache dir must never block decode.
+            yield from blocks
+            return
+
+        frames = 0
+        written_bytes = 0
+        writable = True
+        committed = False
+        try:
+            for block in blocks:
+                if writable:
+                    stored = np.ascontiguousarray(block, dtype=self.dtype)
+                    written_bytes += stored.nbytes
+                    if written_bytes > self.max_bytes:
+                        # One stem larger than the whole cache is never kept.
+                        writable = False
+                    else:
+                        try:
+                            handle.write(stored.tobytes())
+                        except OSError:
+                            writable = False
+                frames += int(block.shape[0])
+                yield block
+            if writable:
+                committed = self._commit(
+                    key,
+                    tmp_path,
+                    handle,
+                    channels=channels,
+                    frames=frames,
+                    sample_rate_hz=sample_rate_hz,
+                    source_sha256=source_sha256,
+                )
+        finally:
+            if not handle.closed:
+                handle.close()
+            if not committed:
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+
+    def _commit(
+        self,
+        key: str,
+        tmp_path: Path,
+        handle: Any,
+        *,
+        channels: int,
+        frames: int,
+        sample_rate_hz: int | None,
+        source_sha256: str,
+    ) -> bool:
+        data_path, meta_path = self._paths(key)
+        sidecar = {
+            "channels": int(channels),
+            "dtype": self.dtype,
+            "format_version": _CACHE_FORMAT_VERSION,
+            "frames": frames,
+            "sample_rate_hz": sample_rate_hz,
+            "source_sha256": source_sha256.lower(),
+        }
+        try:
+            handle.close()
+            os.replace(tmp_path, data_path)
+            meta_path.write_text(
+                json.dumps(sidecar, indent=2, sort_keys=True) + "\n",
+                encoding="utf-8",
+            )
+        except OSError:
+            return False
+        _bump("stores")
+        self.evict(keep=key)
+        return True
+
+    def evict(self, *, keep: str | None = None) -> int:
+        """Delete least-recently-used entries until the cache fits ``max_bytes``."""
+        entries: list[tuple[int, str, int]] = []
+        try:
+            data_paths = sorted(self.root.glob("*.pcm"))
+        except OSError:
+            return 0
+        for data_path in data_paths:
+            try:
+                stat = data_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, data_path.stem, stat.st_size))
+
+        total_bytes = sum(size for _, _, size in entries)
+        evicted = 0
+        for _, key, size in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            data_path, meta_path = self._paths(key)
+            for path in (meta_path, data_path):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            total_bytes -= size
+            evicted += 1
+            _bump("evictions")
+        return evicted
+
+
+def _iter_cached_blocks(cached: Any, chunk_frames: int) -> Iterator[Any]:
+    import numpy as np
+
+    for start in range(0, cached.shape[0], chunk_frames):
+        yield np.asarray(cached[start : start + chunk_frames], dtype=np.float64)
+
+
+def decode_cache_dir() -> Path:
+    """Return the directory the env-configured decode cache uses."""
+    return default_cache_dir() / _CACHE_SUBDIR
+
+
+def decode_cache_enabled() -> bool:
+    return os.environ.get(DECODE_CACHE_ENV, "").strip().lower() in _TRUE_VALUES
+
+
+def active_decode_cache() -> DecodeCache | None:
+    """Return the env-configured cache, or None when it is off or numpy is absent."""
+    if not decode_cache_enabled():
+        return None
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return None
+
+    max_bytes = DEFAULT_DECODE_CACHE_MAX_BYTES
+    raw_max_mb = os.environ.get(DECODE_CACHE_MAX_MB_ENV, "").strip()
+    if raw_max_mb:
+        try:
+            max_mb = int(raw_max_mb)
+        except ValueError:
+            max_mb = 0
+        if max_mb > 0:
+            max_bytes = max_mb * 1024 * 1024
+    dtype = os.environ.get(DECODE_CACHE_DTYPE_ENV, "").strip().lower() or "float64"
+    if dtype not in _SUPPORTED_DTYPES:
+        dtype = "float64"
+    return DecodeCache(decode_cache_dir(), max_bytes=max_bytes, dtype=dtype)
+
+
+def build_decode_cache_receipt(before: Mapping[str, int]) -> dict[str, Any] | None:
+    """Return hit/miss counts since ``before`` for receipts, or None when disabled."""
+    cache = active_decode_cache()
+    if cache is None:
+        return None
+    receipt: dict[str, Any] = {
+        "enabled": True,
+        "dtype": cache.dtype,
+        "max_bytes": cache.max_bytes,
+    }
+    receipt.update(decode_cache_stats_since(before))
+    return receipt
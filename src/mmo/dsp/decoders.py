@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Iterator, Mapping, Sequence
 
-from mmo.dsp.backends.ffmpeg_decode import iter_ffmpeg_float64_samples
+from mmo.dsp.backends.ffmpeg_decode import (
+    iter_ffmpeg_float64_samples,
+    iter_ffmpeg_frames_ndarray,
+)
 from mmo.dsp.backends.ffmpeg_discovery import resolve_ffmpeg_cmd
 from mmo.dsp.backends.ffprobe_meta import find_ffprobe, read_metadata_ffprobe
-from mmo.dsp.io import read_wav_metadata
-from mmo.dsp.meters import iter_wav_float64_samples
-from mmo.dsp.sample_rate import iter_resampled_float64_samples
+from mmo.dsp.decode_cache import DecodeCache, active_decode_cache
+from mmo.dsp.io import read_aiff_metadata, read_wav_metadata, sha256_file
+from mmo.dsp.meters import (
+    iter_aiff_float64_samples,
+    iter_aiff_frames_ndarray,
+    iter_wav_float64_samples,
+    iter_wav_frames_ndarray,
+    validate_aiff_format,
+)
+from mmo.dsp.sample_rate import RESAMPLE_METHOD_LINEAR, iter_resampled_float64_samples
 
 
 class DecoderError(Exception):
@@ -30,11 +42,11 @@ _EXTENSION_FORMATS = {
     ".m4a": "m4a",
 }
 _WAV_FORMAT_ID = "wav"
+_AIFF_FORMAT_ID = "aiff"
 _FFMPEG_ONLY_FORMAT_IDS = frozenset(
     {
         "flac",
         "wavpack",
-        "aiff",
         "ape",
         "mp3",
         "aac",
@@ -43,6 +55,8 @@ _FFMPEG_ONLY_FORMAT_IDS = frozenset(
         "m4a",
     }
 )
+PROBE_WORKERS_ENV = "MMO_PROBE_WORKERS"
+_DEFAULT_PROBE_WORKERS = 8
 _LOSSLESS_FORMAT_IDS = frozenset({"wav", "flac", "wavpack", "aiff", "ape"})
 _LOSSY_FORMAT_IDS = frozenset({"mp3", "aac", "ogg", "opus"})
 
@@ -71,6 +85,19 @@ def _coerce_positive_int(value: Any) -> int | None:
     return None
 
 
+def has_native_aiff_decoder(path: Path) -> bool:
+    """Return True when an AIFF/AIFC file can be decoded without ffmpeg.
+
+    Compressed AIFC variants (``ulaw``, ``ima4``, ...) and 8-bit PCM still go
+    through the ffmpeg compatibility path.
+    """
+    try:
+        validate_aiff_format(read_aiff_metadata(path))
+    except ValueError:
+        return False
+    return True
+
+
 def is_lossless_format_id(format_id: str, *, codec_name: str | None = None) -> bool:
     normalized = format_id.strip().lower()
     if normalized in _LOSSLESS_FORMAT_IDS:
@@ -89,6 +116,14 @@ def read_audio_metadata(path: Path) -> dict:
         # WAV metadata stays on the local parser path so common sessions do not
         # depend on ffprobe for basic decode authority.
         return read_wav_metadata(path)
+    if format_id == _AIFF_FORMAT_ID:
+        # Uncompressed AIFF is parsed locally for the same reason. Compressed
+        # AIFC falls through to ffprobe when it is installed.
+        try:
+            return read_aiff_metadata(path)
+        except ValueError:
+            if find_ffprobe() is None:
+                raise
     if format_id == "unknown":
         # Unknown formats must fail explicitly. Guessing here would hide which
         # backend owns the file and which artifact contract should apply.
@@ -108,6 +143,66 @@ def read_metadata(path: Path) -> dict:
     return read_audio_metadata(path)
 
 
+def resolve_probe_workers(max_workers: int | None = None) -> int:
+    """Return the probe thread count: explicit value, then env, then default."""
+    if max_workers is None:
+        raw_value = os.environ.get(PROBE_WORKERS_ENV, "").strip()
+        max_workers = _coerce_positive_int(raw_value) if raw_value else None
+        if max_workers is None:
+            max_workers = _DEFAULT_PROBE_WORKERS
+    return max(1, int(max_workers))
+
+
+def _probe_runs_inline(path: Path) -> bool:
+    # Header walks are cheap and hold the GIL; only ffprobe-bound files gain
+    # anything from a worker thread.
+    format_id = detect_format_from_path(path)
+    if format_id == _WAV_FORMAT_ID or format_id == "unknown":
+        return True
+    return format_id == _AIFF_FORMAT_ID and has_native_aiff_decoder(path)
+
+
+def _read_metadata_or_error(path: Path) -> dict | Exception:
+    try:
+        return read_audio_metadata(path)
+    except (ValueError, NotImplementedError) as exc:
+        return exc
+
+
+def read_metadata_many(
+    paths: Sequence[Path],
+    *,
+    max_workers: int | None = None,
+) -> list[dict | Exception]:
+    """Probe many files at once; results come back in ``paths`` order.
+
+    WAV and uncompressed AIFF headers are parsed inline. Files that need
+    ffprobe (one input per invocation) are probed on a bounded thread pool
+    sized by ``max_workers`` or ``MMO_PROBE_WORKERS``. A ``ValueError`` or
+    ``NotImplementedError`` for one file is returned in its slot instead of
+    aborting the batch.
+    """
+    results: list[dict | Exception | None] = [None] * len(paths)
+    pooled: list[int] = []
+    for index, path in enumerate(paths):
+        if _probe_runs_inline(path):
+            results[index] = _read_metadata_or_error(path)
+        else:
+            pooled.append(index)
+
+    workers = min(resolve_probe_workers(max_workers), len(pooled))
+    if workers <= 1:
+        for index in pooled:
+            results[index] = _read_metadata_or_error(paths[index])
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mmo_probe") as pool:
+            # map() yields in submission order, so slots fill deterministically.
+            probed = pool.map(_read_metadata_or_error, [paths[index] for index in pooled])
+            for index, result in zip(pooled, probed):
+                results[index] = result
+    return results  # type: ignore[return-value]
+
+
 def _iter_frame_aligned_samples(
     float_samples_iter: Iterator[list[float]],
     *,
@@ -121,6 +216,153 @@ def _iter_frame_aligned_samples(
         yield [float(sample) for sample in chunk]
 
 
+def _decodes_via_ffmpeg(format_id: str, path: Path) -> bool:
+    if format_id in _FFMPEG_ONLY_FORMAT_IDS:
+        return True
+    return format_id == _AIFF_FORMAT_ID and not has_native_aiff_decoder(path)
+
+
+def _resolved_decoder_cmd(ffmpeg_cmd: Sequence[str] | None) -> list[str]:
+    decoder_cmd = list(ffmpeg_cmd) if ffmpeg_cmd is not None else resolve_ffmpeg_cmd()
+    if decoder_cmd is None:
+        # Non-WAV decode has no safe fallback once FFmpeg is unavailable.
+        raise ValueError(
+            "ffmpeg not available for non-WAV decode; install ffmpeg or set MMO_FFMPEG_PATH"
+        )
+    return decoder_cmd
+
+
+def _source_digest(
+    path: Path,
+    source_sha256: str | None,
+    metadata: Mapping[str, Any] | None,
+) -> str:
+    if isinstance(source_sha256, str) and source_sha256:
+        return source_sha256
+    if isinstance(metadata, Mapping):
+        recorded = metadata.get("sha256")
+        if isinstance(recorded, str) and recorded:
+            return recorded
+    return sha256_file(path)
+
+
+def iter_audio_frames_ndarray(
+    path: Path,
+    *,
+    error_context: str,
+    channels: int,
+    chunk_frames: int = 4096,
+    ffmpeg_cmd: Sequence[str] | None = None,
+    source_sha256: str | None = None,
+    decode_cache: DecodeCache | None = None,
+) -> Iterator[Any]:
+    """Yield native-rate ``(frames, channels)`` float64 blocks for any format.
+
+    WAV and uncompressed AIFF decode in-process. Everything else goes through
+    FFmpeg, and through the opt-in decode cache when one is active.
+    """
+    if chunk_frames <= 0:
+        raise ValueError("chunk_frames must be positive")
+    format_id = detect_format_from_path(path)
+    if format_id == _WAV_FORMAT_ID:
+        yield from iter_wav_frames_ndarray(
+            path, error_context=error_context, chunk_frames=chunk_frames
+        )
+        return
+    if not _decodes_via_ffmpeg(format_id, path):
+        if format_id == _AIFF_FORMAT_ID:
+            yield from iter_aiff_frames_ndarray(
+                path, error_context=error_context, chunk_frames=chunk_frames
+            )
+            return
+        raise NotImplementedError(f"No decoder backend for format '{format_id}'")
+
+    cache = decode_cache if decode_cache is not None else active_decode_cache()
+    digest = ""
+    if cache is not None:
+        digest = _source_digest(path, source_sha256, None)
+        cached_blocks = cache.iter_blocks(digest, channels=channels, chunk_frames=chunk_frames)
+        if cached_blocks is not None:
+            yield from cached_blocks
+            return
+
+    blocks = iter_ffmpeg_frames_ndarray(path, _resolved_decoder_cmd(ffmpeg_cmd), channels=channels)
+    if cache is None:
+        yield from blocks
+        return
+    yield from cache.store_blocks(digest, None, blocks, channels=channels)
+
+
+def _iter_lists_as_blocks(chunks: Iterator[list[float]], *, channels: int) -> Iterator[Any]:
+    import numpy as np
+
+    for chunk in chunks:
+        yield np.asarray(chunk, dtype=np.float64).reshape(-1, channels)
+
+
+def _iter_cached_audio_float64_samples(
+    path: Path,
+    cache: DecodeCache,
+    *,
+    error_context: str,
+    chunk_frames: int,
+    metadata: Mapping[str, Any],
+    ffmpeg_cmd: Sequence[str] | None,
+    source_sha256: str | None,
+    channels: int,
+    source_sample_rate_hz: int,
+    target_sample_rate_hz: int | None,
+    resample_method_id: str,
+) -> Iterator[list[float]]:
+    digest = _source_digest(path, source_sha256, metadata)
+    native_iter = (
+        block.ravel().tolist()
+        for block in iter_audio_frames_ndarray(
+            path,
+            error_context=error_context,
+            channels=channels,
+            chunk_frames=chunk_frames,
+            ffmpeg_cmd=ffmpeg_cmd,
+            source_sha256=digest,
+            decode_cache=cache,
+        )
+    )
+    if target_sample_rate_hz is None or target_sample_rate_hz == source_sample_rate_hz:
+        yield from native_iter
+        return
+
+    # Resampled output is cached under its own rate (and method) so repeated
+    # render passes skip both FFmpeg and the resampling work.
+    variant = None if resample_method_id == RESAMPLE_METHOD_LINEAR else resample_method_id
+    cached_blocks = cache.iter_blocks(
+        digest,
+        target_sample_rate_hz,
+        channels=channels,
+        chunk_frames=chunk_frames,
+        variant=variant,
+    )
+    if cached_blocks is not None:
+        for block in cached_blocks:
+            yield block.ravel().tolist()
+        return
+    resampled_iter = iter_resampled_float64_samples(
+        native_iter,
+        channels=channels,
+        source_sample_rate_hz=source_sample_rate_hz,
+        target_sample_rate_hz=target_sample_rate_hz,
+        chunk_frames=chunk_frames,
+        method=resample_method_id,
+    )
+    for block in cache.store_blocks(
+        digest,
+        target_sample_rate_hz,
+        _iter_lists_as_blocks(resampled_iter, channels=channels),
+        channels=channels,
+        variant=variant,
+    ):
+        yield block.ravel().tolist()
+
+
 def iter_audio_float64_samples(
     path: Path,
     *,
@@ -129,6 +371,9 @@ def iter_audio_float64_samples(
     metadata: Mapping[str, Any] | None = None,
     ffmpeg_cmd: Sequence[str] | None = None,
     target_sample_rate_hz: int | None = None,
+    source_sha256: str | None = None,
+    decode_cache: DecodeCache | None = None,
+    resample_method_id: str = RESAMPLE_METHOD_LINEAR,
 ) -> Iterator[list[float]]:
     if chunk_frames <= 0:
         raise ValueError("chunk_frames must be positive")
@@ -152,34 +397,53 @@ def iter_audio_float64_samples(
     if source_sample_rate_hz is None:
         raise ValueError(f"invalid sample rate in metadata for {path}")
 
+    target_rate: int | None = None
+    if target_sample_rate_hz is not None and int(target_sample_rate_hz) != source_sample_rate_hz:
+        target_rate = _coerce_positive_int(target_sample_rate_hz)
+        if target_rate is None:
+            raise ValueError("target_sample_rate_hz must be a positive integer")
+
+    uses_ffmpeg = _decodes_via_ffmpeg(format_id, path)
+    if uses_ffmpeg:
+        # Repeated passes over FFmpeg-only stems are where the decode cache
+        # pays off; native WAV/AIFF decode is already cheaper than a cache read.
+        cache = decode_cache if decode_cache is not None else active_decode_cache()
+        if cache is not None:
+            yield from _iter_cached_audio_float64_samples(
+                path,
+                cache,
+                error_context=error_context,
+                chunk_frames=chunk_frames,
+                metadata=resolved_metadata,
+                ffmpeg_cmd=ffmpeg_cmd,
+                source_sha256=source_sha256,
+                channels=channels,
+                source_sample_rate_hz=source_sample_rate_hz,
+                target_sample_rate_hz=target_rate,
+                resample_method_id=resample_method_id,
+            )
+            return
+
     if format_id == _WAV_FORMAT_ID:
         # Use the local WAV path to avoid taking a subprocess dependency when
         # the repo can already decode and meter it directly.
         source_iter = iter_wav_float64_samples(path, error_context=error_context)
-    elif format_id in _FFMPEG_ONLY_FORMAT_IDS:
-        decoder_cmd = list(ffmpeg_cmd) if ffmpeg_cmd is not None else resolve_ffmpeg_cmd()
-        if decoder_cmd is None:
-            # Non-WAV decode has no safe fallback once FFmpeg is unavailable.
-            raise ValueError(
-                "ffmpeg not available for non-WAV decode; install ffmpeg or set MMO_FFMPEG_PATH"
-            )
+    elif format_id == _AIFF_FORMAT_ID and not uses_ffmpeg:
+        source_iter = iter_aiff_float64_samples(path, error_context=error_context)
+    elif uses_ffmpeg:
         source_iter = iter_ffmpeg_float64_samples(
             path,
-            decoder_cmd,
+            _resolved_decoder_cmd(ffmpeg_cmd),
             chunk_frames=chunk_frames,
         )
     else:
         raise NotImplementedError(f"No decoder backend for format '{format_id}'")
 
     aligned_iter = _iter_frame_aligned_samples(source_iter, channels=channels)
-    if target_sample_rate_hz is None or int(target_sample_rate_hz) == source_sample_rate_hz:
+    if target_rate is None:
         yield from aligned_iter
         return
 
-    target_rate = _coerce_positive_int(target_sample_rate_hz)
-    if target_rate is None:
-        raise ValueError("target_sample_rate_hz must be a positive integer")
-
     # Resample through the shared iterator so every non-native-rate path emits
     # the same receipt policy and interpolation behavior.
     yield from iter_resampled_float64_samples(
@@ -188,4 +452,5 @@ def iter_audio_float64_samples(
         source_sample_rate_hz=source_sample_rate_hz,
         target_sample_rate_hz=target_rate,
         chunk_frames=chunk_frames,
+        method=resample_method_id,
     )
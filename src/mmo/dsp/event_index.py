@@ -0,0 +1,199 @@
+"""Bounded index of clip and over events found while metering.
+
+Meters flag samples (``|x| >= clip threshold``, true-peak above a ceiling)
+block by block; ``EventRunIndex`` folds the flags into runs of consecutive
+flagged samples per channel, carrying open runs across block boundaries.
+Only the earliest ``max_events`` runs are kept, so memory stays bounded,
+while the totals cover every run. Requires numpy.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_MAX_EVENTS = 100
+
+
+@dataclass(frozen=True)
+class MeterEvent:
+    start_frame: int
+    length: int
+    channel: int
+    peak: float
+
+
+@dataclass(frozen=True)
+class EventIndex:
+    events: tuple[MeterEvent, ...]
+    event_count: int
+    flagged_count: int
+    max_events: int
+
+    @property
+    def truncated(self) -> bool:
+        return self.event_count > len(self.events)
+
+
+class EventRunIndex:
+    """Collect runs of flagged samples with start, length, channel, and peak."""
+
+    def __init__(self, channels: int, *, max_events: int = DEFAULT_MAX_EVENTS) -> None:
+        import numpy as np
+
+        if channels <= 0:
+            raise ValueError("channels must be positive")
+        if max_events < 0:
+            raise ValueError("max_events must be non-negative")
+        self.channels = channels
+        self.max_events = max_events
+        self.event_count = 0
+        self.flagged_count = 0
+        self._next_position: int | None = None
+        # Per channel: start position and running peak of the open run.
+        self._open_start = np.full(channels, -1, dtype=np.int64)
+        self._open_peak = np.zeros(channels, dtype=np.float64)
+        self._kept = _empty_runs()
+        self._result: EventIndex | None = None
+
+    def update(self, magnitude: Any, flagged: Any, start: int) -> None:
+        """Add one ``(samples, channels)`` block whose first row is at ``start``."""
+        import numpy as np
+
+        if self._result is not None:
+            raise ValueError("event index already finalized")
+        length, channels = flagged.shape
+        if channels != self.channels:
+            raise ValueError("flagged channel count mismatch")
+        if length == 0:
+            return
+        if self._next_position is not None and start != self._next_position:
+            self._close_open(self._next_position)
+        self._next_position = start + length
+
+        flagged_count = int(np.count_nonzero(flagged))
+        if flagged_count == 0:
+            self._close_open(start)
+            return
+        self.flagged_count += flagged_count
+
+        padded = np.zeros((channels, length + 2), dtype=np.int8)
+        padded[:, 1:-1] = flagged.T
+        edges = np.diff(padded, axis=1)
+        run_channels, run_starts = np.nonzero(edges == 1)
+        _, run_ends = np.nonzero(edges == -1)
+
+        # Peak of every run in one reduceat over the channel-major magnitudes.
+        flat = np.zeros(channels * length + 1, dtype=np.float64)
+        flat[:-1] = np.ascontiguousarray(magnitude.T).reshape(-1)
+        bounds = np.empty(run_starts.shape[0] * 2, dtype=np.int64)
+        bounds[0::2] = run_channels * length + run_starts
+        bounds[1::2] = run_channels * length + run_ends
+        run_peaks = np.maximum.reduceat(flat, bounds)[0::2]
+
+        run_starts = run_starts.astype(np.int64) + start
+        run_ends = run_ends.astype(np.int64) + start
+        continues = run_starts == start
+        for channel in range(channels):
+            if self._open_start[channel] < 0:
+                continue
+            hit = np.nonzero(continues & (run_channels == channel))[0]
+            if hit.size:
+                index = int(hit[0])
+                run_starts[index] = self._open_start[channel]
+                run_peaks[index] = max(float(run_peaks[index]), float(self._open_peak[channel]))
+                self._open_start[channel] = -1
+                self._open_peak[channel] = 0.0
+            else:
+                self._emit_open(channel, start)
+
+        still_open = run_ends == start + length
+        self._open_start[run_channels[still_open]] = run_starts[still_open]
+        self._open_peak[run_channels[still_open]] = run_peaks[still_open]
+        closed = ~still_open
+        self._emit(
+            run_starts[closed],
+            run_ends[closed] - run_starts[closed],
+            run_channels[closed].astype(np.int64),
+            run_peaks[closed],
+        )
+
+    def _emit_open(self, channel: int, end: int) -> None:
+        import numpy as np
+
+        start = int(self._open_start[channel])
+        self._emit(
+            np.array([start], dtype=np.int64),
+            np.array([end - start], dtype=np.int64),
+            np.array([channel], dtype=np.int64),
+            np.array([self._open_peak[channel]], dtype=np.float64),
+        )
+        self._open_start[channel] = -1
+        self._open_peak[channel] = 0.0
+
+    def _close_open(self, end: int) -> None:
+        for channel in range(self.channels):
+            if self._open_start[channel] >= 0:
+                self._emit_open(channel, end)
+
+    def _emit(self, starts: Any, lengths: Any, channels: Any, peaks: Any) -> None:
+        import numpy as np
+
+        if not starts.size:
+            return
+        self.event_count += int(starts.size)
+        if self.max_events == 0:
+            return
+        kept_starts, kept_lengths, kept_channels, kept_peaks = self._kept
+        if kept_starts.size == self.max_events and int(starts.min()) > int(kept_starts.max()):
+            # Every new run starts after the kept ones; the index is full.
+            return
+        starts = np.concatenate([kept_starts, starts])
+        lengths = np.concatenate([kept_lengths, lengths])
+        channels = np.concatenate([kept_channels, channels])
+        peaks = np.concatenate([kept_peaks, peaks])
+        if starts.size > self.max_events:
+            order = np.lexsort((channels, starts))[: self.max_events]
+            starts, lengths, channels, peaks = (
+                starts[order],
+                lengths[order],
+                channels[order],
+                peaks[order],
+            )
+        self._kept = (starts, lengths, channels, peaks)
+
+    def finalize(self) -> EventIndex:
+        import numpy as np
+
+        if self._result is not None:
+            return self._result
+        if self._next_position is not None:
+            self._close_open(self._next_position)
+        starts, lengths, channels, peaks = self._kept
+        order = np.lexsort((channels, starts))
+        self._result = EventIndex(
+            events=tuple(
+                MeterEvent(
+                    start_frame=int(starts[index]),
+                    length=int(lengths[index]),
+                    channel=int(channels[index]),
+                    peak=float(peaks[index]),
+                )
+                for index in order
+            ),
+            event_count=self.event_count,
+            flagged_count=self.flagged_count,
+            max_events=self.max_events,
+        )
+        return self._result
+
+
+def _empty_runs() -> tuple[Any, Any, Any, Any]:
+    import numpy as np
+
+    return (
+        np.zeros(0, dtype=np.int64),
+        np.zeros(0, dtype=np.int64),
+        np.zeros(0, dtype=np.int64),
+        np.zeros(0, dtype=np.float64),
+    )
@@ -4,7 +4,7 @@ import hashlib
 import math
 import struct
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Sequence
 
 
 SUPPORTED_DITHER_POLICIES: tuple[str, ...] = ("none", "tpdf", "tpdf_hp")
@@ -132,6 +132,21 @@ class _DeterministicRng:
         value ^= value >> 31
         return float((value >> 11) & ((1 << 53) - 1)) / float(1 << 53)
 
+    def random_block(self, np: Any, count: int) -> Any:
+        """Return the next ``count`` ``random()`` values as a float64 ndarray.
+
+        SplitMix64 is counter based: draw ``k`` mixes ``seed + k * increment``,
+        so a block is one vectorized pass of wrapping uint64 arithmetic.
+        """
+        steps = np.arange(1, count + 1, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            value = np.uint64(self._state) + steps * np.uint64(_SPLITMIX64_INCREMENT)
+            value = (value ^ (value >> np.uint64(30))) * np.uint64(_SPLITMIX64_MUL_A)
+            value = (value ^ (value >> np.uint64(27))) * np.uint64(_SPLITMIX64_MUL_B)
+            value ^= value >> np.uint64(31)
+        self._state = (self._state + count * _SPLITMIX64_INCREMENT) & _MASK_U64
+        return (value >> np.uint64(11)).astype(np.float64) / float(1 << 53)
+
 
 @dataclass
 class _ExportFinalizeState:
@@ -197,8 +212,16 @@ def _int_samples_to_bytes(samples: list[int], bit_depth: int) -> bytes:
     raise ValueError(f"Unsupported PCM bit depth: {bit_depth}")
 
 
+def _optional_numpy() -> Any | None:
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
 def _export_finalize_bytes(
-    samples: list[float],
+    samples: Sequence[float],
     *,
     channels: int,
     bit_depth: int,
@@ -210,6 +233,79 @@ def _export_finalize_bytes(
     if len(samples) % channels != 0:
         raise ValueError("interleaved sample data must be frame-aligned")
 
+    np = _optional_numpy()
+    if np is not None:
+        values = np.asarray(samples, dtype=np.float64).reshape(-1)
+        # NaN has no defined quantization; the scalar path raises for it.
+        if not np.isnan(values).any():
+            return _export_finalize_ndarray_bytes(
+                np,
+                values,
+                channels=channels,
+                bit_depth=bit_depth,
+                dither_policy=dither_policy,
+                state=state,
+            )
+    return _export_finalize_scalar_bytes(
+        samples,
+        channels=channels,
+        bit_depth=bit_depth,
+        dither_policy=dither_policy,
+        state=state,
+    )
+
+
+def _export_finalize_ndarray_bytes(
+    np: Any,
+    values: Any,
+    *,
+    channels: int,
+    bit_depth: int,
+    dither_policy: str,
+    state: _ExportFinalizeState,
+) -> bytes:
+    # Every step mirrors the scalar path operation for operation (same float64
+    # arithmetic, round-half-even, same draw order), so bytes are identical.
+    scale = _pcm_scale(bit_depth)
+    values = np.clip(values, -1.0, _FLOAT_MAX)
+    if dither_policy != "none" and state.rng is not None and values.size:
+        draws = state.rng.random_block(np, 2 * values.size)
+        raw_tpdf = ((draws[0::2] - draws[1::2]) / float(scale)).reshape(-1, channels)
+        if dither_policy == "tpdf_hp":
+            previous = np.empty_like(raw_tpdf)
+            previous[0] = state.previous_tpdf_by_channel
+            previous[1:] = raw_tpdf[:-1]
+            state.previous_tpdf_by_channel = raw_tpdf[-1].tolist()
+            noise = raw_tpdf - previous
+        else:
+            noise = raw_tpdf
+        values = np.clip(values + noise.reshape(-1), -1.0, _FLOAT_MAX)
+
+    quantized = np.rint(values * float(scale)).astype(np.int64)
+    np.clip(quantized, -scale, scale - 1, out=quantized)
+    return _int_ndarray_to_bytes(np, quantized, bit_depth)
+
+
+def _int_ndarray_to_bytes(np: Any, samples: Any, bit_depth: int) -> bytes:
+    if bit_depth == 16:
+        return samples.astype("<i2").tobytes()
+    if bit_depth == 24:
+        # Keep the low three bytes of each little-endian int32 word.
+        words = samples.astype("<i4").view(np.uint8).reshape(-1, 4)
+        return words[:, :3].tobytes()
+    if bit_depth == 32:
+        return samples.astype("<i4").tobytes()
+    raise ValueError(f"Unsupported PCM bit depth: {bit_depth}")
+
+
+def _export_finalize_scalar_bytes(
+    samples: Sequence[float],
+    *,
+    channels: int,
+    bit_depth: int,
+    dither_policy: str,
+    state: _ExportFinalizeState,
+) -> bytes:
     scale = _pcm_scale(bit_depth)
     min_int = -scale
     max_int = scale - 1
@@ -236,7 +332,7 @@ def _export_finalize_bytes(
 
 
 def export_finalize_interleaved_f64(
-    samples: list[float],
+    samples: Sequence[float],
     *,
     channels: int,
     bit_depth: int,
@@ -283,7 +379,8 @@ class StreamingExportFinalizer:
             seed=seed,
         )
 
-    def finalize_chunk(self, samples: list[float]) -> bytes:
+    def finalize_chunk(self, samples: Sequence[float]) -> bytes:
+        """Quantize one interleaved chunk; accepts a list or a float64 ndarray."""
         return _export_finalize_bytes(
             samples,
             channels=self.channels,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import math
 import struct
-from typing import Sequence
+from typing import Any, Sequence
 
 
 def pcm_int_to_float64(samples: Sequence[int], bits_per_sample: int) -> list[float]:
@@ -110,13 +110,139 @@ def bytes_to_float_samples_ieee(
 
 
 def interleaved_to_mono_peak(samples_float64: list[float], channels: int) -> float:
-    """Return the peak absolute sample across all channels."""
+    """Return the peak absolute sample across all channels.
+
+    ndarray input is reduced in one vectorized pass with the same result.
+    """
     if channels <= 0:
         raise ValueError(f"Invalid channel count: {channels}")
 
+    if not isinstance(samples_float64, list) and hasattr(samples_float64, "ndim"):
+        import numpy as np
+
+        if samples_float64.size == 0:
+            return 0.0
+        # fmax skips NaN, matching the scalar ``value > peak`` comparison.
+        return max(0.0, float(np.fmax.reduce(np.abs(samples_float64), axis=None)))
+
     peak = 0.0
     for sample in samples_float64:
         value = abs(sample)
         if value > peak:
             peak = value
     return peak
+
+
+def _ndarray_clamp_max(np: Any, dtype: Any) -> float:
+    # Match the list helpers: values at or above 1.0 land on the largest
+    # representable value below 1.0 for the requested output dtype.
+    return float(np.nextafter(np.asarray(1.0, dtype=dtype), np.asarray(0.0, dtype=dtype)))
+
+
+def _validated_byteorder(byteorder: str) -> str:
+    if byteorder not in ("<", ">"):
+        raise ValueError(f"Unsupported byte order: {byteorder!r}")
+    return byteorder
+
+
+def pcm_bytes_to_ndarray(
+    frames: bytes,
+    bits_per_sample: int,
+    channels: int,
+    *,
+    dtype: str = "float64",
+    byteorder: str = "<",
+) -> Any:
+    """Decode PCM bytes to a ``(frames, channels)`` float ndarray.
+
+    Values match ``pcm_int_to_float64(bytes_to_int_samples_pcm(...))``
+    exactly for float64 output, including the clamp into ``[-1.0, 1.0)``.
+    Trailing partial frames are dropped. ``byteorder`` is ``"<"`` for WAV
+    and ``">"`` for big-endian AIFF data.
+    """
+    import numpy as np
+
+    if channels <= 0:
+        raise ValueError(f"Invalid channel count: {channels}")
+    byteorder = _validated_byteorder(byteorder)
+    out_dtype = np.dtype(dtype)
+    if out_dtype not in (np.dtype(np.float32), np.dtype(np.float64)):
+        raise ValueError(f"Unsupported output dtype: {out_dtype.name}")
+
+    if bits_per_sample == 16:
+        bytes_per_sample = 2
+    elif bits_per_sample == 24:
+        bytes_per_sample = 3
+    elif bits_per_sample == 32:
+        bytes_per_sample = 4
+    else:
+        raise ValueError(f"Unsupported bits per sample: {bits_per_sample}")
+
+    bytes_per_frame = bytes_per_sample * channels
+    frame_count = len(frames) // bytes_per_frame
+    if frame_count <= 0:
+        return np.zeros((0, channels), dtype=out_dtype)
+    total_bytes = frame_count * bytes_per_frame
+
+    if bits_per_sample == 16:
+        ints = np.frombuffer(frames, dtype=f"{byteorder}i2", count=total_bytes // 2)
+    elif bits_per_sample == 32:
+        ints = np.frombuffer(frames, dtype=f"{byteorder}i4", count=total_bytes // 4)
+    else:
+        # Place each 3-byte word in the top of an int32 lane, then shift right
+        # arithmetically so the sign bit of the top byte extends across the word.
+        triplets = np.frombuffer(frames, dtype=np.uint8, count=total_bytes).reshape(-1, 3)
+        widened = np.zeros((triplets.shape[0], 4), dtype=np.uint8)
+        if byteorder == "<":
+            widened[:, 1:] = triplets
+        else:
+            widened[:, :3] = triplets
+        ints = widened.view(f"{byteorder}i4").reshape(-1) >> 8
+
+    divisor = float(2 ** (bits_per_sample - 1))
+    values = ints.astype(np.float64) / divisor
+    np.clip(values, -1.0, (divisor - 1.0) / divisor, out=values)
+    if out_dtype != np.dtype(np.float64):
+        values = values.astype(out_dtype)
+        np.clip(values, -1.0, _ndarray_clamp_max(np, out_dtype), out=values)
+    return values.reshape(frame_count, channels)
+
+
+def ieee_bytes_to_ndarray(
+    frames: bytes,
+    bits_per_sample: int,
+    channels: int,
+    *,
+    dtype: str = "float64",
+    byteorder: str = "<",
+) -> Any:
+    """Decode IEEE float bytes to a ``(frames, channels)`` ndarray.
+
+    Values match ``bytes_to_float_samples_ieee`` exactly for float64 output.
+    """
+    import numpy as np
+
+    if channels <= 0:
+        raise ValueError(f"Invalid channel count: {channels}")
+    byteorder = _validated_byteorder(byteorder)
+    out_dtype = np.dtype(dtype)
+    if out_dtype not in (np.dtype(np.float32), np.dtype(np.float64)):
+        raise ValueError(f"Unsupported output dtype: {out_dtype.name}")
+
+    if bits_per_sample == 32:
+        source_dtype = np.dtype(f"{byteorder}f4")
+    elif bits_per_sample == 64:
+        source_dtype = np.dtype(f"{byteorder}f8")
+    else:
+        raise ValueError(f"Unsupported bits per sample: {bits_per_sample}")
+
+    bytes_per_frame = source_dtype.itemsize * channels
+    frame_count = len(frames) // bytes_per_frame
+    if frame_count <= 0:
+        return np.zeros((0, channels), dtype=out_dtype)
+
+    values = np.frombuffer(
+        frames, dtype=source_dtype, count=frame_count * channels
+    ).astype(out_dtype)
+    np.clip(values, -1.0, _ndarray_clamp_max(np, out_dtype), out=values)
+    return values.reshape(frame_count, channels)
@@ -2,12 +2,18 @@ from __future__ import annotations
 
 import hashlib
 import io
+import math
+import os
 import struct
+import uuid
+import wave
 import xml.etree.ElementTree as ET
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterator
 
 from mmo.core.media_tags import RawTag, canonicalize_tag_bag, tag_bag_to_mapping
+from mmo.dsp.metadata_cache import cached_metadata, store_metadata
 
 
 _KSDATAFORMAT_SUBTYPE_PCM = struct.pack(
@@ -17,7 +23,12 @@ _KSDATAFORMAT_SUBTYPE_IEEE_FLOAT = struct.pack(
     "<IHH8s", 0x00000003, 0x0000, 0x0010, b"\x80\x00\x00\xaa\x00\x38\x9b\x71"
 )
 
+_WAV_FORM_IDS = frozenset({b"RIFF", b"RF64", b"BW64"})
+_RF64_FORM_IDS = frozenset({b"RF64", b"BW64"})
+_RF64_SIZE_SENTINEL = 0xFFFFFFFF
+
 _KNOWN_WAV_CHUNK_IDS = frozenset({
+    b"ds64",
     b"fmt ",
     b"data",
     b"LIST",
@@ -213,43 +224,241 @@ def _riff_chunk_bytes(chunk_id: bytes, payload: bytes) -> bytes:
     return chunk_id + struct.pack("<I", len(payload)) + payload + padding
 
 
-def write_wav_ixml_chunk(path: Path, xml_text: str) -> None:
-    """Replace or append a WAV iXML chunk with deterministic payload text."""
+_COPY_BLOCK_BYTES = 1024 * 1024
+_SHA256_NAMESPACE = "sha256"
+
+
+class HashingWriter:
+    """Binary file wrapper that feeds every written byte to SHA-256.
+
+    Writes must stay sequential for the digest to describe the file. Seeking
+    back to overwrite bytes (``wave`` patches its header on close when the
+    frame count was not set up front) makes ``hexdigest`` return None.
+    """
+
+    def __init__(self, handle: BinaryIO) -> None:
+        self._handle = handle
+        self._digest = hashlib.sha256()
+        self._position = 0
+        self._hashed_bytes = 0
+        self._rewritten = False
+
+    def write(self, data: bytes) -> int:
+        view = memoryview(data).cast("B")
+        written = self._handle.write(view)
+        count = len(view) if written is None else int(written)
+        if self._position == self._hashed_bytes:
+            self._digest.update(view[:count])
+            self._hashed_bytes += count
+        else:
+            self._rewritten = True
+        self._position += count
+        return count
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._position = self._handle.seek(offset, whence)
+        return self._position
+
+    def flush(self) -> None:
+        self._handle.flush()
+
+    def hexdigest(self) -> str | None:
+        """Return the digest of the bytes written, or None after a rewrite."""
+        if self._rewritten:
+            return None
+        return self._digest.hexdigest()
+
+
+def record_file_sha256(path: Path, sha256_hex: str) -> None:
+    """Remember a digest computed while writing ``path`` (see ``sha256_file``)."""
+    store_metadata(path, _SHA256_NAMESPACE, {"sha256": sha256_hex})
+
+
+@contextmanager
+def hashed_wav_writer(
+    path: Path,
+    *,
+    channels: int,
+    sample_width: int,
+    sample_rate_hz: int,
+    frame_count: int | None = None,
+) -> Iterator[wave.Wave_write]:
+    """Open a PCM WAV writer whose output digest is recorded on close.
+
+    Pass ``frame_count`` when it is known so the header is final up front;
+    otherwise ``wave`` patches the header on close and nothing is recorded.
+    """
+    with path.open("wb") as raw_handle:
+        writer = HashingWriter(raw_handle)
+        handle = wave.open(writer, "wb")  # type: ignore[arg-type]
+        try:
+            handle.setnchannels(channels)
+            handle.setsampwidth(sample_width)
+            handle.setframerate(sample_rate_hz)
+            if frame_count is not None:
+                handle.setnframes(frame_count)
+            yield handle
+        finally:
+            handle.close()
+    sha256_hex = writer.hexdigest()
+    if sha256_hex is not None:
+        record_file_sha256(path, sha256_hex)
+
+
+def write_wav_ixml_chunk(path: Path, xml_text: str) -> str:
+    """Replace or append a WAV iXML chunk with deterministic payload text.
+
+    The file is streamed into a sibling temp file and swapped into place, so
+    the rewrite hashes the new bytes as it goes. Returns that SHA-256, which
+    ``sha256_file`` then reuses instead of reading the file back.
+    """
     try:
-        source_bytes = path.read_bytes()
+        source = path.open("rb")
     except OSError as exc:
         raise ValueError(f"Failed to read WAV file '{path}': {exc}") from exc
 
-    if len(source_bytes) < 12:
+    # pid alone is not unique: two threads of one process may rewrite iXML at once.
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex}.ixml.tmp")
+    try:
+        with source:
+            try:
+                source_size = os.fstat(source.fileno()).st_size
+                form_id, kept_chunks = _wav_chunks_without_ixml(source, source_size, path)
+            except OSError as exc:
+                raise ValueError(f"Failed to read WAV file '{path}': {exc}") from exc
+
+            xml_payload = xml_text.encode("utf-8") + b"\x00"
+            ixml_chunk = _riff_chunk_bytes(b"iXML", xml_payload)
+            riff_size = 4 + sum(total for _, _, total in kept_chunks) + len(ixml_chunk)
+            ds64_chunk = None
+            if form_id in _RF64_FORM_IDS or riff_size > _RF64_SIZE_SENTINEL:
+                ds64_chunk = _rf64_ds64_chunk(source, kept_chunks, riff_size, path)
+                if form_id not in _RF64_FORM_IDS:
+                    form_id = b"RF64"
+                header = form_id + struct.pack("<I", _RF64_SIZE_SENTINEL) + b"WAVE"
+            else:
+                header = form_id + struct.pack("<I", riff_size) + b"WAVE"
+            try:
+                with tmp_path.open("wb") as raw_handle:
+                    writer = HashingWriter(raw_handle)
+                    writer.write(header)
+                    for index, (_chunk_id, offset, total) in enumerate(kept_chunks):
+                        if index == 0 and ds64_chunk is not None:
+                            writer.write(ds64_chunk)
+                            continue
+                        source.seek(offset)
+                        remaining = total
+                        while remaining > 0:
+                            block = source.read(min(remaining, _COPY_BLOCK_BYTES))
+                            if not block:
+                                raise OSError("unexpected end of file")
+                            writer.write(block)
+                            remaining -= len(block)
+                    writer.write(ixml_chunk)
+            except OSError as exc:
+                raise ValueError(f"Failed to write WAV iXML chunk '{path}': {exc}") from exc
+        # Swap only once the source handle is closed; Windows refuses to
+        # replace a file that is still open.
+        try:
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            raise ValueError(f"Failed to write WAV iXML chunk '{path}': {exc}") from exc
+    finally:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+    sha256_hex = writer.hexdigest()
+    if sha256_hex is None:
+        # Unreachable: the rewrite above only appends.
+        return sha256_file(path)
+    record_file_sha256(path, sha256_hex)
+    return sha256_hex
+
+
+def _wav_chunks_without_ixml(
+    source: BinaryIO,
+    source_size: int,
+    path: Path,
+) -> tuple[bytes, list[tuple[bytes, int, int]]]:
+    """Return the form id and ``(id, offset, total size)`` of every non-iXML chunk."""
+    if source_size < 12:
         raise ValueError(f"WAV file too small to contain RIFF header: '{path}'")
-
-    riff_id, _riff_size, wave_id = struct.unpack("<4sI4s", source_bytes[:12])
-    if riff_id != b"RIFF" or wave_id != b"WAVE":
+    source.seek(0)
+    form_id, _riff_size, wave_id = struct.unpack("<4sI4s", source.read(12))
+    if form_id not in _WAV_FORM_IDS or wave_id != b"WAVE":
         raise ValueError(f"Unsupported WAV container for iXML write: '{path}'")
+    ds64_sizes = _read_ds64_sizes(source, path) if form_id in _RF64_FORM_IDS else {}
 
-    chunks: list[bytes] = []
+    chunks: list[tuple[bytes, int, int]] = []
     cursor = 12
-    while cursor + 8 <= len(source_bytes):
-        chunk_id, chunk_size = struct.unpack("<4sI", source_bytes[cursor : cursor + 8])
+    while cursor + 8 <= source_size:
+        source.seek(cursor)
+        chunk_id, chunk_size = struct.unpack("<4sI", source.read(8))
+        if chunk_size == _RF64_SIZE_SENTINEL and chunk_id in ds64_sizes:
+            chunk_size = ds64_sizes[chunk_id]
         chunk_total = 8 + chunk_size + (chunk_size % 2)
         end = cursor + chunk_total
-        if end > len(source_bytes):
+        if end > source_size:
             raise ValueError(f"Truncated chunk {chunk_id!r} in '{path}'")
         if chunk_id != b"iXML":
-            chunks.append(source_bytes[cursor:end])
+            chunks.append((chunk_id, cursor, chunk_total))
         cursor = end
-
-    xml_payload = xml_text.encode("utf-8") + b"\x00"
-    riff_payload = b"WAVE" + b"".join(chunks) + _riff_chunk_bytes(b"iXML", xml_payload)
-    updated = b"RIFF" + struct.pack("<I", len(riff_payload)) + riff_payload
-    try:
-        path.write_bytes(updated)
-    except OSError as exc:
-        raise ValueError(f"Failed to write WAV iXML chunk '{path}': {exc}") from exc
+    return form_id, chunks
+
+
+def _rf64_ds64_chunk(
+    source: BinaryIO,
+    chunks: list[tuple[bytes, int, int]],
+    riff_size: int,
+    path: Path,
+) -> bytes:
+    """Return the leading ``ds64`` chunk rewritten for a new RIFF size.
+
+    A RIFF file that outgrows 32-bit sizes is upgraded in place when its first
+    chunk is a ``JUNK`` reservation large enough to become ``ds64``.
+    """
+    first_id, first_offset, first_total = chunks[0] if chunks else (b"", 0, 0)
+    if first_id not in (b"ds64", b"JUNK") or first_total < 36:
+        raise ValueError(f"WAV file exceeds the RIFF size limit without a ds64 chunk: '{path}'")
+    source.seek(first_offset + 4)
+    chunk_size = struct.unpack("<I", source.read(4))[0]
+    payload = bytearray(source.read(chunk_size))
+    if first_id == b"JUNK":
+        data_size = 0
+        block_align = 0
+        for chunk_id, offset, _total in chunks:
+            source.seek(offset + 4)
+            size = struct.unpack("<I", source.read(4))[0]
+            if chunk_id == b"data":
+                data_size = size
+            elif chunk_id == b"fmt " and size >= 16:
+                block_align = struct.unpack("<12xH", source.read(14))[0]
+        sample_count = data_size // block_align if block_align else 0
+        payload = bytearray(chunk_size)
+        payload[8:28] = struct.pack("<QQI", data_size, sample_count, 0)
+    payload[:8] = struct.pack("<Q", riff_size)
+    padding = b"\x00" if chunk_size % 2 == 1 else b""
+    return b"ds64" + struct.pack("<I", chunk_size) + bytes(payload) + padding
 
 
 def sha256_file(path: Path) -> str:
-    """Return the SHA-256 hex digest for a file."""
+    """Return the SHA-256 hex digest for a file.
+
+    Digests go through the metadata cache: one recorded while the file was
+    written, or computed by an earlier call, is reused as long as the file's
+    size, mtime, and inode still match. With ``MMO_METADATA_CACHE_PERSIST``
+    that also holds across runs, so rescans skip re-reading unchanged stems.
+    """
+    recorded = cached_metadata(path, _SHA256_NAMESPACE, _read_sha256)
+    return recorded["sha256"]
+
+
+def _read_sha256(path: Path) -> dict:
     digest = hashlib.sha256()
     try:
         with path.open("rb") as handle:
@@ -257,11 +466,42 @@ def sha256_file(path: Path) -> str:
                 digest.update(chunk)
     except OSError as exc:
         raise ValueError(f"Failed to read file '{path}': {exc}") from exc
-    return digest.hexdigest()
+    return {"sha256": digest.hexdigest()}
 
 
 def read_wav_metadata(path: Path) -> dict:
-    """Parse RIFF/WAVE headers and return basic WAV metadata."""
+    """Parse RIFF/WAVE (or RF64/BW64) headers and return basic WAV metadata."""
+    return cached_metadata(path, "wav", _read_wav_metadata_uncached)
+
+
+def _read_ds64_sizes(handle: BinaryIO, path: Path) -> dict[bytes, int]:
+    """Read the 64-bit sizes from the ``ds64`` chunk that opens an RF64 file."""
+    chunk_header = handle.read(8)
+    if len(chunk_header) != 8:
+        raise ValueError(f"Truncated ds64 chunk header in '{path}'")
+    chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+    if chunk_id != b"ds64" or chunk_size < 28:
+        raise ValueError(f"Missing ds64 chunk in RF64 file '{path}'")
+    payload = handle.read(chunk_size)
+    if len(payload) != chunk_size:
+        raise ValueError(f"Truncated ds64 chunk in '{path}'")
+    riff_size, data_size, _sample_count, table_length = struct.unpack(
+        "<QQQI", payload[:28]
+    )
+    sizes = {b"RIFF": riff_size, b"data": data_size}
+    # Optional table of other chunks whose size overflows 32 bits.
+    for index in range(table_length):
+        entry = payload[28 + 12 * index : 40 + 12 * index]
+        if len(entry) != 12:
+            raise ValueError(f"Truncated ds64 chunk table in '{path}'")
+        table_id, table_size = struct.unpack("<4sQ", entry)
+        sizes[table_id] = table_size
+    if chunk_size % 2 == 1:
+        handle.seek(1, io.SEEK_CUR)
+    return sizes
+
+
+def _read_wav_metadata_uncached(path: Path) -> dict:
     try:
         file_size = path.stat().st_size
     except OSError as exc:
@@ -277,16 +517,21 @@ def read_wav_metadata(path: Path) -> dict:
                 raise ValueError(f"Truncated RIFF header in '{path}'")
 
             riff_id, riff_size, wave_id = struct.unpack("<4sI4s", header)
-            if riff_id != b"RIFF":
+            if riff_id not in _WAV_FORM_IDS:
                 raise ValueError(f"Unsupported RIFF id {riff_id!r} in '{path}'")
             if wave_id != b"WAVE":
                 raise ValueError(f"Missing WAVE identifier in '{path}'")
+            ds64_sizes: dict[bytes, int] = {}
+            if riff_id in _RF64_FORM_IDS:
+                ds64_sizes = _read_ds64_sizes(handle, path)
+                riff_size = ds64_sizes[b"RIFF"]
             if riff_size + 8 > file_size:
                 raise ValueError(f"RIFF size exceeds file size in '{path}'")
 
             fmt_fields = None
             fmt_chunk = None
             data_bytes = None
+            data_offset = None
             raw_tags: list[RawTag] = []
             tag_warnings: list[str] = []
             info_tag_index = 0
@@ -299,6 +544,8 @@ def read_wav_metadata(path: Path) -> dict:
                     raise ValueError(f"Truncated chunk header in '{path}'")
 
                 chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+                if chunk_size == _RF64_SIZE_SENTINEL and chunk_id in ds64_sizes:
+                    chunk_size = ds64_sizes[chunk_id]
                 chunk_start = handle.tell()
                 chunk_end = chunk_start + chunk_size
 
@@ -317,6 +564,7 @@ def read_wav_metadata(path: Path) -> dict:
                     fmt_fields = struct.unpack("<HHIIHH", chunk_data[:16])
                 elif chunk_id == b"data":
                     data_bytes = chunk_size
+                    data_offset = chunk_start
                     handle.seek(chunk_size, io.SEEK_CUR)
                 elif chunk_id == b"LIST":
                     chunk_data = handle.read(chunk_size)
@@ -424,9 +672,219 @@ def read_wav_metadata(path: Path) -> dict:
         "num_frames": num_frames,
         "duration_s": duration_s,
         "data_bytes": data_bytes,
+        "data_offset": data_offset,
         "byte_rate": byte_rate,
         "block_align": block_align,
         "channel_mask": channel_mask,
         "fmt_chunk": fmt_chunk,
         "tags": tag_bag_to_mapping(canonicalize_tag_bag(raw_tags, tag_warnings)),
     }
+
+
+# AIFC compression types that are plain PCM or IEEE float. Each maps to
+# (sample_format, byte_order, fixed bits_per_sample or None, codec prefix).
+_AIFC_SAMPLE_LAYOUTS: dict[bytes, tuple[str, str, int | None, str]] = {
+    b"NONE": ("pcm", "big", None, "pcm_s{bits}be"),
+    b"twos": ("pcm", "big", None, "pcm_s{bits}be"),
+    b"sowt": ("pcm", "little", None, "pcm_s{bits}le"),
+    b"fl32": ("float", "big", 32, "pcm_f32be"),
+    b"FL32": ("float", "big", 32, "pcm_f32be"),
+    b"fl64": ("float", "big", 64, "pcm_f64be"),
+    b"FL64": ("float", "big", 64, "pcm_f64be"),
+}
+
+_AIFF_TEXT_CHUNK_IDS = frozenset({b"NAME", b"AUTH", b"(c) ", b"ANNO"})
+
+_KNOWN_AIFF_CHUNK_IDS = frozenset({
+    b"COMM",
+    b"SSND",
+    b"FVER",
+    b"MARK",
+    b"INST",
+    b"COMT",
+    b"APPL",
+    b"MIDI",
+    b"AESD",
+    b"ID3 ",
+    b"CHAN",
+    b"wave",
+    *_AIFF_TEXT_CHUNK_IDS,
+})
+
+
+def _ieee_extended_to_float(raw: bytes) -> float:
+    """Decode the 80-bit big-endian extended float used for AIFF sample rates."""
+    sign_exponent, mantissa = struct.unpack(">HQ", raw)
+    exponent = sign_exponent & 0x7FFF
+    if exponent == 0 and mantissa == 0:
+        return 0.0
+    if exponent == 0x7FFF:
+        raise ValueError("Non-finite AIFF sample rate")
+    value = math.ldexp(float(mantissa), exponent - 16383 - 63)
+    return -value if sign_exponent & 0x8000 else value
+
+
+def read_aiff_metadata(path: Path) -> dict:
+    """Parse FORM/AIFF or FORM/AIFC headers and return basic metadata.
+
+    Only uncompressed layouts (``NONE``, ``twos``, ``sowt``, ``fl32``,
+    ``fl64``) are accepted; other AIFC compression types raise
+    ``ValueError`` so callers can hand the file to ffprobe instead.
+    """
+    return cached_metadata(path, "aiff", _read_aiff_metadata_uncached)
+
+
+def _read_aiff_metadata_uncached(path: Path) -> dict:
+    try:
+        file_size = path.stat().st_size
+    except OSError as exc:
+        raise ValueError(f"Failed to stat file '{path}': {exc}") from exc
+
+    if file_size < 12:
+        raise ValueError(f"AIFF file too small to contain FORM header: '{path}'")
+
+    try:
+        with path.open("rb") as handle:
+            header = handle.read(12)
+            if len(header) != 12:
+                raise ValueError(f"Truncated FORM header in '{path}'")
+
+            form_id, form_size, form_type = struct.unpack(">4sI4s", header)
+            if form_id != b"FORM":
+                raise ValueError(f"Unsupported FORM id {form_id!r} in '{path}'")
+            if form_type not in (b"AIFF", b"AIFC"):
+                raise ValueError(f"Missing AIFF/AIFC identifier in '{path}'")
+            if form_size + 8 > file_size:
+                raise ValueError(f"FORM size exceeds file size in '{path}'")
+
+            comm_chunk = None
+            data_bytes = None
+            data_offset = None
+            raw_tags: list[RawTag] = []
+            tag_warnings: list[str] = []
+            text_tag_index = 0
+
+            while handle.tell() + 8 <= file_size:
+                chunk_header = handle.read(8)
+                if len(chunk_header) != 8:
+                    raise ValueError(f"Truncated chunk header in '{path}'")
+
+                chunk_id, chunk_size = struct.unpack(">4sI", chunk_header)
+                chunk_start = handle.tell()
+                chunk_end = chunk_start + chunk_size
+
+                if chunk_end > file_size:
+                    raise ValueError(
+                        f"Truncated chunk {chunk_id!r} (size {chunk_size}) in '{path}'"
+                    )
+
+                if chunk_id == b"COMM":
+                    chunk_data = handle.read(chunk_size)
+                    if len(chunk_data) != chunk_size:
+                        raise ValueError(f"Truncated COMM chunk in '{path}'")
+                    if chunk_size < 18:
+                        raise ValueError(f"COMM chunk too small in '{path}'")
+                    comm_chunk = chunk_data
+                elif chunk_id == b"SSND":
+                    if chunk_size < 8:
+                        raise ValueError(f"SSND chunk too small in '{path}'")
+                    ssnd_offset, _block_size = struct.unpack(">II", handle.read(8))
+                    if ssnd_offset > chunk_size - 8:
+                        raise ValueError(f"SSND offset exceeds chunk size in '{path}'")
+                    data_offset = chunk_start + 8 + ssnd_offset
+                    data_bytes = chunk_size - 8 - ssnd_offset
+                    handle.seek(chunk_end, io.SEEK_SET)
+                elif chunk_id in _AIFF_TEXT_CHUNK_IDS:
+                    chunk_data = handle.read(chunk_size)
+                    if len(chunk_data) != chunk_size:
+                        raise ValueError(f"Truncated {chunk_id!r} chunk in '{path}'")
+                    value = _decode_wav_text(chunk_data)
+                    if value:
+                        raw_tags.append(
+                            RawTag(
+                                source="format",
+                                container="aiff",
+                                scope="text",
+                                key=_chunk_id_text(chunk_id),
+                                value=value,
+                                index=text_tag_index,
+                            )
+                        )
+                        text_tag_index += 1
+                else:
+                    handle.seek(chunk_size, io.SEEK_CUR)
+                    if chunk_id not in _KNOWN_AIFF_CHUNK_IDS:
+                        tag_warnings.append(
+                            f"Unknown AIFF chunk '{_chunk_id_text(chunk_id)}' size={chunk_size}"
+                        )
+
+                if chunk_size % 2 == 1:
+                    if handle.tell() + 1 > file_size:
+                        # Some writers drop the final pad byte; the audio is
+                        # still complete, so stop instead of rejecting it.
+                        break
+                    handle.seek(1, io.SEEK_CUR)
+    except OSError as exc:
+        raise ValueError(f"Failed to read AIFF file '{path}': {exc}") from exc
+
+    if comm_chunk is None:
+        raise ValueError(f"Missing COMM chunk in '{path}'")
+    if data_bytes is None or data_offset is None:
+        raise ValueError(f"Missing SSND chunk in '{path}'")
+
+    channels, declared_frames, sample_size = struct.unpack(">hIh", comm_chunk[:8])
+    try:
+        sample_rate = _ieee_extended_to_float(comm_chunk[8:18])
+    except ValueError as exc:
+        raise ValueError(f"{exc} in '{path}'") from exc
+
+    compression_type = b"NONE"
+    if form_type == b"AIFC":
+        if len(comm_chunk) < 22:
+            raise ValueError(f"AIFC COMM chunk missing compression type in '{path}'")
+        compression_type = comm_chunk[18:22]
+    layout = _AIFC_SAMPLE_LAYOUTS.get(compression_type)
+    if layout is None:
+        raise ValueError(
+            f"Unsupported AIFC compression type '{_chunk_id_text(compression_type)}' in '{path}'"
+        )
+    sample_format, byte_order, fixed_bits, codec_template = layout
+
+    sample_rate_hz = int(round(sample_rate))
+    bits_per_sample = fixed_bits if fixed_bits is not None else sample_size
+    if channels <= 0:
+        raise ValueError(f"Invalid channel count {channels} in '{path}'")
+    if sample_rate_hz <= 0:
+        raise ValueError(f"Invalid sample rate {sample_rate} in '{path}'")
+    if bits_per_sample <= 0 or bits_per_sample > 64:
+        raise ValueError(f"Invalid bits per sample {bits_per_sample} in '{path}'")
+
+    # Sample sizes that are not byte multiples are stored left-justified in
+    # the next whole byte width, so full scale is set by the container.
+    container_bits = ((bits_per_sample + 7) // 8) * 8
+    block_align = (container_bits // 8) * channels
+    # Trust the SSND payload over COMM when a file was truncated mid-write.
+    num_frames = min(declared_frames, data_bytes // block_align)
+    duration_s = num_frames / sample_rate_hz
+    codec_name = codec_template.format(bits=container_bits)
+    if sample_format == "pcm" and container_bits == 8:
+        codec_name = "pcm_s8"
+
+    return {
+        "container": "aifc" if form_type == b"AIFC" else "aiff",
+        "compression_type": _chunk_id_text(compression_type),
+        "sample_format": sample_format,
+        "byte_order": byte_order,
+        "codec_name": codec_name,
+        "channels": channels,
+        "sample_rate_hz": sample_rate_hz,
+        "bits_per_sample": bits_per_sample,
+        "container_bits_per_sample": container_bits,
+        "num_frames": num_frames,
+        "duration_s": duration_s,
+        "data_bytes": num_frames * block_align,
+        "data_offset": data_offset,
+        "byte_rate": sample_rate_hz * block_align,
+        "block_align": block_align,
+        "tags": tag_bag_to_mapping(canonicalize_tag_bag(raw_tags, tag_warnings)),
+    }
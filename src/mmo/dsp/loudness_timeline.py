@@ -0,0 +1,150 @@
+"""Time-indexed momentary and short-term loudness series.
+
+A ``LoudnessTimeline`` is a side output of an integrated-loudness pass
+(``OnlineLufsIntegrated(..., timeline=True)``): momentary (400 ms) and
+short-term (3 s) loudness every 100 ms, kept as float32 arrays. It can be
+stored beside a report or render output so downstream tools query the
+series instead of re-metering the audio.
+
+Value ``i`` of a series belongs to the window covering frames
+``[i * hop_frames, i * hop_frames + block_frames)`` and is timestamped at
+the window end. Silent windows read ``-inf``.
+
+Render QA writes ``<output>.loudness_timeline.npz`` sidecars when
+``MMO_LOUDNESS_TIMELINE`` is set; they are keyed by the output's sha256.
+``load_loudness_timeline`` is the reader for tools that consume them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+from pathlib import Path
+from typing import Any
+import uuid
+import zipfile
+
+LOUDNESS_TIMELINE_ENV = "MMO_LOUDNESS_TIMELINE"
+MOMENTARY_WINDOW_S = 0.4
+SHORTTERM_WINDOW_S = 3.0
+TIMELINE_HOP_S = 0.1
+
+_TIMELINE_SUFFIX = ".loudness_timeline.npz"
+_TIMELINE_FORMAT_VERSION = 1
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+@dataclass(frozen=True)
+class LoudnessTimeline:
+    sample_rate_hz: int
+    hop_frames: int
+    momentary_block_frames: int
+    shortterm_block_frames: int
+    momentary_lufs: Any
+    shortterm_lufs: Any
+    method_id: str | None = None
+    source_sha256: str | None = None
+
+    @property
+    def hop_s(self) -> float:
+        return self.hop_frames / float(self.sample_rate_hz)
+
+    def _window(
+        self,
+        values: Any,
+        block_frames: int,
+        start_s: float | None,
+        end_s: float | None,
+    ) -> tuple[Any, Any]:
+        import numpy as np
+
+        times = (
+            np.arange(values.shape[0], dtype=np.float64) * self.hop_frames + block_frames
+        ) / float(self.sample_rate_hz)
+        first = 0 if start_s is None else int(np.searchsorted(times, start_s, side="left"))
+        last = values.shape[0] if end_s is None else int(np.searchsorted(times, end_s, side="left"))
+        return times[first:last], values[first:last]
+
+    def momentary(
+        self, start_s: float | None = None, end_s: float | None = None
+    ) -> tuple[Any, Any]:
+        """Return ``(times_s, lufs)`` for momentary windows ending in ``[start_s, end_s)``."""
+        return self._window(
+            self.momentary_lufs, self.momentary_block_frames, start_s, end_s
+        )
+
+    def shortterm(
+        self, start_s: float | None = None, end_s: float | None = None
+    ) -> tuple[Any, Any]:
+        """Return ``(times_s, lufs)`` for short-term windows ending in ``[start_s, end_s)``."""
+        return self._window(
+            self.shortterm_lufs, self.shortterm_block_frames, start_s, end_s
+        )
+
+
+def loudness_timeline_sidecars_enabled() -> bool:
+    return os.environ.get(LOUDNESS_TIMELINE_ENV, "").strip().lower() in _TRUE_VALUES
+
+
+def loudness_timeline_path(artifact_path: Path) -> Path:
+    """Return the sidecar path that stores the timeline of ``artifact_path``."""
+    artifact_path = Path(artifact_path)
+    return artifact_path.with_name(f"{artifact_path.name}{_TIMELINE_SUFFIX}")
+
+
+def save_loudness_timeline(timeline: LoudnessTimeline, path: Path) -> Path:
+    """Write ``timeline`` to ``path`` atomically and return ``path``."""
+    import numpy as np
+
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    try:
+        with tmp_path.open("wb") as handle:
+            np.savez(
+                handle,
+                format_version=np.int64(_TIMELINE_FORMAT_VERSION),
+                sample_rate_hz=np.int64(timeline.sample_rate_hz),
+                hop_frames=np.int64(timeline.hop_frames),
+                momentary_block_frames=np.int64(timeline.momentary_block_frames),
+                shortterm_block_frames=np.int64(timeline.shortterm_block_frames),
+                momentary_lufs=np.asarray(timeline.momentary_lufs, dtype=np.float32),
+                shortterm_lufs=np.asarray(timeline.shortterm_lufs, dtype=np.float32),
+                method_id=np.str_(timeline.method_id or ""),
+                source_sha256=np.str_((timeline.source_sha256 or "").lower()),
+            )
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return path
+
+
+def load_loudness_timeline(
+    path: Path, *, source_sha256: str | None = None
+) -> LoudnessTimeline | None:
+    """Read a stored timeline, or return None when absent, unreadable, or stale.
+
+    With ``source_sha256`` the stored digest must match, so a timeline for an
+    overwritten render is never served.
+    """
+    import numpy as np
+
+    try:
+        with np.load(Path(path), allow_pickle=False) as data:
+            if int(data["format_version"]) != _TIMELINE_FORMAT_VERSION:
+                return None
+            stored_sha256 = str(data["source_sha256"]) or None
+            if source_sha256 is not None and stored_sha256 != source_sha256.lower():
+                return None
+            return LoudnessTimeline(
+                sample_rate_hz=int(data["sample_rate_hz"]),
+                hop_frames=int(data["hop_frames"]),
+                momentary_block_frames=int(data["momentary_block_frames"]),
+                shortterm_block_frames=int(data["shortterm_block_frames"]),
+                momentary_lufs=np.asarray(data["momentary_lufs"], dtype=np.float32),
+                shortterm_lufs=np.asarray(data["shortterm_lufs"], dtype=np.float32),
+                method_id=str(data["method_id"]) or None,
+                source_sha256=stored_sha256,
+            )
+    except (OSError, EOFError, ValueError, KeyError, TypeError, zipfile.BadZipFile):
+        return None
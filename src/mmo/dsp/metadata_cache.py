@@ -0,0 +1,289 @@
+"""Process-wide cache of parsed audio-file metadata.
+
+Stems index, scan, classification, render preflight, and render QA all ask
+for the same headers again; for non-WAV files every ask is an ffprobe
+subprocess. ``cached_metadata`` memoizes a reader per file, keyed by
+``(resolved path, size, mtime_ns, inode)``, so any rewrite of the file is a
+miss and never a stale hit.
+
+The in-process cache is on by default (``MMO_METADATA_CACHE=0`` turns it
+off). ``MMO_METADATA_CACHE_PERSIST=1`` also keeps entries as JSON under
+``<cache dir>/audio_metadata`` so watch-folder rescans and later CLI runs
+skip the header walk too. Entries are only dropped by
+``invalidate_metadata_cache``; a changed stat key simply replaces them.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from mmo.resources import default_cache_dir
+
+METADATA_CACHE_ENV = "MMO_METADATA_CACHE"
+METADATA_CACHE_PERSIST_ENV = "MMO_METADATA_CACHE_PERSIST"
+
+_CACHE_SUBDIR = "audio_metadata"
+_CACHE_FORMAT_VERSION = 1
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+_STAT_KEYS = ("hits", "misses", "persistent_hits", "invalidations")
+_BYTES_KEY = "$bytes"
+
+_LOCK = threading.Lock()
+_ENTRIES: dict[tuple[str, str], tuple[tuple[int, int, int], dict[str, Any]]] = {}
+_STATS: dict[str, int] = {key: 0 for key in _STAT_KEYS}
+
+
+def metadata_cache_enabled() -> bool:
+    return os.environ.get(METADATA_CACHE_ENV, "").strip().lower() not in _FALSE_VALUES
+
+
+def metadata_cache_persistent() -> bool:
+    return os.environ.get(METADATA_CACHE_PERSIST_ENV, "").strip().lower() in _TRUE_VALUES
+
+
+def file_identity(path: Path) -> tuple[str, int, int, int]:
+    """Return ``(resolved posix path, size, mtime_ns, inode)`` for ``path``."""
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return resolved.as_posix(), stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+def metadata_cache_dir() -> Path:
+    """Return the directory that holds persistent metadata entries."""
+    return default_cache_dir() / _CACHE_SUBDIR
+
+
+def _persistent_root() -> Path:
+    return metadata_cache_dir()
+
+
+def _path_token(resolved_path: str) -> str:
+    return hashlib.sha256(resolved_path.encode("utf-8")).hexdigest()[:32]
+
+
+def _namespace_token(namespace: str) -> str:
+    return hashlib.sha256(namespace.encode("utf-8")).hexdigest()[:12]
+
+
+def _persistent_path(namespace: str, resolved_path: str) -> Path:
+    return _persistent_root() / (
+        f"{_path_token(resolved_path)}.{_namespace_token(namespace)}.json"
+    )
+
+
+def _encode(value: Any) -> Any:
+    # Header parsers return raw chunk bytes (``fmt_chunk``); JSON keeps them as hex.
+    if isinstance(value, bytes):
+        return {_BYTES_KEY: value.hex()}
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        if set(value) == {_BYTES_KEY}:
+            return bytes.fromhex(value[_BYTES_KEY])
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+def _load_persistent(namespace: str, identity: tuple[str, int, int, int]) -> dict | None:
+    try:
+        payload = json.loads(
+            _persistent_path(namespace, identity[0]).read_text(encoding="utf-8")
+        )
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if (
+        payload.get("format_version") != _CACHE_FORMAT_VERSION
+        or payload.get("namespace") != namespace
+        or payload.get("path") != identity[0]
+        or [payload.get("size"), payload.get("mtime_ns"), payload.get("inode")]
+        != list(identity[1:])
+    ):
+        return None
+    metadata = payload.get("metadata")
+    if not isinstance(metadata, dict):
+        return None
+    try:
+        return _decode(metadata)
+    except (TypeError, ValueError):
+        return None
+
+
+def _store_persistent(
+    namespace: str,
+    identity: tuple[str, int, int, int],
+    metadata: dict,
+) -> None:
+    target = _persistent_path(namespace, identity[0])
+    payload = {
+        "format_version": _CACHE_FORMAT_VERSION,
+        "inode": identity[3],
+        "metadata": _encode(metadata),
+        "mtime_ns": identity[2],
+        "namespace": namespace,
+        "path": identity[0],
+        "size": identity[1],
+    }
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(payload, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp_path, target)
+    except (OSError, TypeError, ValueError):
+        # An unwritable cache dir must never fail a metadata read.
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def cached_metadata(
+    path: Path,
+    namespace: str,
+    read: Callable[[Path], dict],
+) -> dict:
+    """Return ``read(path)``, reusing an earlier result for an unchanged file.
+
+    ``namespace`` separates readers (and reader configurations) that return
+    different shapes for the same file. Callers always get their own deep
+    copy, so mutating the result never leaks into later reads. Reader errors
+    are not cached.
+    """
+    if not metadata_cache_enabled():
+        return read(path)
+    try:
+        identity = file_identity(path)
+    except (OSError, RuntimeError):
+        # Let the reader raise its own, caller-facing error.
+        return read(path)
+
+    key = (namespace, identity[0])
+    with _LOCK:
+        entry = _ENTRIES.get(key)
+        if entry is not None and entry[0] == identity[1:]:
+            _STATS["hits"] += 1
+            return copy.deepcopy(entry[1])
+
+    persistent = metadata_cache_persistent()
+    metadata = _load_persistent(namespace, identity) if persistent else None
+    if metadata is not None:
+        stat_key = "persistent_hits"
+    else:
+        metadata = read(path)
+        stat_key = "misses"
+        if persistent:
+            _store_persistent(namespace, identity, metadata)
+
+    with _LOCK:
+        _STATS[stat_key] += 1
+        _ENTRIES[key] = (identity[1:], copy.deepcopy(metadata))
+    return metadata
+
+
+def lookup_metadata(path: Path, namespace: str) -> dict | None:
+    """Return metadata stored for the unchanged ``path``, or None.
+
+    Unlike ``cached_metadata`` this never reads the file; it serves values
+    that a writer recorded with ``store_metadata``.
+    """
+    if not metadata_cache_enabled():
+        return None
+    try:
+        identity = file_identity(path)
+    except (OSError, RuntimeError):
+        return None
+
+    key = (namespace, identity[0])
+    with _LOCK:
+        entry = _ENTRIES.get(key)
+        if entry is not None and entry[0] == identity[1:]:
+            _STATS["hits"] += 1
+            return copy.deepcopy(entry[1])
+
+    if not metadata_cache_persistent():
+        return None
+    metadata = _load_persistent(namespace, identity)
+    if metadata is None:
+        return None
+    with _LOCK:
+        _STATS["persistent_hits"] += 1
+        _ENTRIES[key] = (identity[1:], copy.deepcopy(metadata))
+    return metadata
+
+
+def store_metadata(path: Path, namespace: str, metadata: dict) -> None:
+    """Record ``metadata`` for ``path`` as it exists on disk right now."""
+    if not metadata_cache_enabled():
+        return
+    try:
+        identity = file_identity(path)
+    except (OSError, RuntimeError):
+        return
+    if metadata_cache_persistent():
+        _store_persistent(namespace, identity, metadata)
+    with _LOCK:
+        _ENTRIES[(namespace, identity[0])] = (identity[1:], copy.deepcopy(metadata))
+
+
+def invalidate_metadata_cache(path: Path | None = None) -> int:
+    """Drop cached metadata for ``path`` (every reader), or for all files.
+
+    Persistent entries are removed as well. Returns how many in-process
+    entries were dropped.
+    """
+    if path is None:
+        with _LOCK:
+            dropped = len(_ENTRIES)
+            _ENTRIES.clear()
+            _STATS["invalidations"] += dropped
+        pattern = "*.json"
+    else:
+        try:
+            resolved = Path(path).resolve().as_posix()
+        except (OSError, RuntimeError):
+            resolved = Path(path).as_posix()
+        with _LOCK:
+            stale = [key for key in _ENTRIES if key[1] == resolved]
+            for key in stale:
+                del _ENTRIES[key]
+            dropped = len(stale)
+            _STATS["invalidations"] += dropped
+        pattern = f"{_path_token(resolved)}.*.json"
+
+    try:
+        stale_files = sorted(_persistent_root().glob(pattern))
+    except OSError:
+        stale_files = []
+    for stale_file in stale_files:
+        try:
+            stale_file.unlink()
+        except OSError:
+            pass
+    return dropped
+
+
+def metadata_cache_stats() -> dict[str, Any]:
+    """Return this process's metadata-cache counters and hit rate."""
+    with _LOCK:
+        stats: dict[str, Any] = dict(_STATS)
+        stats["entries"] = len(_ENTRIES)
+    lookups = stats["hits"] + stats["persistent_hits"] + stats["misses"]
+    hit_count = stats["hits"] + stats["persistent_hits"]
+    stats["hit_rate"] = round(hit_count / lookups, 6) if lookups else 0.0
+    return stats
@@ -0,0 +1,192 @@
+"""Single-pass per-stem metering.
+
+``MeterBank`` takes decoded chunks once and feeds every enabled meter from
+the same buffer, so a stem is read and decoded a single time no matter how
+many meters a scan asks for.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+from mmo.core.loudness_methods import DEFAULT_LOUDNESS_METHOD_ID
+from mmo.dsp.correlation import CorrelationMatrixAccumulator
+from mmo.dsp.meters import BasicStatsAccumulator
+
+_STEREO_PAIR = "STEREO"
+# Inter-sample overs are true-peak samples above digital full scale.
+OVER_CEILING_DBTP = 0.0
+
+
+@dataclass(frozen=True)
+class MeterBankResult:
+    peak: float | None = None
+    clip_count: int | None = None
+    dc_offset: float | None = None
+    rms_dbfs: float | None = None
+    crest_factor_db: float | None = None
+    stereo_correlation: float | None = None
+    pair_correlations: Dict[str, float] | None = None
+    true_peak_dbtp: float | None = None
+    lufs_i: float | None = None
+    lufs_s: float | None = None
+    clip_events: Any | None = None
+    over_events: Any | None = None
+    mono: Any | None = None
+    mix_features: Any | None = None
+    truth_error: str | None = None
+
+
+class MeterBank:
+    """Feed one decode to basic, correlation, truth, and spectral-input meters.
+
+    ``update`` takes ``(frames, channels)`` float64 ndarrays.
+    ``mix_features=True`` keeps only the compact per-window features
+    (``mmo.meters.mix_features``) instead of the whole downmix.
+    ``event_index=True`` also returns bounded clip and true-peak over event
+    indexes from the same masks that produce the counts.
+
+    A ValueError from a truth meter (for example a channel layout the
+    loudness weighting rejects) drops only the truth meters: the other
+    meters keep running and ``truth_error`` in the result says why.
+    """
+
+    def __init__(
+        self,
+        sample_rate_hz: int,
+        channels: int,
+        *,
+        basic: bool = True,
+        stereo_correlation: bool = False,
+        correlation_pairs: Dict[str, tuple[int, int]] | None = None,
+        truth: bool = False,
+        event_index: bool = False,
+        mono_downmix: bool = False,
+        mix_features: bool = False,
+        channel_mask: int | None = None,
+        channel_layout: str | None = None,
+        method_id: str | None = DEFAULT_LOUDNESS_METHOD_ID,
+    ) -> None:
+        if channels <= 0:
+            raise ValueError("channels must be positive")
+        self.sample_rate_hz = int(sample_rate_hz)
+        self.channels = channels
+        self._event_index = event_index
+        self._basic: BasicStatsAccumulator | None = None
+        if basic:
+            self._basic = BasicStatsAccumulator(
+                clip_event_channels=channels if event_index else None
+            )
+        self._stereo_pair = (
+            {_STEREO_PAIR: (0, 1)} if stereo_correlation and channels == 2 else None
+        )
+        self._pairs = dict(correlation_pairs) if correlation_pairs else None
+        # The stereo and requested pairs all come from one channel-matrix
+        # accumulation.
+        self._correlation: CorrelationMatrixAccumulator | None = None
+        if self._stereo_pair is not None or self._pairs is not None:
+            self._correlation = CorrelationMatrixAccumulator(channels)
+        self._lufs = None
+        self._true_peak = None
+        self._truth_error: str | None = None
+        if truth:
+            from mmo.dsp.meters_truth import (  # noqa: WPS433
+                OnlineLufsIntegrated,
+                TruePeakOversampler,
+            )
+
+            try:
+                self._lufs = OnlineLufsIntegrated(
+                    self.sample_rate_hz,
+                    channels,
+                    channel_mask,
+                    channel_layout,
+                    method_id=method_id,
+                    include_shortterm=True,
+                )
+                self._true_peak = TruePeakOversampler(
+                    self.sample_rate_hz,
+                    channels,
+                    ceiling_dbtp=OVER_CEILING_DBTP if event_index else None,
+                )
+            except ValueError as exc:
+                self._drop_truth(exc)
+        self._mono_blocks: list[Any] | None = [] if mono_downmix else None
+        self._mix_features = None
+        if mix_features:
+            from mmo.meters.mix_features import MixFeatureAccumulator  # noqa: WPS433
+
+            self._mix_features = MixFeatureAccumulator(self.sample_rate_hz)
+
+    def _drop_truth(self, exc: ValueError) -> None:
+        self._lufs = None
+        self._true_peak = None
+        self._truth_error = str(exc) or type(exc).__name__
+
+    def update(self, frames: Any) -> None:
+        if frames.size == 0:
+            return
+        if frames.ndim != 2 or frames.shape[1] != self.channels:
+            raise ValueError("chunk_frames channel count mismatch")
+        if self._basic is not None:
+            self._basic.update(frames)
+        if self._correlation is not None:
+            self._correlation.update(frames)
+        if self._lufs is not None and self._true_peak is not None:
+            try:
+                self._lufs.update(frames)
+                self._true_peak.update(frames)
+            except ValueError as exc:
+                self._drop_truth(exc)
+        if self._mono_blocks is not None or self._mix_features is not None:
+            mono = frames.sum(axis=1) * (1.0 / float(self.channels))
+            if self._mono_blocks is not None:
+                self._mono_blocks.append(mono)
+            if self._mix_features is not None:
+                self._mix_features.update(mono)
+
+    def result(self) -> MeterBankResult:
+        values: Dict[str, Any] = {}
+        if self._basic is not None:
+            (
+                values["peak"],
+                values["clip_count"],
+                values["dc_offset"],
+                values["rms_dbfs"],
+                values["crest_factor_db"],
+            ) = self._basic.finalize()
+            if self._event_index:
+                values["clip_events"] = self._basic.clip_events()
+        if self._correlation is not None:
+            if self._stereo_pair is not None:
+                values["stereo_correlation"] = self._correlation.correlations(
+                    self._stereo_pair
+                )[_STEREO_PAIR]
+            if self._pairs is not None:
+                values["pair_correlations"] = self._correlation.correlations(self._pairs)
+        if self._lufs is not None and self._true_peak is not None:
+            try:
+                true_peak = self._true_peak.finalize()
+                truth_values = {
+                    "true_peak_dbtp": true_peak.max_dbtp,
+                    "over_events": true_peak.over_events,
+                    "lufs_i": self._lufs.finalize(),
+                    "lufs_s": self._lufs.finalize_shortterm(),
+                }
+            except ValueError as exc:
+                self._drop_truth(exc)
+            else:
+                values.update(truth_values)
+        values["truth_error"] = self._truth_error
+        if self._mono_blocks is not None:
+            import numpy as np  # noqa: WPS433
+
+            values["mono"] = (
+                np.concatenate(self._mono_blocks)
+                if self._mono_blocks
+                else np.zeros(0, dtype=np.float64)
+            )
+        if self._mix_features is not None:
+            values["mix_features"] = self._mix_features.finalize()
+        return MeterBankResult(**values)
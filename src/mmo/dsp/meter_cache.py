@@ -0,0 +1,268 @@
+"""Opt-in on-disk cache of per-stem meter outputs.
+
+A scan meters every stem on every run, even when only one stem changed or
+one meter option was toggled. When ``MMO_METER_CACHE`` is set, the outputs
+of each meter for each stem are kept in ``<cache dir>/meter_results`` as a
+JSON payload (plus an ``.npz`` for array outputs such as the mono downmix),
+so a later scan only meters the stems and meters that are missing.
+
+Entries are keyed by the source content sha256 (the digest recorded in
+lockfiles and sessions), the meter id, the meter method/version string, and
+a digest of the options that affect the meter's output. The directory is
+size-capped with least-recently-used eviction; a hit refreshes the entry's
+mtime.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import uuid
+import zipfile
+from pathlib import Path
+from typing import Any, Mapping
+
+from mmo.resources import default_cache_dir
+
+METER_CACHE_ENV = "MMO_METER_CACHE"
+METER_CACHE_MAX_MB_ENV = "MMO_METER_CACHE_MAX_MB"
+DEFAULT_METER_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+_CACHE_SUBDIR = "meter_results"
+_CACHE_FORMAT_VERSION = 1
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_STAT_KEYS = ("hits", "misses", "stores", "evictions")
+
+_STATS: dict[str, int] = {key: 0 for key in _STAT_KEYS}
+
+
+def meter_cache_stats() -> dict[str, int]:
+    """Return this process's cumulative meter-cache counters."""
+    return dict(_STATS)
+
+
+def meter_cache_stats_since(before: Mapping[str, int]) -> dict[str, int]:
+    """Return counters accumulated since an earlier ``meter_cache_stats()``."""
+    return {key: _STATS[key] - int(before.get(key, 0)) for key in _STAT_KEYS}
+
+
+def _bump(key: str) -> None:
+    _STATS[key] += 1
+
+
+def _options_digest(meter_version: str, options: Mapping[str, Any]) -> str:
+    canonical = json.dumps(
+        {
+            "format_version": _CACHE_FORMAT_VERSION,
+            "meter_version": meter_version,
+            "options": dict(options),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+class MeterCache:
+    """Size-capped store of per-stem meter payloads."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_bytes: int = DEFAULT_METER_CACHE_MAX_BYTES,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+
+    def entry_key(
+        self,
+        source_sha256: str,
+        meter_id: str,
+        meter_version: str,
+        options: Mapping[str, Any],
+    ) -> str:
+        digest = _options_digest(meter_version, options)
+        return f"{source_sha256.lower()}.{meter_id}.{digest}"
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.root / f"{key}.json", self.root / f"{key}.npz"
+
+    def load(
+        self,
+        source_sha256: str,
+        meter_id: str,
+        meter_version: str,
+        options: Mapping[str, Any],
+    ) -> dict[str, Any] | None:
+        """Return the stored payload, with array outputs restored, or None."""
+        key = self.entry_key(source_sha256, meter_id, meter_version, options)
+        meta_path, arrays_path = self._paths(key)
+        try:
+            sidecar = json.loads(meta_path.read_text(encoding="utf-8"))
+            payload = dict(sidecar["payload"])
+            array_names = list(sidecar.get("arrays", []))
+        except (OSError, ValueError, KeyError, TypeError):
+            _bump("misses")
+            return None
+        if array_names:
+            import numpy as np
+
+            try:
+                with np.load(arrays_path, allow_pickle=False) as stored:
+                    for name in array_names:
+                        payload[name] = np.array(stored[name])
+            except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+                # A torn or foreign entry is treated as absent and overwritten.
+                _bump("misses")
+                return None
+
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+        _bump("hits")
+        return payload
+
+    def store(
+        self,
+        source_sha256: str,
+        meter_id: str,
+        meter_version: str,
+        options: Mapping[str, Any],
+        payload: Mapping[str, Any],
+    ) -> bool:
+        """Store ``payload``; ndarray values go to the ``.npz`` beside the JSON.
+
+        The JSON sidecar is written last, so a reader never sees an entry
+        whose arrays are still being written. Write failures are swallowed:
+        an unwritable cache dir must never fail a scan.
+        """
+        key = self.entry_key(source_sha256, meter_id, meter_version, options)
+        meta_path, arrays_path = self._paths(key)
+        arrays = {name: value for name, value in payload.items() if hasattr(value, "dtype")}
+        scalars = {name: value for name, value in payload.items() if name not in arrays}
+        sidecar = {
+            "arrays": sorted(arrays),
+            "format_version": _CACHE_FORMAT_VERSION,
+            "meter_id": meter_id,
+            "meter_version": meter_version,
+            "options": dict(options),
+            "payload": scalars,
+            "source_sha256": source_sha256.lower(),
+        }
+        try:
+            text = json.dumps(sidecar, indent=2, sort_keys=True) + "\n"
+        except (TypeError, ValueError):
+            return False
+
+        suffix = f".{os.getpid()}.{uuid.uuid4().hex}.tmp"
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            if arrays:
+                import numpy as np
+
+                tmp_arrays = arrays_path.with_name(f"{arrays_path.name}{suffix}")
+                with tmp_arrays.open("wb") as handle:
+                    np.savez(handle, **arrays)
+                os.replace(tmp_arrays, arrays_path)
+            tmp_meta = meta_path.with_name(f"{meta_path.name}{suffix}")
+            tmp_meta.write_text(text, encoding="utf-8")
+            os.replace(tmp_meta, meta_path)
+        except OSError:
+            return False
+        _bump("stores")
+        self.evict(keep=key)
+        return True
+
+    def evict(self, *, keep: str | None = None) -> int:
+        """Delete least-recently-used entries until the cache fits ``max_bytes``."""
+        entries: list[tuple[int, str, int]] = []
+        try:
+            meta_paths = sorted(self.root.glob("*.json"))
+        except OSError:
+            return 0
+        for meta_path in meta_paths:
+            key = meta_path.name[: -len(".json")]
+            _, arrays_path = self._paths(key)
+            try:
+                stat = meta_path.stat()
+            except OSError:
+                continue
+            size = stat.st_size
+            try:
+                size += arrays_path.stat().st_size
+            except OSError:
+                pass
+            entries.append((stat.st_mtime_ns, key, size))
+
+        total_bytes = sum(size for _, _, size in entries)
+        evicted = 0
+        for _, key, size in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            for path in self._paths(key):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            total_bytes -= size
+            evicted += 1
+            _bump("evictions")
+        return evicted
+
+
+def meter_cache_enabled() -> bool:
+    return os.environ.get(METER_CACHE_ENV, "").strip().lower() in _TRUE_VALUES
+
+
+def active_meter_cache() -> MeterCache | None:
+    """Return the env-configured cache, or None when it is off."""
+    if not meter_cache_enabled():
+        return None
+    return open_meter_cache()
+
+
+def open_meter_cache() -> MeterCache:
+    """Return the cache under ``<cache dir>/meter_results`` even when it is off.
+
+    Incremental rescans use it for the mix-complexity features that reports
+    do not carry.
+    """
+    max_bytes = DEFAULT_METER_CACHE_MAX_BYTES
+    raw_max_mb = os.environ.get(METER_CACHE_MAX_MB_ENV, "").strip()
+    if raw_max_mb:
+        try:
+            max_mb = int(raw_max_mb)
+        except ValueError:
+            max_mb = 0
+        if max_mb > 0:
+            max_bytes = max_mb * 1024 * 1024
+    return MeterCache(default_cache_dir() / _CACHE_SUBDIR, max_bytes=max_bytes)
+
+
+def build_meter_cache_receipt(
+    before: Mapping[str, int],
+    *,
+    stems: list[dict[str, Any]] | None = None,
+) -> dict[str, Any] | None:
+    """Return hit/miss counts since ``before`` for receipts, or None when disabled.
+
+    ``stems`` carries per-stem provenance: which meter ids were served from
+    the cache and which were computed in this run.
+    """
+    cache = active_meter_cache()
+    if cache is None:
+        return None
+    receipt: dict[str, Any] = {
+        "enabled": True,
+        "max_bytes": cache.max_bytes,
+    }
+    receipt.update(meter_cache_stats_since(before))
+    receipt["stems"] = list(stems or [])
+    return receipt
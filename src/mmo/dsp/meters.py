@@ -1,32 +1,18 @@
 from __future__ import annotations
 
 import math
-import wave
 from pathlib import Path
-from typing import Iterator
+from typing import Any, Iterator
 
-from mmo.dsp.float64 import (
-    bytes_to_float_samples_ieee,
-    bytes_to_int_samples_pcm,
-    interleaved_to_mono_peak,
-    pcm_int_to_float64,
-)
-from mmo.dsp.io import read_wav_metadata
+from mmo.dsp.event_index import DEFAULT_MAX_EVENTS, EventIndex, EventRunIndex
+from mmo.dsp.io import read_aiff_metadata, read_wav_metadata
 
 _EPSILON = 1e-12
 _CHUNK_FRAMES = 4096
+_STATS_BLOCK_SAMPLES = 65536
 
 
-def iter_wav_float64_samples(
-    path: Path, *, error_context: str
-) -> Iterator[list[float]]:
-    return _iter_wav_float64_samples(path, error_context=error_context)
-
-
-def _iter_wav_float64_samples(
-    path: Path, *, error_context: str
-) -> Iterator[list[float]]:
-    metadata = read_wav_metadata(path)
+def _validated_wav_format(metadata: dict) -> tuple[int, int, int]:
     audio_format = metadata["audio_format_resolved"]
     bits_per_sample = metadata["bits_per_sample"]
     channels = metadata["channels"]
@@ -39,40 +25,212 @@ def _iter_wav_float64_samples(
             raise ValueError(f"Unsupported bits per sample: {bits_per_sample}")
     else:
         raise ValueError(f"Unsupported WAV format: {audio_format}")
+    return audio_format, bits_per_sample, channels
+
+
+def iter_wav_float64_samples(
+    path: Path, *, error_context: str
+) -> Iterator[list[float]]:
+    return _iter_wav_float64_samples(path, error_context=error_context)
+
+
+def iter_wav_frames_ndarray(
+    path: Path,
+    *,
+    error_context: str,
+    chunk_frames: int = _CHUNK_FRAMES,
+    dtype: str = "float64",
+) -> Iterator[Any]:
+    """Yield ``(frames, channels)`` float ndarrays decoded from a WAV file.
+
+    Sample values and clamping match ``iter_wav_float64_samples``; only the
+    container type differs. Requires numpy.
+    """
+    from mmo.dsp.float64 import ieee_bytes_to_ndarray, pcm_bytes_to_ndarray
+
+    if chunk_frames <= 0:
+        raise ValueError("chunk_frames must be positive")
+    metadata = read_wav_metadata(path)
+    audio_format, bits_per_sample, channels = _validated_wav_format(metadata)
+    convert = pcm_bytes_to_ndarray if audio_format == 1 else ieee_bytes_to_ndarray
+
+    for frames in _iter_wav_sample_bytes(
+        path, metadata, error_context=error_context, chunk_frames=chunk_frames
+    ):
+        block = convert(frames, bits_per_sample, channels, dtype=dtype)
+        if block.shape[0] == 0:
+            continue
+        yield block
+
+
+def _iter_wav_sample_bytes(
+    path: Path, metadata: dict, *, error_context: str, chunk_frames: int
+) -> Iterator[bytes]:
+    # Reads the ``data`` payload located by ``read_wav_metadata`` directly, so
+    # RF64/BW64 masters, WAVE_FORMAT_EXTENSIBLE, and IEEE float files decode
+    # the same way as plain RIFF PCM.
+    frame_bytes = int(metadata["channels"]) * (int(metadata["bits_per_sample"]) // 8)
+    data_bytes = int(metadata["data_bytes"])
+    yield from _iter_data_chunk_bytes(
+        path,
+        data_offset=int(metadata["data_offset"]),
+        data_bytes=data_bytes - data_bytes % frame_bytes,
+        read_size=chunk_frames * frame_bytes,
+        error_message=f"Failed to read WAV for {error_context}: {path}",
+    )
+
+
+def _frame_range_bytes(
+    data_offset: int,
+    data_bytes: int,
+    frame_bytes: int,
+    *,
+    start_frame: int,
+    frame_count: int | None,
+) -> tuple[int, int]:
+    """Narrow a frame-aligned payload to ``frame_count`` frames from ``start_frame``."""
+    if start_frame < 0:
+        raise ValueError("start_frame must not be negative")
+    skip = min(data_bytes, start_frame * frame_bytes)
+    remaining = data_bytes - skip
+    if frame_count is not None:
+        remaining = min(remaining, max(0, frame_count) * frame_bytes)
+    return data_offset + skip, remaining
+
+
+def _iter_wav_float64_samples(
+    path: Path, *, error_context: str
+) -> Iterator[list[float]]:
+    for block in iter_wav_frames_ndarray(path, error_context=error_context):
+        yield block.ravel().tolist()
 
+
+def validate_aiff_format(metadata: dict) -> tuple[str, int, int, str]:
+    """Return ``(sample_format, container_bits, channels, byteorder)`` for native decode.
+
+    Raises ValueError for layouts the AIFF block decoder cannot read, such as
+    compressed AIFC or 8-bit PCM.
+    """
+    sample_format = metadata["sample_format"]
+    container_bits = metadata["container_bits_per_sample"]
+    channels = metadata["channels"]
+
+    if sample_format == "pcm":
+        if container_bits not in (16, 24, 32):
+            raise ValueError(f"Unsupported bits per sample: {metadata['bits_per_sample']}")
+    elif sample_format == "float":
+        if container_bits not in (32, 64):
+            raise ValueError(f"Unsupported bits per sample: {metadata['bits_per_sample']}")
+    else:
+        raise ValueError(f"Unsupported AIFF sample format: {sample_format}")
+    byteorder = ">" if metadata["byte_order"] == "big" else "<"
+    return sample_format, container_bits, channels, byteorder
+
+
+def _iter_data_chunk_bytes(
+    path: Path,
+    *,
+    data_offset: int,
+    data_bytes: int,
+    read_size: int,
+    error_message: str,
+) -> Iterator[bytes]:
+    remaining = data_bytes
     try:
-        with wave.open(str(path), "rb") as handle:
-            while True:
-                frames = handle.readframes(_CHUNK_FRAMES)
+        with path.open("rb") as handle:
+            handle.seek(data_offset)
+            while remaining > 0:
+                frames = handle.read(min(read_size, remaining))
                 if not frames:
                     break
-                if audio_format == 1:
-                    int_samples = bytes_to_int_samples_pcm(
-                        frames, bits_per_sample, channels
-                    )
-                    if not int_samples:
-                        continue
-                    float_samples = pcm_int_to_float64(int_samples, bits_per_sample)
-                    yield float_samples
-                elif audio_format == 3:
-                    float_samples = bytes_to_float_samples_ieee(
-                        frames, bits_per_sample, channels
-                    )
-                    if not float_samples:
-                        continue
-                    yield float_samples
-    except (OSError, wave.Error) as exc:
-        raise ValueError(f"Failed to read WAV for {error_context}: {path}") from exc
+                remaining -= len(frames)
+                yield frames
+    except OSError as exc:
+        raise ValueError(error_message) from exc
+
+
+def _iter_aiff_sample_bytes(
+    path: Path,
+    metadata: dict,
+    *,
+    error_context: str,
+    chunk_frames: int,
+    start_frame: int = 0,
+    frame_count: int | None = None,
+) -> Iterator[bytes]:
+    block_align = int(metadata["block_align"])
+    data_offset, data_bytes = _frame_range_bytes(
+        int(metadata["data_offset"]),
+        int(metadata["num_frames"]) * block_align,
+        block_align,
+        start_frame=start_frame,
+        frame_count=frame_count,
+    )
+    yield from _iter_data_chunk_bytes(
+        path,
+        data_offset=data_offset,
+        data_bytes=data_bytes,
+        read_size=chunk_frames * block_align,
+        error_message=f"Failed to read AIFF for {error_context}: {path}",
+    )
+
+
+def iter_aiff_float64_samples(
+    path: Path, *, error_context: str
+) -> Iterator[list[float]]:
+    """Yield interleaved float64 chunks from an uncompressed AIFF/AIFC file."""
+    for block in iter_aiff_frames_ndarray(path, error_context=error_context):
+        yield block.ravel().tolist()
+
+
+def iter_aiff_frames_ndarray(
+    path: Path,
+    *,
+    error_context: str,
+    chunk_frames: int = _CHUNK_FRAMES,
+    dtype: str = "float64",
+    start_frame: int = 0,
+    frame_count: int | None = None,
+) -> Iterator[Any]:
+    """Yield ``(frames, channels)`` float ndarrays decoded from an AIFF/AIFC file.
+
+    Reads the ``SSND`` payload directly, so uncompressed AIFF stems decode
+    without an ffmpeg subprocess. ``start_frame``/``frame_count`` seek
+    straight to a frame range instead of reading from the top (WAV has
+    ``WavMemmap`` for this). Requires numpy.
+    """
+    from mmo.dsp.float64 import ieee_bytes_to_ndarray, pcm_bytes_to_ndarray
+
+    if chunk_frames <= 0:
+        raise ValueError("chunk_frames must be positive")
+    metadata = read_aiff_metadata(path)
+    sample_format, container_bits, channels, byteorder = validate_aiff_format(metadata)
+    convert = pcm_bytes_to_ndarray if sample_format == "pcm" else ieee_bytes_to_ndarray
+
+    for frames in _iter_aiff_sample_bytes(
+        path,
+        metadata,
+        error_context=error_context,
+        chunk_frames=chunk_frames,
+        start_frame=start_frame,
+        frame_count=frame_count,
+    ):
+        block = convert(frames, container_bits, channels, dtype=dtype, byteorder=byteorder)
+        if block.shape[0] == 0:
+            continue
+        yield block
+
+
+def _stats_wav(path: Path, *, error_context: str) -> tuple[float, int, float, float, float]:
+    stats = BasicStatsAccumulator()
+    for block in iter_wav_frames_ndarray(path, error_context=error_context):
+        stats.update(block)
+    return stats.finalize()
 
 
 def compute_sample_peak_dbfs_wav(path: Path) -> float:
     """Compute the sample peak (dBFS) for a PCM WAV file."""
-    peak = 0.0
-    for float_samples in _iter_wav_float64_samples(path, error_context="peak meter"):
-        chunk_peak = interleaved_to_mono_peak(float_samples, channels=1)
-        if chunk_peak > peak:
-            peak = chunk_peak
-
+    peak, _, _, _, _ = _stats_wav(path, error_context="peak meter")
     if peak == 0.0:
         return float("-inf")
 
@@ -81,95 +239,31 @@ def compute_sample_peak_dbfs_wav(path: Path) -> float:
 
 def compute_clip_sample_count_wav(path: Path) -> int:
     """Count the number of clipped samples in a PCM WAV file."""
-    threshold = 1.0 - _EPSILON
-    count = 0
-    for float_samples in _iter_wav_float64_samples(path, error_context="clip meter"):
-        for sample in float_samples:
-            if abs(sample) >= threshold:
-                count += 1
-    return count
+    _, clip_count, _, _, _ = _stats_wav(path, error_context="clip meter")
+    return clip_count
 
 
 def compute_dc_offset_wav(path: Path) -> float:
     """Compute DC offset (mean) across all interleaved samples."""
-    total = 0.0
-    count = 0
-    for float_samples in _iter_wav_float64_samples(path, error_context="dc offset meter"):
-        for sample in float_samples:
-            total += sample
-        count += len(float_samples)
-    if count == 0:
-        return 0.0
-    return total / count
+    _, _, dc_offset, _, _ = _stats_wav(path, error_context="dc offset meter")
+    return dc_offset
 
 
 def compute_rms_dbfs_wav(path: Path) -> float:
     """Compute RMS level in dBFS for a PCM WAV file."""
-    total = 0.0
-    count = 0
-    for float_samples in _iter_wav_float64_samples(path, error_context="rms meter"):
-        for sample in float_samples:
-            total += sample * sample
-        count += len(float_samples)
-    if count == 0:
-        return float("-inf")
-    mean_square = total / count
-    if mean_square == 0.0:
-        return float("-inf")
-    rms = math.sqrt(mean_square)
-    if rms == 0.0:
-        return float("-inf")
-    return 20.0 * math.log10(rms)
+    _, _, _, rms_dbfs, _ = _stats_wav(path, error_context="rms meter")
+    return rms_dbfs
 
 
 def compute_crest_factor_db_wav(path: Path) -> float:
     """Compute crest factor (peak/rms) in dB for a PCM WAV file."""
-    peak = 0.0
-    total = 0.0
-    count = 0
-    for float_samples in _iter_wav_float64_samples(path, error_context="crest factor meter"):
-        chunk_peak = interleaved_to_mono_peak(float_samples, channels=1)
-        if chunk_peak > peak:
-            peak = chunk_peak
-        for sample in float_samples:
-            total += sample * sample
-        count += len(float_samples)
-    if count == 0:
-        return float("-inf")
-    mean_square = total / count
-    if mean_square == 0.0:
-        return float("-inf")
-    rms = math.sqrt(mean_square)
-    if rms == 0.0:
-        return float("-inf")
-    ratio = peak / rms
-    if ratio <= 0.0:
-        return float("-inf")
-    return 20.0 * math.log10(ratio)
+    _, _, _, _, crest_db = _stats_wav(path, error_context="crest factor meter")
+    return crest_db
 
 
-def compute_basic_stats_from_float64(
-    float_samples_iter: Iterator[list[float]],
+def _basic_stats_tuple(
+    peak: float, clip_count: int, total: float, total_sq: float, count: int
 ) -> tuple[float, int, float, float, float]:
-    """Return peak, clip count, DC offset, RMS dBFS, and crest factor dB."""
-    threshold = 1.0 - _EPSILON
-    peak = 0.0
-    clip_count = 0
-    total = 0.0
-    total_sq = 0.0
-    count = 0
-
-    for float_samples in float_samples_iter:
-        for sample in float_samples:
-            abs_sample = abs(sample)
-            if abs_sample > peak:
-                peak = abs_sample
-            if abs_sample >= threshold:
-                clip_count += 1
-            total += sample
-            total_sq += sample * sample
-        count += len(float_samples)
-
     if count == 0:
         return 0.0, 0, 0.0, float("-inf"), float("-inf")
 
@@ -188,3 +282,198 @@ def compute_basic_stats_from_float64(
 
     crest_db = 20.0 * math.log10(peak / rms)
     return peak, clip_count, dc_offset, rms_dbfs, crest_db
+
+
+class OnlineBasicStats:
+    """Streaming peak, clip count, DC offset, RMS, and crest factor.
+
+    Feed interleaved float chunks with ``update``; ``finalize`` returns the
+    same tuple as ``compute_basic_stats_from_float64``. This is the pure-Python
+    reference used when numpy is unavailable; ``BasicStatsAccumulator`` is
+    the ndarray counterpart.
+    """
+
+    def __init__(self) -> None:
+        self._threshold = 1.0 - _EPSILON
+        self.peak = 0.0
+        self.clip_count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.count = 0
+
+    def update(self, float_samples: list[float]) -> None:
+        threshold = self._threshold
+        peak = self.peak
+        clip_count = self.clip_count
+        total = self.total
+        total_sq = self.total_sq
+        for sample in float_samples:
+            abs_sample = abs(sample)
+            if abs_sample > peak:
+                peak = abs_sample
+            if abs_sample >= threshold:
+                clip_count += 1
+            total += sample
+            total_sq += sample * sample
+        self.peak = peak
+        self.clip_count = clip_count
+        self.total = total
+        self.total_sq = total_sq
+        self.count += len(float_samples)
+
+    def finalize(self) -> tuple[float, int, float, float, float]:
+        return _basic_stats_tuple(
+            self.peak, self.clip_count, self.total, self.total_sq, self.count
+        )
+
+
+class _CompensatedSum:
+    """Neumaier-compensated running sum of floats."""
+
+    __slots__ = ("total", "compensation")
+
+    def __init__(self) -> None:
+        self.total = 0.0
+        self.compensation = 0.0
+
+    def add(self, value: float) -> None:
+        total = self.total + value
+        if abs(self.total) >= abs(value):
+            self.compensation += (self.total - total) + value
+        else:
+            self.compensation += (value - total) + self.total
+        self.total = total
+
+    def value(self, extra: float = 0.0) -> float:
+        probe = _CompensatedSum()
+        probe.total = self.total
+        probe.compensation = self.compensation
+        probe.add(extra)
+        return probe.total + probe.compensation
+
+
+class BasicStatsAccumulator:
+    """ndarray streaming peak, clip count, DC offset, RMS, and crest factor.
+
+    Accepts arrays of any shape (interleaved or ``(frames, channels)``) and
+    ``list[float]`` chunks. Peak and clip count (``|x| >= 1 - 1e-12``, as in
+    the scalar meters) are exact. Sums are taken with numpy's pairwise
+    summation over fixed ``block_samples`` blocks and the block sums are
+    combined with compensated summation, so the result depends only on the
+    samples, never on how the caller chunked them; it agrees with
+    ``OnlineBasicStats`` to within rounding.
+
+    With ``clip_event_channels`` set, chunks must be whole frames and the
+    same clip mask also feeds an ``EventRunIndex``, read back with
+    ``clip_events``.
+    """
+
+    def __init__(
+        self,
+        *,
+        block_samples: int = _STATS_BLOCK_SAMPLES,
+        clip_event_channels: int | None = None,
+        max_clip_events: int = DEFAULT_MAX_EVENTS,
+    ) -> None:
+        import numpy as np
+
+        if block_samples <= 0:
+            raise ValueError("block_samples must be positive")
+        self._clip_events = (
+            EventRunIndex(clip_event_channels, max_events=max_clip_events)
+            if clip_event_channels is not None
+            else None
+        )
+        self._frames_seen = 0
+        self._threshold = 1.0 - _EPSILON
+        self.peak = 0.0
+        self.clip_count = 0
+        self.count = 0
+        self._total = _CompensatedSum()
+        self._total_sq = _CompensatedSum()
+        self._pending = np.empty(block_samples, dtype=np.float64)
+        self._pending_count = 0
+        self._scratch = np.empty(block_samples, dtype=np.float64)
+
+    def update(self, samples: Any) -> None:
+        import numpy as np
+
+        values = np.asarray(samples, dtype=np.float64).reshape(-1)
+        if values.size == 0:
+            return
+        magnitudes = np.abs(values)
+        # fmax skips NaN, like the scalar ``abs(sample) > peak`` comparison.
+        chunk_peak = float(np.fmax.reduce(magnitudes))
+        if chunk_peak > self.peak:
+            self.peak = chunk_peak
+        clipped = magnitudes >= self._threshold
+        self.clip_count += int(np.count_nonzero(clipped))
+        self.count += int(values.size)
+        if self._clip_events is not None:
+            channels = self._clip_events.channels
+            if values.size % channels:
+                raise ValueError("clip event chunks must hold whole frames")
+            frames = values.size // channels
+            self._clip_events.update(
+                magnitudes.reshape(frames, channels),
+                clipped.reshape(frames, channels),
+                self._frames_seen,
+            )
+            self._frames_seen += frames
+
+        block = self._pending.shape[0]
+        offset = 0
+        if self._pending_count:
+            take = min(block - self._pending_count, values.size)
+            self._pending[self._pending_count : self._pending_count + take] = values[:take]
+            self._pending_count += take
+            offset = take
+            if self._pending_count == block:
+                self._add_block(self._pending)
+                self._pending_count = 0
+        while values.size - offset >= block:
+            self._add_block(values[offset : offset + block])
+            offset += block
+        rest = values.size - offset
+        if rest:
+            self._pending[:rest] = values[offset:]
+            self._pending_count = rest
+
+    def _block_sums(self, values: Any) -> tuple[float, float]:
+        import numpy as np
+
+        squares = self._scratch[: values.shape[0]]
+        np.multiply(values, values, out=squares)
+        return float(np.sum(values)), float(np.sum(squares))
+
+    def _add_block(self, values: Any) -> None:
+        total, total_sq = self._block_sums(values)
+        self._total.add(total)
+        self._total_sq.add(total_sq)
+
+    def clip_events(self) -> EventIndex:
+        if self._clip_events is None:
+            raise ValueError("clip events were not requested")
+        return self._clip_events.finalize()
+
+    def finalize(self) -> tuple[float, int, float, float, float]:
+        total, total_sq = 0.0, 0.0
+        if self._pending_count:
+            total, total_sq = self._block_sums(self._pending[: self._pending_count])
+        return _basic_stats_tuple(
+            self.peak,
+            self.clip_count,
+            self._total.value(total),
+            self._total_sq.value(total_sq),
+            self.count,
+        )
+
+
+def compute_basic_stats_from_float64(
+    float_samples_iter: Iterator[list[float]],
+) -> tuple[float, int, float, float, float]:
+    """Return peak, clip count, DC offset, RMS dBFS, and crest factor dB."""
+    stats = BasicStatsAccumulator()
+    for float_samples in float_samples_iter:
+        stats.update(float_samples)
+    return stats.finalize()
@@ -2,11 +2,10 @@ from __future__ import annotations
 
 from functools import lru_cache
 import math
-import wave
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Any, Iterable, Tuple
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 import numpy as np
 
@@ -15,12 +14,10 @@ from mmo.core.loudness_methods import (
     require_implemented_loudness_method,
 )
 from mmo.resources import ontology_dir
-from mmo.dsp.float64 import (
-    bytes_to_float_samples_ieee,
-    bytes_to_int_samples_pcm,
-    pcm_int_to_float64,
-)
+from mmo.dsp.event_index import DEFAULT_MAX_EVENTS, EventIndex, EventRunIndex
+from mmo.dsp.float64 import ieee_bytes_to_ndarray, pcm_bytes_to_ndarray
 from mmo.dsp.io import read_wav_metadata
+from mmo.dsp.loudness_timeline import LoudnessTimeline, SHORTTERM_WINDOW_S, TIMELINE_HOP_S
 from mmo.dsp.channel_layout import (
     lufs_weighting_order_and_mode,
 )
@@ -34,9 +31,13 @@ _EPSILON = 1e-12
 _TRUEPEAK_UPSAMPLE = 4
 _TRUEPEAK_TAPS = 63
 _LOUDNESS_OFFSET = -0.691
-_TRUEPEAK_PHASE_TAPS = 12
-_TRUEPEAK_BLOCK = 262144
+_TRUEPEAK_BLOCK = 4096
 _BS1770_5_METHOD_ID = "BS.1770-5"
+_IIR_BLOCK_FRAMES = 256
+_INTEGRATED_WINDOW = (0.4, 0.1)
+_SHORTTERM_WINDOW = (3.0, 1.0)
+_ABS_GATE_LUFS = -70.0
+_LUFS_WAV_CHUNK_FRAMES = 65536
 
 _SHORT_LABEL_TO_SPK_ID: dict[str, str] = {
     "M": "SPK.M",
@@ -86,14 +87,6 @@ _DEFAULT_SPEAKER_COORDS: dict[str, tuple[float, float]] = {
 }
 
 
-@dataclass
-class _BiquadState:
-    x1: float = 0.0
-    x2: float = 0.0
-    y1: float = 0.0
-    y2: float = 0.0
-
-
 @dataclass(frozen=True)
 class LoudnessWeightingReceipt:
     method_id: str
@@ -317,26 +310,22 @@ def _read_wav_float64(path: Path) -> Tuple[np.ndarray, int]:
     else:
         raise ValueError(f"Unsupported WAV format: {audio_format}")
 
+    # Read the located data chunk directly; ``wave`` rejects RF64, float, and
+    # extensible files.
+    frame_bytes = channels * (bits_per_sample // 8)
+    data_bytes = int(metadata["data_bytes"])
     try:
-        with wave.open(str(path), "rb") as handle:
-            frames = handle.readframes(handle.getnframes())
-    except (OSError, wave.Error) as exc:
+        with path.open("rb") as handle:
+            handle.seek(int(metadata["data_offset"]))
+            frames = handle.read(data_bytes - data_bytes % frame_bytes)
+    except OSError as exc:
         raise ValueError(f"Failed to read WAV for truth meters: {path}") from exc
 
     if audio_format == 1:
-        int_samples = bytes_to_int_samples_pcm(frames, bits_per_sample, channels)
-        float_samples = pcm_int_to_float64(int_samples, bits_per_sample)
+        samples = pcm_bytes_to_ndarray(frames, bits_per_sample, channels)
     else:
-        float_samples = bytes_to_float_samples_ieee(frames, bits_per_sample, channels)
-
-    if not float_samples:
-        return np.zeros((0, channels), dtype=np.float64), sample_rate_hz
-
-    samples = np.asarray(float_samples, dtype=np.float64)
-    total = (len(samples) // channels) * channels
-    if total != len(samples):
-        samples = samples[:total]
-    return samples.reshape(-1, channels), sample_rate_hz
+        samples = ieee_bytes_to_ndarray(frames, bits_per_sample, channels)
+    return samples, sample_rate_hz
 
 
 def _design_lowpass_fir(cutoff: float, taps: int) -> np.ndarray:
@@ -355,48 +344,6 @@ def _design_lowpass_fir(cutoff: float, taps: int) -> np.ndarray:
     return kernel.astype(np.float64)
 
 
-def _apply_biquad(samples: np.ndarray, b: Iterable[float], a: Iterable[float]) -> np.ndarray:
-    b0, b1, b2 = b
-    _, a1, a2 = a
-    output = np.zeros_like(samples, dtype=np.float64)
-    x1 = 0.0
-    x2 = 0.0
-    y1 = 0.0
-    y2 = 0.0
-    for index, x0 in enumerate(samples):
-        y0 = b0 * x0 + b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2
-        output[index] = y0
-        x2 = x1
-        x1 = x0
-        y2 = y1
-        y1 = y0
-    return output
-
-
-def _apply_biquad_stateful(
-    samples: np.ndarray, b: Iterable[float], a: Iterable[float], state: _BiquadState
-) -> np.ndarray:
-    b0, b1, b2 = b
-    _, a1, a2 = a
-    output = np.zeros_like(samples, dtype=np.float64)
-    x1 = state.x1
-    x2 = state.x2
-    y1 = state.y1
-    y2 = state.y2
-    for index, x0 in enumerate(samples):
-        y0 = b0 * x0 + b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2
-        output[index] = y0
-        x2 = x1
-        x1 = x0
-        y2 = y1
-        y1 = y0
-    state.x1 = x1
-    state.x2 = x2
-    state.y1 = y1
-    state.y2 = y2
-    return output
-
-
 def k_weighting_biquads(
     sample_rate_hz: int,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
@@ -442,39 +389,360 @@ def k_weighting_biquads(
     return pre_b, pre_a, rlb_b, rlb_a
 
 
-def _k_weighted(samples: np.ndarray, fs: int) -> np.ndarray:
-    pre_b, pre_a, rlb_b, rlb_a = k_weighting_biquads(fs)
-    filtered = _apply_biquad(samples, pre_b, pre_a)
-    filtered = _apply_biquad(filtered, rlb_b, rlb_a)
-    return filtered
+def _optional_sosfilt() -> Any | None:
+    try:
+        from scipy.signal import sosfilt  # noqa: WPS433
+    except ImportError:
+        return None
+    return sosfilt
 
 
-def _block_energies(
-    samples: np.ndarray,
-    fs: int,
-    block_s: float,
-    hop_s: float,
-    weights: np.ndarray | None = None,
-) -> list[float]:
-    block_size = int(round(block_s * fs))
-    hop_size = int(round(hop_s * fs))
-    if block_size <= 0 or hop_size <= 0:
-        return []
-    if samples.shape[0] < block_size:
-        return []
-    energies: list[float] = []
-    for start in range(0, samples.shape[0] - block_size + 1, hop_size):
-        block = samples[start : start + block_size]
-        per_ch = np.mean(block * block, axis=0)
-        if weights is None:
-            block_energy = float(per_ch.sum())
-        else:
-            block_energy = float(np.dot(per_ch, weights))
-        energies.append(block_energy)
-    return energies
+@lru_cache(maxsize=32)
+def _biquad_block_operators(a1: float, a2: float, length: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(T, G)`` for ``y[n] = v[n] - a1*y[n-1] - a2*y[n-2]`` over a block.
+
+    ``T`` is the lower-triangular Toeplitz matrix of the all-pole impulse
+    response (zero-state part) and ``G`` maps ``(y[-1], y[-2])`` to the
+    zero-input response, so a whole block is two matrix products.
+    """
+    impulse = np.zeros(length, dtype=np.float64)
+    carry = np.zeros((length, 2), dtype=np.float64)
+    h1 = h2 = 0.0
+    g1 = np.array([1.0, 0.0])
+    g2 = np.array([0.0, 1.0])
+    for index in range(length):
+        h0 = (1.0 if index == 0 else 0.0) - a1 * h1 - a2 * h2
+        impulse[index] = h0
+        h2, h1 = h1, h0
+        g0 = -a1 * g1 - a2 * g2
+        carry[index] = g0
+        g2, g1 = g1, g0
+    lags = np.subtract.outer(np.arange(length), np.arange(length))
+    toeplitz = np.where(lags >= 0, impulse[np.clip(lags, 0, None)], 0.0)
+    return toeplitz, carry
+
+
+class KWeightingFilter:
+    """Stateful multichannel BS.1770 K-weighting (pre-filter + RLB high-pass).
+
+    ``process`` takes ``(frames, channels)`` chunks and carries filter state
+    across calls, so chunked and whole-signal filtering agree. The engine is
+    ``scipy.signal.sosfilt`` when SciPy is installed; otherwise a NumPy
+    block-recursive evaluation (FIR part vectorized, all-pole part solved
+    ``_IIR_BLOCK_FRAMES`` at a time) matches it to within rounding.
+    """
+
+    def __init__(self, sample_rate_hz: int, channels: int, *, engine: str | None = None) -> None:
+        if channels <= 0:
+            raise ValueError("channels must be positive")
+        if engine is None:
+            engine = "scipy" if _optional_sosfilt() is not None else "numpy"
+        if engine not in ("scipy", "numpy"):
+            raise ValueError(f"Unsupported K-weighting engine: {engine}")
+        self.channels = channels
+        self.engine = engine
+        pre_b, pre_a, rlb_b, rlb_a = k_weighting_biquads(sample_rate_hz)
+        self._sos = np.array(
+            [np.concatenate([pre_b, pre_a]), np.concatenate([rlb_b, rlb_a])],
+            dtype=np.float64,
+        )
+        # scipy: per-section delay lines; numpy: per-section (x1, x2, y1, y2).
+        self._zi = np.zeros((self._sos.shape[0], 2, channels), dtype=np.float64)
+        self._history = np.zeros((self._sos.shape[0], 4, channels), dtype=np.float64)
+
+    def process(self, chunk_frames: np.ndarray) -> np.ndarray:
+        samples = np.asarray(chunk_frames, dtype=np.float64)
+        if samples.ndim != 2 or samples.shape[1] != self.channels:
+            raise ValueError("chunk_frames channel count mismatch")
+        if samples.shape[0] == 0:
+            return samples.copy()
+        if self.engine == "scipy":
+            filtered, self._zi = _optional_sosfilt()(self._sos, samples, axis=0, zi=self._zi)
+            return filtered
+        filtered = samples
+        for section in range(self._sos.shape[0]):
+            filtered = self._process_section(section, filtered)
+        return filtered
+
+    def _process_section(self, section: int, samples: np.ndarray) -> np.ndarray:
+        b0, b1, b2, _, a1, a2 = self._sos[section]
+        x1, x2, y1, y2 = self._history[section]
+        padded = np.concatenate([x2[None, :], x1[None, :], samples], axis=0)
+        driven = b0 * padded[2:] + b1 * padded[1:-1] + b2 * padded[:-2]
+
+        toeplitz, carry = _biquad_block_operators(float(a1), float(a2), _IIR_BLOCK_FRAMES)
+        output = np.empty_like(driven)
+        previous = np.stack([y1, y2])
+        for start in range(0, driven.shape[0], _IIR_BLOCK_FRAMES):
+            stop = min(start + _IIR_BLOCK_FRAMES, driven.shape[0])
+            size = stop - start
+            block = toeplitz[:size, :size] @ driven[start:stop] + carry[:size] @ previous
+            output[start:stop] = block
+            previous = np.stack([block[-1], block[-2] if size > 1 else previous[0]])
+        self._history[section] = np.stack([padded[-1], padded[-2], previous[0], previous[1]])
+        return output
+
+
+def _block_energy_sums(
+    squared: np.ndarray, block_size: int, hop_size: int
+) -> np.ndarray:
+    """Return per-channel sums of every complete ``block_size`` window.
+
+    Windows start every ``hop_size`` frames. Frames are summed once into
+    segments of ``gcd(block, hop)`` frames and each window adds up its
+    segments, so the cost no longer scales with the block/hop overlap.
+    """
+    block_count = 1 + (squared.shape[0] - block_size) // hop_size
+    if squared.shape[0] < block_size or block_count <= 0:
+        return np.zeros((0, squared.shape[1]), dtype=np.float64)
+    segment = math.gcd(block_size, hop_size)
+    used = (block_count - 1) * hop_size + block_size
+    segments = squared[:used].reshape(used // segment, segment, squared.shape[1]).sum(axis=1)
+    windows = np.lib.stride_tricks.sliding_window_view(
+        segments, block_size // segment, axis=0
+    )[:: hop_size // segment]
+    return windows.sum(axis=-1)
+
+
+class _BlockEnergyWindow:
+    """Collect channel-weighted mean-square energies for one block/hop size."""
+
+    def __init__(
+        self,
+        weights: np.ndarray,
+        block_size: int,
+        hop_size: int,
+        histogram: LoudnessHistogram | None = None,
+    ) -> None:
+        self.weights = weights
+        self.block_size = block_size
+        self.hop_size = hop_size
+        # With a histogram, energies are binned as they arrive instead of kept.
+        self.histogram = histogram
+        # Set to a list to also keep per-block loudness as float32 (timelines).
+        self.series: list[np.ndarray] | None = None
+        self._buffer = np.zeros((0, weights.shape[0]), dtype=np.float64)
+        self._energies: list[np.ndarray] = []
+
+    def update(self, squared: np.ndarray) -> None:
+        if self.block_size <= 0 or self.hop_size <= 0:
+            return
+        buffer = np.concatenate([self._buffer, squared], axis=0) if self._buffer.size else squared
+        sums = _block_energy_sums(buffer, self.block_size, self.hop_size)
+        if sums.shape[0]:
+            energies = (sums / float(self.block_size)) @ self.weights
+            if self.histogram is not None:
+                self.histogram.add_energies(energies)
+            else:
+                self._energies.append(energies)
+            if self.series is not None:
+                with np.errstate(divide="ignore"):
+                    loudness = _LOUDNESS_OFFSET + 10.0 * np.log10(energies)
+                self.series.append(loudness.astype(np.float32))
+            buffer = buffer[sums.shape[0] * self.hop_size :]
+        self._buffer = buffer
+
+    def energies(self) -> np.ndarray:
+        if not self._energies:
+            return np.zeros(0, dtype=np.float64)
+        return np.concatenate(self._energies)
+
+    def loudness_series(self) -> np.ndarray:
+        if not self.series:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(self.series)
+
+
+class _KWeightedBlockEnergies:
+    """K-weight chunks once and feed one or more block-energy windows."""
+
+    def __init__(
+        self,
+        sample_rate_hz: int,
+        weights: np.ndarray,
+        *,
+        windows: tuple[tuple[float, float], ...],
+    ) -> None:
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self._filter = KWeightingFilter(sample_rate_hz, self.weights.shape[0])
+        self.windows = [
+            _BlockEnergyWindow(
+                self.weights,
+                int(round(block_s * sample_rate_hz)),
+                int(round(hop_s * sample_rate_hz)),
+            )
+            for block_s, hop_s in windows
+        ]
+
+    def update(self, chunk_frames: np.ndarray) -> None:
+        if chunk_frames.size == 0:
+            return
+        weighted = self._filter.process(chunk_frames)
+        squared = weighted * weighted
+        for window in self.windows:
+            window.update(squared)
+
+    def energies(self, index: int = 0) -> np.ndarray:
+        return self.windows[index].energies()
+
+
+def _gated_loudness(energies: np.ndarray, *, gated: bool) -> float:
+    """Apply BS.1770 absolute/relative gating to block energies and return LUFS."""
+    if gated and energies.size:
+        abs_threshold = 10.0 ** ((_ABS_GATE_LUFS - _LOUDNESS_OFFSET) / 10.0)
+        energies = energies[energies > abs_threshold]
+        if energies.size:
+            rel_threshold = float(np.mean(energies)) / 10.0
+            energies = energies[energies > rel_threshold]
+    if not energies.size:
+        return float("-inf")
+    mean_energy = float(np.mean(energies))
+    if mean_energy <= 0.0:
+        return float("-inf")
+    return _LOUDNESS_OFFSET + 10.0 * math.log10(mean_energy)
+
+
+class LoudnessHistogram:
+    """Block-loudness histogram for bounded-memory BS.1770 gating.
+
+    Blocks are binned by loudness at ``resolution_lu``; each bin keeps a
+    block count and the exact sum of its block energies, so memory is
+    O(bins) no matter how long the programme runs. Histograms with the same
+    binning can be merged, e.g. to combine per-worker results.
+
+    Accuracy against the exact block list: integrated loudness differs only
+    through blocks inside the single bin straddling the relative gate, which
+    are split by linear interpolation (well under ``resolution_lu``
+    for programme material); percentiles are within one bin width and LRA
+    within two.
+    """
+
+    def __init__(
+        self,
+        *,
+        resolution_lu: float = 0.01,
+        floor_lufs: float = _ABS_GATE_LUFS,
+        ceiling_lufs: float = 30.0,
+    ) -> None:
+        if resolution_lu <= 0.0:
+            raise ValueError("resolution_lu must be positive")
+        if ceiling_lufs <= floor_lufs:
+            raise ValueError("ceiling_lufs must be above floor_lufs")
+        self.resolution_lu = float(resolution_lu)
+        self.floor_lufs = float(floor_lufs)
+        self.ceiling_lufs = float(ceiling_lufs)
+        bins = int(math.ceil((self.ceiling_lufs - self.floor_lufs) / self.resolution_lu))
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.energy_sums = np.zeros(bins, dtype=np.float64)
+        # Blocks at or below the floor never pass a gate; keep only a tally.
+        self.below_floor = 0
+
+    def add_energies(self, energies: np.ndarray) -> None:
+        values = np.asarray(energies, dtype=np.float64).ravel()
+        if not values.size:
+            return
+        floor_energy = 10.0 ** ((self.floor_lufs - _LOUDNESS_OFFSET) / 10.0)
+        kept = values[values > floor_energy]
+        self.below_floor += int(values.size - kept.size)
+        if not kept.size:
+            return
+        loudness = _LOUDNESS_OFFSET + 10.0 * np.log10(kept)
+        index = ((loudness - self.floor_lufs) / self.resolution_lu).astype(np.int64)
+        # Louder than the ceiling: pile into the top bin, energy stays exact.
+        np.clip(index, 0, self.counts.shape[0] - 1, out=index)
+        self.counts += np.bincount(index, minlength=self.counts.shape[0])
+        self.energy_sums += np.bincount(index, weights=kept, minlength=self.counts.shape[0])
+
+    def merge(self, other: LoudnessHistogram) -> LoudnessHistogram:
+        if (
+            other.resolution_lu != self.resolution_lu
+            or other.floor_lufs != self.floor_lufs
+            or other.ceiling_lufs != self.ceiling_lufs
+        ):
+            raise ValueError("Cannot merge loudness histograms with different binning.")
+        self.counts += other.counts
+        self.energy_sums += other.energy_sums
+        self.below_floor += other.below_floor
+        return self
+
+    @property
+    def block_count(self) -> int:
+        return int(self.counts.sum()) + self.below_floor
+
+    def _above(self, threshold_lufs: float) -> tuple[float, float]:
+        """Return ``(count, energy)`` of blocks louder than ``threshold_lufs``."""
+        position = (threshold_lufs - self.floor_lufs) / self.resolution_lu
+        if position <= 0.0:
+            return float(self.counts.sum()), float(self.energy_sums.sum())
+        if position >= self.counts.shape[0]:
+            return 0.0, 0.0
+        index = int(position)
+        fraction = 1.0 - (position - index)
+        count = float(self.counts[index + 1 :].sum()) + fraction * float(self.counts[index])
+        energy = float(self.energy_sums[index + 1 :].sum()) + fraction * float(
+            self.energy_sums[index]
+        )
+        return count, energy
+
+    def _relative_gate(self, relative_gate_lu: float) -> float | None:
+        count, energy = self._above(_ABS_GATE_LUFS)
+        if count <= 0.0 or energy <= 0.0:
+            return None
+        return _LOUDNESS_OFFSET + 10.0 * math.log10(energy / count) + relative_gate_lu
+
+    def integrated_lufs(self, *, relative_gate_lu: float = -10.0) -> float:
+        threshold = self._relative_gate(relative_gate_lu)
+        if threshold is None:
+            return float("-inf")
+        count, energy = self._above(threshold)
+        if count <= 0.0 or energy <= 0.0:
+            return float("-inf")
+        return _LOUDNESS_OFFSET + 10.0 * math.log10(energy / count)
+
+    def percentile(self, percentile: float, *, gate_lufs: float | None = None) -> float | None:
+        """Linear-interpolated percentile of block loudness at bin centres."""
+        counts = self.counts
+        if gate_lufs is not None:
+            first = int(math.ceil((gate_lufs - self.floor_lufs) / self.resolution_lu - 0.5))
+            counts = counts.copy()
+            counts[: max(0, min(first, counts.shape[0]))] = 0
+        total = int(counts.sum())
+        if total == 0:
+            return None
+        cumulative = np.cumsum(counts)
+        clamped = min(100.0, max(0.0, float(percentile)))
+        rank = (clamped / 100.0) * (total - 1)
+        lower_rank = int(math.floor(rank))
+        upper_rank = int(math.ceil(rank))
+        lower_bin = int(np.searchsorted(cumulative, lower_rank, side="right"))
+        upper_bin = int(np.searchsorted(cumulative, upper_rank, side="right"))
+        lower_value = self.floor_lufs + (lower_bin + 0.5) * self.resolution_lu
+        upper_value = self.floor_lufs + (upper_bin + 0.5) * self.resolution_lu
+        return lower_value + (upper_value - lower_value) * (rank - lower_rank)
+
+    def loudness_range(self, *, relative_gate_lu: float = -20.0) -> float | None:
+        """EBU R128-style LRA (P95 - P10) over gated short-term blocks."""
+        threshold = self._relative_gate(relative_gate_lu)
+        if threshold is None:
+            return None
+        p10 = self.percentile(10.0, gate_lufs=threshold)
+        p95 = self.percentile(95.0, gate_lufs=threshold)
+        if p10 is None or p95 is None:
+            return None
+        return max(0.0, p95 - p10)
 
 
 class OnlineLufsIntegrated:
+    """Streaming integrated loudness.
+
+    With ``include_shortterm=True`` the same K-weighted signal also feeds the
+    3 s / 1 s short-term windows, read back with ``finalize_shortterm``.
+    ``histogram_resolution_lu`` opts into gating from a ``LoudnessHistogram``
+    instead of the full block list, keeping memory constant for long inputs.
+    ``timeline=True`` also records momentary and 100 ms-hop short-term
+    series, read back with ``timeline``.
+    """
+
     def __init__(
         self,
         sample_rate_hz: int,
@@ -483,6 +751,9 @@ class OnlineLufsIntegrated:
         channel_layout: str | None,
         *,
         method_id: str | None = DEFAULT_LOUDNESS_METHOD_ID,
+        include_shortterm: bool = False,
+        histogram_resolution_lu: float | None = None,
+        timeline: bool = False,
     ) -> None:
         if channels <= 0:
             raise ValueError("channels must be positive")
@@ -495,226 +766,299 @@ class OnlineLufsIntegrated:
             channel_layout=channel_layout,
             method_id=self.method_id,
         )
-        self.block_size = int(round(0.4 * sample_rate_hz))
-        self.hop_size = int(round(0.1 * sample_rate_hz))
-        self._energies: list[float] = []
-        self._buffer = np.zeros((0, channels), dtype=np.float64)
-        self._pre_b, self._pre_a, self._rlb_b, self._rlb_a = k_weighting_biquads(
-            sample_rate_hz
+        windows = [_INTEGRATED_WINDOW]
+        if include_shortterm:
+            windows.append(_SHORTTERM_WINDOW)
+        self._timeline_index: int | None = None
+        if timeline:
+            # Momentary loudness is the 400 ms / 100 ms integrated block series.
+            self._timeline_index = len(windows)
+            windows.append((SHORTTERM_WINDOW_S, TIMELINE_HOP_S))
+        self._blocks = _KWeightedBlockEnergies(
+            sample_rate_hz, self.weights, windows=tuple(windows)
         )
-        self._pre_states = [_BiquadState() for _ in range(channels)]
-        self._rlb_states = [_BiquadState() for _ in range(channels)]
+        self.block_size = self._blocks.windows[0].block_size
+        self.hop_size = self._blocks.windows[0].hop_size
+        if self._timeline_index is not None:
+            self._blocks.windows[0].series = []
+            self._blocks.windows[self._timeline_index].series = []
+        self.histogram: LoudnessHistogram | None = None
+        if histogram_resolution_lu is not None:
+            self.histogram = LoudnessHistogram(resolution_lu=histogram_resolution_lu)
+            self._blocks.windows[0].histogram = self.histogram
 
     def update(self, chunk_frames: np.ndarray) -> None:
         if chunk_frames.size == 0:
             return
         if chunk_frames.shape[1] != self.channels:
             raise ValueError("chunk_frames channel count mismatch")
-        weighted = np.empty_like(chunk_frames, dtype=np.float64)
-        for channel_index in range(self.channels):
-            channel = chunk_frames[:, channel_index]
-            filtered = _apply_biquad_stateful(
-                channel, self._pre_b, self._pre_a, self._pre_states[channel_index]
-            )
-            filtered = _apply_biquad_stateful(
-                filtered, self._rlb_b, self._rlb_a, self._rlb_states[channel_index]
-            )
-            weighted[:, channel_index] = filtered
+        self._blocks.update(chunk_frames)
 
-        if self._buffer.size:
-            buffer = np.concatenate([self._buffer, weighted], axis=0)
-        else:
-            buffer = weighted
+    def finalize(self) -> float:
+        if self.histogram is not None:
+            return self.histogram.integrated_lufs()
+        return _gated_loudness(self._blocks.energies(0), gated=True)
+
+    def finalize_shortterm(self) -> float:
+        if len(self._blocks.windows) < 2 or self._timeline_index == 1:
+            raise ValueError("short-term loudness was not requested")
+        return _gated_loudness(self._blocks.energies(1), gated=False)
+
+    def timeline(self, *, source_sha256: str | None = None) -> LoudnessTimeline:
+        if self._timeline_index is None:
+            raise ValueError("loudness timeline was not requested")
+        momentary = self._blocks.windows[0]
+        shortterm = self._blocks.windows[self._timeline_index]
+        return LoudnessTimeline(
+            sample_rate_hz=int(self.sample_rate_hz),
+            hop_frames=momentary.hop_size,
+            momentary_block_frames=momentary.block_size,
+            shortterm_block_frames=shortterm.block_size,
+            momentary_lufs=momentary.loudness_series(),
+            shortterm_lufs=shortterm.loudness_series(),
+            method_id=self.method_id,
+            source_sha256=source_sha256,
+        )
 
-        if self.block_size <= 0 or self.hop_size <= 0:
-            self._buffer = buffer
-            return
 
-        if buffer.shape[0] >= self.block_size:
-            block_count = 1 + (buffer.shape[0] - self.block_size) // self.hop_size
-            for index in range(block_count):
-                start = index * self.hop_size
-                block = buffer[start : start + self.block_size]
-                per_ch = np.mean(block * block, axis=0)
-                block_energy = float(np.dot(per_ch, self.weights))
-                self._energies.append(block_energy)
-            drop = block_count * self.hop_size
-            buffer = buffer[drop:]
+# ITU-R BS.1770 Annex 2 4x interpolation filter, one column per phase.
+_BS1770_TRUEPEAK_COEFFS = (
+    (0.0017089843750, -0.0291748046875, -0.0189208984375, -0.0083007812500),
+    (0.0109863281250, 0.0292968750000, 0.0330810546875, 0.0148925781250),
+    (-0.0196533203125, -0.0517578125000, -0.0582275390625, -0.0266113281250),
+    (0.0332031250000, 0.0891113281250, 0.1015625000000, 0.0476074218750),
+    (-0.0594482421875, -0.1665039062500, -0.2003173828125, -0.1022949218750),
+    (0.1373291015625, 0.4650878906250, 0.7797851562500, 0.9721679687500),
+    (0.9721679687500, 0.7797851562500, 0.4650878906250, 0.1373291015625),
+    (-0.1022949218750, -0.2003173828125, -0.1665039062500, -0.0594482421875),
+    (0.0476074218750, 0.1015625000000, 0.0891113281250, 0.0332031250000),
+    (-0.0266113281250, -0.0582275390625, -0.0517578125000, -0.0196533203125),
+    (0.0148925781250, 0.0330810546875, 0.0292968750000, 0.0109863281250),
+    (-0.0083007812500, -0.0189208984375, -0.0291748046875, 0.0017089843750),
+)
 
-        self._buffer = buffer
 
-    def finalize(self) -> float:
-        if not self._energies:
-            return float("-inf")
+@lru_cache(maxsize=8)
+def _truepeak_phase_taps(sample_rate_hz: int) -> tuple[np.ndarray, int]:
+    """Return ``(taps, skip)`` for the 4x interpolator at ``sample_rate_hz``.
 
-        abs_threshold = 10.0 ** ((-70.0 - _LOUDNESS_OFFSET) / 10.0)
-        energies = [energy for energy in self._energies if energy > abs_threshold]
-        if not energies:
-            return float("-inf")
+    ``taps`` is ``(phases, taps_per_phase)``. At 48 kHz it is the BS.1770
+    table; other rates split the windowed-sinc FIR into its four polyphase
+    branches. ``skip`` is the count of leading 4x outputs that the centred
+    FIR kernel delays by (zero for the causal BS.1770 table).
+    """
+    if sample_rate_hz == 48000:
+        taps = np.array(_BS1770_TRUEPEAK_COEFFS, dtype=np.float64).T.copy()
+        skip = 0
+    else:
+        kernel = _design_lowpass_fir(cutoff=0.25, taps=_TRUEPEAK_TAPS)
+        per_phase = -(-_TRUEPEAK_TAPS // _TRUEPEAK_UPSAMPLE)
+        taps = np.zeros((_TRUEPEAK_UPSAMPLE, per_phase), dtype=np.float64)
+        for phase in range(_TRUEPEAK_UPSAMPLE):
+            branch = kernel[phase::_TRUEPEAK_UPSAMPLE]
+            taps[phase, : branch.shape[0]] = branch
+        skip = (_TRUEPEAK_TAPS - 1) // 2
+    taps.setflags(write=False)
+    return taps, skip
 
-        mean_energy = float(np.mean(energies))
-        rel_threshold = mean_energy / 10.0
-        energies = [energy for energy in energies if energy > rel_threshold]
-        if not energies:
-            return float("-inf")
 
-        mean_energy = float(np.mean(energies))
-        if mean_energy <= 0.0:
-            return float("-inf")
-        return _LOUDNESS_OFFSET + 10.0 * math.log10(mean_energy)
-
-
-def _true_peak_48k_polyphase(channel: np.ndarray) -> float:
-    coeffs = np.array(
-        [
-            [0.0017089843750, -0.0291748046875, -0.0189208984375, -0.0083007812500],
-            [0.0109863281250, 0.0292968750000, 0.0330810546875, 0.0148925781250],
-            [-0.0196533203125, -0.0517578125000, -0.0582275390625, -0.0266113281250],
-            [0.0332031250000, 0.0891113281250, 0.1015625000000, 0.0476074218750],
-            [-0.0594482421875, -0.1665039062500, -0.2003173828125, -0.1022949218750],
-            [0.1373291015625, 0.4650878906250, 0.7797851562500, 0.9721679687500],
-            [0.9721679687500, 0.7797851562500, 0.4650878906250, 0.1373291015625],
-            [-0.1022949218750, -0.2003173828125, -0.1665039062500, -0.0594482421875],
-            [0.0476074218750, 0.1015625000000, 0.0891113281250, 0.0332031250000],
-            [-0.0266113281250, -0.0582275390625, -0.0517578125000, -0.0196533203125],
-            [0.0148925781250, 0.0330810546875, 0.0292968750000, 0.0109863281250],
-            [-0.0083007812500, -0.0189208984375, -0.0291748046875, 0.0017089843750],
-        ],
-        dtype=np.float64,
-    )
-    phase_taps = coeffs.T
-    history_len = _TRUEPEAK_PHASE_TAPS - 1
-    max_peak = 0.0
-    history = np.zeros(history_len, dtype=np.float64)
-    index = 0
-    while index < channel.shape[0]:
-        end = min(index + _TRUEPEAK_BLOCK, channel.shape[0])
-        block = channel[index:end]
-        work = np.concatenate([history, block])
-        for phase in range(_TRUEPEAK_UPSAMPLE):
-            conv = np.convolve(work, phase_taps[phase], mode="full")
-            block_out = conv[history_len : history_len + block.shape[0]]
-            phase_peak = float(np.max(np.abs(block_out))) if block_out.size else 0.0
-            if phase_peak > max_peak:
-                max_peak = phase_peak
-        if block.shape[0] >= history_len:
-            history = block[-history_len:]
-        else:
-            history = np.concatenate([history[block.shape[0] :], block])
-        index = end
-    return max_peak
+@dataclass(frozen=True)
+class TruePeakResult:
+    channel_peaks_dbtp: tuple[float, ...]
+    over_positions: tuple[np.ndarray, ...] | None = None
+    over_events: EventIndex | None = None
 
+    @property
+    def max_dbtp(self) -> float:
+        return max(self.channel_peaks_dbtp, default=float("-inf"))
 
-class OnlineTruePeak:
-    def __init__(self, sample_rate_hz: int, channels: int) -> None:
+
+def _linear_to_dbtp(peak: float) -> float:
+    if peak <= 0.0:
+        return float("-inf")
+    return 20.0 * math.log10(peak)
+
+
+class TruePeakOversampler:
+    """Streaming 4x true-peak meter for ``(frames, channels)`` chunks.
+
+    All channels and all four phases go through one FFT overlap-save pass per
+    block: one ``rfft`` of the block and one batched ``irfft`` against the
+    phase spectra. Memory stays bounded by the block size, so files of any
+    length stream through. With ``ceiling_dbtp`` set, ``finalize`` also
+    reports a bounded index of over events (runs of consecutive 4x samples
+    above the ceiling) in input-frame units; its ``flagged_count`` counts 4x
+    samples. ``collect_positions=True`` additionally keeps every over
+    position per channel (4x samples; divide by four for input frames),
+    which grows with the number of overs.
+    """
+
+    def __init__(
+        self,
+        sample_rate_hz: int,
+        channels: int,
+        *,
+        ceiling_dbtp: float | None = None,
+        collect_positions: bool = False,
+        block_frames: int = _TRUEPEAK_BLOCK,
+        max_over_events: int = DEFAULT_MAX_EVENTS,
+    ) -> None:
         if channels <= 0:
             raise ValueError("channels must be positive")
+        if block_frames <= 0:
+            raise ValueError("block_frames must be positive")
         self.sample_rate_hz = sample_rate_hz
         self.channels = channels
-        self._max_peak = 0.0
-        self._atten = 0.25
-        self._gain_comp = 20.0 * math.log10(float(_TRUEPEAK_UPSAMPLE))
-        self._kernel = None
-        self._phase_taps = None
-        self._histories: list[np.ndarray] = []
-        self._fir_states: list[np.ndarray] = []
-        self._skip_outputs: list[int] = []
-        self._pad = (_TRUEPEAK_TAPS - 1) // 2
-
-        if sample_rate_hz == 48000:
-            coeffs = np.array(
-                [
-                    [0.0017089843750, -0.0291748046875, -0.0189208984375, -0.0083007812500],
-                    [0.0109863281250, 0.0292968750000, 0.0330810546875, 0.0148925781250],
-                    [-0.0196533203125, -0.0517578125000, -0.0582275390625, -0.0266113281250],
-                    [0.0332031250000, 0.0891113281250, 0.1015625000000, 0.0476074218750],
-                    [-0.0594482421875, -0.1665039062500, -0.2003173828125, -0.1022949218750],
-                    [0.1373291015625, 0.4650878906250, 0.7797851562500, 0.9721679687500],
-                    [0.9721679687500, 0.7797851562500, 0.4650878906250, 0.1373291015625],
-                    [-0.1022949218750, -0.2003173828125, -0.1665039062500, -0.0594482421875],
-                    [0.0476074218750, 0.1015625000000, 0.0891113281250, 0.0332031250000],
-                    [-0.0266113281250, -0.0582275390625, -0.0517578125000, -0.0196533203125],
-                    [0.0148925781250, 0.0330810546875, 0.0292968750000, 0.0109863281250],
-                    [-0.0083007812500, -0.0189208984375, -0.0291748046875, 0.0017089843750],
-                ],
-                dtype=np.float64,
-            )
-            self._phase_taps = coeffs.T
-            history_len = _TRUEPEAK_PHASE_TAPS - 1
-            self._histories = [
-                np.zeros(history_len, dtype=np.float64) for _ in range(channels)
-            ]
-        else:
-            self._kernel = _design_lowpass_fir(cutoff=0.25, taps=_TRUEPEAK_TAPS)
-            self._fir_states = [
-                np.zeros(_TRUEPEAK_TAPS - 1, dtype=np.float64) for _ in range(channels)
-            ]
-            self._skip_outputs = [self._pad for _ in range(channels)]
-
-    def _update_true_peak_48k(self, channel: np.ndarray, channel_index: int) -> None:
-        if channel.size == 0:
-            return
-        history = self._histories[channel_index]
-        history_len = _TRUEPEAK_PHASE_TAPS - 1
-        work = np.concatenate([history, channel])
-        for phase in range(_TRUEPEAK_UPSAMPLE):
-            conv = np.convolve(work, self._phase_taps[phase], mode="full")
-            block_out = conv[history_len : history_len + channel.shape[0]]
-            if block_out.size:
-                phase_peak = float(np.max(np.abs(block_out)))
-                if phase_peak > self._max_peak:
-                    self._max_peak = phase_peak
-        if channel.shape[0] >= history_len:
-            history = channel[-history_len:]
-        else:
-            history = np.concatenate([history[channel.shape[0] :], channel])
-        self._histories[channel_index] = history
-
-    def _update_true_peak_fir(self, channel: np.ndarray, channel_index: int) -> None:
-        if channel.size == 0:
-            return
-        upsampled = np.zeros(channel.shape[0] * _TRUEPEAK_UPSAMPLE, dtype=np.float64)
-        upsampled[:: _TRUEPEAK_UPSAMPLE] = channel
-        state = self._fir_states[channel_index]
-        work = np.concatenate([state, upsampled])
-        conv = np.convolve(work, self._kernel, mode="full")
-        start = state.shape[0]
-        end = start + upsampled.shape[0]
-        output = conv[start:end]
-        skip = self._skip_outputs[channel_index]
-        if skip:
-            if skip >= output.size:
-                self._skip_outputs[channel_index] = skip - output.size
-                output = np.zeros(0, dtype=np.float64)
-            else:
-                output = output[skip:]
-                self._skip_outputs[channel_index] = 0
-        if output.size:
-            peak = float(np.max(np.abs(output)))
-            if peak > self._max_peak:
-                self._max_peak = peak
-        self._fir_states[channel_index] = work[-(_TRUEPEAK_TAPS - 1) :]
+        taps, self._skip = _truepeak_phase_taps(sample_rate_hz)
+        self._history_len = taps.shape[1] - 1
+        nfft = 1 << (block_frames + self._history_len - 1).bit_length()
+        self._nfft = nfft
+        self._block = nfft - self._history_len
+        self._phase_spectra = np.fft.rfft(taps, n=nfft, axis=1)[None, :, :]
+        # irfft otherwise returns a non-C-ordered array, which makes the peak
+        # reductions below several times slower than the transforms.
+        self._filtered = np.empty((channels, taps.shape[0], nfft), dtype=np.float64)
+        self._history = np.zeros((self._history_len, channels), dtype=np.float64)
+        self._frames_in = 0
+        self._frames_out = 0
+        self._peaks = np.zeros(channels, dtype=np.float64)
+        self._ceiling = None if ceiling_dbtp is None else 10.0 ** (ceiling_dbtp / 20.0)
+        self._overs: list[list[np.ndarray]] | None = (
+            [[] for _ in range(channels)]
+            if collect_positions and self._ceiling is not None
+            else None
+        )
+        self._over_events = (
+            EventRunIndex(channels, max_events=max_over_events)
+            if self._ceiling is not None
+            else None
+        )
+        self._result: TruePeakResult | None = None
 
     def update(self, chunk_frames: np.ndarray) -> None:
+        if self._result is not None:
+            raise ValueError("true-peak oversampler already finalized")
         if chunk_frames.size == 0:
             return
-        if chunk_frames.shape[1] != self.channels:
+        if chunk_frames.ndim != 2 or chunk_frames.shape[1] != self.channels:
             raise ValueError("chunk_frames channel count mismatch")
-        for channel_index in range(self.channels):
-            channel = chunk_frames[:, channel_index] * self._atten
-            if self.sample_rate_hz == 48000:
-                self._update_true_peak_48k(channel, channel_index)
-            else:
-                self._update_true_peak_fir(channel, channel_index)
+        samples = np.asarray(chunk_frames, dtype=np.float64)
+        for start in range(0, samples.shape[0], self._block):
+            self._process(samples[start : start + self._block])
+        self._frames_in += samples.shape[0]
+
+    def _process(self, block: np.ndarray, *, limit: int | None = None) -> None:
+        work = np.concatenate([self._history, block], axis=0)
+        # Transform along the contiguous last axis: (channels, bins) against
+        # (phases, bins) gives every channel/phase pair in one irfft call.
+        spectrum = np.fft.rfft(work.T, n=self._nfft, axis=-1)
+        filtered = np.fft.irfft(
+            spectrum[:, None, :] * self._phase_spectra,
+            n=self._nfft,
+            axis=-1,
+            out=self._filtered,
+        )
+        frames = block.shape[0]
+        start = self._history_len
+        segment = filtered[:, :, start : start + frames]
+        self._history = work[-self._history_len :] if self._history_len else work[:0]
+
+        first = _TRUEPEAK_UPSAMPLE * self._frames_out
+        self._frames_out += frames
+        total = frames * _TRUEPEAK_UPSAMPLE
+        low = max(0, self._skip - first)
+        high = total if limit is None else max(low, min(total, limit - first))
+        if high <= low:
+            return
+        if low == 0 and high == total:
+            # Steady state: reduce over phases and frames without reordering;
+            # only blocks that cross the ceiling need per-sample positions.
+            peaks = np.maximum(segment.max(axis=(1, 2)), -segment.min(axis=(1, 2)))
+            np.maximum(self._peaks, peaks, out=self._peaks)
+            if self._ceiling is None or not np.any(peaks > self._ceiling):
+                return
+
+        # (channels, phases, frames) -> (4x samples in time order, channels).
+        upsampled = segment.transpose(2, 1, 0).reshape(total, self.channels)
+        magnitude = np.abs(upsampled[low:high])
+        np.maximum(self._peaks, magnitude.max(axis=0), out=self._peaks)
+        if self._ceiling is not None and self._over_events is not None:
+            flagged = magnitude > self._ceiling
+            self._over_events.update(magnitude, flagged, first + low - self._skip)
+            if self._overs is None:
+                return
+            rows, cols = np.nonzero(flagged)
+            if rows.size:
+                positions = rows.astype(np.int64) + (first + low - self._skip)
+                for channel_index in range(self.channels):
+                    hits = positions[cols == channel_index]
+                    if hits.size:
+                        self._overs[channel_index].append(hits)
+
+    def finalize(self) -> TruePeakResult:
+        if self._result is not None:
+            return self._result
+        if self._skip:
+            # Flush the centred kernel's tail so the last input frames reach
+            # the output, then stop at the 4x length of the input.
+            tail = np.zeros((-(-self._skip // _TRUEPEAK_UPSAMPLE), self.channels), dtype=np.float64)
+            self._process(tail, limit=self._skip + _TRUEPEAK_UPSAMPLE * self._frames_in)
+        over_positions = None
+        over_events = None
+        if self._overs is not None:
+            over_positions = tuple(
+                np.concatenate(hits) if hits else np.zeros(0, dtype=np.int64)
+                for hits in self._overs
+            )
+        if self._over_events is not None:
+            over_events = _over_events_in_frames(self._over_events.finalize())
+        self._result = TruePeakResult(
+            channel_peaks_dbtp=tuple(_linear_to_dbtp(float(peak)) for peak in self._peaks),
+            over_positions=over_positions,
+            over_events=over_events,
+        )
+        return self._result
+
+
+def _over_events_in_frames(index: EventIndex) -> EventIndex:
+    """Map 4x-sample runs onto the input frames they span."""
+    events = []
+    for event in index.events:
+        first = event.start_frame // _TRUEPEAK_UPSAMPLE
+        last = -(-(event.start_frame + event.length) // _TRUEPEAK_UPSAMPLE)
+        events.append(replace(event, start_frame=first, length=last - first))
+    return replace(index, events=tuple(events))
+
+
+class OnlineTruePeak:
+    def __init__(self, sample_rate_hz: int, channels: int) -> None:
+        if channels <= 0:
+            raise ValueError("channels must be positive")
+        self.sample_rate_hz = sample_rate_hz
+        self.channels = channels
+        self._oversampler = TruePeakOversampler(sample_rate_hz, channels)
+
+    def update(self, chunk_frames: np.ndarray) -> None:
+        self._oversampler.update(chunk_frames)
 
     def finalize(self) -> float:
-        if self.sample_rate_hz != 48000 and self._kernel is not None:
-            tail = np.zeros(self._pad, dtype=np.float64)
-            for channel_index in range(self.channels):
-                self._update_true_peak_fir(tail, channel_index)
-        if self._max_peak <= 0.0:
-            return float("-inf")
-        return 20.0 * math.log10(self._max_peak) + self._gain_comp
+        return self._oversampler.finalize().max_dbtp
+
+
+def warm_truth_meter_state(sample_rates: Iterable[int]) -> None:
+    """Fill this process's speaker-table and filter caches for ``sample_rates``.
+
+    Pooled scan workers call this once at start-up, so the first stem each
+    worker meters does not pay for ontology parsing or filter design.
+    """
+    _speaker_coords_from_ontology()
+    use_numpy_iir = _optional_sosfilt() is None
+    for sample_rate_hz in sorted({int(rate) for rate in sample_rates if int(rate) > 0}):
+        _truepeak_phase_taps(sample_rate_hz)
+        if use_numpy_iir:
+            _, pre_a, _, rlb_a = k_weighting_biquads(sample_rate_hz)
+            for a in (pre_a, rlb_a):
+                _biquad_block_operators(float(a[1]), float(a[2]), _IIR_BLOCK_FRAMES)
 
 
 def compute_true_peak_dbtp_wav(path: Path) -> float:
@@ -729,28 +1073,26 @@ def compute_true_peak_dbtp_float64(
     """Compute true-peak (dBTP) from float64 samples."""
     if samples.size == 0:
         return float("-inf")
-    atten = 0.25
-    gain_comp = 20.0 * math.log10(float(_TRUEPEAK_UPSAMPLE))
-    max_peak = 0.0
-    kernel = None
-    if sample_rate_hz != 48000:
-        kernel = _design_lowpass_fir(cutoff=0.25, taps=_TRUEPEAK_TAPS)
-    for channel_index in range(samples.shape[1]):
-        channel = samples[:, channel_index] * atten
-        if sample_rate_hz == 48000:
-            channel_peak = _true_peak_48k_polyphase(channel)
-        else:
-            upsampled = np.zeros(
-                channel.shape[0] * _TRUEPEAK_UPSAMPLE, dtype=np.float64
-            )
-            upsampled[:: _TRUEPEAK_UPSAMPLE] = channel
-            filtered = np.convolve(upsampled, kernel, mode="same")
-            channel_peak = float(np.max(np.abs(filtered))) if filtered.size else 0.0
-        if channel_peak > max_peak:
-            max_peak = channel_peak
-    if max_peak <= 0.0:
-        return float("-inf")
-    return 20.0 * math.log10(max_peak) + gain_comp
+    return compute_true_peak_float64(samples, sample_rate_hz).max_dbtp
+
+
+def compute_true_peak_float64(
+    samples: np.ndarray,
+    sample_rate_hz: int,
+    *,
+    ceiling_dbtp: float | None = None,
+    collect_positions: bool = False,
+) -> TruePeakResult:
+    """Per-channel true-peak (dBTP) and optional over-ceiling events or positions."""
+    oversampler = TruePeakOversampler(
+        sample_rate_hz,
+        samples.shape[1],
+        ceiling_dbtp=ceiling_dbtp,
+        collect_positions=collect_positions,
+        block_frames=max(1, min(_TRUEPEAK_BLOCK, samples.shape[0])),
+    )
+    oversampler.update(samples)
+    return oversampler.finalize()
 
 
 def compute_true_peak_dbtp_from_chunks(
@@ -774,18 +1116,7 @@ def compute_lufs_integrated_wav(
     method_id: str | None = DEFAULT_LOUDNESS_METHOD_ID,
 ) -> float:
     """Compute integrated loudness (LUFS) per ITU-style gating."""
-    metadata = read_wav_metadata(path)
-    channels = int(metadata["channels"])
-    channel_mask = metadata.get("channel_mask")
-    samples, sample_rate_hz = _read_wav_float64(path)
-    return compute_lufs_integrated_float64(
-        samples,
-        sample_rate_hz,
-        channels,
-        channel_mask=channel_mask,
-        channel_layout=None,
-        method_id=method_id,
-    )
+    return _compute_lufs_wav(path, method_id=method_id, block_s=0.4, hop_s=0.1, gated=True)
 
 
 def compute_lufs_shortterm_wav(
@@ -794,18 +1125,35 @@ def compute_lufs_shortterm_wav(
     method_id: str | None = DEFAULT_LOUDNESS_METHOD_ID,
 ) -> float:
     """Compute short-term loudness (LUFS) over 3s windows."""
+    return _compute_lufs_wav(path, method_id=method_id, block_s=3.0, hop_s=1.0, gated=False)
+
+
+def _compute_lufs_wav(
+    path: Path,
+    *,
+    method_id: str | None,
+    block_s: float,
+    hop_s: float,
+    gated: bool,
+) -> float:
+    # Streams the file in blocks; filter state and partial windows carry over.
+    from mmo.dsp.meters import iter_wav_frames_ndarray  # noqa: WPS433
+
     metadata = read_wav_metadata(path)
-    channels = int(metadata["channels"])
-    channel_mask = metadata.get("channel_mask")
-    samples, sample_rate_hz = _read_wav_float64(path)
-    return compute_lufs_shortterm_float64(
-        samples,
-        sample_rate_hz,
-        channels,
-        channel_mask=channel_mask,
+    weights, _, _ = _bs1770_gi_weights(
+        int(metadata["channels"]),
+        metadata.get("channel_mask"),
         channel_layout=None,
         method_id=method_id,
     )
+    blocks = _KWeightedBlockEnergies(
+        int(metadata["sample_rate_hz"]), weights, windows=((block_s, hop_s),)
+    )
+    for chunk in iter_wav_frames_ndarray(
+        path, error_context="truth meters", chunk_frames=_LUFS_WAV_CHUNK_FRAMES
+    ):
+        blocks.update(chunk)
+    return _gated_loudness(blocks.energies(), gated=gated)
 
 
 def _compute_lufs_from_samples(
@@ -819,33 +1167,9 @@ def _compute_lufs_from_samples(
 ) -> float:
     if samples.size == 0:
         return float("-inf")
-
-    weighted = np.zeros_like(samples, dtype=np.float64)
-    for channel_index in range(samples.shape[1]):
-        weighted[:, channel_index] = _k_weighted(samples[:, channel_index], sample_rate_hz)
-
-    energies = _block_energies(
-        weighted, sample_rate_hz, block_s=block_s, hop_s=hop_s, weights=weights
-    )
-    if not energies:
-        return float("-inf")
-
-    if gated:
-        abs_threshold = 10.0 ** ((-70.0 - _LOUDNESS_OFFSET) / 10.0)
-        energies = [energy for energy in energies if energy > abs_threshold]
-        if not energies:
-            return float("-inf")
-
-        mean_energy = float(np.mean(energies))
-        rel_threshold = mean_energy / 10.0
-        energies = [energy for energy in energies if energy > rel_threshold]
-        if not energies:
-            return float("-inf")
-
-    mean_energy = float(np.mean(energies))
-    if mean_energy <= 0.0:
-        return float("-inf")
-    return _LOUDNESS_OFFSET + 10.0 * math.log10(mean_energy)
+    blocks = _KWeightedBlockEnergies(sample_rate_hz, weights, windows=((block_s, hop_s),))
+    blocks.update(samples)
+    return _gated_loudness(blocks.energies(), gated=gated)
 
 
 def compute_lufs_integrated_float64(
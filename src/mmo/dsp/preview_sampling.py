@@ -0,0 +1,67 @@
+"""Seeded window sampling for preview scans.
+
+A preview reads ``window_count`` windows of ``window_s`` seconds per stem
+instead of the whole file. The stem is split into equal strata and one
+window starts at a seeded offset inside each, so windows never overlap,
+cover the whole duration, and land on the same frames for the same seed
+and stem. Error bounds come from how much a measurement varies between
+windows.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import random
+from typing import Sequence
+
+DEFAULT_PREVIEW_WINDOW_COUNT = 32
+DEFAULT_PREVIEW_WINDOW_S = 3.0
+PREVIEW_CONFIDENCE = 0.95
+_Z_95 = 1.959964
+
+
+def preview_windows(
+    frame_count: int,
+    window_frames: int,
+    *,
+    window_count: int = DEFAULT_PREVIEW_WINDOW_COUNT,
+    seed: int = 0,
+    key: str = "",
+) -> list[tuple[int, int]] | None:
+    """Return sorted ``(start_frame, frame_count)`` windows, or None to read it all.
+
+    None means the windows would cover the whole stem, so sampling would
+    save nothing. ``key`` (the stem id) decorrelates stems scanned with the
+    same ``seed``.
+    """
+    if window_frames <= 0 or window_count <= 0:
+        raise ValueError("window_frames and window_count must be positive")
+    if frame_count <= window_frames * window_count:
+        return None
+    digest = hashlib.sha256(f"{seed}:{key}".encode("utf-8")).digest()
+    rng = random.Random(int.from_bytes(digest[:8], "big"))
+    stride = frame_count / window_count
+    windows = []
+    for index in range(window_count):
+        low = int(math.floor(index * stride))
+        high = int(math.floor((index + 1) * stride)) - window_frames
+        windows.append((rng.randint(low, max(low, high)), window_frames))
+    return windows
+
+
+def window_error_bound(values: Sequence[float], *, population: float) -> float | None:
+    """Half-width of a 95% interval for the mean of ``values``.
+
+    ``values`` are one reading per sampled window; ``population`` is how many
+    windows the whole stem holds, for the finite-population correction.
+    Returns None with fewer than two finite readings.
+    """
+    finite = [float(value) for value in values if math.isfinite(value)]
+    count = len(finite)
+    if count < 2:
+        return None
+    mean = sum(finite) / count
+    variance = sum((value - mean) ** 2 for value in finite) / (count - 1)
+    correction = max(0.0, 1.0 - count / population) if population > 0 else 0.0
+    return _Z_95 * math.sqrt(variance / count * correction)
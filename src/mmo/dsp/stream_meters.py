@@ -5,7 +5,10 @@ from pathlib import Path
 from typing import Any, Iterator, Sequence
 
 from mmo.core.loudness_methods import DEFAULT_LOUDNESS_METHOD_ID
-from mmo.dsp.backends.ffmpeg_decode import iter_ffmpeg_float64_samples
+from mmo.dsp.backends.ffmpeg_decode import (
+    iter_ffmpeg_float64_samples,
+    iter_ffmpeg_frames_ndarray,
+)
 from mmo.dsp.decoders import read_metadata
 from mmo.dsp.meters import compute_basic_stats_from_float64, iter_wav_float64_samples
 
@@ -35,20 +38,8 @@ def _iter_ffmpeg_frame_chunks(
     channels: int,
     np_module: Any,
 ) -> Iterator[Any]:
-    carry: list[float] = []
-    for float_samples in iter_ffmpeg_float64_samples(path, ffmpeg_cmd):
-        data = carry + float_samples
-        remainder = len(data) % channels
-        if remainder:
-            carry = data[-remainder:]
-            data = data[:-remainder]
-        else:
-            carry = []
-        if not data:
-            continue
-        frames = np_module.asarray(data, dtype=np_module.float64).reshape(-1, channels)
-        if frames.size > 0:
-            yield frames
+    del np_module
+    yield from iter_ffmpeg_frames_ndarray(path, ffmpeg_cmd, channels=channels)
 
 
 def _integrated_lufs_or_none(
@@ -0,0 +1,175 @@
+"""Random-access WAV reads over a memory-mapped ``data`` chunk."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterator, Mapping
+
+import numpy as np
+
+from mmo.dsp.io import read_wav_metadata
+
+_PCM_BYTES_PER_SAMPLE = {16: 2, 24: 3, 32: 4}
+_IEEE_BYTES_PER_SAMPLE = {32: 4, 64: 8}
+_CHUNK_FRAMES = 4096
+
+
+class WavMemmap:
+    """Read-only, frame-indexed view of a PCM or IEEE-float WAV file.
+
+    The ``data`` chunk located by ``read_wav_metadata`` is mapped with
+    ``np.memmap`` so a slice only touches the pages it covers, and several
+    processes reading the same stem share one page-cached copy.
+
+    Indexing returns ``(frames, channels)`` float64 arrays with the same
+    values and clamping as ``iter_wav_frames_ndarray``::
+
+        with WavMemmap(path) as wav:
+            window = wav[48000:96000]
+    """
+
+    def __init__(self, path: Path, *, metadata: Mapping[str, Any] | None = None) -> None:
+        self.path = path
+        resolved_metadata = dict(metadata) if metadata is not None else read_wav_metadata(path)
+
+        audio_format = resolved_metadata["audio_format_resolved"]
+        bits_per_sample = int(resolved_metadata["bits_per_sample"])
+        channels = int(resolved_metadata["channels"])
+        block_align = int(resolved_metadata["block_align"])
+        data_offset = resolved_metadata.get("data_offset")
+        if audio_format == 1:
+            bytes_per_sample = _PCM_BYTES_PER_SAMPLE.get(bits_per_sample)
+        elif audio_format == 3:
+            bytes_per_sample = _IEEE_BYTES_PER_SAMPLE.get(bits_per_sample)
+        else:
+            raise ValueError(f"Unsupported WAV format: {audio_format}")
+        if bytes_per_sample is None:
+            raise ValueError(f"Unsupported bits per sample: {bits_per_sample}")
+        if not isinstance(data_offset, int) or data_offset < 0:
+            raise ValueError(f"Missing data chunk offset for '{path}'")
+        if block_align < bytes_per_sample * channels:
+            raise ValueError(f"Invalid block alignment {block_align} in '{path}'")
+
+        self.metadata = resolved_metadata
+        self.audio_format = audio_format
+        self.bits_per_sample = bits_per_sample
+        self.bytes_per_sample = bytes_per_sample
+        self.channels = channels
+        self.sample_rate_hz = int(resolved_metadata["sample_rate_hz"])
+        self.block_align = block_align
+        self.num_frames = int(resolved_metadata["num_frames"])
+
+        # Map whole frames as raw bytes. Typed views are carved out of this
+        # per read so padded block alignments and 24-bit words share one path.
+        if self.num_frames > 0:
+            self._raw: Any = np.memmap(
+                path,
+                dtype=np.uint8,
+                mode="r",
+                offset=data_offset,
+                shape=(self.num_frames, block_align),
+            )
+        else:
+            self._raw = np.zeros((0, block_align), dtype=np.uint8)
+
+    def __enter__(self) -> "WavMemmap":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.num_frames
+
+    def close(self) -> None:
+        """Drop this reader's mapping. Arrays already returned stay valid."""
+        self._raw = np.zeros((0, self.block_align), dtype=np.uint8)
+        self.num_frames = 0
+
+    @property
+    def duration_s(self) -> float:
+        return self.num_frames / float(self.sample_rate_hz)
+
+    def raw_frames(self, start: int = 0, stop: int | None = None) -> Any:
+        """Return stored samples for ``[start, stop)`` without float conversion.
+
+        16/32-bit PCM and float formats come back as zero-copy read-only
+        ``(frames, channels)`` views. 24-bit PCM is sign-extended into int32,
+        which needs one vectorized pass over the requested frames.
+        """
+        start, stop = self._clamp_range(start, stop)
+        sample_bytes = self.bytes_per_sample * self.channels
+        rows = self._raw[start:stop, :sample_bytes]
+        if self.bits_per_sample == 24 and self.audio_format == 1:
+            words = rows.reshape(stop - start, self.channels, 3).astype(np.int32)
+            ints = words[:, :, 0] | (words[:, :, 1] << 8) | (words[:, :, 2] << 16)
+            return (ints ^ 0x800000) - 0x800000
+        return rows.view(self._stored_dtype()).reshape(stop - start, self.channels)
+
+    def read(self, start: int = 0, stop: int | None = None, *, dtype: str = "float64") -> Any:
+        """Return ``[start, stop)`` as a ``(frames, channels)`` float array."""
+        out_dtype = np.dtype(dtype)
+        if out_dtype not in (np.dtype(np.float32), np.dtype(np.float64)):
+            raise ValueError(f"Unsupported output dtype: {out_dtype.name}")
+        stored = self.raw_frames(start, stop)
+        values = stored.astype(np.float64)
+        if self.audio_format == 1:
+            divisor = float(2 ** (self.bits_per_sample - 1))
+            values /= divisor
+            np.clip(values, -1.0, (divisor - 1.0) / divisor, out=values)
+        else:
+            np.clip(values, -1.0, float(np.nextafter(1.0, 0.0)), out=values)
+        if out_dtype != np.dtype(np.float64):
+            values = values.astype(out_dtype)
+            upper = np.nextafter(np.asarray(1.0, dtype=out_dtype), np.asarray(0.0, dtype=out_dtype))
+            np.clip(values, -1.0, float(upper), out=values)
+        return values
+
+    def iter_blocks(
+        self,
+        start: int = 0,
+        stop: int | None = None,
+        *,
+        chunk_frames: int = _CHUNK_FRAMES,
+        dtype: str = "float64",
+    ) -> Iterator[Any]:
+        """Yield float blocks covering ``[start, stop)`` in order."""
+        if chunk_frames <= 0:
+            raise ValueError("chunk_frames must be positive")
+        start, stop = self._clamp_range(start, stop)
+        for block_start in range(start, stop, chunk_frames):
+            yield self.read(block_start, min(block_start + chunk_frames, stop), dtype=dtype)
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.num_frames)
+            if step == 1:
+                return self.read(start, stop)
+            if step > 0:
+                if stop <= start:
+                    return np.zeros((0, self.channels), dtype=np.float64)
+                return self.read(start, stop)[::step]
+            # Negative steps read the covered span once, then reverse it.
+            if start <= stop:
+                return np.zeros((0, self.channels), dtype=np.float64)
+            return self.read(stop + 1, start + 1)[::-1][::-step]
+        if isinstance(key, (int, np.integer)) and not isinstance(key, bool):
+            index = int(key)
+            if index < 0:
+                index += self.num_frames
+            if index < 0 or index >= self.num_frames:
+                raise IndexError("frame index out of range")
+            return self.read(index, index + 1)[0]
+        raise TypeError("WavMemmap indices must be integers or slices")
+
+    def _clamp_range(self, start: int, stop: int | None) -> tuple[int, int]:
+        if stop is None:
+            stop = self.num_frames
+        start = max(0, min(int(start), self.num_frames))
+        stop = max(start, min(int(stop), self.num_frames))
+        return start, stop
+
+    def _stored_dtype(self) -> Any:
+        if self.audio_format == 3:
+            return np.dtype("<f4") if self.bits_per_sample == 32 else np.dtype("<f8")
+        return np.dtype("<i2") if self.bits_per_sample == 16 else np.dtype("<i4")
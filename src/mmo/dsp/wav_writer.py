@@ -0,0 +1,176 @@
+"""Streaming PCM WAV writer that upgrades to RF64 past the RIFF size limit.
+
+``wave.Wave_write`` stores sizes in 32-bit RIFF fields, so a long
+multichannel master silently overflows at 4 GiB. ``Rf64WavWriter`` keeps the
+same ``setnchannels``/``setsampwidth``/``setframerate``/``writeframes``
+surface but reserves a 28-byte ``JUNK`` chunk ahead of ``fmt``. While the
+file fits RIFF it stays a plain RIFF/WAVE file; as soon as the data crosses
+the limit the header is rewritten in place to ``RF64`` and the reserved
+chunk becomes ``ds64`` (EBU Tech 3306 / ITU-R BS.2088), carrying the 64-bit
+RIFF, data, and sample counts.
+"""
+
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO
+
+RIFF_SIZE_LIMIT = 0xFFFFFFFF
+
+_DS64_PAYLOAD_BYTES = 28
+_RIFF_SIZE_OFFSET = 4
+_DS64_CHUNK_OFFSET = 12
+_DATA_SIZE_OFFSET = 76
+_HEADER_BYTES = 80
+_SUPPORTED_SAMPLE_WIDTHS = (2, 3, 4)
+
+
+class Rf64WavWriter:
+    """Write interleaved little-endian PCM frames to a RIFF or RF64 WAV file.
+
+    ``riff_size_limit`` only exists so tests can exercise the upgrade
+    without writing 4 GiB.
+    """
+
+    def __init__(self, path: Path, *, riff_size_limit: int = RIFF_SIZE_LIMIT) -> None:
+        if not 0 < riff_size_limit <= RIFF_SIZE_LIMIT:
+            raise ValueError("riff_size_limit must be within the 32-bit RIFF range")
+        self.path = Path(path)
+        self._size_limit = int(riff_size_limit)
+        self._handle: BinaryIO | None = self.path.open("wb")
+        self._channels = 0
+        self._sample_width = 0
+        self._sample_rate_hz = 0
+        self._header_written = False
+        self._data_bytes = 0
+        self._rf64 = False
+
+    def __enter__(self) -> "Rf64WavWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def setnchannels(self, channels: int) -> None:
+        self._require_open_header()
+        if channels <= 0:
+            raise ValueError("channels must be > 0")
+        self._channels = int(channels)
+
+    def setsampwidth(self, sample_width: int) -> None:
+        self._require_open_header()
+        if sample_width not in _SUPPORTED_SAMPLE_WIDTHS:
+            raise ValueError(f"Unsupported PCM sample width: {sample_width}")
+        self._sample_width = int(sample_width)
+
+    def setframerate(self, sample_rate_hz: int) -> None:
+        self._require_open_header()
+        if sample_rate_hz <= 0:
+            raise ValueError("sample_rate_hz must be > 0")
+        self._sample_rate_hz = int(sample_rate_hz)
+
+    def setnframes(self, frame_count: int) -> None:
+        """Accepted for ``wave`` compatibility; sizes are patched on close."""
+
+    @property
+    def is_rf64(self) -> bool:
+        return self._rf64
+
+    @property
+    def frame_count(self) -> int:
+        block_align = self._channels * self._sample_width
+        return self._data_bytes // block_align if block_align else 0
+
+    def writeframes(self, data: bytes) -> None:
+        handle = self._require_handle()
+        if not self._header_written:
+            self._write_header(handle)
+        handle.write(data)
+        self._data_bytes += len(data)
+        if not self._rf64 and self._riff_payload_bytes() > self._size_limit:
+            self._upgrade_to_rf64(handle)
+
+    def close(self) -> None:
+        handle = self._handle
+        if handle is None:
+            return
+        try:
+            if not self._header_written:
+                self._write_header(handle)
+            if self._data_bytes % 2 == 1:
+                handle.write(b"\x00")
+            self._patch_sizes(handle)
+        finally:
+            self._handle = None
+            handle.close()
+
+    def _require_handle(self) -> BinaryIO:
+        if self._handle is None:
+            raise ValueError("WAV writer is closed")
+        return self._handle
+
+    def _require_open_header(self) -> None:
+        self._require_handle()
+        if self._header_written:
+            raise ValueError("Cannot change WAV parameters after writing frames")
+
+    def _riff_payload_bytes(self) -> int:
+        # WAVE id + header chunks + data payload (+ pad byte).
+        return _HEADER_BYTES - 8 + self._data_bytes + (self._data_bytes % 2)
+
+    def _write_header(self, handle: BinaryIO) -> None:
+        if not (self._channels and self._sample_width and self._sample_rate_hz):
+            raise ValueError("WAV channels, sample width, and frame rate must be set")
+        block_align = self._channels * self._sample_width
+        handle.write(
+            b"RIFF"
+            + struct.pack("<I", 0)
+            + b"WAVE"
+            + b"JUNK"
+            + struct.pack("<I", _DS64_PAYLOAD_BYTES)
+            + bytes(_DS64_PAYLOAD_BYTES)
+            + b"fmt "
+            + struct.pack(
+                "<IHHIIHH",
+                16,
+                1,
+                self._channels,
+                self._sample_rate_hz,
+                self._sample_rate_hz * block_align,
+                block_align,
+                self._sample_width * 8,
+            )
+            + b"data"
+            + struct.pack("<I", 0)
+        )
+        self._header_written = True
+
+    def _upgrade_to_rf64(self, handle: BinaryIO) -> None:
+        position = handle.tell()
+        handle.seek(0)
+        handle.write(b"RF64" + struct.pack("<I", RIFF_SIZE_LIMIT))
+        handle.seek(_DS64_CHUNK_OFFSET)
+        handle.write(b"ds64")
+        handle.seek(_DATA_SIZE_OFFSET)
+        handle.write(struct.pack("<I", RIFF_SIZE_LIMIT))
+        handle.seek(position)
+        self._rf64 = True
+
+    def _patch_sizes(self, handle: BinaryIO) -> None:
+        if self._rf64:
+            handle.seek(_DS64_CHUNK_OFFSET + 8)
+            handle.write(
+                struct.pack(
+                    "<QQQI",
+                    self._riff_payload_bytes(),
+                    self._data_bytes,
+                    self.frame_count,
+                    0,
+                )
+            )
+            return
+        handle.seek(_RIFF_SIZE_OFFSET)
+        handle.write(struct.pack("<I", self._riff_payload_bytes()))
+        handle.seek(_DATA_SIZE_OFFSET)
+        handle.write(struct.pack("<I", self._data_bytes))
@@ -94,25 +94,17 @@ def compute_masking_risk(
     normalized.sort(key=lambda item: item["stem_id"])
 
     if len(normalized) < 2:
-        return {
-            "top_pairs": [],
-            "pair_count": 0,
-            "window_size": window_size,
-            "hop_size": hop_size,
-            "mid_band_hz": {"low_hz": low_hz, "high_hz": high_hz},
-        }
+        return _masking_payload(
+            [], window_size=window_size, hop_size=hop_size, low_hz=low_hz, high_hz=high_hz, top_n=top_n
+        )
 
     window = np.hanning(window_size).astype(np.float64)
     freqs = np.fft.rfftfreq(window_size, d=1.0 / float(sample_rate_hz))
     band_mask = (freqs >= low_hz) & (freqs <= high_hz)
     if not np.any(band_mask):
-        return {
-            "top_pairs": [],
-            "pair_count": 0,
-            "window_size": window_size,
-            "hop_size": hop_size,
-            "mid_band_hz": {"low_hz": low_hz, "high_hz": high_hz},
-        }
+        return _masking_payload(
+            [], window_size=window_size, hop_size=hop_size, low_hz=low_hz, high_hz=high_hz, top_n=top_n
+        )
 
     pairs: list[dict[str, Any]] = []
     for index_a, stem_a in enumerate(normalized):
@@ -148,29 +140,149 @@ def compute_masking_risk(
                 scores[window_index] = score
                 weights[window_index] = weight
 
-            if float(np.sum(weights)) > _EPSILON:
-                pair_score = float(np.sum(scores * weights) / np.sum(weights))
-            else:
-                pair_score = float(np.mean(scores))
-
-            start_s, end_s = _best_time_range(
-                scores,
-                weights,
-                hop_size=hop_size,
-                window_size=window_size,
-                sample_rate_hz=sample_rate_hz,
+            pairs.append(
+                _pair_entry(
+                    stem_a["stem_id"],
+                    stem_b["stem_id"],
+                    scores,
+                    weights,
+                    window_size=window_size,
+                    hop_size=hop_size,
+                    sample_rate_hz=sample_rate_hz,
+                )
             )
+
+    return _masking_payload(
+        pairs, window_size=window_size, hop_size=hop_size, low_hz=low_hz, high_hz=high_hz, top_n=top_n
+    )
+
+
+def compute_masking_risk_from_features(
+    stems: Iterable[dict[str, Any]],
+    *,
+    sample_rate_hz: int,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+    hop_size: int = DEFAULT_HOP_SIZE,
+    low_hz: float = DEFAULT_LOW_HZ,
+    high_hz: float = DEFAULT_HIGH_HZ,
+    top_n: int = DEFAULT_TOP_N,
+) -> dict[str, Any]:
+    """Compute ``compute_masking_risk`` from per-window mid-band spectra.
+
+    Each stem carries ``stem_id``, ``frame_count``, and ``mid_band``: the
+    ``(windows, bins)`` mid-band magnitude spectra from
+    ``mmo.meters.mix_features`` computed with the same window, hop, and
+    band. With float32 spectra, scores agree with ``compute_masking_risk``
+    to float32 rounding.
+    """
+    if sample_rate_hz <= 0:
+        raise ValueError("sample_rate_hz must be positive")
+    if window_size <= 0 or hop_size <= 0:
+        raise ValueError("window_size and hop_size must be positive")
+    if low_hz < 0.0 or high_hz <= low_hz:
+        raise ValueError("Invalid masking band")
+
+    normalized: list[dict[str, Any]] = []
+    for stem in stems:
+        stem_id = stem.get("stem_id")
+        mid_band = stem.get("mid_band")
+        frame_count = stem.get("frame_count")
+        if not isinstance(stem_id, str) or not stem_id:
+            continue
+        if not isinstance(mid_band, np.ndarray) or mid_band.ndim != 2:
+            continue
+        if not isinstance(frame_count, (int, np.integer)) or frame_count < 0:
+            continue
+        normalized.append(
+            {"stem_id": stem_id, "mid_band": mid_band, "frame_count": int(frame_count)}
+        )
+    normalized.sort(key=lambda item: item["stem_id"])
+
+    if len(normalized) < 2 or any(item["mid_band"].shape[1] == 0 for item in normalized):
+        return _masking_payload(
+            [], window_size=window_size, hop_size=hop_size, low_hz=low_hz, high_hz=high_hz, top_n=top_n
+        )
+
+    pairs: list[dict[str, Any]] = []
+    for index_a, stem_a in enumerate(normalized):
+        band_a_all = stem_a["mid_band"].astype(np.float64)
+        energy_a_all = np.einsum("ij,ij->i", band_a_all, band_a_all)
+        for stem_b in normalized[index_a + 1 :]:
+            length = min(stem_a["frame_count"], stem_b["frame_count"])
+            window_count = _window_count(length, window_size, hop_size)
+            if window_count == 0:
+                continue
+
+            band_a = band_a_all[:window_count]
+            band_b = stem_b["mid_band"][:window_count].astype(np.float64)
+            energy_a = energy_a_all[:window_count]
+            energy_b = np.einsum("ij,ij->i", band_b, band_b)
+            valid = (energy_a > _EPSILON) & (energy_b > _EPSILON)
+            norm = np.sqrt(energy_a * energy_b)
+            dot_values = np.einsum("ij,ij->i", band_a, band_b)
+
+            scores = np.zeros(window_count, dtype=np.float64)
+            weights = np.zeros(window_count, dtype=np.float64)
+            scores[valid] = np.clip(dot_values[valid] / (norm[valid] + _EPSILON), 0.0, 1.0)
+            weights[valid] = norm[valid]
             pairs.append(
-                {
-                    "stem_a": stem_a["stem_id"],
-                    "stem_b": stem_b["stem_id"],
-                    "score": pair_score,
-                    "start_s": round(start_s, 6),
-                    "end_s": round(end_s, 6),
-                    "window_count": int(window_count),
-                }
+                _pair_entry(
+                    stem_a["stem_id"],
+                    stem_b["stem_id"],
+                    scores,
+                    weights,
+                    window_size=window_size,
+                    hop_size=hop_size,
+                    sample_rate_hz=sample_rate_hz,
+                )
             )
 
+    return _masking_payload(
+        pairs, window_size=window_size, hop_size=hop_size, low_hz=low_hz, high_hz=high_hz, top_n=top_n
+    )
+
+
+def _pair_entry(
+    stem_a: str,
+    stem_b: str,
+    scores: np.ndarray,
+    weights: np.ndarray,
+    *,
+    window_size: int,
+    hop_size: int,
+    sample_rate_hz: int,
+) -> dict[str, Any]:
+    if float(np.sum(weights)) > _EPSILON:
+        pair_score = float(np.sum(scores * weights) / np.sum(weights))
+    else:
+        pair_score = float(np.mean(scores))
+
+    start_s, end_s = _best_time_range(
+        scores,
+        weights,
+        hop_size=hop_size,
+        window_size=window_size,
+        sample_rate_hz=sample_rate_hz,
+    )
+    return {
+        "stem_a": stem_a,
+        "stem_b": stem_b,
+        "score": pair_score,
+        "start_s": round(start_s, 6),
+        "end_s": round(end_s, 6),
+        "window_count": int(scores.size),
+    }
+
+
+def _masking_payload(
+    pairs: list[dict[str, Any]],
+    *,
+    window_size: int,
+    hop_size: int,
+    low_hz: float,
+    high_hz: float,
+    top_n: int,
+) -> dict[str, Any]:
     pairs.sort(
         key=lambda item: (
             -float(item.get("score", 0.0)),
@@ -82,40 +82,30 @@ def compute_mix_density(
     normalized.sort(key=lambda item: item["stem_id"])
 
     if not normalized:
-        return {
-            "density_mean": 0.0,
-            "density_peak": 0,
-            "density_timeline": [],
-            "timeline_total_windows": 0,
-            "timeline_truncated": False,
-            "window_size": window_size,
-            "hop_size": hop_size,
-            "rms_threshold_dbfs": rms_threshold_dbfs,
-            "bands_hz": [
-                {"low_hz": float(low_hz), "high_hz": float(high_hz)}
-                for low_hz, high_hz in bands_hz
-            ],
-            "stem_count": 0,
-        }
+        return _density_payload(
+            np.zeros(0, dtype=np.int32),
+            stem_count=0,
+            sample_rate_hz=sample_rate_hz,
+            window_size=window_size,
+            hop_size=hop_size,
+            rms_threshold_dbfs=rms_threshold_dbfs,
+            max_timeline_points=max_timeline_points,
+            bands_hz=bands_hz,
+        )
 
     max_length = max(int(item["samples"].size) for item in normalized)
     total_windows = _window_count(max_length, window_size, hop_size)
     if total_windows == 0:
-        return {
-            "density_mean": 0.0,
-            "density_peak": 0,
-            "density_timeline": [],
-            "timeline_total_windows": 0,
-            "timeline_truncated": False,
-            "window_size": window_size,
-            "hop_size": hop_size,
-            "rms_threshold_dbfs": rms_threshold_dbfs,
-            "bands_hz": [
-                {"low_hz": float(low_hz), "high_hz": float(high_hz)}
-                for low_hz, high_hz in bands_hz
-            ],
-            "stem_count": len(normalized),
-        }
+        return _density_payload(
+            np.zeros(0, dtype=np.int32),
+            stem_count=len(normalized),
+            sample_rate_hz=sample_rate_hz,
+            window_size=window_size,
+            hop_size=hop_size,
+            rms_threshold_dbfs=rms_threshold_dbfs,
+            max_timeline_points=max_timeline_points,
+            bands_hz=bands_hz,
+        )
 
     window = np.hanning(window_size).astype(np.float64)
     band_masks = _band_bin_masks(sample_rate_hz, window_size, bands_hz)
@@ -145,6 +135,85 @@ def compute_mix_density(
             if is_active:
                 active_counts[window_index] += 1
 
+    return _density_payload(
+        active_counts,
+        stem_count=len(normalized),
+        sample_rate_hz=sample_rate_hz,
+        window_size=window_size,
+        hop_size=hop_size,
+        rms_threshold_dbfs=rms_threshold_dbfs,
+        max_timeline_points=max_timeline_points,
+        bands_hz=bands_hz,
+    )
+
+
+def compute_mix_density_from_features(
+    stems: Iterable[dict[str, Any]],
+    *,
+    sample_rate_hz: int,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+    hop_size: int = DEFAULT_HOP_SIZE,
+    rms_threshold_dbfs: float = DEFAULT_RMS_THRESHOLD_DBFS,
+    max_timeline_points: int = DEFAULT_MAX_TIMELINE_POINTS,
+    bands_hz: Sequence[tuple[float, float]] = DEFAULT_BANDS_HZ,
+) -> dict[str, Any]:
+    """Compute ``compute_mix_density`` from per-window activity features.
+
+    Each stem carries ``stem_id``, ``frame_count``, and ``active``: the
+    per-window activity flags from ``mmo.meters.mix_features`` computed with
+    the same window, hop, threshold, and bands. The result matches
+    ``compute_mix_density`` on the stems' mono signals.
+    """
+    if sample_rate_hz <= 0:
+        raise ValueError("sample_rate_hz must be positive")
+    if window_size <= 0 or hop_size <= 0:
+        raise ValueError("window_size and hop_size must be positive")
+
+    normalized: list[dict[str, Any]] = []
+    for stem in stems:
+        stem_id = stem.get("stem_id")
+        active = stem.get("active")
+        frame_count = stem.get("frame_count")
+        if not isinstance(stem_id, str) or not stem_id:
+            continue
+        if not isinstance(active, np.ndarray) or active.ndim != 1:
+            continue
+        if not isinstance(frame_count, (int, np.integer)) or frame_count < 0:
+            continue
+        normalized.append({"stem_id": stem_id, "active": active, "frame_count": int(frame_count)})
+    normalized.sort(key=lambda item: item["stem_id"])
+
+    max_length = max((item["frame_count"] for item in normalized), default=0)
+    total_windows = _window_count(max_length, window_size, hop_size)
+    active_counts = np.zeros(total_windows, dtype=np.int32)
+    for stem in normalized:
+        flags = stem["active"][:total_windows]
+        active_counts[: flags.size] += flags.astype(np.int32)
+
+    return _density_payload(
+        active_counts,
+        stem_count=len(normalized),
+        sample_rate_hz=sample_rate_hz,
+        window_size=window_size,
+        hop_size=hop_size,
+        rms_threshold_dbfs=rms_threshold_dbfs,
+        max_timeline_points=max_timeline_points,
+        bands_hz=bands_hz,
+    )
+
+
+def _density_payload(
+    active_counts: np.ndarray,
+    *,
+    stem_count: int,
+    sample_rate_hz: int,
+    window_size: int,
+    hop_size: int,
+    rms_threshold_dbfs: float,
+    max_timeline_points: int,
+    bands_hz: Sequence[tuple[float, float]],
+) -> dict[str, Any]:
+    total_windows = int(active_counts.size)
     density_mean = float(np.mean(active_counts)) if active_counts.size else 0.0
     density_peak = int(np.max(active_counts)) if active_counts.size else 0
 
@@ -175,5 +244,5 @@ def compute_mix_density(
             {"low_hz": float(low_hz), "high_hz": float(high_hz)}
             for low_hz, high_hz in bands_hz
         ],
-        "stem_count": len(normalized),
+        "stem_count": stem_count,
     }
@@ -0,0 +1,155 @@
+"""Streaming per-stem features for the mix-complexity meters.
+
+``compute_mix_density`` and ``compute_masking_risk`` read whole mono
+signals, so handing them every stem at once keeps ``stems x frames``
+float64 samples resident. ``MixFeatureAccumulator`` takes one stem's mono
+downmix chunk by chunk and keeps only what those meters read per analysis
+window: whether any density band is active (``uint8``) and the magnitude
+spectrum of the masking mid band (``float32``). The ``*_from_features``
+variants of the two meters produce their payloads from these.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+import numpy as np
+
+from mmo.meters.meter_masking_risk import DEFAULT_HIGH_HZ, DEFAULT_LOW_HZ
+from mmo.meters.meter_mix_density import (
+    DEFAULT_BANDS_HZ,
+    DEFAULT_HOP_SIZE,
+    DEFAULT_RMS_THRESHOLD_DBFS,
+    DEFAULT_WINDOW_SIZE,
+    _band_bin_masks,
+)
+
+_EPSILON = 1e-12
+
+
+@dataclass(frozen=True)
+class MixFeatures:
+    """Per-window features of one stem; window ``i`` starts at ``i * hop_size``."""
+
+    sample_rate_hz: int
+    frame_count: int
+    active: Any
+    mid_band: Any
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.active.nbytes + self.mid_band.nbytes)
+
+
+def _mid_band_mask(sample_rate_hz: int, window_size: int, low_hz: float, high_hz: float) -> np.ndarray:
+    freqs = np.fft.rfftfreq(window_size, d=1.0 / float(sample_rate_hz))
+    return (freqs >= low_hz) & (freqs <= high_hz)
+
+
+def _feature_window_count(frame_count: int, hop_size: int) -> int:
+    # Every window that starts inside the stem; later ones are silence.
+    return -(-max(0, int(frame_count)) // hop_size)
+
+
+def estimate_mix_feature_bytes(
+    frame_count: int,
+    sample_rate_hz: int,
+    *,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+    hop_size: int = DEFAULT_HOP_SIZE,
+    low_hz: float = DEFAULT_LOW_HZ,
+    high_hz: float = DEFAULT_HIGH_HZ,
+) -> int:
+    """Return the resident size of a stem's features before decoding it."""
+    bins = int(np.count_nonzero(_mid_band_mask(sample_rate_hz, window_size, low_hz, high_hz)))
+    return _feature_window_count(frame_count, hop_size) * (bins * 4 + 1)
+
+
+class MixFeatureAccumulator:
+    """Reduce a mono stream to mix-complexity window features as it arrives.
+
+    Only the samples of the window in progress are buffered. Activity uses
+    the density meter's float64 band test, so density from features is
+    identical to ``compute_mix_density``; mid-band magnitudes are rounded
+    to float32.
+    """
+
+    def __init__(
+        self,
+        sample_rate_hz: int,
+        *,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        hop_size: int = DEFAULT_HOP_SIZE,
+        rms_threshold_dbfs: float = DEFAULT_RMS_THRESHOLD_DBFS,
+        bands_hz: Sequence[tuple[float, float]] = DEFAULT_BANDS_HZ,
+        low_hz: float = DEFAULT_LOW_HZ,
+        high_hz: float = DEFAULT_HIGH_HZ,
+    ) -> None:
+        if sample_rate_hz <= 0:
+            raise ValueError("sample_rate_hz must be positive")
+        if window_size <= 0 or hop_size <= 0:
+            raise ValueError("window_size and hop_size must be positive")
+        if hop_size > window_size:
+            raise ValueError("hop_size must not exceed window_size")
+        self.sample_rate_hz = int(sample_rate_hz)
+        self.window_size = window_size
+        self.hop_size = hop_size
+        self._window = np.hanning(window_size).astype(np.float64)
+        self._band_masks = [
+            mask for mask in _band_bin_masks(sample_rate_hz, window_size, bands_hz) if np.any(mask)
+        ]
+        self._mid_mask = _mid_band_mask(sample_rate_hz, window_size, low_hz, high_hz)
+        self._threshold = 10.0 ** (rms_threshold_dbfs / 20.0) + _EPSILON
+        self._pending = np.zeros(0, dtype=np.float64)
+        self._frame_count = 0
+        self._active: list[np.ndarray] = []
+        self._mid_band: list[np.ndarray] = []
+
+    def update(self, mono: Any) -> None:
+        samples = np.asarray(mono, dtype=np.float64).reshape(-1)
+        if samples.size == 0:
+            return
+        self._frame_count += int(samples.size)
+        pending = np.concatenate([self._pending, samples])
+        if pending.size < self.window_size:
+            self._pending = pending
+            return
+        count = 1 + (pending.size - self.window_size) // self.hop_size
+        windows = np.lib.stride_tricks.sliding_window_view(pending, self.window_size)
+        self._analyze(windows[:: self.hop_size][:count])
+        self._pending = pending[count * self.hop_size :].copy()
+
+    def _analyze(self, windows: np.ndarray) -> None:
+        spectrum = np.fft.rfft(windows * self._window, axis=1)
+        power = (spectrum.real * spectrum.real) + (spectrum.imag * spectrum.imag)
+        active = np.zeros(windows.shape[0], dtype=bool)
+        for mask in self._band_masks:
+            band_power = np.mean(power[:, mask], axis=1)
+            active |= (band_power > 0.0) & (np.sqrt(np.maximum(band_power, 0.0)) >= self._threshold)
+        self._active.append(active.astype(np.uint8))
+        self._mid_band.append(np.abs(spectrum[:, self._mid_mask]).astype(np.float32))
+
+    def finalize(self) -> MixFeatures:
+        """Zero-pad the windows that run past the end and return the features."""
+        emitted = sum(block.shape[0] for block in self._active)
+        remaining = _feature_window_count(self._frame_count, self.hop_size) - emitted
+        if remaining > 0:
+            tail = np.zeros((remaining - 1) * self.hop_size + self.window_size, dtype=np.float64)
+            tail[: self._pending.size] = self._pending
+            windows = np.lib.stride_tricks.sliding_window_view(tail, self.window_size)
+            self._analyze(windows[:: self.hop_size][:remaining])
+        self._pending = np.zeros(0, dtype=np.float64)
+        bins = int(np.count_nonzero(self._mid_mask))
+        return MixFeatures(
+            sample_rate_hz=self.sample_rate_hz,
+            frame_count=self._frame_count,
+            active=(
+                np.concatenate(self._active) if self._active else np.zeros(0, dtype=np.uint8)
+            ),
+            mid_band=(
+                np.concatenate(self._mid_band)
+                if self._mid_band
+                else np.zeros((0, bins), dtype=np.float32)
+            ),
+        )
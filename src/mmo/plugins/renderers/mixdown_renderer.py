@@ -19,9 +19,14 @@ from mmo.dsp.export_finalize import (
     export_finalize_interleaved_f64,
     resolve_dither_policy_for_bit_depth,
 )
-from mmo.dsp.io import sha256_file, write_wav_ixml_chunk
+from mmo.dsp.io import write_wav_ixml_chunk
 from mmo.dsp.process_context import build_process_context
-from mmo.dsp.sample_rate import build_resampling_receipt, choose_target_rate_for_session
+from mmo.dsp.decode_cache import build_decode_cache_receipt, decode_cache_stats
+from mmo.dsp.sample_rate import (
+    build_resampling_receipt,
+    choose_target_rate_for_session,
+    resolve_resample_method_id,
+)
 from mmo.core.deliverables import (
     RENDER_RESULT_SILENT_OUTPUT,
     build_output_render_result,
@@ -139,6 +144,14 @@ def _resolve_explicit_render_sample_rate_hz(session: Dict[str, Any]) -> tuple[in
     return None, None
 
 
+def _resolve_resample_method_id(session: Dict[str, Any]) -> str:
+    candidates: list[Any] = [session.get("resample_method_id")]
+    options_payload = session.get("options")
+    if isinstance(options_payload, dict):
+        candidates.append(options_payload.get("resample_method_id"))
+    return resolve_resample_method_id(*candidates)
+
+
 def _resampling_warning_row(
     *,
     stem_id: str,
@@ -387,6 +400,7 @@ def _read_stereo_program_from_stems(session: Dict[str, Any]) -> _ProgramStereo:
         f"{_coerce_str(selection_receipt.get('sample_rate_policy_reason')).strip()}"
     )
 
+    resample_method_id = _resolve_resample_method_id(session)
     resampled_stems: list[dict[str, Any]] = []
     native_rate_stems: list[dict[str, Any]] = []
     for plan in decode_plans:
@@ -422,6 +436,7 @@ def _read_stereo_program_from_stems(session: Dict[str, Any]) -> _ProgramStereo:
                     "sample_rate_hz": plan.source_sample_rate_hz,
                 },
                 target_sample_rate_hz=sample_rate_hz,
+                resample_method_id=resample_method_id,
             ):
                 if not chunk:
                     continue
@@ -498,7 +513,7 @@ def _read_stereo_program_from_stems(session: Dict[str, Any]) -> _ProgramStereo:
             native_rate_stems=native_rate_stems,
             decoder_warnings=list(selection_receipt.get("decoder_warnings") or []),
             resample_stage="decode",
-            resample_method_id="linear_interpolation_v1",
+            resample_method_id=resample_method_id,
         ),
     )
 
@@ -576,7 +591,7 @@ def _write_pcm_wav(
     dither_policy: str,
     seed: int,
     trace_metadata: dict[str, str],
-) -> None:
+) -> str:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     pcm_bytes = export_finalize_interleaved_f64(
         list(buffer.data),
@@ -590,7 +605,7 @@ def _write_pcm_wav(
         handle.setsampwidth(bit_depth // 8)
         handle.setframerate(buffer.sample_rate_hz)
         handle.writeframes(pcm_bytes)
-    write_wav_ixml_chunk(output_path, build_trace_ixml_payload(trace_metadata))
+    return write_wav_ixml_chunk(output_path, build_trace_ixml_payload(trace_metadata))
 
 
 def _layout_slug(layout_id: str) -> str:
@@ -654,7 +669,9 @@ class MixdownRenderer(RendererPlugin):
 
         # Decode and trim once, then carry that same resampling receipt and
         # headroom policy into every layout-specific output row.
+        decode_cache_before = decode_cache_stats()
         program = _read_stereo_program_from_stems(session)
+        decode_cache_receipt = build_decode_cache_receipt(decode_cache_before)
         trim_linear, trim_db, trim_reason = _compute_trim(program)
 
         outputs: list[dict[str, Any]] = []
@@ -689,7 +706,7 @@ class MixdownRenderer(RendererPlugin):
                     "render_seed": render_seed,
                 }
             )
-            _write_pcm_wav(
+            output_sha = _write_pcm_wav(
                 abs_path,
                 buffer=output_buffer,
                 bit_depth=bit_depth,
@@ -697,7 +714,6 @@ class MixdownRenderer(RendererPlugin):
                 seed=export_seed,
                 trace_metadata=trace_metadata,
             )
-            output_sha = sha256_file(abs_path)
             layout_slug = _layout_slug(layout_id)
             rendered_frame_count = (
                 len(output_buffer.data) // output_buffer.channels
@@ -793,6 +809,8 @@ class MixdownRenderer(RendererPlugin):
             )
             if program.notes:
                 output_row["metadata"]["warnings"] = list(program.notes)
+            if decode_cache_receipt is not None:
+                output_row["metadata"]["decode_cache"] = dict(decode_cache_receipt)
             decoder_warnings = program.resampling.get("decoder_warnings")
             if isinstance(decoder_warnings, list) and decoder_warnings:
                 existing_warnings = output_row["metadata"].get("warnings")
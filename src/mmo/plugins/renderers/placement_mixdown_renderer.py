@@ -4,7 +4,6 @@ import hashlib
 import json
 import math
 import shutil
-import wave
 from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterator, List, Sequence
@@ -52,7 +51,14 @@ from mmo.dsp.export_finalize import (
 from mmo.dsp.io import sha256_file, write_wav_ixml_chunk
 from mmo.dsp.lfe_derive import derive_missing_lfe
 from mmo.dsp.process_context import build_process_context
-from mmo.dsp.sample_rate import build_resampling_receipt, choose_target_rate_for_session
+from mmo.dsp.decode_cache import build_decode_cache_receipt, decode_cache_stats
+from mmo.dsp.wav_writer import Rf64WavWriter
+from mmo.dsp.sample_rate import (
+    RESAMPLE_METHOD_LINEAR,
+    build_resampling_receipt,
+    choose_target_rate_for_session,
+    resolve_resample_method_id,
+)
 from mmo.plugins.interfaces import Recommendation, RenderManifest, RendererPlugin
 
 _PLUGIN_ID = "PLUGIN.RENDERER.PLACEMENT_MIXDOWN_V1"
@@ -185,6 +191,7 @@ class _PreparedStem:
     wide_wrap_right_gain: float
     stereo_channel_wise: bool
     bed_decorrelation_taps: tuple[_BedDecorrelationTap, ...] = ()
+    resample_method_id: str = RESAMPLE_METHOD_LINEAR
 
 
 @dataclass(frozen=True)
@@ -623,6 +630,20 @@ def _resolve_explicit_render_sample_rate_hz(
     return None, None
 
 
+def _resolve_resample_method_id(
+    session: Dict[str, Any],
+    render_intent: dict[str, Any],
+) -> str:
+    candidates: list[Any] = [
+        session.get("resample_method_id"),
+        render_intent.get("resample_method_id"),
+    ]
+    options_payload = session.get("options")
+    if isinstance(options_payload, dict):
+        candidates.append(options_payload.get("resample_method_id"))
+    return resolve_resample_method_id(*candidates)
+
+
 def _resampling_warning_row(
     *,
     stem_id: str,
@@ -1126,6 +1147,7 @@ def _run_mix_pass(
                     "sample_rate_hz": stem.source_sample_rate_hz,
                 },
                 target_sample_rate_hz=stem.render_sample_rate_hz,
+                resample_method_id=stem.resample_method_id,
             ),
             bed_decorrelation_taps={
                 tap.channel_index: tap for tap in stem.bed_decorrelation_taps
@@ -1512,6 +1534,7 @@ def _prepare_layout_stems(
         explicit_rate_reason=explicit_sample_rate_reason,
         default=_DEFAULT_SAMPLE_RATE_HZ,
     )
+    resample_method_id = _resolve_resample_method_id(session, render_intent)
 
     notes.append(
         f"{layout_id}:render_sample_rate_selected:{sample_rate_hz}:"
@@ -1562,6 +1585,7 @@ def _prepare_layout_stems(
                 wide_wrap_right_gain=plan.wide_wrap_right_gain,
                 stereo_channel_wise=plan.stereo_channel_wise,
                 bed_decorrelation_taps=bed_taps,
+                resample_method_id=resample_method_id,
             )
         )
         if plan.source_sample_rate_hz != sample_rate_hz:
@@ -1615,7 +1639,7 @@ def _prepare_layout_stems(
             native_rate_stems=native_rate_stems,
             decoder_warnings=list(selection_receipt.get("decoder_warnings") or []),
             resample_stage="decode",
-            resample_method_id="linear_interpolation_v1",
+            resample_method_id=resample_method_id,
         ),
         decorrelation_receipt,
     )
@@ -1633,7 +1657,7 @@ def _update_chunk_peak_by_channel(
 
 def _write_trimmed_chunk(
     *,
-    handle: wave.Wave_write,
+    handle: Rf64WavWriter,
     mixed_chunk: AudioBufferF64,
     trim_linear: float,
     finalizer: StreamingExportFinalizer,
@@ -1736,7 +1760,7 @@ def _render_subbus_output(
     trace_metadata = build_trace_metadata(trace_context)
     abs_path.parent.mkdir(parents=True, exist_ok=True)
     pass_frames = 0
-    with wave.open(str(abs_path), "wb") as handle:
+    with Rf64WavWriter(abs_path) as handle:
         handle.setnchannels(channel_count)
         handle.setsampwidth(bit_depth // 8)
         handle.setframerate(sample_rate_hz)
@@ -1754,9 +1778,7 @@ def _render_subbus_output(
         )
         if pass_notes:
             notes.extend(pass_notes)
-    write_wav_ixml_chunk(abs_path, build_trace_ixml_payload(trace_metadata))
-
-    output_sha = sha256_file(abs_path)
+    output_sha = write_wav_ixml_chunk(abs_path, build_trace_ixml_payload(trace_metadata))
     stem_ids = sorted(stem.stem_id for stem in prepared_stems)
     scene_bindings = {
         stem_id: _stem_reference_summary(stem_scene_refs.get(stem_id, {}))
@@ -1966,6 +1988,7 @@ def _mix_layout_from_intent(
     enable_bed_decorrelation: bool,
 ) -> tuple[list[dict[str, Any]], list[str]]:
     notes: list[str] = []
+    decode_cache_before = decode_cache_stats()
     channel_order = render_intent.get("channel_order")
     if not isinstance(channel_order, list) or not channel_order:
         return [], [f"{layout_id}:missing_channel_order"]
@@ -2152,7 +2175,7 @@ def _mix_layout_from_intent(
             )
             master_abs_path.parent.mkdir(parents=True, exist_ok=True)
             pass2_frames = 0
-            with wave.open(str(master_abs_path), "wb") as handle:
+            with Rf64WavWriter(master_abs_path) as handle:
                 handle.setnchannels(channel_count)
                 handle.setsampwidth(bit_depth // 8)
                 handle.setframerate(sample_rate_hz)
@@ -2201,12 +2224,10 @@ def _mix_layout_from_intent(
                 "layout_id": layout_id,
                 "render_seed": render_seed,
             }
-            write_wav_ixml_chunk(
+            output_sha = write_wav_ixml_chunk(
                 master_abs_path,
                 build_trace_ixml_payload(build_trace_metadata(trace_context)),
             )
-
-            output_sha = sha256_file(master_abs_path)
             outputs.append(
                 {
                     "output_id": f"OUTPUT.PLACEMENT_MIXDOWN.{layout_slug}.{output_sha[:12]}",
@@ -2277,6 +2298,9 @@ def _mix_layout_from_intent(
                     },
                 }
             )
+            decode_cache_receipt = build_decode_cache_receipt(decode_cache_before)
+            if decode_cache_receipt is not None:
+                outputs[-1]["metadata"]["decode_cache"] = decode_cache_receipt
             outputs[-1]["metadata"] = add_trace_metadata(
                 outputs[-1].get("metadata"),
                 trace_context,
@@ -16,7 +16,6 @@ from __future__ import annotations
 
 import math
 import re
-import wave
 from pathlib import Path
 from typing import Any, Mapping
 
@@ -26,7 +25,7 @@ from mmo.core.speaker_layout import (
     SpeakerPosition,
     get_preset,
 )
-from mmo.dsp.io import read_wav_metadata, sha256_file
+from mmo.dsp.io import hashed_wav_writer, read_wav_metadata, sha256_file
 from mmo.dsp.meters import iter_wav_float64_samples
 from mmo.dsp.plugins.base import (
     LayoutContext,
@@ -419,10 +418,13 @@ def _write_stereo_wav(
     pcm_bytes = _to_pcm_bytes(interleaved, bit_depth)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with wave.open(str(output_path), "wb") as handle:
-        handle.setnchannels(2)
-        handle.setsampwidth(bit_depth // 8)
-        handle.setframerate(sample_rate_hz)
+    with hashed_wav_writer(
+        output_path,
+        channels=2,
+        sample_width=bit_depth // 8,
+        sample_rate_hz=sample_rate_hz,
+        frame_count=int(stereo.shape[1]),
+    ) as handle:
         handle.writeframes(pcm_bytes)
 
 
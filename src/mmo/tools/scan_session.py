@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
 import hashlib
 import json
 import math
@@ -11,7 +13,7 @@ import sys
 import time
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 try:
     import yaml
@@ -23,9 +25,15 @@ try:
 except ImportError:  # pragma: no cover - environment issue
     jsonschema = None
 
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
 from mmo import __version__ as engine_version  # noqa: E402
 from mmo.core.loudness_methods import DEFAULT_LOUDNESS_METHOD_ID  # noqa: E402
 from mmo.core.lfe_audit import (  # noqa: E402
+    audit_lfe_channel_samples,
     audit_lfe_channels,
     build_lfe_audit_issues,
     detect_lfe_channel_indices,
@@ -37,16 +45,45 @@ from mmo.core.source_locator import resolve_stem_locator, resolved_stem_path  #
 from mmo.core.stems_classifier import derive_role_name_tokens  # noqa: E402
 from mmo.core.validators import validate_session  # noqa: E402
 from mmo.core.vibe_signals import derive_vibe_signals  # noqa: E402
-from mmo.dsp.decoders import detect_format_from_path  # noqa: E402
+from mmo.dsp.decode_cache import (  # noqa: E402
+    active_decode_cache,
+    build_decode_cache_receipt,
+    decode_cache_stats,
+    decode_cache_stats_since,
+    record_decode_cache_stats,
+)
+from mmo.dsp.decoders import (  # noqa: E402
+    detect_format_from_path,
+    has_native_aiff_decoder,
+    iter_audio_frames_ndarray,
+)
 from mmo.dsp.backends.ffmpeg_discovery import resolve_ffmpeg_cmd  # noqa: E402
-from mmo.dsp.backends.ffmpeg_decode import iter_ffmpeg_float64_samples  # noqa: E402
-from mmo.dsp.correlation import PairCorrelationAccumulator  # noqa: E402
+from mmo.dsp.backends.ffmpeg_decode import (  # noqa: E402
+    iter_ffmpeg_float64_samples,
+    iter_ffmpeg_frames_ndarray,
+)
+from mmo.dsp.meter_bank import MeterBank, MeterBankResult  # noqa: E402
+from mmo.dsp.preview_sampling import (  # noqa: E402
+    DEFAULT_PREVIEW_WINDOW_COUNT,
+    DEFAULT_PREVIEW_WINDOW_S,
+    PREVIEW_CONFIDENCE,
+    preview_windows,
+    window_error_bound,
+)
+from mmo.dsp.meter_cache import (  # noqa: E402
+    MeterCache,
+    active_meter_cache,
+    build_meter_cache_receipt,
+    meter_cache_stats,
+    open_meter_cache,
+)
 from mmo.dsp.meters import (  # noqa: E402
-    compute_basic_stats_from_float64,
     compute_sample_peak_dbfs_wav,
+    iter_aiff_float64_samples,
+    iter_aiff_frames_ndarray,
     iter_wav_float64_samples,
+    iter_wav_frames_ndarray,
 )
-from mmo.dsp.stereo import compute_stereo_correlation_wav  # noqa: E402
 from mmo.resources import ontology_dir, presets_dir  # noqa: E402
 from mmo.core.progress import ExplainableLogEvent, format_live_log_line  # noqa: E402
 
@@ -122,6 +159,290 @@ def _resolved_stem_path_for_scan(
     return resolved_stem_path(resolve_stem_locator(stem, stems_dir=stems_dir))
 
 
+_NON_WAV_SCAN_FORMAT_IDS = frozenset({"flac", "wavpack", "aiff", "ape"})
+
+# Upper bound on the float32/uint8 mix-complexity features held for all stems
+# at once; stems past it are skipped rather than growing memory with the mix.
+MIX_FEATURES_MAX_MB_ENV = "MMO_MIX_FEATURES_MAX_MB"
+DEFAULT_MIX_FEATURES_MAX_BYTES = 1024 * 1024 * 1024
+
+
+def _uses_native_aiff(format_id: str, stem_path: Path) -> bool:
+    # Uncompressed AIFF decodes in-process; compressed AIFC keeps using ffmpeg.
+    return format_id == "aiff" and has_native_aiff_decoder(stem_path)
+
+
+def _iter_ffmpeg_stem_blocks(
+    stem: Dict[str, Any],
+    stem_path: Path,
+    ffmpeg_cmd: Any,
+    *,
+    channels: int,
+    error_context: str,
+) -> Any:
+    # Route through the shared decoder so repeated scan phases reuse the
+    # opt-in decode cache instead of spawning ffmpeg once per phase.
+    sha256 = stem.get("sha256")
+    return iter_audio_frames_ndarray(
+        stem_path,
+        error_context=error_context,
+        channels=channels,
+        ffmpeg_cmd=ffmpeg_cmd,
+        source_sha256=sha256 if isinstance(sha256, str) else None,
+    )
+
+
+def _iter_ffmpeg_stem_samples(
+    stem: Dict[str, Any],
+    stem_path: Path,
+    ffmpeg_cmd: Any,
+    *,
+    error_context: str,
+) -> Any:
+    if active_decode_cache() is None:
+        return iter_ffmpeg_float64_samples(stem_path, ffmpeg_cmd)
+    channels = stem.get("channel_count")
+    if not isinstance(channels, int) or channels <= 0:
+        channels = 1
+    return (
+        block.ravel().tolist()
+        for block in _iter_ffmpeg_stem_blocks(
+            stem, stem_path, ffmpeg_cmd, channels=channels, error_context=error_context
+        )
+    )
+
+
+def _iter_wav_stem_window(wav_map: Any, *, start_frame: int, frame_count: int) -> Iterator[Any]:
+    # Memory-mapped reads touch only the window's pages.
+    return wav_map.iter_blocks(start_frame, start_frame + frame_count)
+
+
+def _iter_ffmpeg_stem_window(
+    stem_path: Path,
+    ffmpeg_cmd: Any,
+    *,
+    channels: int,
+    sample_rate_hz: int,
+    start_frame: int,
+    frame_count: int,
+) -> Iterator[Any]:
+    # Seeks ffmpeg to the window instead of decoding up to it. The decode
+    # cache holds whole files, so windows always go to ffmpeg directly.
+    remaining = frame_count
+    for block in iter_ffmpeg_frames_ndarray(
+        stem_path,
+        ffmpeg_cmd,
+        channels=channels,
+        start_s=start_frame / sample_rate_hz,
+        duration_s=frame_count / sample_rate_hz,
+    ):
+        # Drain past the window so ffmpeg exits and reports errors normally.
+        if remaining > 0:
+            yield block[:remaining]
+            remaining -= block.shape[0]
+
+
+def _with_decode_cache_stats(worker: Any, *args: Any) -> Dict[str, Any]:
+    """Run a scan worker and attach the decode-cache counters it produced."""
+    before = decode_cache_stats()
+    result = worker(*args)
+    result["decode_cache"] = decode_cache_stats_since(before)
+    return result
+
+
+def _init_scan_worker(sample_rates: tuple[int, ...]) -> None:
+    """Pool initializer: warm per-process meter state once per worker."""
+    try:
+        from mmo.dsp.meters_truth import warm_truth_meter_state  # noqa: WPS433
+    except ImportError:
+        return
+    warm_truth_meter_state(sample_rates)
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    """Return this process's peak resident set size, or None where unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+def _timed_pool_call(worker: Any, *args: Any) -> Dict[str, Any]:
+    """Run ``worker`` and record how long this pool process spent on it."""
+    started = time.perf_counter()
+    result = worker(*args)
+    return {
+        "result": result,
+        "run_s": time.perf_counter() - started,
+        "pid": os.getpid(),
+        "peak_rss_bytes": _peak_rss_bytes(),
+    }
+
+
+def _stem_job_cost(stem: Dict[str, Any]) -> float:
+    """Estimate a stem's decode-and-meter cost as frames x channels.
+
+    Stems without duration/rate/channel metadata cost 0: they cannot be
+    metered and finish at once, so they are scheduled last.
+    """
+    duration_s = stem.get("duration_s")
+    sample_rate_hz = stem.get("sample_rate_hz")
+    channel_count = stem.get("channel_count")
+    if (
+        not isinstance(duration_s, (int, float))
+        or not isinstance(sample_rate_hz, int)
+        or not isinstance(channel_count, int)
+    ):
+        return 0.0
+    return max(0.0, float(duration_s)) * sample_rate_hz * channel_count
+
+
+def _stem_frame_count(stem: Dict[str, Any]) -> int:
+    """Frames per channel from probed duration and rate, or 0 when unknown."""
+    duration_s = stem.get("duration_s")
+    sample_rate_hz = stem.get("sample_rate_hz")
+    if not isinstance(duration_s, (int, float)) or not isinstance(sample_rate_hz, (int, float)):
+        return 0
+    if duration_s <= 0 or sample_rate_hz <= 0:
+        return 0
+    return int(round(float(duration_s) * float(sample_rate_hz)))
+
+
+def _stem_sample_rates(stems: List[Dict[str, Any]]) -> tuple[int, ...]:
+    return tuple(
+        sorted(
+            {
+                stem["sample_rate_hz"]
+                for stem in stems
+                if isinstance(stem.get("sample_rate_hz"), int) and stem["sample_rate_hz"] > 0
+            }
+        )
+    )
+
+
+class _ScanWorkerPool:
+    """Process pool shared by every pooled phase of one scan.
+
+    Worker processes start with the first phase that has jobs and stay up
+    until the scan ends. The pool is sized from ``planned_jobs`` (the scan's
+    stem count) capped at ``max_workers``, not from whichever phase starts
+    it. Each worker runs ``_init_scan_worker`` once, so numpy, mmo, the
+    speaker table, and per-rate filter coefficients for every planned
+    ``sample_rates`` entry load once per worker rather than once per phase. Jobs are submitted largest estimated
+    cost first; idle workers take the next job from the shared queue, so the
+    longest stem starts first and short stems fill in the tail.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: Optional[int] = None,
+        planned_jobs: Optional[int] = None,
+        sample_rates: tuple[int, ...] = (),
+    ) -> None:
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.planned_jobs = planned_jobs
+        self.sample_rates = tuple(sample_rates)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._worker_count = 0
+        self.worker_peak_rss_bytes: Optional[int] = None
+
+    def __enter__(self) -> "_ScanWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def run_phase(
+        self,
+        phase: str,
+        jobs: List[tuple[float, Any, Any, tuple]],
+        *,
+        sample_rates: tuple[int, ...] = (),
+    ) -> Iterator[tuple[Any, Any]]:
+        """Run ``(cost, key, worker, args)`` jobs; yield ``(key, result)`` as they finish.
+
+        Jobs that raise are dropped, matching a stem that could not be
+        decoded. Workers started here are warmed for the planned sample
+        rates plus ``sample_rates``; workers kept from an earlier phase keep
+        their state. Queue wait, run time, worker utilization, and the
+        highest worker peak RSS seen so far go out as one [MMO-LIVE] line
+        once the phase finishes.
+        """
+        if not jobs:
+            return
+        if self._executor is None:
+            self._worker_count = min(self.max_workers, self.planned_jobs or self.max_workers)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._worker_count,
+                initializer=_init_scan_worker,
+                initargs=(tuple(sorted(set(self.sample_rates) | set(sample_rates))),),
+            )
+        phase_start = time.perf_counter()
+        submitted: Dict[Any, tuple[Any, float]] = {}
+        done_at: Dict[Any, float] = {}
+
+        def _record_done(future: Any) -> None:
+            done_at[future] = time.perf_counter()
+
+        # sorted() is stable, so equal-cost jobs keep their input order.
+        for _cost, key, worker, args in sorted(jobs, key=lambda job: -job[0]):
+            submitted_at = time.perf_counter()
+            future = self._executor.submit(_timed_pool_call, worker, *args)
+            submitted[future] = (key, submitted_at)
+            future.add_done_callback(_record_done)
+
+        waits_ms: List[float] = []
+        runs_ms: List[float] = []
+        for future in as_completed(submitted):
+            key, submitted_at = submitted[future]
+            try:
+                timed = future.result()
+            except Exception:
+                continue
+            # Both clocks are read in this process; the worker only reports
+            # a duration, so the wait is turnaround minus run time.
+            turnaround_s = done_at.get(future, time.perf_counter()) - submitted_at
+            waits_ms.append(max(0.0, turnaround_s - timed["run_s"]) * 1000)
+            runs_ms.append(timed["run_s"] * 1000)
+            if timed["peak_rss_bytes"] is not None:
+                self.worker_peak_rss_bytes = max(
+                    self.worker_peak_rss_bytes or 0, timed["peak_rss_bytes"]
+                )
+            yield key, timed["result"]
+
+        wall_ms = (time.perf_counter() - phase_start) * 1000
+        busy_ms = sum(runs_ms)
+        _emit_live(
+            what=f"worker pool: {phase}",
+            why="largest-first jobs on the scan's persistent worker pool",
+            where=["session"],
+            kind="action",
+            step_index=len(jobs),
+            total_steps=len(jobs),
+            progress=1.0,
+            evidence={
+                "jobs": len(jobs),
+                "workers": self._worker_count,
+                "queue_wait_ms_mean": round(sum(waits_ms) / len(waits_ms), 1) if waits_ms else 0.0,
+                "queue_wait_ms_max": round(max(waits_ms, default=0.0), 1),
+                "run_ms_total": round(busy_ms, 1),
+                "run_ms_max": round(max(runs_ms, default=0.0), 1),
+                "wall_ms": round(wall_ms, 1),
+                "utilization": (
+                    round(busy_ms / (self._worker_count * wall_ms), 3) if wall_ms > 0 else 0.0
+                ),
+                "worker_peak_rss_bytes": self.worker_peak_rss_bytes,
+            },
+        )
+
+
 def _plan_correlation_pairs(
     order_csv: str, mode_str: str, channels: int
 ) -> tuple[Dict[str, tuple[int, int]], list[dict], str | None]:
@@ -238,7 +559,13 @@ def _validate_schema(schema_path: Path, report: Dict[str, Any]) -> None:
         raise ValueError(f"Report schema validation failed:\n{messages}")
 
 
-def _add_peak_metrics(session: Dict[str, Any], stems_dir: Path) -> None:
+def _add_peak_metrics(
+    session: Dict[str, Any],
+    stems_dir: Path,
+    *,
+    precomputed: Optional[Dict[str, float]] = None,
+) -> None:
+    """Add WAV sample-peak metrics; ``precomputed`` maps stem_id to peaks already measured."""
     stems = session.get("stems", [])
     for stem in stems:
         if not isinstance(stem, dict):
@@ -250,10 +577,12 @@ def _add_peak_metrics(session: Dict[str, Any], stems_dir: Path) -> None:
             continue
         if detect_format_from_path(stem_path) != "wav":
             continue
-        try:
-            peak_dbfs = compute_sample_peak_dbfs_wav(stem_path)
-        except ValueError:
-            continue
+        peak_dbfs = (precomputed or {}).get(stem.get("stem_id"))
+        if peak_dbfs is None:
+            try:
+                peak_dbfs = compute_sample_peak_dbfs_wav(stem_path)
+            except ValueError:
+                continue
         metrics = stem.get("metrics")
         if not isinstance(metrics, dict):
             metrics = {}
@@ -273,173 +602,83 @@ def _add_peak_metrics(session: Dict[str, Any], stems_dir: Path) -> None:
         )
 
 
-def _worker_basic_meters(
-    stem: Dict[str, Any],
-    stems_dir_str: str,
-    step_index: int,
-    total_steps: int,
-    phase_start: float,
-) -> Dict[str, Any]:
-    """Top-level worker for ProcessPoolExecutor: compute basic meters for one stem.
-
-    Returns a dict with keys: stem_id, measurements, stereo_correlation, missing_ffmpeg.
-    Emits [MMO-LIVE] lines to stderr.
-    """
-    stems_dir = Path(stems_dir_str)
-    stem_id = stem.get("stem_id", "")
-    result: Dict[str, Any] = {
-        "stem_id": stem_id,
-        "measurements": [],
-        "stereo_correlation": None,
-        "missing_ffmpeg": False,
-    }
-
-    stem_path = _resolved_stem_path_for_scan(stem, stems_dir)
-    if stem_path is None:
-        return result
-
-    format_id = detect_format_from_path(stem_path)
+def _basic_measurement_dicts(
+    result: MeterBankResult, *, include_peak: bool
+) -> List[Dict[str, Any]]:
+    clip_count = result.clip_count
+    dc_offset = float(result.dc_offset or 0.0)
     measurements: List[Dict[str, Any]] = []
-
-    # Use the native WAV reader here. It matches the direct decode path used
-    # elsewhere and leaves FFmpeg as the compatibility path for other formats.
-    if format_id == "wav":
-        if "sample_rate_hz" not in stem or "bits_per_sample" not in stem:
-            return result
-        try:
-            (
-                _basic_peak,
-                clip_count,
-                dc_offset,
-                rms_dbfs,
-                crest_factor_db,
-            ) = compute_basic_stats_from_float64(
-                iter_wav_float64_samples(stem_path, error_context="basic meters")
-            )
-        except ValueError:
-            return result
-
-        measurements = [
-            {"evidence_id": "EVID.METER.CLIP_SAMPLE_COUNT", "value": clip_count, "unit_id": "UNIT.COUNT"},
-            {"evidence_id": "EVID.QUALITY.CLIPPED_SAMPLES_COUNT", "value": clip_count, "unit_id": "UNIT.COUNT"},
-            {"evidence_id": "EVID.METER.DC_OFFSET", "value": dc_offset, "unit_id": "UNIT.RATIO"},
-            {"evidence_id": "EVID.QUALITY.DC_OFFSET_PERCENT", "value": dc_offset * 100.0, "unit_id": "UNIT.PERCENT"},
-            {"evidence_id": "EVID.METER.RMS_DBFS", "value": rms_dbfs, "unit_id": "UNIT.DBFS"},
-            {"evidence_id": "EVID.METER.CREST_FACTOR_DB", "value": crest_factor_db, "unit_id": "UNIT.DB"},
-        ]
-
-        if stem.get("channel_count") == 2:
-            try:
-                correlation = compute_stereo_correlation_wav(stem_path)
-                result["stereo_correlation"] = correlation
-            except ValueError:
-                pass
-
-    elif format_id in {"flac", "wavpack", "aiff", "ape"}:
-        ffmpeg_cmd = resolve_ffmpeg_cmd()
-        if ffmpeg_cmd is None:
-            # Missing ffmpeg is an optional-dependency problem. Return a flag so
-            # the session-level report can keep scanning the rest of the stems
-            # and emit one shared issue instead of failing early here.
-            result["missing_ffmpeg"] = True
-            return result
-        try:
-            (
-                peak,
-                clip_count,
-                dc_offset,
-                rms_dbfs,
-                crest_factor_db,
-            ) = compute_basic_stats_from_float64(
-                iter_ffmpeg_float64_samples(stem_path, ffmpeg_cmd)
-            )
-        except ValueError:
-            return result
-
-        if peak <= 0.0:
-            peak_dbfs = float("-inf")
-        else:
-            peak_dbfs = 20.0 * math.log10(peak)
-
-        measurements = [
-            {"evidence_id": "EVID.METER.SAMPLE_PEAK_DBFS", "value": peak_dbfs, "unit_id": "UNIT.DBFS"},
-            {"evidence_id": "EVID.METER.PEAK_DBFS", "value": peak_dbfs, "unit_id": "UNIT.DBFS"},
+    if include_peak:
+        peak = float(result.peak or 0.0)
+        peak_dbfs = float("-inf") if peak <= 0.0 else 20.0 * math.log10(peak)
+        measurements.extend(
+            [
+                {"evidence_id": "EVID.METER.SAMPLE_PEAK_DBFS", "value": peak_dbfs, "unit_id": "UNIT.DBFS"},
+                {"evidence_id": "EVID.METER.PEAK_DBFS", "value": peak_dbfs, "unit_id": "UNIT.DBFS"},
+            ]
+        )
+    measurements.extend(
+        [
             {"evidence_id": "EVID.METER.CLIP_SAMPLE_COUNT", "value": clip_count, "unit_id": "UNIT.COUNT"},
             {"evidence_id": "EVID.QUALITY.CLIPPED_SAMPLES_COUNT", "value": clip_count, "unit_id": "UNIT.COUNT"},
             {"evidence_id": "EVID.METER.DC_OFFSET", "value": dc_offset, "unit_id": "UNIT.RATIO"},
             {"evidence_id": "EVID.QUALITY.DC_OFFSET_PERCENT", "value": dc_offset * 100.0, "unit_id": "UNIT.PERCENT"},
-            {"evidence_id": "EVID.METER.RMS_DBFS", "value": rms_dbfs, "unit_id": "UNIT.DBFS"},
-            {"evidence_id": "EVID.METER.CREST_FACTOR_DB", "value": crest_factor_db, "unit_id": "UNIT.DB"},
+            {"evidence_id": "EVID.METER.RMS_DBFS", "value": result.rms_dbfs, "unit_id": "UNIT.DBFS"},
+            {"evidence_id": "EVID.METER.CREST_FACTOR_DB", "value": result.crest_factor_db, "unit_id": "UNIT.DB"},
         ]
-    else:
-        return result
+    )
+    if result.clip_events is not None:
+        measurements.extend(
+            [
+                {"evidence_id": "EVID.QUALITY.CLIP_EVENTS_COUNT", "value": result.clip_events.event_count, "unit_id": "UNIT.COUNT"},
+                {"evidence_id": "EVID.METER.CLIP_EVENT_INDEX", "value": _event_index_json(result.clip_events, peak_key="peak_dbfs", count_key="clipped_sample_count"), "unit_id": "UNIT.NONE"},
+            ]
+        )
+    return measurements
 
-    result["measurements"] = measurements
 
-    elapsed = time.perf_counter() - phase_start
-    done = step_index + 1
-    eta = (elapsed / done) * (total_steps - done) if done < total_steps else 0.0
-    _emit_live(
-        what="basic meters",
-        why="peak, RMS, crest factor, DC offset, clip count",
-        where=[stem_id],
-        step_index=done,
-        total_steps=total_steps,
-        progress=done / total_steps if total_steps else 1.0,
-        eta_seconds=eta,
-        evidence={"format": format_id},
+def _event_index_json(index: Any, *, peak_key: str, count_key: str) -> str:
+    """Serialize a bounded event index as compact, deterministic JSON."""
+    events = []
+    for event in index.events:
+        peak_db = 20.0 * math.log10(event.peak) if event.peak > 0.0 else None
+        events.append(
+            {
+                "channel": event.channel,
+                "length_frames": event.length,
+                peak_key: None if peak_db is None else round(peak_db, 4),
+                "start_frame": event.start_frame,
+            }
+        )
+    return json.dumps(
+        {
+            count_key: index.flagged_count,
+            "event_count": index.event_count,
+            "events": events,
+            "max_events": index.max_events,
+            "truncated": index.truncated,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
     )
-    return result
 
 
-def _worker_truth_meters(
+def _truth_measurement_dicts(
     stem: Dict[str, Any],
-    stems_dir_str: str,
+    result: MeterBankResult,
+    *,
+    channels: int,
+    channel_mask: int | None,
     method_id: str,
-    step_index: int,
-    total_steps: int,
-    phase_start: float,
-) -> Dict[str, Any]:
-    """Top-level worker for ProcessPoolExecutor: compute truth meters for one stem.
-
-    Returns a dict with keys: stem_id, measurements, missing_ffmpeg.
-    Emits [MMO-LIVE] lines to stderr.
-    """
+    pair_meta: list[dict],
+    skip_reason: str | None,
+    pair_source: str,
+) -> List[Dict[str, Any]]:
     from mmo.dsp.meters_truth import (  # noqa: WPS433
-        _read_wav_float64,
         bs1770_weighting_info,
-        compute_lufs_integrated_float64,
-        compute_lufs_shortterm_float64,
-        compute_true_peak_dbtp_float64,
         loudness_weighting_receipt,
     )
-    import numpy as np  # noqa: WPS433
 
-    stems_dir = Path(stems_dir_str)
-    stem_id = stem.get("stem_id", "")
-    result: Dict[str, Any] = {
-        "stem_id": stem_id,
-        "measurements": [],
-        "missing_ffmpeg": False,
-    }
-
-    stem_path = _resolved_stem_path_for_scan(stem, stems_dir)
-    if stem_path is None:
-        return result
-
-    format_id = detect_format_from_path(stem_path)
-    channels = stem.get("channels")
-    if not isinstance(channels, int) or channels <= 0:
-        channels = stem.get("channel_count")
-    if not isinstance(channels, int) or channels <= 0:
-        return result
-
-    sample_rate_hz = stem.get("sample_rate_hz")
-    if not isinstance(sample_rate_hz, (int, float)) or sample_rate_hz <= 0:
-        return result
-
-    mask = stem.get("wav_channel_mask")
-    channel_mask = mask if isinstance(mask, int) else None
     weights, order_csv, mode_str = bs1770_weighting_info(
         channels, channel_mask, channel_layout=stem.get("channel_layout")
     )
@@ -448,87 +687,6 @@ def _worker_truth_meters(
         channel_layout=stem.get("channel_layout"),
         method_id=method_id,
     )
-    # Pair correlations are only meaningful when channel order evidence is
-    # strong enough to name the pair. Weak layout hints should emit a skipped
-    # receipt, not guessed stereo evidence.
-    pairs, pair_meta, skip_reason = _plan_correlation_pairs(order_csv, mode_str, channels)
-    pair_correlations: Dict[str, float] | None = None
-    pair_source: str | None = None
-
-    if format_id == "wav":
-        try:
-            samples_array, _sr = _read_wav_float64(stem_path)
-            pair_accumulator = PairCorrelationAccumulator(channels, pairs) if pairs else None
-            if pair_accumulator is not None and samples_array.size > 0:
-                for idx in range(0, len(samples_array), channels):
-                    chunk = samples_array[idx : idx + channels].tolist()
-                    pair_accumulator.update_chunk(chunk)
-            truepeak_dbtp = compute_true_peak_dbtp_float64(samples_array, int(sample_rate_hz))
-            lufs_i = compute_lufs_integrated_float64(
-                samples_array, int(sample_rate_hz), channels,
-                channel_mask=stem.get("wav_channel_mask"),
-                channel_layout=stem.get("channel_layout"),
-                method_id=method_id,
-            )
-            lufs_s = compute_lufs_shortterm_float64(
-                samples_array, int(sample_rate_hz), channels,
-                channel_mask=stem.get("wav_channel_mask"),
-                channel_layout=stem.get("channel_layout"),
-                method_id=method_id,
-            )
-        except ValueError:
-            return result
-        if pair_accumulator is not None:
-            pair_correlations = pair_accumulator.correlations()
-            pair_source = "wav_reader"
-
-    elif format_id in {"flac", "wavpack", "aiff", "ape"}:
-        ffmpeg_cmd = resolve_ffmpeg_cmd()
-        if ffmpeg_cmd is None:
-            # Truth meters can still leave a useful session receipt behind even
-            # when ffmpeg is absent. Report that gap later instead of hiding
-            # all other scan evidence behind one missing tool.
-            result["missing_ffmpeg"] = True
-            return result
-        try:
-            samples: list[float] = []
-            pair_accumulator = PairCorrelationAccumulator(channels, pairs) if pairs else None
-            for chunk in iter_ffmpeg_float64_samples(stem_path, ffmpeg_cmd):
-                samples.extend(chunk)
-                if pair_accumulator is not None:
-                    pair_accumulator.update_chunk(chunk)
-            if samples:
-                samples_array = np.asarray(samples, dtype=np.float64)
-                total = (len(samples_array) // channels) * channels
-                if total != len(samples_array):
-                    samples_array = samples_array[:total]
-                samples_array = samples_array.reshape(-1, channels)
-            else:
-                samples_array = np.zeros((0, channels), dtype=np.float64)
-        except ValueError:
-            return result
-        try:
-            truepeak_dbtp = compute_true_peak_dbtp_float64(samples_array, int(sample_rate_hz))
-            lufs_i = compute_lufs_integrated_float64(
-                samples_array, int(sample_rate_hz), channels,
-                channel_mask=stem.get("wav_channel_mask"),
-                channel_layout=stem.get("channel_layout"),
-                method_id=method_id,
-            )
-            lufs_s = compute_lufs_shortterm_float64(
-                samples_array, int(sample_rate_hz), channels,
-                channel_mask=stem.get("wav_channel_mask"),
-                channel_layout=stem.get("channel_layout"),
-                method_id=method_id,
-            )
-        except ValueError:
-            return result
-        if pair_accumulator is not None:
-            pair_correlations = pair_accumulator.correlations()
-            pair_source = "ffmpeg_f64le"
-    else:
-        return result
-
     gi_csv = ",".join(f"{weight:.2f}" for weight in weights)
     receipt_json = json.dumps(
         {
@@ -541,16 +699,21 @@ def _worker_truth_meters(
         separators=(",", ":"),
     )
     measurements: List[Dict[str, Any]] = [
-        {"evidence_id": "EVID.METER.TRUEPEAK_DBTP", "value": truepeak_dbtp, "unit_id": "UNIT.DBTP"},
-        {"evidence_id": "EVID.METER.LUFS_I", "value": lufs_i, "unit_id": "UNIT.LUFS"},
-        {"evidence_id": "EVID.METER.LUFS_S", "value": lufs_s, "unit_id": "UNIT.LUFS"},
+        {"evidence_id": "EVID.METER.TRUEPEAK_DBTP", "value": result.true_peak_dbtp, "unit_id": "UNIT.DBTP"},
+        {"evidence_id": "EVID.METER.LUFS_I", "value": result.lufs_i, "unit_id": "UNIT.LUFS"},
+        {"evidence_id": "EVID.METER.LUFS_S", "value": result.lufs_s, "unit_id": "UNIT.LUFS"},
         {"evidence_id": "EVID.METER.LUFS_WEIGHTING_MODE", "value": mode_str, "unit_id": "UNIT.NONE"},
         {"evidence_id": "EVID.METER.LUFS_WEIGHTING_ORDER", "value": order_csv, "unit_id": "UNIT.NONE"},
         {"evidence_id": "EVID.METER.LUFS_WEIGHTING_GI", "value": gi_csv, "unit_id": "UNIT.NONE"},
         {"evidence_id": "EVID.METER.LUFS_WEIGHTING_RECEIPT", "value": receipt_json, "unit_id": "UNIT.NONE"},
     ]
+    if result.over_events is not None:
+        measurements.append(
+            {"evidence_id": "EVID.METER.TRUEPEAK_OVER_EVENT_INDEX", "value": _event_index_json(result.over_events, peak_key="peak_dbtp", count_key="over_sample_count_4x"), "unit_id": "UNIT.NONE"}
+        )
 
-    if pair_correlations is not None and pair_source is not None and pair_meta:
+    pair_correlations = result.pair_correlations
+    if pair_correlations is not None and pair_meta:
         for meta in pair_meta:
             token = meta["token"]
             corr = pair_correlations.get(token)
@@ -588,40 +751,501 @@ def _worker_truth_meters(
             measurements.append(
                 {"evidence_id": "EVID.IMAGE.CORRELATION_PAIRS_LOG", "value": pairs_log, "unit_id": "UNIT.NONE"}
             )
+    return measurements
+
+
+def _stem_meter_plan(
+    stem: Dict[str, Any],
+    stems_dir: Path,
+    *,
+    truth: bool,
+    mix_features: bool,
+    lfe_audit: bool = False,
+) -> Dict[str, Any] | None:
+    """Resolve which stem meters apply to one stem, without decoding it.
+
+    Returns None when the stem cannot be metered at all (unresolved path or
+    unsupported format).
+    """
+    stem_path = _resolved_stem_path_for_scan(stem, stems_dir)
+    if stem_path is None:
+        return None
+
+    format_id = detect_format_from_path(stem_path)
+    if format_id != "wav" and format_id not in _NON_WAV_SCAN_FORMAT_IDS:
+        return None
+
+    # The native WAV reader matches the direct decode path used elsewhere and
+    # leaves FFmpeg as the compatibility path for other formats.
+    want_basic = format_id != "wav" or (
+        "sample_rate_hz" in stem and "bits_per_sample" in stem
+    )
+    channels = stem.get("channels")
+    if not isinstance(channels, int) or channels <= 0:
+        channels = stem.get("channel_count")
+    sample_rate_hz = stem.get("sample_rate_hz")
+    rate_ok = isinstance(sample_rate_hz, (int, float)) and sample_rate_hz > 0
+    want_truth = truth and rate_ok and isinstance(channels, int) and channels > 0
+    stem_id = stem.get("stem_id", "")
+    channel_count = stem.get("channel_count")
+    want_mix = (
+        mix_features
+        and rate_ok
+        and isinstance(stem_id, str)
+        and bool(stem_id)
+        and isinstance(channel_count, int)
+        and channel_count > 0
+    )
+    lfe_layout = _stem_lfe_layout(stem) if lfe_audit else None
+    meter_ids = [
+        meter_id
+        for meter_id, wanted in (
+            ("basic", want_basic),
+            ("truth", want_truth),
+            ("mix_features", want_mix),
+            ("lfe_audit", lfe_layout is not None),
+        )
+        if wanted
+    ]
+    return {
+        "stem_path": stem_path,
+        "format_id": format_id,
+        "channels": channels,
+        "channel_count": channel_count,
+        "sample_rate_hz": sample_rate_hz,
+        "rate_ok": rate_ok,
+        "lfe_layout": lfe_layout,
+        "meter_ids": meter_ids,
+    }
+
+
+def _worker_stem_meters(
+    stem: Dict[str, Any],
+    stems_dir_str: str,
+    method_id: str,
+    truth: bool,
+    mix_features: bool,
+    step_index: int,
+    total_steps: int,
+    phase_start: float,
+    skip_meters: tuple[str, ...] = (),
+    lfe_audit: bool = False,
+    preview: Optional[tuple[int, float, int]] = None,
+) -> Dict[str, Any]:
+    """Top-level worker for ProcessPoolExecutor: meter one stem from one decode.
+
+    Basic stats, stereo/pair correlation, truth meters, the windowed
+    mix-complexity features of the mono downmix, and the LFE channels used
+    by the LFE audit all read from the same decode. Meter ids in ``skip_meters`` (already served
+    from the meter cache) are left out. ``preview`` is ``(window_count,
+    window_s, seed)``: only those windows are read, and ``preview`` in the
+    result carries the per-measurement error bounds.
+
+    Returns a dict with keys: stem_id, basic_measurements, stereo_correlation,
+    sample_peak_dbfs, truth_measurements, mix_active (plus mix_mid_band,
+    mix_frame_count, mix_sample_rate_hz when set), lfe_audit, missing_ffmpeg,
+    computed_meters, preview.
+    Emits [MMO-LIVE] lines to stderr.
+    """
+    stems_dir = Path(stems_dir_str)
+    stem_id = stem.get("stem_id", "")
+    result: Dict[str, Any] = {
+        "stem_id": stem_id,
+        "basic_measurements": [],
+        "stereo_correlation": None,
+        "sample_peak_dbfs": None,
+        "truth_measurements": [],
+        "mix_active": None,
+        "lfe_audit": None,
+        "missing_ffmpeg": False,
+        "computed_meters": [],
+        "preview": None,
+    }
+
+    plan = _stem_meter_plan(
+        stem, stems_dir, truth=truth, mix_features=mix_features, lfe_audit=lfe_audit
+    )
+    if plan is None:
+        return result
+    stem_path = plan["stem_path"]
+    format_id = plan["format_id"]
+    channels = plan["channels"]
+    channel_count = plan["channel_count"]
+    sample_rate_hz = plan["sample_rate_hz"]
+    rate_ok = plan["rate_ok"]
+    meter_ids = [m for m in plan["meter_ids"] if m not in skip_meters]
+    want_basic = "basic" in meter_ids
+    want_truth = "truth" in meter_ids
+    want_mix = "mix_features" in meter_ids
+    want_lfe = "lfe_audit" in meter_ids
+    want_stereo = want_basic and format_id == "wav" and channel_count == 2
+    if not (want_basic or want_truth or want_mix or want_lfe):
+        return result
+
+    channel_mask = stem.get("wav_channel_mask")
+    channel_mask = channel_mask if isinstance(channel_mask, int) else None
+    pairs: Dict[str, tuple[int, int]] = {}
+    pair_meta: list[dict] = []
+    skip_reason: str | None = None
+    if want_truth:
+        from mmo.dsp.meters_truth import bs1770_weighting_info  # noqa: WPS433
+
+        _, order_csv, mode_str = bs1770_weighting_info(
+            channels, channel_mask, channel_layout=stem.get("channel_layout")
+        )
+        # Pair correlations are only meaningful when channel order evidence is
+        # strong enough to name the pair. Weak layout hints should emit a
+        # skipped receipt, not guessed stereo evidence.
+        pairs, pair_meta, skip_reason = _plan_correlation_pairs(order_csv, mode_str, channels)
+
+    windows = None
+    window_frames = 0
+    frame_count = _stem_frame_count(stem)
+    if preview is not None and rate_ok and frame_count:
+        window_count, window_s, seed = preview
+        window_frames = max(1, int(round(window_s * float(sample_rate_hz))))
+        windows = preview_windows(
+            frame_count, window_frames, window_count=window_count, seed=seed, key=str(stem_id)
+        )
+    read_window: Any = None
+    wav_map: Any = None
+    if format_id == "wav":
+        pair_source = "wav_reader"
+        if windows is not None:
+            from mmo.dsp.wav_memmap import WavMemmap  # noqa: WPS433
+
+            try:
+                wav_map = WavMemmap(stem_path)
+            except ValueError:
+                return result
+            read_window = functools.partial(_iter_wav_stem_window, wav_map)
+        else:
+            chunk_iter = iter_wav_frames_ndarray(stem_path, error_context="stem meters")
+    elif _uses_native_aiff(format_id, stem_path):
+        pair_source = "aiff_reader"
+        if windows is not None:
+            read_window = functools.partial(
+                iter_aiff_frames_ndarray, stem_path, error_context="stem meters"
+            )
+        else:
+            chunk_iter = iter_aiff_frames_ndarray(stem_path, error_context="stem meters")
+    else:
+        pair_source = "ffmpeg_f64le"
+        ffmpeg_cmd = resolve_ffmpeg_cmd()
+        if ffmpeg_cmd is None:
+            # Missing ffmpeg is an optional-dependency problem. Return a flag so
+            # the session-level report can keep scanning the rest of the stems
+            # and emit one shared issue instead of failing early here.
+            result["missing_ffmpeg"] = True
+            return result
+        if windows is not None:
+            read_window = functools.partial(
+                _iter_ffmpeg_stem_window,
+                stem_path,
+                ffmpeg_cmd,
+                channels=channels if isinstance(channels, int) and channels > 0 else 1,
+                sample_rate_hz=int(sample_rate_hz),
+            )
+        else:
+            decode_channels = channels if isinstance(channels, int) and channels > 0 else 1
+            chunk_iter = _iter_ffmpeg_stem_blocks(
+                stem, stem_path, ffmpeg_cmd, channels=decode_channels, error_context="stem meters"
+            )
 
-    result["measurements"] = measurements
+    def _make_bank(bank_channels: int) -> MeterBank:
+        return MeterBank(
+            int(sample_rate_hz) if rate_ok else 0,
+            bank_channels,
+            basic=want_basic,
+            stereo_correlation=want_stereo,
+            correlation_pairs=pairs or None,
+            truth=want_truth,
+            # Event frames would point into the joined windows, not the file.
+            event_index=windows is None,
+            mix_features=want_mix,
+            channel_mask=channel_mask,
+            channel_layout=stem.get("channel_layout"),
+            method_id=method_id,
+        )
+
+    lfe_tap = _LfeChannelTap(*plan["lfe_layout"]) if want_lfe else None
+    bank: MeterBank | None = None
+    window_readings: Dict[str, List[float]] = {}
+    sampled_frames = 0
+    try:
+        if windows is not None:
+            bank, window_readings, sampled_frames = _meter_stem_windows(
+                read_window, windows, _make_bank, stereo_correlation=want_stereo
+            )
+        else:
+            for chunk in chunk_iter:
+                if bank is None:
+                    bank = _make_bank(chunk.shape[1])
+                bank.update(chunk)
+                if lfe_tap is not None:
+                    lfe_tap.update(chunk)
+        if bank is None:
+            bank = _make_bank(channels if isinstance(channels, int) and channels > 0 else 1)
+        bank_result = bank.result()
+    except ValueError:
+        return result
+    finally:
+        if wav_map is not None:
+            wav_map.close()
+
+    if want_basic:
+        result["basic_measurements"] = _basic_measurement_dicts(
+            bank_result, include_peak=format_id != "wav"
+        )
+        result["stereo_correlation"] = bank_result.stereo_correlation
+        if format_id == "wav":
+            # Same value ``compute_sample_peak_dbfs_wav`` reports for --peak.
+            peak = float(bank_result.peak or 0.0)
+            result["sample_peak_dbfs"] = float("-inf") if peak == 0.0 else 20.0 * math.log10(peak)
+    if want_truth and bank_result.truth_error is not None:
+        # A truth meter rejected the stem; its basic rows above still stand.
+        want_truth = False
+        meter_ids = [meter_id for meter_id in meter_ids if meter_id != "truth"]
+    if want_truth:
+        result["truth_measurements"] = _truth_measurement_dicts(
+            stem,
+            bank_result,
+            channels=channels,
+            channel_mask=channel_mask,
+            method_id=method_id,
+            pair_meta=pair_meta,
+            skip_reason=skip_reason,
+            pair_source=pair_source,
+        )
+    if want_mix:
+        features = bank_result.mix_features
+        result["mix_active"] = features.active
+        result["mix_mid_band"] = features.mid_band
+        result["mix_frame_count"] = features.frame_count
+        result["mix_sample_rate_hz"] = features.sample_rate_hz
+    if lfe_tap is not None:
+        result["lfe_audit"] = lfe_tap.audit()
+    if windows is not None and sampled_frames > 0:
+        result["preview"] = _preview_estimates(
+            result,
+            window_readings,
+            window_count=len(windows),
+            frame_count=frame_count,
+            window_frames=window_frames,
+            sampled_frames=sampled_frames,
+        )
+    result["computed_meters"] = [
+        meter_id
+        for meter_id in meter_ids
+        if meter_id != "lfe_audit" or result["lfe_audit"] is not None
+    ]
 
     elapsed = time.perf_counter() - phase_start
     done = step_index + 1
     eta = (elapsed / done) * (total_steps - done) if done < total_steps else 0.0
     _emit_live(
-        what="truth meters",
-        why="TruePeak, LUFS-I, LUFS-S, correlation",
+        what="stem meters",
+        why=(
+            "peak, RMS, crest factor, DC offset, clip count, TruePeak, LUFS-I, LUFS-S, correlation"
+            if want_truth
+            else "peak, RMS, crest factor, DC offset, clip count"
+        ),
         where=[stem_id],
         step_index=done,
         total_steps=total_steps,
         progress=done / total_steps if total_steps else 1.0,
         eta_seconds=eta,
-        evidence={"format": format_id, "sample_rate_hz": int(sample_rate_hz)},
+        evidence={"format": format_id},
     )
     return result
 
 
-def _add_basic_meter_measurements(
-    session: Dict[str, Any], stems_dir: Path
-) -> bool:
+def _meter_stem_windows(
+    read_window: Any,
+    windows: List[tuple[int, int]],
+    make_bank: Any,
+    *,
+    stereo_correlation: bool,
+) -> tuple[Optional[MeterBank], Dict[str, List[float]], int]:
+    """Meter preview windows; return the stem bank, readings per window, and frames read.
+
+    Every window feeds the stem's bank, which yields the point estimates, and
+    a basic-stats bank of its own, whose readings give the spread between
+    windows without running the truth meters twice.
+    """
+    bank: Optional[MeterBank] = None
+    readings: Dict[str, List[float]] = {}
+    sampled_frames = 0
+    for start_frame, frame_count in windows:
+        window_bank: Optional[MeterBank] = None
+        for chunk in read_window(start_frame=start_frame, frame_count=frame_count):
+            if bank is None:
+                bank = make_bank(chunk.shape[1])
+            if window_bank is None:
+                window_bank = MeterBank(
+                    bank.sample_rate_hz, chunk.shape[1], stereo_correlation=stereo_correlation
+                )
+            bank.update(chunk)
+            window_bank.update(chunk)
+            sampled_frames += int(chunk.shape[0])
+        if window_bank is None:
+            continue
+        window_result = window_bank.result()
+        rows = _basic_measurement_dicts(window_result, include_peak=True)
+        if window_result.stereo_correlation is not None:
+            rows.append(
+                {"evidence_id": "EVID.IMAGE.CORRELATION", "value": window_result.stereo_correlation}
+            )
+        for row in rows:
+            value = row["value"]
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                readings.setdefault(row["evidence_id"], []).append(float(value))
+    return bank, readings, sampled_frames
+
+
+# Window banks only run basic stats, so truth readings take their spread
+# from the basic reading that tracks them: loudness from RMS level, true
+# peak from sample peak.
+_PREVIEW_BOUND_PROXIES = {
+    "EVID.METER.LUFS_I": "EVID.METER.RMS_DBFS",
+    "EVID.METER.LUFS_S": "EVID.METER.RMS_DBFS",
+    "EVID.METER.TRUEPEAK_DBTP": "EVID.METER.SAMPLE_PEAK_DBFS",
+}
+# Describe the loudness weighting applied, not the audio, so a preview
+# reports them exactly.
+_PREVIEW_EXACT_EVIDENCE_IDS = frozenset(
+    {
+        "EVID.METER.LUFS_WEIGHTING_MODE",
+        "EVID.METER.LUFS_WEIGHTING_ORDER",
+        "EVID.METER.LUFS_WEIGHTING_GI",
+        "EVID.METER.LUFS_WEIGHTING_RECEIPT",
+    }
+)
+
+
+def _preview_estimates(
+    result: Dict[str, Any],
+    window_readings: Dict[str, List[float]],
+    *,
+    window_count: int,
+    frame_count: int,
+    window_frames: int,
+    sampled_frames: int,
+) -> Dict[str, Any]:
+    """Turn a stem's sampled readings into whole-stem estimates, in place.
+
+    Counts are scaled from the frames read to the whole stem. Returns the
+    stem's preview entry: window count, frames read, and, per approximate
+    evidence id, a 95% error bound (None when the windows do not give one,
+    e.g. per-pair correlations).
+    """
+    population = frame_count / window_frames
+    scale = frame_count / sampled_frames
+    error_bounds: Dict[str, Optional[float]] = {}
+    for row in result["basic_measurements"] + result["truth_measurements"]:
+        evidence_id = row["evidence_id"]
+        if evidence_id in _PREVIEW_EXACT_EVIDENCE_IDS:
+            continue
+        values = window_readings.get(_PREVIEW_BOUND_PROXIES.get(evidence_id, evidence_id), [])
+        bound = window_error_bound(values, population=population) if values else None
+        if row["unit_id"] == "UNIT.COUNT":
+            row["value"] = int(round(row["value"] * scale))
+            bound = None if bound is None else bound * population
+        error_bounds[evidence_id] = bound
+    extra_ids = []
+    if result["stereo_correlation"] is not None:
+        extra_ids.append("EVID.IMAGE.CORRELATION")
+    if result["sample_peak_dbfs"] is not None:
+        # Read by --peak, which writes these two ids from the sampled peak.
+        extra_ids.extend(["EVID.METER.SAMPLE_PEAK_DBFS", "EVID.METER.PEAK_DBFS"])
+    for evidence_id in extra_ids:
+        values = window_readings.get(evidence_id, [])
+        error_bounds[evidence_id] = (
+            window_error_bound(values, population=population) if values else None
+        )
+    return {
+        "window_count": window_count,
+        "sampled_frames": sampled_frames,
+        "error_bounds": error_bounds,
+    }
+
+
+# Bump an entry here whenever that meter's output for the same audio changes.
+_METER_CACHE_VERSIONS = {
+    "basic": "stem-basic.v2",
+    "truth": "stem-truth.v1",
+    "mix_features": "stem-mix-features.v1",
+    "lfe_audit": "stem-lfe-audit.v1",
+}
+_METER_CACHE_PAYLOAD_KEYS = {
+    "basic": ("basic_measurements", "stereo_correlation", "sample_peak_dbfs"),
+    "truth": ("truth_measurements",),
+    "mix_features": ("mix_active", "mix_mid_band", "mix_frame_count", "mix_sample_rate_hz"),
+    "lfe_audit": ("lfe_audit",),
+}
+
+
+def _meter_cache_options(
+    stem: Dict[str, Any],
+    format_id: str,
+    meter_id: str,
+    method_id: str,
+) -> Dict[str, Any]:
+    """Return the stem metadata and settings that shape one meter's output."""
+    options: Dict[str, Any] = {
+        "engine_version": engine_version,
+        "format_id": format_id,
+    }
+    for key in (
+        "bits_per_sample",
+        "channel_count",
+        "channel_layout",
+        "channels",
+        "sample_rate_hz",
+        "wav_channel_mask",
+    ):
+        options[key] = stem.get(key)
+    if meter_id == "truth":
+        options["method_id"] = method_id
+    return options
+
+
+def _run_stem_meters(
+    session: Dict[str, Any],
+    stems_dir: Path,
+    *,
+    truth: bool,
+    mix_features: bool,
+    lfe_audit: bool = False,
+    meter_cache: MeterCache | None = None,
+    cached_meter_ids: Optional[tuple[str, ...]] = None,
+    skip_meters_by_stem: Optional[Dict[str, tuple[str, ...]]] = None,
+    worker_pool: Optional[_ScanWorkerPool] = None,
+    preview: Optional[tuple[int, float, int]] = None,
+) -> tuple[Dict[str, Dict[str, Any]], bool, List[Dict[str, Any]]]:
+    """Meter every stem once in a process pool; return results keyed by stem_id.
+
+    With ``meter_cache``, each stem's meters are looked up by content sha256
+    first and only the missing ones are decoded and computed; new outputs are
+    stored back; ``cached_meter_ids`` limits this to those meters. The third
+    return value lists, per stem, which meters came from the cache and which
+    were computed. ``skip_meters_by_stem`` names
+    meter ids a caller already has for a stem (incremental rescans).
+    Jobs run on ``worker_pool`` when given, else on a pool of their own.
+    ``preview`` is passed to each worker (see ``_worker_stem_meters``).
+    """
     stems = [s for s in session.get("stems", []) if isinstance(s, dict)]
     if not stems:
-        return False
+        return {}, False, []
 
-    stems_by_id = {s.get("stem_id"): s for s in stems if s.get("stem_id")}
+    method_id = DEFAULT_LOUDNESS_METHOD_ID
     total = len(stems)
     missing_ffmpeg = False
     phase_start = time.perf_counter()
 
     _emit_live(
-        what="basic meters: starting",
-        why="peak, RMS, crest factor, DC offset, clip count for all stems",
+        what="stem meters: starting",
+        why="one decode per stem feeds every enabled meter",
         where=["session"],
         kind="action",
         step_index=0,
@@ -629,166 +1253,227 @@ def _add_basic_meter_measurements(
         progress=0.0,
     )
 
-    max_workers = min(total, os.cpu_count() or 1)
-    futures = {}
-    with ProcessPoolExecutor(max_workers=max_workers) as pool:
-        for idx, stem in enumerate(stems):
-            future = pool.submit(
-                _worker_basic_meters,
+    results: Dict[str, Dict[str, Any]] = {}
+    provenance: Dict[str, Dict[str, List[str]]] = {}
+    pending: List[tuple[int, Dict[str, Any], tuple[str, ...]]] = []
+    cache_keys: Dict[str, tuple[str, str, Dict[str, str]]] = {}
+    for idx, stem in enumerate(stems):
+        stem_id = stem.get("stem_id")
+        sha256 = stem.get("sha256")
+        skip = tuple((skip_meters_by_stem or {}).get(stem_id, ()))
+        plan = None
+        if meter_cache is not None and isinstance(sha256, str) and sha256:
+            plan = _stem_meter_plan(
                 stem,
-                str(stems_dir),
-                idx,
-                total,
-                phase_start,
+                stems_dir,
+                truth=truth,
+                mix_features=mix_features,
+                lfe_audit=lfe_audit,
             )
-            futures[future] = stem.get("stem_id")
+        if plan is None or not isinstance(stem_id, str) or not stem_id:
+            pending.append((idx, stem, skip))
+            continue
 
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-            except Exception:
+        wanted = [meter_id for meter_id in plan["meter_ids"] if meter_id not in skip]
+        cached: Dict[str, Any] = {}
+        cached_ids: List[str] = []
+        for meter_id in wanted:
+            if cached_meter_ids is not None and meter_id not in cached_meter_ids:
                 continue
-            stem_id = result.get("stem_id")
-            stem = stems_by_id.get(stem_id)
-            if stem is None:
+            payload = meter_cache.load(
+                sha256,
+                meter_id,
+                _METER_CACHE_VERSIONS[meter_id],
+                _meter_cache_options(stem, plan["format_id"], meter_id, method_id),
+            )
+            if payload is None:
                 continue
-            if result.get("missing_ffmpeg"):
-                missing_ffmpeg = True
-            for m in result.get("measurements", []):
-                upsert_measurement(stem, evidence_id=m["evidence_id"], value=m["value"], unit_id=m["unit_id"])
+            cached.update(payload)
+            cached_ids.append(meter_id)
+        cache_keys[stem_id] = (sha256, plan["format_id"], cached)
+        provenance[stem_id] = {"cached": cached_ids, "computed": []}
+        if wanted and len(cached_ids) == len(wanted):
+            result = {
+                "stem_id": stem_id,
+                "basic_measurements": [],
+                "stereo_correlation": None,
+                "sample_peak_dbfs": None,
+                "truth_measurements": [],
+                "mix_active": None,
+                "lfe_audit": None,
+                "missing_ffmpeg": False,
+                "computed_meters": [],
+            }
+            result.update(cached)
+            results[stem_id] = result
+            continue
+        pending.append((idx, stem, skip + tuple(cached_ids)))
+
+    stems_by_id = {stem.get("stem_id"): stem for stem in stems}
+    if pending:
+        jobs = [
+            (
+                _stem_job_cost(stem),
+                stem.get("stem_id"),
+                _with_decode_cache_stats,
+                (
+                    _worker_stem_meters,
+                    stem,
+                    str(stems_dir),
+                    method_id,
+                    truth,
+                    mix_features,
+                    idx,
+                    total,
+                    phase_start,
+                    skip_meters,
+                    lfe_audit,
+                    preview,
+                ),
+            )
+            for idx, stem, skip_meters in pending
+        ]
+        with (
+            _ScanWorkerPool(planned_jobs=len(pending))
+            if worker_pool is None
+            else contextlib.nullcontext(worker_pool)
+        ) as pool:
+            for _stem_id, result in pool.run_phase(
+                "stem meters",
+                jobs,
+                sample_rates=_stem_sample_rates([stem for _, stem, _ in pending]),
+            ):
+                record_decode_cache_stats(result.get("decode_cache"))
+                if result.get("missing_ffmpeg"):
+                    missing_ffmpeg = True
+                stem_id = result.get("stem_id")
+                if not stem_id:
+                    continue
+                keyed = cache_keys.get(stem_id)
+                if meter_cache is not None and keyed is not None:
+                    sha256, format_id, cached = keyed
+                    for key, value in cached.items():
+                        result[key] = value
+                    for meter_id in result.get("computed_meters", []):
+                        if cached_meter_ids is not None and meter_id not in cached_meter_ids:
+                            continue
+                        meter_cache.store(
+                            sha256,
+                            meter_id,
+                            _METER_CACHE_VERSIONS[meter_id],
+                            _meter_cache_options(
+                                stems_by_id[stem_id], format_id, meter_id, method_id
+                            ),
+                            {key: result.get(key) for key in _METER_CACHE_PAYLOAD_KEYS[meter_id]},
+                        )
+                    provenance[stem_id]["computed"] = list(result.get("computed_meters", []))
+                results[stem_id] = result
+
+    provenance_rows = [
+        {"stem_id": stem_id, "cached": entry["cached"], "computed": entry["computed"]}
+        for stem_id, entry in sorted(provenance.items())
+    ]
+    return results, missing_ffmpeg, provenance_rows
+
+
+def _mark_preview_measurements(
+    session: Dict[str, Any], preview_entries: Dict[str, Dict[str, Any]]
+) -> None:
+    """Flag each sampled stem's measurements ``approximate`` with their error bounds."""
+    for stem in session.get("stems", []):
+        if not isinstance(stem, dict):
+            continue
+        entry = preview_entries.get(stem.get("stem_id"))
+        if entry is None:
+            continue
+        error_bounds = entry["error_bounds"]
+        for measurement in stem.get("measurements", []):
+            evidence_id = measurement.get("evidence_id")
+            if evidence_id not in error_bounds:
+                continue
+            measurement["approximate"] = True
+            if error_bounds[evidence_id] is not None:
+                measurement["error_bound"] = error_bounds[evidence_id]
+
+
+def _apply_stem_meter_results(
+    session: Dict[str, Any],
+    results: Dict[str, Dict[str, Any]],
+    key: str,
+) -> None:
+    for stem in session.get("stems", []):
+        if not isinstance(stem, dict):
+            continue
+        result = results.get(stem.get("stem_id"))
+        if result is None:
+            continue
+        for m in result.get(key, []):
+            upsert_measurement(stem, evidence_id=m["evidence_id"], value=m["value"], unit_id=m["unit_id"])
+        if key == "basic_measurements":
             corr = result.get("stereo_correlation")
             if corr is not None:
                 upsert_measurement(stem, evidence_id="EVID.IMAGE.CORRELATION", value=corr, unit_id="UNIT.CORRELATION")
 
-    return missing_ffmpeg
-
-
-def _add_truth_meter_measurements(session: Dict[str, Any], stems_dir: Path) -> bool:
-    stems = [s for s in session.get("stems", []) if isinstance(s, dict)]
-    if not stems:
-        return False
-
-    stems_by_id = {s.get("stem_id"): s for s in stems if s.get("stem_id")}
-    method_id = DEFAULT_LOUDNESS_METHOD_ID
-    total = len(stems)
-    missing_ffmpeg = False
-    phase_start = time.perf_counter()
-
-    _emit_live(
-        what="truth meters: starting",
-        why="TruePeak, LUFS-I, LUFS-S, stereo correlation for all stems",
-        where=["session"],
-        kind="action",
-        step_index=0,
-        total_steps=total,
-        progress=0.0,
-    )
-
-    max_workers = min(total, os.cpu_count() or 1)
-    futures = {}
-    with ProcessPoolExecutor(max_workers=max_workers) as pool:
-        for idx, stem in enumerate(stems):
-            future = pool.submit(
-                _worker_truth_meters,
-                stem,
-                str(stems_dir),
-                method_id,
-                idx,
-                total,
-                phase_start,
-            )
-            futures[future] = stem.get("stem_id")
 
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-            except Exception:
-                continue
-            stem_id = result.get("stem_id")
-            stem = stems_by_id.get(stem_id)
-            if stem is None:
-                continue
-            if result.get("missing_ffmpeg"):
-                missing_ffmpeg = True
-            for m in result.get("measurements", []):
-                upsert_measurement(stem, evidence_id=m["evidence_id"], value=m["value"], unit_id=m["unit_id"])
+def _mix_complexity_stems(results: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    loaded = [
+        {
+            "stem_id": stem_id,
+            "active": result["mix_active"],
+            "mid_band": result["mix_mid_band"],
+            "frame_count": int(result["mix_frame_count"]),
+            "sample_rate_hz": result["mix_sample_rate_hz"],
+        }
+        for stem_id, result in results.items()
+        if result.get("mix_active") is not None
+    ]
+    loaded.sort(key=lambda item: item["stem_id"])
+    return loaded
 
-    return missing_ffmpeg
 
+def _mix_features_ceiling_bytes() -> int:
+    """Return the resident-size ceiling for mix-complexity features."""
+    raw_max_mb = os.environ.get(MIX_FEATURES_MAX_MB_ENV, "").strip()
+    if raw_max_mb:
+        try:
+            max_mb = int(raw_max_mb)
+        except ValueError:
+            max_mb = 0
+        if max_mb > 0:
+            return max_mb * 1024 * 1024
+    return DEFAULT_MIX_FEATURES_MAX_BYTES
 
-def _to_mono_samples(interleaved: List[float], channels: int) -> List[float]:
-    if channels <= 1:
-        return list(interleaved)
-    usable = len(interleaved) - (len(interleaved) % channels)
-    if usable <= 0:
-        return []
-    mono: List[float] = []
-    scale = 1.0 / float(channels)
-    for index in range(0, usable, channels):
-        frame = interleaved[index : index + channels]
-        mono.append(sum(frame) * scale)
-    return mono
 
+def _mix_features_over_ceiling(stems: List[Dict[str, Any]], ceiling_bytes: int) -> List[str]:
+    """Return stem ids whose features would not fit under ``ceiling_bytes``.
 
-def _load_mix_complexity_stems(
-    session: Dict[str, Any], stems_dir: Path
-) -> tuple[List[Dict[str, Any]], bool]:
-    import numpy as np  # noqa: WPS433
+    Sizes are estimated from metadata before any decode; stems are admitted
+    in stem_id order so the cut is deterministic.
+    """
+    from mmo.meters.mix_features import estimate_mix_feature_bytes  # noqa: WPS433
 
-    loaded: List[Dict[str, Any]] = []
-    missing_ffmpeg = False
-    ffmpeg_cmd = None
-    stems = session.get("stems", [])
-    for stem in stems:
-        if not isinstance(stem, dict):
-            continue
+    total_bytes = 0
+    over: List[str] = []
+    dict_stems = [stem for stem in stems if isinstance(stem, dict)]
+    for stem in sorted(dict_stems, key=lambda item: str(item.get("stem_id", ""))):
         stem_id = stem.get("stem_id")
-        if not isinstance(stem_id, str) or not stem_id:
-            continue
-        channels = stem.get("channel_count")
-        if not isinstance(channels, int) or channels <= 0:
-            continue
+        duration_s = stem.get("duration_s")
         sample_rate_hz = stem.get("sample_rate_hz")
-        if not isinstance(sample_rate_hz, (int, float)) or sample_rate_hz <= 0:
-            continue
-        stem_path = _resolved_stem_path_for_scan(stem, stems_dir)
-        if stem_path is None:
-            continue
-        format_id = detect_format_from_path(stem_path)
-        mono_samples: List[float] = []
-
-        if format_id == "wav":
-            try:
-                for chunk in iter_wav_float64_samples(
-                    stem_path, error_context="mix complexity meter"
-                ):
-                    mono_samples.extend(_to_mono_samples(chunk, channels))
-            except ValueError:
-                continue
-        elif format_id in {"flac", "wavpack", "aiff", "ape"}:
-            if ffmpeg_cmd is None:
-                ffmpeg_cmd = resolve_ffmpeg_cmd()
-            if ffmpeg_cmd is None:
-                missing_ffmpeg = True
-                continue
-            try:
-                for chunk in iter_ffmpeg_float64_samples(stem_path, ffmpeg_cmd):
-                    mono_samples.extend(_to_mono_samples(chunk, channels))
-            except ValueError:
-                continue
-        else:
+        if (
+            not isinstance(stem_id, str)
+            or not isinstance(duration_s, (int, float))
+            or not isinstance(sample_rate_hz, int)
+            or sample_rate_hz <= 0
+        ):
             continue
-
-        loaded.append(
-            {
-                "stem_id": stem_id,
-                "samples": np.asarray(mono_samples, dtype=np.float64),
-                "sample_rate_hz": int(sample_rate_hz),
-            }
+        estimate = estimate_mix_feature_bytes(
+            int(round(max(0.0, float(duration_s)) * sample_rate_hz)), sample_rate_hz
         )
-
-    loaded.sort(key=lambda item: item["stem_id"])
-    return loaded, missing_ffmpeg
+        if total_bytes + estimate > ceiling_bytes:
+            over.append(stem_id)
+            continue
+        total_bytes += estimate
+    return over
 
 
 def _default_mix_complexity_payload() -> Dict[str, Any]:
@@ -824,14 +1509,27 @@ def _default_mix_complexity_payload() -> Dict[str, Any]:
 
 
 def _build_mix_complexity(
-    session: Dict[str, Any], stems_dir: Path
-) -> tuple[Dict[str, Any], bool]:
-    from mmo.meters.meter_masking_risk import compute_masking_risk  # noqa: WPS433
-    from mmo.meters.meter_mix_density import compute_mix_density  # noqa: WPS433
+    loaded_stems: List[Dict[str, Any]],
+    *,
+    memory_ceiling_bytes: int = DEFAULT_MIX_FEATURES_MAX_BYTES,
+    over_ceiling_stem_ids: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Build the mix-complexity payload from per-stem streamed features.
+
+    Stems left out by the feature memory ceiling are listed as skipped.
+    """
+    from mmo.meters.meter_masking_risk import compute_masking_risk_from_features  # noqa: WPS433
+    from mmo.meters.meter_mix_density import compute_mix_density_from_features  # noqa: WPS433
 
-    loaded_stems, missing_ffmpeg = _load_mix_complexity_stems(session, stems_dir)
+    over_ceiling_ids = sorted(over_ceiling_stem_ids or [])
     if not loaded_stems:
-        return _default_mix_complexity_payload(), missing_ffmpeg
+        payload = _default_mix_complexity_payload()
+        if over_ceiling_ids:
+            payload["skipped_stem_ids"] = over_ceiling_ids
+            payload["features"] = _mix_features_receipt(
+                [], memory_ceiling_bytes, over_ceiling_ids
+            )
+        return payload
 
     sample_rate_counts: Dict[int, int] = {}
     for item in loaded_stems:
@@ -845,19 +1543,20 @@ def _build_mix_complexity(
     )[0][0]
 
     included = [
-        {"stem_id": item["stem_id"], "samples": item["samples"]}
-        for item in loaded_stems
-        if int(item["sample_rate_hz"]) == selected_sample_rate
+        item for item in loaded_stems if int(item["sample_rate_hz"]) == selected_sample_rate
     ]
     included_ids = sorted(item["stem_id"] for item in included)
     skipped_ids = sorted(
-        item["stem_id"]
-        for item in loaded_stems
-        if int(item["sample_rate_hz"]) != selected_sample_rate
+        [
+            item["stem_id"]
+            for item in loaded_stems
+            if int(item["sample_rate_hz"]) != selected_sample_rate
+        ]
+        + over_ceiling_ids
     )
 
-    density = compute_mix_density(included, sample_rate_hz=selected_sample_rate)
-    masking = compute_masking_risk(
+    density = compute_mix_density_from_features(included, sample_rate_hz=selected_sample_rate)
+    masking = compute_masking_risk_from_features(
         included,
         sample_rate_hz=selected_sample_rate,
         top_n=3,
@@ -875,7 +1574,26 @@ def _build_mix_complexity(
         "density": density,
         "masking_risk": masking,
     }
-    return payload, missing_ffmpeg
+    if over_ceiling_ids:
+        payload["features"] = _mix_features_receipt(
+            loaded_stems, memory_ceiling_bytes, over_ceiling_ids
+        )
+    return payload
+
+
+def _mix_features_receipt(
+    loaded_stems: List[Dict[str, Any]],
+    memory_ceiling_bytes: int,
+    over_ceiling_stem_ids: List[str],
+) -> Dict[str, Any]:
+    return {
+        "dtype": "float32",
+        "resident_bytes": int(
+            sum(item["active"].nbytes + item["mid_band"].nbytes for item in loaded_stems)
+        ),
+        "memory_ceiling_bytes": int(memory_ceiling_bytes),
+        "over_ceiling_stem_ids": sorted(over_ceiling_stem_ids),
+    }
 
 
 def _has_optional_dep_issue(issues: List[Dict[str, Any]], dep_name: str) -> bool:
@@ -927,6 +1645,81 @@ def _add_optional_dep_issue(
     )
 
 
+def _stem_lfe_layout(stem: Dict[str, Any]) -> tuple[int, int, List[int]] | None:
+    """Return ``(channels, sample_rate_hz, lfe_indices)`` for stems the LFE audit covers."""
+    channels = stem.get("channel_count")
+    if channels is None:
+        channels = stem.get("channels")
+    if not isinstance(channels, int) or channels <= 0:
+        return None
+    sample_rate_hz = stem.get("sample_rate_hz")
+    if not isinstance(sample_rate_hz, (int, float)) or sample_rate_hz <= 0:
+        return None
+    lfe_indices = detect_lfe_channel_indices(
+        channels,
+        channel_layout=stem.get("channel_layout"),
+        wav_channel_mask=stem.get("wav_channel_mask"),
+    )
+    if not lfe_indices:
+        return None
+    return channels, int(sample_rate_hz), list(lfe_indices)
+
+
+class _LfeChannelTap:
+    """Keep the LFE channels and the summed mains of a stem as it streams by.
+
+    Feeds ``audit_lfe_channel_samples`` from the shared stem-meter decode
+    with the same values (and mains summation order) as the standalone
+    ``_collect_stem_samples`` path.
+    """
+
+    def __init__(self, channels: int, sample_rate_hz: int, lfe_indices: List[int]) -> None:
+        self.channels = channels
+        self.sample_rate_hz = sample_rate_hz
+        self.lfe_indices = sorted({int(index) for index in lfe_indices})
+        lfe_set = set(self.lfe_indices)
+        self.mains_channels = [i for i in range(channels) if i not in lfe_set]
+        self._lfe_blocks: Dict[int, List[Any]] = {
+            index: [] for index in self.lfe_indices if 0 <= index < channels
+        }
+        self._mains_blocks: List[Any] = []
+        self._mismatch = False
+
+    def update(self, frames: Any) -> None:
+        if self._mismatch or frames.shape[1] != self.channels:
+            # A decode whose frame width disagrees with the stem metadata is
+            # left to the standalone audit path.
+            self._mismatch = True
+            return
+        for index, blocks in self._lfe_blocks.items():
+            blocks.append(frames[:, index].copy())
+        if self.mains_channels:
+            mains = frames[:, self.mains_channels[0]].copy()
+            for index in self.mains_channels[1:]:
+                mains += frames[:, index]
+            self._mains_blocks.append(mains)
+
+    def audit(self) -> Dict[str, Any] | None:
+        import numpy as np
+
+        if self._mismatch:
+            return None
+        lfe_channels = {
+            index: np.concatenate(blocks).tolist() if blocks else []
+            for index, blocks in self._lfe_blocks.items()
+        }
+        for index in self.lfe_indices:
+            lfe_channels.setdefault(index, [])
+        mains_samples = (
+            np.concatenate(self._mains_blocks).tolist() if self._mains_blocks else []
+        )
+        return audit_lfe_channel_samples(
+            lfe_channels,
+            sample_rate_hz=self.sample_rate_hz,
+            mains_samples=mains_samples if mains_samples else None,
+        )
+
+
 def _collect_stem_samples(
     stem: Dict[str, Any],
     stems_dir: Path,
@@ -954,11 +1747,17 @@ def _collect_stem_samples(
             except ValueError:
                 return None
         return samples
-    elif format_id in {"flac", "wavpack", "aiff", "ape"}:
-        if ffmpeg_cmd is None:
+    elif format_id in _NON_WAV_SCAN_FORMAT_IDS:
+        if _uses_native_aiff(format_id, stem_path):
+            chunk_iter = iter_aiff_float64_samples(stem_path, error_context="lfe audit")
+        elif ffmpeg_cmd is None:
             return None
+        else:
+            chunk_iter = _iter_ffmpeg_stem_samples(
+                stem, stem_path, ffmpeg_cmd, error_context="lfe audit"
+            )
         try:
-            for chunk in iter_ffmpeg_float64_samples(stem_path, ffmpeg_cmd):
+            for chunk in chunk_iter:
                 samples.extend(chunk)
         except ValueError:
             return None
@@ -966,18 +1765,64 @@ def _collect_stem_samples(
     return None
 
 
+def _decode_lfe_audit(
+    stem: Dict[str, Any],
+    stems_dir_str: str,
+    ffmpeg_cmd: Optional[str],
+) -> Optional[Dict[str, Any]]:
+    """Top-level worker: decode one stem and audit its LFE channels.
+
+    Returns the audit summary, or None when the stem has no LFE layout or
+    cannot be decoded.
+    """
+    lfe_layout = _stem_lfe_layout(stem)
+    if lfe_layout is None:
+        return None
+    channels, sample_rate_hz, lfe_indices = lfe_layout
+    all_samples = _collect_stem_samples(stem, Path(stems_dir_str), ffmpeg_cmd)
+    if all_samples is None:
+        return None
+
+    # Build mains samples = all non-LFE channels mixed together
+    lfe_set = set(lfe_indices)
+    mains_channels = [i for i in range(channels) if i not in lfe_set]
+    mains_samples: List[float] = []
+    if mains_channels:
+        # Mix all mains channels to mono
+        for ch_idx in mains_channels:
+            ch_mono = _extract_channel(all_samples, channels, ch_idx)
+            if not mains_samples:
+                mains_samples = list(ch_mono)
+            else:
+                for j, s in enumerate(ch_mono):
+                    if j < len(mains_samples):
+                        mains_samples[j] += s
+
+    return audit_lfe_channels(
+        all_samples,
+        channels=channels,
+        lfe_indices=lfe_indices,
+        sample_rate_hz=sample_rate_hz,
+        mains_samples=mains_samples if mains_samples else None,
+    )
+
+
 def _add_lfe_audit_issues(
     session: Dict[str, Any],
     stems_dir: Path,
     issues: List[Dict[str, Any]],
     *,
     strict: bool = False,
+    precomputed: Optional[Dict[str, Dict[str, Any]]] = None,
+    worker_pool: Optional["_ScanWorkerPool"] = None,
 ) -> bool:
     """Run LFE content audit for all stems that have LFE channels.
 
     Requires numpy (returns True if numpy is missing).
     Uses ffprobe channel_layout / WAV mask to detect LFE indices.
-    Adds ISSUE.LFE.* issues to the shared issues list.
+    Adds ISSUE.LFE.* issues to the shared issues list. ``precomputed`` maps
+    stem_id to audit summaries already taken from the stem-meter decode;
+    only the remaining stems are decoded here.
     """
     try:
         import numpy  # noqa: F401
@@ -988,65 +1833,66 @@ def _add_lfe_audit_issues(
     missing_ffmpeg = False
     stems = session.get("stems", [])
 
-    # Audit stems independently so one unreadable file does not hide LFE
-    # evidence from the rest of the session.
+    # Stems the stem-meter pass did not audit are decoded first, on the
+    # scan's worker pool when more than one needs it.
+    to_decode: List[Dict[str, Any]] = []
     for stem in stems:
-        if not isinstance(stem, dict):
-            continue
-        stem_id = stem.get("stem_id", "")
-        channels = stem.get("channel_count")
-        if channels is None:
-            channels = stem.get("channels")
-        if not isinstance(channels, int) or channels <= 0:
-            continue
-        sample_rate_hz = stem.get("sample_rate_hz")
-        if not isinstance(sample_rate_hz, (int, float)) or sample_rate_hz <= 0:
+        if not isinstance(stem, dict) or _stem_lfe_layout(stem) is None:
             continue
-
-        lfe_indices = detect_lfe_channel_indices(
-            channels,
-            channel_layout=stem.get("channel_layout"),
-            wav_channel_mask=stem.get("wav_channel_mask"),
-        )
-        if not lfe_indices:
+        if stem.get("stem_id", "") in (precomputed or {}):
             continue
-
         # Need ffmpeg for non-WAV
         stem_path = _resolved_stem_path_for_scan(stem, stems_dir)
         format_id = detect_format_from_path(stem_path) if stem_path else None
-        if format_id in {"flac", "wavpack", "aiff", "ape"} and ffmpeg_cmd is None:
+        if (
+            format_id in _NON_WAV_SCAN_FORMAT_IDS
+            and ffmpeg_cmd is None
+            and not missing_ffmpeg
+            and not _uses_native_aiff(format_id, stem_path)
+        ):
             ffmpeg_cmd = resolve_ffmpeg_cmd()
             if ffmpeg_cmd is None:
                 missing_ffmpeg = True
+        to_decode.append(stem)
+
+    decoded: Dict[str, Dict[str, Any]] = {}
+    if worker_pool is not None and len(to_decode) > 1:
+        jobs = [
+            (
+                _stem_job_cost(stem),
+                stem.get("stem_id", ""),
+                _decode_lfe_audit,
+                (stem, str(stems_dir), ffmpeg_cmd),
+            )
+            for stem in to_decode
+        ]
+        for stem_id, summary in worker_pool.run_phase(
+            "lfe audit", jobs, sample_rates=_stem_sample_rates(to_decode)
+        ):
+            if summary is not None:
+                decoded[stem_id] = summary
+    else:
+        for stem in to_decode:
+            summary = _decode_lfe_audit(stem, str(stems_dir), ffmpeg_cmd)
+            if summary is not None:
+                decoded[stem.get("stem_id", "")] = summary
+
+    # Audit stems independently so one unreadable file does not hide LFE
+    # evidence from the rest of the session.
+    for stem in stems:
+        if not isinstance(stem, dict):
+            continue
+        stem_id = stem.get("stem_id", "")
+        if _stem_lfe_layout(stem) is None:
+            continue
 
-        all_samples = _collect_stem_samples(stem, stems_dir, ffmpeg_cmd)
-        if all_samples is None:
+        lfe_summary = (precomputed or {}).get(stem_id)
+        if lfe_summary is None:
+            lfe_summary = decoded.get(stem_id)
+        if lfe_summary is None:
             # Validation already owns the broader session error surface. The LFE
             # audit only adds extra evidence when a stem can be decoded here.
             continue
-
-        # Build mains samples = all non-LFE channels mixed together
-        lfe_set = set(lfe_indices)
-        mains_channels = [i for i in range(channels) if i not in lfe_set]
-        mains_samples: List[float] = []
-        if mains_channels:
-            # Mix all mains channels to mono
-            for ch_idx in mains_channels:
-                ch_mono = _extract_channel(all_samples, channels, ch_idx)
-                if not mains_samples:
-                    mains_samples = list(ch_mono)
-                else:
-                    for j, s in enumerate(ch_mono):
-                        if j < len(mains_samples):
-                            mains_samples[j] += s
-
-        lfe_summary = audit_lfe_channels(
-            all_samples,
-            channels=channels,
-            lfe_indices=lfe_indices,
-            sample_rate_hz=int(sample_rate_hz),
-            mains_samples=mains_samples if mains_samples else None,
-        )
         lfe_rows = lfe_summary.get("rows", [])
         if isinstance(lfe_rows, list):
             _upsert_lfe_channel_rows(stem, lfe_rows, lfe_summary)
@@ -1318,6 +2164,12 @@ def _render_scan_summary(report: Dict[str, Any]) -> str:
     lines.append(f"Folder : {stems_dir}")
     lines.append(f"Stems  : {len(stems)}")
     lines.append(f"Issues : {len(issues)}")
+    preview = report.get("preview")
+    if isinstance(preview, dict):
+        lines.append(
+            f"Preview: {preview.get('window_count')} x {preview.get('window_s')}s windows "
+            "per stem; measurements are approximate"
+        )
     lines.append("")
 
     if stems:
@@ -1408,6 +2260,132 @@ def _render_scan_summary(report: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+# Meters whose outputs an incremental rescan takes from the previous report.
+_INCREMENTAL_REUSED_METERS = ("basic", "truth", "lfe_audit")
+# Mix-complexity features are not in reports; an incremental rescan keeps
+# them in the meter cache instead, even when ``MMO_METER_CACHE`` is off.
+_INCREMENTAL_CACHED_METERS = ("mix_features",)
+
+
+def _measurement_value(stem: Dict[str, Any], evidence_id: str) -> Any:
+    for measurement in stem.get("measurements", []) or []:
+        if isinstance(measurement, dict) and measurement.get("evidence_id") == evidence_id:
+            return measurement.get("value")
+    return None
+
+
+def _reusable_previous_stems(
+    session: Dict[str, Any],
+    stems_dir: Path,
+    previous_report: Dict[str, Any],
+    previous_lock: Optional[Dict[str, Any]],
+    *,
+    meters: Optional[str],
+    include_peak: bool,
+) -> Dict[str, Dict[str, Any]]:
+    """Return previous-report stems, keyed by stem_id, that a rescan can reuse.
+
+    A stem is reusable when its file is byte-identical to the previous scan
+    (same path and sha256 in the previous report, and the same sha256 and
+    size in the previous lockfile when one is given) and the previous scan
+    ran the same engine, ontology, and meter settings. A preview report
+    only holds approximate readings, so nothing is reused from it.
+    """
+    if previous_report.get("engine_version") != engine_version:
+        return {}
+    if "preview" in previous_report:
+        return {}
+    if previous_report.get("ontology_version") != _load_ontology_version(
+        ontology_dir() / "ontology.yaml"
+    ):
+        return {}
+    previous_metering = previous_report.get("metering")
+    previous_mode = (
+        previous_metering.get("mode") if isinstance(previous_metering, dict) else None
+    )
+    if previous_mode != meters:
+        return {}
+
+    previous_session = previous_report.get("session")
+    previous_stems = (
+        previous_session.get("stems", []) if isinstance(previous_session, dict) else []
+    )
+    previous_by_id = {
+        stem.get("stem_id"): stem for stem in previous_stems if isinstance(stem, dict)
+    }
+    lock_by_rel_path: Optional[Dict[str, Dict[str, Any]]] = None
+    if previous_lock is not None:
+        lock_by_rel_path = {
+            item.get("rel_path"): item
+            for item in previous_lock.get("files", []) or []
+            if isinstance(item, dict)
+        }
+
+    reusable: Dict[str, Dict[str, Any]] = {}
+    for stem in session.get("stems", []):
+        if not isinstance(stem, dict):
+            continue
+        stem_id = stem.get("stem_id")
+        previous = previous_by_id.get(stem_id)
+        if previous is None:
+            continue
+        file_path = stem.get("file_path")
+        sha256 = stem.get("sha256")
+        if previous.get("file_path") != file_path or previous.get("sha256") != sha256:
+            continue
+        stem_path = _resolved_stem_path_for_scan(stem, stems_dir)
+        if stem_path is None:
+            continue
+        if lock_by_rel_path is not None:
+            entry = lock_by_rel_path.get(file_path)
+            if entry is None or entry.get("sha256") != sha256:
+                continue
+            try:
+                if entry.get("size_bytes") != stem_path.stat().st_size:
+                    continue
+            except OSError:
+                continue
+        if (
+            detect_format_from_path(stem_path) == "wav"
+            and "sample_rate_hz" in stem
+            and "bits_per_sample" in stem
+        ):
+            # WAV sample peaks only come from --peak, so their presence
+            # records whether the previous scan used it.
+            had_peak = _measurement_value(previous, "EVID.METER.SAMPLE_PEAK_DBFS") is not None
+            if had_peak != include_peak:
+                continue
+        reusable[stem_id] = previous
+    return reusable
+
+
+def _lfe_summary_from_measurements(stem: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild an LFE audit summary from a reported ``EVID.LFE.CHANNEL_ROWS``.
+
+    The stored rows carry every field the issue builders read, so issues
+    are rebuilt (with the current ``strict`` setting) without a decode.
+    """
+    raw_rows = _measurement_value(stem, "EVID.LFE.CHANNEL_ROWS")
+    try:
+        rows = json.loads(raw_rows) if isinstance(raw_rows, str) else []
+    except ValueError:
+        rows = []
+    return {
+        "rows": [
+            {
+                "channel_index": row.get("channel_index"),
+                "inband_energy_db": row.get("inband_energy_db"),
+                "out_of_band_energy_db": row.get("out_of_band_energy_db"),
+                "true_peak_dbtp": row.get("true_peak_dbtp"),
+                "out_of_band_high": row.get("out_of_band_high"),
+                "audit_result": dict(row),
+            }
+            for row in rows
+            if isinstance(row, dict)
+        ]
+    }
+
+
 def build_report(
     stems_dir: Path,
     generated_at: str,
@@ -1415,7 +2393,37 @@ def build_report(
     strict: bool = False,
     include_peak: bool = False,
     meters: Optional[str] = None,
+    previous_report: Optional[Dict[str, Any]] = None,
+    previous_lock: Optional[Dict[str, Any]] = None,
+    preview: bool = False,
+    preview_seed: int = 0,
 ) -> Dict[str, Any]:
+    """Scan ``stems_dir`` into a report.
+
+    With ``previous_report`` (and optionally the lockfile taken with it),
+    the scan is incremental: stems whose files are unchanged keep their
+    previous measurements and LFE audit rows, only added or changed stems
+    are metered, and session-level aggregates are recomputed. Mix-complexity
+    features go through the meter cache, so an unchanged stem is decoded
+    only when its features are not cached yet. The report then carries an
+    ``incremental_scan`` receipt.
+
+    Stem metering and any LFE audit decodes it left over share one worker
+    pool for the whole scan. Peak RSS of the scan and its workers goes in a
+    ``scan_receipt``; it varies run to run, so leave it out when comparing
+    reports.
+
+    With ``preview``, stem meters read a seeded set of windows per stem
+    (see ``mmo.dsp.preview_sampling``) instead of whole files. Sampled
+    measurements are marked ``approximate`` with an ``error_bound``, the
+    LFE audit and mix complexity are skipped, and the report carries a
+    ``preview`` receipt. A preview without ``meters`` runs the truth meters,
+    since it measures nothing else.
+    """
+    if preview and previous_report is not None:
+        raise ValueError("--preview cannot be combined with --previous-report.")
+    if preview and meters is None:
+        meters = "truth"
     # Build the normalized session first so every later phase sees the same
     # resolved stem list and portable IDs.
     session = build_session_from_stems_dir(stems_dir)
@@ -1426,13 +2434,79 @@ def build_report(
             "Point scan_session at an actual stems folder containing .wav/.flac/.wv/.aiff/.mp3/etc. "
             "Note: fixtures/sessions contains YAML fixture definitions, not audio stems."
         )
-    if include_peak:
-        _add_peak_metrics(session, stems_dir)
+    with _ScanWorkerPool(
+        planned_jobs=len(stems),
+        sample_rates=_stem_sample_rates([stem for stem in stems if isinstance(stem, dict)]),
+    ) as worker_pool:
+        return _build_report(
+            session,
+            stems_dir,
+            generated_at,
+            strict=strict,
+            include_peak=include_peak,
+            meters=meters,
+            previous_report=previous_report,
+            previous_lock=previous_lock,
+            preview=preview,
+            preview_seed=preview_seed,
+            worker_pool=worker_pool,
+        )
+
+
+def _build_report(
+    session: Dict[str, Any],
+    stems_dir: Path,
+    generated_at: str,
+    *,
+    strict: bool,
+    include_peak: bool,
+    meters: Optional[str],
+    previous_report: Optional[Dict[str, Any]],
+    previous_lock: Optional[Dict[str, Any]],
+    preview: bool,
+    preview_seed: int,
+    worker_pool: _ScanWorkerPool,
+) -> Dict[str, Any]:
+    stems = session["stems"]
+    reused_stems: Dict[str, Dict[str, Any]] = {}
+    if previous_report is not None:
+        reused_stems = _reusable_previous_stems(
+            session,
+            stems_dir,
+            previous_report,
+            previous_lock,
+            meters=meters,
+            include_peak=include_peak,
+        )
+        for stem in stems:
+            previous = reused_stems.get(stem.get("stem_id"))
+            if previous is None:
+                continue
+            # Later phases skip reused stems or upsert identical values.
+            stem["measurements"] = json.loads(json.dumps(previous.get("measurements", [])))
+            if isinstance(previous.get("metrics"), dict):
+                stem["metrics"] = dict(previous["metrics"])
+    reused_peaks = {
+        stem_id: previous["metrics"]["peak_dbfs"]
+        for stem_id, previous in reused_stems.items()
+        if isinstance(previous.get("metrics"), dict) and "peak_dbfs" in previous["metrics"]
+    }
+    if include_peak and meters not in {"basic", "truth"}:
+        _add_peak_metrics(session, stems_dir, precomputed=reused_peaks)
     missing_ffmpeg = False
     mix_complexity: Dict[str, Any] | None = None
     numpy_available: bool | None = None
     metering_summary: Dict[str, Any] | None = None
     scan_timings: Dict[str, float] = {}
+    decode_cache_before = decode_cache_stats()
+    # Preview readings are approximate, so they never enter the meter cache.
+    meter_cache = None if preview else active_meter_cache()
+    cached_meter_ids: Optional[tuple[str, ...]] = None
+    if meter_cache is None and previous_report is not None:
+        meter_cache = open_meter_cache()
+        cached_meter_ids = _INCREMENTAL_CACHED_METERS
+    meter_cache_before = meter_cache_stats()
+    meter_cache_provenance: List[Dict[str, Any]] = []
 
     # Detect numpy availability early (shared by truth meters, mix complexity, LFE audit)
     try:
@@ -1443,12 +2517,28 @@ def build_report(
 
     stem_count = len(stems)
     phase_total = (
-        (2 if meters == "truth" else 1 if meters == "basic" else 0) + 1 + 1
-    )  # basic + optional truth + mix_complexity + lfe
+        (2 if meters == "truth" else 1 if meters == "basic" else 0) + (0 if preview else 2)
+    )  # basic + optional truth + mix_complexity + lfe (both skipped by preview)
     phase_index = 0
 
-    # truth mode subsumes basic: run both so crest/RMS/peak are always present
+    stem_meter_results: Dict[str, Dict[str, Any]] = {}
+    preview_entries: Dict[str, Dict[str, Any]] = {}
+    preview_full_read_ids: List[str] = []
+
+    # truth mode subsumes basic: one decode per stem feeds basic, truth, and
+    # the mix-complexity downmix so crest/RMS/peak are always present.
+    mix_features_ceiling = _mix_features_ceiling_bytes()
+    over_ceiling_stem_ids = (
+        _mix_features_over_ceiling(stems, mix_features_ceiling) if numpy_available else []
+    )
     if meters in {"basic", "truth"}:
+        skip_meters_by_stem: Dict[str, tuple[str, ...]] = {
+            stem_id: _INCREMENTAL_REUSED_METERS for stem_id in reused_stems
+        }
+        for stem_id in over_ceiling_stem_ids:
+            skip_meters_by_stem[stem_id] = skip_meters_by_stem.get(stem_id, ()) + (
+                "mix_features",
+            )
         phase_index += 1
         _emit_live(
             what="basic meters",
@@ -1461,9 +2551,49 @@ def build_report(
             evidence={"stem_count": stem_count},
         )
         t_start = time.perf_counter()
-        missing_ffmpeg = _add_basic_meter_measurements(session, stems_dir)
+        stem_meter_results, missing_ffmpeg, meter_cache_provenance = _run_stem_meters(
+            session,
+            stems_dir,
+            truth=meters == "truth" and bool(numpy_available),
+            mix_features=bool(numpy_available) and not preview,
+            lfe_audit=bool(numpy_available) and not preview,
+            meter_cache=meter_cache,
+            cached_meter_ids=cached_meter_ids,
+            skip_meters_by_stem=skip_meters_by_stem,
+            worker_pool=worker_pool,
+            preview=(
+                (DEFAULT_PREVIEW_WINDOW_COUNT, DEFAULT_PREVIEW_WINDOW_S, preview_seed)
+                if preview
+                else None
+            ),
+        )
+        preview_entries = {
+            stem_id: result["preview"]
+            for stem_id, result in stem_meter_results.items()
+            if result.get("preview") is not None
+        }
+        preview_full_read_ids = [
+            stem_id
+            for stem_id, result in stem_meter_results.items()
+            if result.get("preview") is None and result.get("computed_meters")
+        ]
+        if include_peak:
+            # --peak reads the stem-meter decode; only stems it missed decode again.
+            _add_peak_metrics(
+                session,
+                stems_dir,
+                precomputed={
+                    **reused_peaks,
+                    **{
+                        stem_id: result["sample_peak_dbfs"]
+                        for stem_id, result in stem_meter_results.items()
+                        if result.get("sample_peak_dbfs") is not None
+                    },
+                },
+            )
+        _apply_stem_meter_results(session, stem_meter_results, "basic_measurements")
         t_elapsed = (time.perf_counter() - t_start) * 1000
-        scan_timings["basic_meters_ms"] = t_elapsed
+        scan_timings["stem_meters_ms"] = t_elapsed
     # Validate once the session shape is stable. Later phases add evidence, but
     # they should not change which stems exist or how they are identified.
     issues = validate_session(session, strict=strict)
@@ -1490,11 +2620,8 @@ def build_report(
                 progress=phase_index / phase_total,
                 evidence={"stem_count": stem_count},
             )
-            t_start = time.perf_counter()
-            missing_ffmpeg = _add_truth_meter_measurements(session, stems_dir) or missing_ffmpeg
-            t_elapsed = (time.perf_counter() - t_start) * 1000
-            scan_timings["truth_meters_ms"] = t_elapsed
-    if meters in {"basic", "truth"}:
+            _apply_stem_meter_results(session, stem_meter_results, "truth_measurements")
+    if meters in {"basic", "truth"} and not preview:
         if numpy_available:
             phase_index += 1
             _emit_live(
@@ -1508,10 +2635,13 @@ def build_report(
                 evidence={"stem_count": stem_count},
             )
             t_start = time.perf_counter()
-            mix_complexity, mix_missing_ffmpeg = _build_mix_complexity(session, stems_dir)
+            mix_complexity = _build_mix_complexity(
+                _mix_complexity_stems(stem_meter_results),
+                memory_ceiling_bytes=mix_features_ceiling,
+                over_ceiling_stem_ids=over_ceiling_stem_ids,
+            )
             t_elapsed = (time.perf_counter() - t_start) * 1000
             scan_timings["mix_complexity_ms"] = t_elapsed
-            missing_ffmpeg = mix_missing_ffmpeg or missing_ffmpeg
         else:
             mix_complexity = _default_mix_complexity_payload()
             _add_optional_dep_issue(
@@ -1519,19 +2649,41 @@ def build_report(
                 dep_name="numpy",
                 hint="Reinstall base MMO deps or install numpy: pip install .",
             )
-
-    # LFE content audit — always attempt when numpy is available
-    t_start = time.perf_counter()
-    lfe_missing_numpy = _add_lfe_audit_issues(session, stems_dir, issues, strict=strict)
-    t_elapsed = (time.perf_counter() - t_start) * 1000
-    scan_timings["lfe_audit_ms"] = t_elapsed
-    if lfe_missing_numpy and not numpy_available:
-        # Only surface numpy issue once
-        _add_optional_dep_issue(
+    # The stem-meter decode already audited LFE channels; only the summaries
+    # are kept. Release the per-stem mix features before the LFE audit.
+    lfe_summaries = {
+        stem_id: result["lfe_audit"]
+        for stem_id, result in stem_meter_results.items()
+        if result.get("lfe_audit") is not None
+    }
+    for stem in stems:
+        if stem.get("stem_id") in reused_stems:
+            lfe_summaries[stem["stem_id"]] = _lfe_summary_from_measurements(stem)
+    stem_meter_results = {}
+
+    # LFE content audit — always attempt when numpy is available. Stems the
+    # stem-meter pass did not cover (meters off, decode failures) decode here.
+    # A preview skips it: the band analysis needs whole LFE channels.
+    if not preview:
+        t_start = time.perf_counter()
+        lfe_missing_numpy = _add_lfe_audit_issues(
+            session,
+            stems_dir,
             issues,
-            dep_name="numpy",
-            hint="Reinstall base MMO deps or install numpy: pip install .",
+            strict=strict,
+            precomputed=lfe_summaries,
+            worker_pool=worker_pool,
         )
+        t_elapsed = (time.perf_counter() - t_start) * 1000
+        scan_timings["lfe_audit_ms"] = t_elapsed
+        if lfe_missing_numpy and not numpy_available:
+            # Only surface numpy issue once
+            _add_optional_dep_issue(
+                issues,
+                dep_name="numpy",
+                hint="Reinstall base MMO deps or install numpy: pip install .",
+            )
+    _mark_preview_measurements(session, preview_entries)
 
     # Build metering summary when meters were run
     if meters in {"basic", "truth"}:
@@ -1568,14 +2720,68 @@ def build_report(
         )
     if metering_summary is not None:
         report["metering"] = metering_summary
+    decode_cache_receipt = build_decode_cache_receipt(decode_cache_before)
+    if decode_cache_receipt is not None:
+        # Only present when the opt-in cache is on, so default reports stay
+        # byte-identical across runs.
+        report["decode_cache"] = decode_cache_receipt
+    meter_cache_receipt = build_meter_cache_receipt(
+        meter_cache_before, stems=meter_cache_provenance
+    )
+    if meter_cache_receipt is not None:
+        report["meter_cache"] = meter_cache_receipt
+    if preview:
+        report["preview"] = {
+            "seed": preview_seed,
+            "window_count": DEFAULT_PREVIEW_WINDOW_COUNT,
+            "window_s": DEFAULT_PREVIEW_WINDOW_S,
+            "confidence": PREVIEW_CONFIDENCE,
+            "sampled_stem_ids": sorted(preview_entries),
+            "full_read_stem_ids": sorted(preview_full_read_ids),
+            "skipped": ["lfe_audit", "mix_complexity"],
+        }
+    if previous_report is not None:
+        previous_session = previous_report.get("session")
+        previous_ids = {
+            stem.get("stem_id")
+            for stem in (
+                previous_session.get("stems", []) if isinstance(previous_session, dict) else []
+            )
+            if isinstance(stem, dict) and isinstance(stem.get("stem_id"), str)
+        }
+        current_ids = {stem.get("stem_id") for stem in stems if isinstance(stem, dict)}
+        previous_report_id = previous_report.get("report_id")
+        report["incremental_scan"] = {
+            "previous_report_id": previous_report_id if isinstance(previous_report_id, str) else None,
+            "lockfile_checked": previous_lock is not None,
+            "reused_stem_ids": sorted(reused_stems),
+            "rescanned_stem_ids": sorted(
+                stem_id for stem_id in current_ids if stem_id not in reused_stems
+            ),
+            "removed_stem_ids": sorted(previous_ids - current_ids),
+        }
+    # Peak RSS varies run to run; deterministic report comparisons drop
+    # this receipt.
+    report["scan_receipt"] = {
+        "peak_rss_bytes": _peak_rss_bytes(),
+        "worker_peak_rss_bytes": worker_pool.worker_peak_rss_bytes,
+    }
     if scan_timings:
+        live_evidence: Dict[str, Any] = {k: round(v) for k, v in scan_timings.items()}
+        if decode_cache_receipt is not None:
+            live_evidence["decode_cache_hits"] = decode_cache_receipt["hits"]
+            live_evidence["decode_cache_misses"] = decode_cache_receipt["misses"]
+        if meter_cache_receipt is not None:
+            live_evidence["meter_cache_hits"] = meter_cache_receipt["hits"]
+            live_evidence["meter_cache_misses"] = meter_cache_receipt["misses"]
+        live_evidence.update(report["scan_receipt"])
         _emit_live(
             kind="action",
             scope="scan",
             what="scan complete",
             why="phase timing summary",
             where=["session"],
-            evidence={k: round(v) for k, v in scan_timings.items()},
+            evidence=live_evidence,
             step_index=phase_total,
             total_steps=phase_total,
             progress=1.0,
@@ -1583,6 +2789,16 @@ def build_report(
     return report
 
 
+def _load_json_object(path: Path, *, label: str) -> Dict[str, Any]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise ValueError(f"{label} could not be read: {path}: {exc}") from exc
+    if not isinstance(payload, dict):
+        raise ValueError(f"{label} must be a JSON object: {path}")
+    return payload
+
+
 def main() -> int:
     try:
         parser = argparse.ArgumentParser(description="Scan a stems directory into an MMO report.")
@@ -1627,7 +2843,36 @@ def main() -> int:
             default="2000-01-01T00:00:00Z",
             help="Override generated_at timestamp (ISO 8601).",
         )
+        parser.add_argument(
+            "--previous-report",
+            dest="previous_report",
+            default=None,
+            help="Rescan incrementally: reuse unchanged stems from this earlier report.",
+        )
+        parser.add_argument(
+            "--previous-lock",
+            dest="previous_lock",
+            default=None,
+            help="Lockfile taken with --previous-report; stems must also match its sha256/size.",
+        )
+        parser.add_argument(
+            "--preview",
+            action="store_true",
+            help=(
+                "Meter a seeded sample of windows per stem; measurements are approximate."
+                " Implies --meters truth unless --meters is given."
+            ),
+        )
+        parser.add_argument(
+            "--preview-seed",
+            dest="preview_seed",
+            type=int,
+            default=0,
+            help="Seed for the --preview window positions (default: 0).",
+        )
         args = parser.parse_args()
+        if args.previous_lock and not args.previous_report:
+            raise ValueError("--previous-lock requires --previous-report.")
 
         report = build_report(
             Path(args.stems_dir),
@@ -1635,6 +2880,18 @@ def main() -> int:
             strict=args.strict,
             include_peak=args.peak,
             meters=args.meters,
+            previous_report=(
+                _load_json_object(Path(args.previous_report), label="Previous report")
+                if args.previous_report
+                else None
+            ),
+            previous_lock=(
+                _load_json_object(Path(args.previous_lock), label="Previous lockfile")
+                if args.previous_lock
+                else None
+            ),
+            preview=args.preview,
+            preview_seed=args.preview_seed,
         )
 
         if args.schema:
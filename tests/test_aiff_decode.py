@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import math
+import os
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from mmo.dsp.decoders import (
+    has_native_aiff_decoder,
+    iter_audio_float64_samples,
+    read_audio_metadata,
+)
+from mmo.dsp.io import read_aiff_metadata
+from mmo.dsp.meters import iter_aiff_float64_samples, iter_aiff_frames_ndarray
+
+
+def _extended(value: float) -> bytes:
+    mantissa, exponent = math.frexp(value)
+    return struct.pack(">HQ", exponent + 16382, int(mantissa * (1 << 64)))
+
+
+def _chunk(chunk_id: bytes, payload: bytes) -> bytes:
+    padding = b"\x00" if len(payload) % 2 else b""
+    return chunk_id + struct.pack(">I", len(payload)) + payload + padding
+
+
+def _write_aiff(
+    path: Path,
+    payload: bytes,
+    *,
+    channels: int,
+    bits_per_sample: int,
+    sample_rate_hz: int = 48000,
+    compression_type: bytes | None = None,
+    extra_chunks: bytes = b"",
+) -> None:
+    bytes_per_sample = (bits_per_sample + 7) // 8
+    if compression_type in (b"fl32", b"FL32"):
+        bytes_per_sample = 4
+    elif compression_type in (b"fl64", b"FL64"):
+        bytes_per_sample = 8
+    frames = len(payload) // (bytes_per_sample * channels)
+    comm = struct.pack(">hIh", channels, frames, bits_per_sample) + _extended(sample_rate_hz)
+    form_type = b"AIFF"
+    if compression_type is not None:
+        form_type = b"AIFC"
+        comm += compression_type + b"\x00\x00"
+    body = form_type + extra_chunks + _chunk(b"COMM", comm)
+    body += _chunk(b"SSND", struct.pack(">II", 0, 0) + payload)
+    path.write_bytes(b"FORM" + struct.pack(">I", len(body)) + body)
+
+
+def _pcm24_be(values: list[int]) -> bytes:
+    return b"".join(struct.pack(">i", value)[1:] for value in values)
+
+
+class TestAiffDecode(unittest.TestCase):
+    def test_read_aiff_metadata_parses_comm_ssnd_and_text_chunks(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "vox.aif"
+            _write_aiff(
+                path,
+                _pcm24_be([0, 1, -1, 2, -2, 3]),
+                channels=2,
+                bits_per_sample=24,
+                sample_rate_hz=44100,
+                extra_chunks=_chunk(b"NAME", b"Lead Vox"),
+            )
+            metadata = read_aiff_metadata(path)
+            self.assertEqual(read_audio_metadata(path), metadata)
+
+        self.assertEqual(metadata["channels"], 2)
+        self.assertEqual(metadata["sample_rate_hz"], 44100)
+        self.assertEqual(metadata["bits_per_sample"], 24)
+        self.assertEqual(metadata["num_frames"], 3)
+        self.assertEqual(metadata["block_align"], 6)
+        self.assertEqual(metadata["codec_name"], "pcm_s24be")
+        self.assertAlmostEqual(metadata["duration_s"], 3 / 44100)
+        self.assertEqual(metadata["tags"]["normalized"].get("name"), ["Lead Vox"])
+
+    def test_block_decoder_matches_reference_values_for_each_layout(self) -> None:
+        ints16 = [0, 16384, -32768, 32767, -1, 123]
+        ints24 = [0, 4194304, -8388608, 8388607, -1, 456]
+        ints32 = [0, 1073741824, -2147483648, 2147483647, -1, 789]
+        floats = [0.0, 0.5, -1.0, 1.5, -0.25, 0.125]
+        cases = [
+            (None, 16, struct.pack(">6h", *ints16), [v / 32768.0 for v in ints16]),
+            (b"twos", 16, struct.pack(">6h", *ints16), [v / 32768.0 for v in ints16]),
+            (b"sowt", 16, struct.pack("<6h", *ints16), [v / 32768.0 for v in ints16]),
+            (None, 24, _pcm24_be(ints24), [v / 8388608.0 for v in ints24]),
+            (None, 32, struct.pack(">6i", *ints32), [v / 2147483648.0 for v in ints32]),
+            (b"fl32", 32, struct.pack(">6f", *floats), floats),
+            (b"fl64", 64, struct.pack(">6d", *floats), floats),
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for index, (compression, bits, payload, expected) in enumerate(cases):
+                path = Path(temp_dir) / f"case_{index}.aiff"
+                _write_aiff(
+                    path,
+                    payload,
+                    channels=2,
+                    bits_per_sample=bits,
+                    compression_type=compression,
+                )
+                expected_clamped = [min(value, math.nextafter(1.0, 0.0)) for value in expected]
+                if compression is None or compression in (b"twos", b"sowt"):
+                    expected_clamped = [
+                        min(value, (2 ** (bits - 1) - 1) / 2 ** (bits - 1))
+                        for value in expected
+                    ]
+                with self.subTest(compression=compression, bits=bits):
+                    blocks = list(
+                        iter_aiff_frames_ndarray(path, error_context="test", chunk_frames=2)
+                    )
+                    self.assertEqual([block.shape for block in blocks], [(2, 2), (1, 2)])
+                    decoded = np.concatenate(blocks).ravel().tolist()
+                    self.assertEqual(decoded, expected_clamped)
+
+                    chunks = [
+                        sample
+                        for chunk in iter_aiff_float64_samples(path, error_context="test")
+                        for sample in chunk
+                    ]
+                    self.assertEqual(chunks, expected_clamped)
+
+    def test_frame_range_matches_slice_of_full_read(self) -> None:
+        values = list(range(-600, 600, 3))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "pad.aiff"
+            _write_aiff(path, struct.pack(f">{len(values)}h", *values), channels=2, bits_per_sample=16)
+            full = np.concatenate(list(iter_aiff_frames_ndarray(path, error_context="test")))
+            window = np.concatenate(
+                list(
+                    iter_aiff_frames_ndarray(
+                        path, error_context="test", chunk_frames=7, start_frame=31, frame_count=50
+                    )
+                )
+            )
+            tail = list(
+                iter_aiff_frames_ndarray(path, error_context="test", start_frame=190, frame_count=50)
+            )
+
+        np.testing.assert_array_equal(window, full[31:81])
+        np.testing.assert_array_equal(np.concatenate(tail), full[190:])
+
+    def test_dispatcher_decodes_aiff_without_ffmpeg(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "bass.aiff"
+            _write_aiff(path, struct.pack(">4h", 8192, -8192, 16384, 0), channels=1, bits_per_sample=16)
+            with mock.patch.dict(
+                os.environ,
+                {"MMO_FFMPEG_PATH": str(Path(temp_dir) / "missing_ffmpeg")},
+                clear=False,
+            ):
+                chunks = list(iter_audio_float64_samples(path, error_context="aiff dispatcher test"))
+
+        self.assertEqual([sample for chunk in chunks for sample in chunk], [0.25, -0.25, 0.5, 0.0])
+
+    def test_compressed_aifc_is_left_to_ffmpeg(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "phone.aifc"
+            _write_aiff(
+                path,
+                b"\x00" * 8,
+                channels=1,
+                bits_per_sample=16,
+                compression_type=b"ulaw",
+            )
+            with self.assertRaisesRegex(ValueError, "compression type 'ulaw'"):
+                read_aiff_metadata(path)
+            self.assertFalse(has_native_aiff_decoder(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
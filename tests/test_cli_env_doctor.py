@@ -79,7 +79,10 @@ class TestCliEnvDoctor(unittest.TestCase):
             self.assertEqual(first_stdout, second_stdout)
 
             payload = json.loads(first_stdout)
-            self.assertEqual(sorted(payload.keys()), ["checks", "env_overrides", "paths", "python"])
+            self.assertEqual(
+                sorted(payload.keys()),
+                ["caches", "checks", "env_overrides", "paths", "python"],
+            )
             self.assertEqual(
                 sorted(payload["python"].keys()),
                 ["executable", "platform", "version"],
@@ -131,6 +134,17 @@ class TestCliEnvDoctor(unittest.TestCase):
                 self.assertTrue(env_entry["present"])
                 self.assertIsInstance(env_entry["path"], str)
 
+            self.assertEqual(sorted(payload["caches"].keys()), ["decode", "metadata"])
+            self.assertEqual(
+                sorted(payload["caches"]["metadata"].keys()),
+                ["bytes", "enabled", "entries", "persistent"],
+            )
+            self.assertEqual(
+                sorted(payload["caches"]["decode"].keys()),
+                ["bytes", "enabled", "entries"],
+            )
+            self.assertIsInstance(payload["caches"]["decode"]["bytes"], int)
+
             self.assertTrue(payload["checks"]["cache_dir_writable"])
             self.assertTrue(payload["checks"]["temp_dir_writable"])
             self.assertTrue(payload["checks"]["data_root_readable"])
@@ -194,9 +208,41 @@ class TestCliEnvDoctor(unittest.TestCase):
                     "env_overrides.MMO_FFMPEG_PATH.path",
                     "env_overrides.MMO_FFPROBE_PATH.present",
                     "env_overrides.MMO_FFPROBE_PATH.path",
+                    "caches.metadata.enabled",
+                    "caches.metadata.persistent",
+                    "caches.metadata.entries",
+                    "caches.metadata.bytes",
+                    "caches.decode.enabled",
+                    "caches.decode.entries",
+                    "caches.decode.bytes",
                 ],
             )
 
+    def test_env_doctor_reports_cache_usage_on_disk(self) -> None:
+        repo_root = Path(__file__).resolve().parents[1]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            env = self._doctor_env(repo_root, temp_path)
+            cache_dir = temp_path / "cache"
+            env["MMO_CACHE_DIR"] = os.fspath(cache_dir)
+            decoded_dir = cache_dir / "decoded_pcm"
+            decoded_dir.mkdir(parents=True)
+            (decoded_dir / "entry.pcm").write_bytes(b"\x00" * 64)
+            (decoded_dir / "entry.json").write_bytes(b"{}\n")
+
+            exit_code, stdout, stderr = self._run_main(
+                ["env", "doctor", "--format", "json"],
+                env_overrides=env,
+            )
+
+        self.assertEqual(exit_code, 0, msg=stderr)
+        caches = json.loads(stdout)["caches"]
+        self.assertEqual(caches["decode"]["entries"], 1)
+        self.assertEqual(caches["decode"]["bytes"], 67)
+        self.assertEqual(caches["metadata"]["entries"], 0)
+        self.assertEqual(caches["metadata"]["bytes"], 0)
+
+
 
 if __name__ == "__main__":
     unittest.main()
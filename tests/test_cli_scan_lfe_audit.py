@@ -408,6 +408,83 @@ class TestScanSessionLfeIntegration(unittest.TestCase):
             self.assertIn("infrasonic_energy_db", first)
             self.assertIn("lfe_to_mains_ratio_db", first)
 
+    def test_scan_lfe_audit_from_stem_meter_decode_matches_standalone(self) -> None:
+        self._skip_if_no_numpy()
+        from mmo.tools.scan_session import build_report
+
+        def _lfe_evidence(report: dict) -> tuple[list, list]:
+            issues = [
+                issue
+                for issue in report.get("issues", [])
+                if issue.get("issue_id", "").startswith("ISSUE.LFE.")
+            ]
+            measurements = [
+                m
+                for stem in report["session"]["stems"]
+                for m in stem.get("measurements", [])
+                if m.get("evidence_id", "").startswith("EVID.LFE.")
+            ]
+            return issues, measurements
+
+        with tempfile.TemporaryDirectory() as tmp:
+            stems_dir = _make_stems_dir_with_lfe(Path(tmp) / "stems")
+            standalone = build_report(stems_dir, "2000-01-01T00:00:00Z")
+            fused = build_report(stems_dir, "2000-01-01T00:00:00Z", meters="truth")
+
+        standalone_issues, standalone_measurements = _lfe_evidence(standalone)
+        self.assertTrue(standalone_issues)
+        self.assertEqual(_lfe_evidence(fused), (standalone_issues, standalone_measurements))
+
+    def test_pooled_lfe_audit_matches_sequential(self) -> None:
+        self._skip_if_no_numpy()
+        import copy
+        import shutil
+
+        from mmo.core.session import build_session_from_stems_dir
+        from mmo.tools.scan_session import _ScanWorkerPool, _add_lfe_audit_issues
+
+        with tempfile.TemporaryDirectory() as tmp:
+            stems_dir = _make_stems_dir_with_lfe(Path(tmp) / "stems")
+            for wav_path in sorted(stems_dir.glob("*.wav")):
+                shutil.copyfile(wav_path, stems_dir / f"copy_{wav_path.name}")
+            session = build_session_from_stems_dir(stems_dir)
+            sequential_session = copy.deepcopy(session)
+            sequential_issues: list = []
+            _add_lfe_audit_issues(sequential_session, stems_dir, sequential_issues)
+            pooled_session = copy.deepcopy(session)
+            pooled_issues: list = []
+            with _ScanWorkerPool() as pool:
+                _add_lfe_audit_issues(pooled_session, stems_dir, pooled_issues, worker_pool=pool)
+
+        self.assertTrue(sequential_issues)
+        self.assertEqual(pooled_issues, sequential_issues)
+        self.assertEqual(pooled_session, sequential_session)
+
+    def test_incremental_rescan_rebuilds_lfe_issues_from_previous_rows(self) -> None:
+        self._skip_if_no_numpy()
+        from mmo.tools.scan_session import build_report
+
+        with tempfile.TemporaryDirectory() as tmp:
+            stems_dir = _make_stems_dir_with_lfe(Path(tmp) / "stems")
+            previous = build_report(stems_dir, "2000-01-01T00:00:00Z", meters="basic")
+            strict_full = build_report(
+                stems_dir, "2000-01-01T00:00:00Z", strict=True, meters="basic"
+            )
+            strict_incremental = build_report(
+                stems_dir,
+                "2000-01-01T00:00:00Z",
+                strict=True,
+                meters="basic",
+                previous_report=previous,
+            )
+
+        self.assertEqual(
+            len(strict_incremental["incremental_scan"]["reused_stem_ids"]),
+            len(previous["session"]["stems"]),
+        )
+        self.assertEqual(strict_incremental["issues"], strict_full["issues"])
+        self.assertNotEqual(strict_full["issues"], previous["issues"])
+
     def test_scan_stereo_wav_no_lfe_issues(self) -> None:
         """Stereo stems should not produce any ISSUE.LFE.* issues."""
         with tempfile.TemporaryDirectory() as tmp:
@@ -0,0 +1,79 @@
+import os
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from mmo.dsp.correlation import (
+    CorrelationMatrixAccumulator,
+    PairCorrelationAccumulator,
+)
+
+
+class TestCorrelationMatrixAccumulator(unittest.TestCase):
+    def _skip_if_no_numpy(self) -> None:
+        if os.getenv("SKIP_NUMPY_TESTS"):
+            self.skipTest("Skipping numpy-dependent test via SKIP_NUMPY_TESTS.")
+        if np is None:
+            self.skipTest("numpy not available")
+
+    def test_matrix_matches_pairwise_accumulators_for_12_channels(self) -> None:
+        self._skip_if_no_numpy()
+        rng = np.random.default_rng(11)
+        base = rng.normal(size=(20011, 1))
+        frames = 0.5 * base + rng.normal(size=(20011, 12)) * np.linspace(0.1, 1.0, 12)
+        frames[:, 11] += 0.3  # DC must not leak into correlation.
+        pairs = {
+            f"{a}_{b}": (a, b) for a in range(12) for b in range(a + 1, 12)
+        }
+
+        matrix_acc = CorrelationMatrixAccumulator(12)
+        for start in range(0, frames.shape[0], 1500):
+            matrix_acc.update(frames[start : start + 1500])
+        pair_acc = PairCorrelationAccumulator(12, pairs)
+        pair_acc.update_chunk(frames.ravel().tolist())
+
+        expected = pair_acc.correlations()
+        actual = matrix_acc.correlations(pairs)
+        self.assertEqual(set(actual), set(expected))
+        for name, value in expected.items():
+            self.assertAlmostEqual(actual[name], value, places=10)
+        self.assertTrue(np.allclose(matrix_acc.matrix(), np.corrcoef(frames.T), atol=1e-12))
+
+        interleaved_acc = CorrelationMatrixAccumulator(12)
+        flat = frames.ravel().tolist()
+        for start in range(0, len(flat), 1001):
+            interleaved_acc.update_chunk(flat[start : start + 1001])
+        self.assertTrue(np.allclose(interleaved_acc.matrix(), matrix_acc.matrix(), atol=1e-12))
+
+    def test_constant_channels_and_windows(self) -> None:
+        self._skip_if_no_numpy()
+        frames = np.zeros((1000, 3), dtype=np.float64)
+        frames[:, 0] = np.sin(np.arange(1000) * 0.05)
+        frames[:500, 1] = frames[:500, 0]
+        frames[500:, 1] = -frames[500:, 0]
+        frames[:, 2] = 0.1
+
+        accumulator = CorrelationMatrixAccumulator(3, window_frames=250)
+        for start in range(0, 1000, 333):
+            accumulator.update(frames[start : start + 333])
+        matrix = accumulator.matrix()
+        self.assertEqual(matrix[0, 2], 0.0)
+        self.assertEqual(matrix[2, 2], 0.0)
+        self.assertEqual(accumulator.correlations({"c": (1, 2)}), {"c": 0.0})
+
+        windows = accumulator.windowed()
+        self.assertEqual(windows.shape, (4, 3, 3))
+        self.assertTrue(np.allclose(windows[:2, 0, 1], 1.0))
+        self.assertTrue(np.allclose(windows[2:, 0, 1], -1.0))
+
+        with self.assertRaises(ValueError):
+            CorrelationMatrixAccumulator(3).windowed()
+        with self.assertRaises(ValueError):
+            accumulator.update(np.zeros((4, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from mmo.dsp import decode_cache as decode_cache_module
+from mmo.dsp.decode_cache import DecodeCache, decode_cache_stats, decode_cache_stats_since
+from mmo.dsp.decoders import iter_audio_float64_samples
+
+_SHA_A = "a" * 64
+_SHA_B = "b" * 64
+
+
+def _write_fake_ffmpeg(path: Path) -> None:
+    path.write_text(
+        """
+import struct
+import sys
+
+samples = [0.125 * ((index % 8) - 4) for index in range(96)]
+sys.stdout.buffer.write(struct.pack(f"<{len(samples)}d", *samples))
+""".lstrip(),
+        encoding="utf-8",
+    )
+
+
+def _blocks(frames: int, channels: int, *, chunk: int = 5) -> list[np.ndarray]:
+    data = np.arange(frames * channels, dtype=np.float64).reshape(frames, channels) / 1000.0
+    return [data[start : start + chunk] for start in range(0, frames, chunk)]
+
+
+class TestDecodeCache(unittest.TestCase):
+    def test_store_then_load_round_trips_blocks_through_memmap(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DecodeCache(Path(temp_dir))
+            source = _blocks(12, 2)
+            before = decode_cache_stats()
+
+            self.assertIsNone(cache.load(_SHA_A, channels=2))
+            passed = list(cache.store_blocks(_SHA_A, None, iter(source), channels=2))
+            cached = cache.load(_SHA_A, channels=2)
+
+            self.assertIsInstance(cached, np.memmap)
+            np.testing.assert_array_equal(cached, np.concatenate(source))
+            np.testing.assert_array_equal(np.concatenate(passed), np.concatenate(source))
+            self.assertIsNone(cache.load(_SHA_A, 44100, channels=2))
+            blocks = list(cache.iter_blocks(_SHA_A, channels=2, chunk_frames=5))
+            self.assertEqual([block.shape for block in blocks], [(5, 2), (5, 2), (2, 2)])
+            # A reader expecting another frame width misses instead of re-framing.
+            self.assertNotEqual(
+                cache.entry_key(_SHA_A, None, channels=4),
+                cache.entry_key(_SHA_A, None, channels=2),
+            )
+            self.assertIsNone(cache.iter_blocks(_SHA_A, channels=4))
+            del cached
+
+        stats = decode_cache_stats_since(before)
+        self.assertEqual(stats["stores"], 1)
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 3)
+
+    def test_channel_mismatch_in_sidecar_is_a_miss(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            cache = DecodeCache(root)
+            list(cache.store_blocks(_SHA_A, None, iter(_blocks(12, 2)), channels=2))
+            # Same byte count, but stored under a four-channel key by a foreign writer.
+            foreign = cache.entry_key(_SHA_A, None, channels=4)
+            good = cache.entry_key(_SHA_A, None, channels=2)
+            os.replace(root / f"{good}.pcm", root / f"{foreign}.pcm")
+            os.replace(root / f"{good}.json", root / f"{foreign}.json")
+
+            self.assertIsNone(cache.load(_SHA_A, channels=4))
+
+    def test_interleaved_writers_of_one_entry_do_not_share_temp_files(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            cache = DecodeCache(root)
+            first = cache.store_blocks(_SHA_A, None, iter(_blocks(12, 1)), channels=1)
+            second = cache.store_blocks(_SHA_A, None, iter(_blocks(12, 1)), channels=1)
+            next(first)
+            next(second)
+            self.assertEqual(len(list(root.glob("*.tmp"))), 2)
+            list(first)
+            list(second)
+
+            self.assertEqual(list(root.glob("*.tmp")), [])
+            np.testing.assert_array_equal(
+                cache.load(_SHA_A, channels=1), np.concatenate(_blocks(12, 1))
+            )
+
+    def test_abandoned_decode_leaves_no_entry(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            cache = DecodeCache(root)
+            stream = cache.store_blocks(_SHA_A, None, iter(_blocks(12, 1)), channels=1)
+            next(stream)
+            stream.close()
+
+            self.assertEqual(list(root.iterdir()), [])
+            self.assertIsNone(cache.load(_SHA_A, channels=1))
+
+    def test_eviction_drops_least_recently_used_entries(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            entry_bytes = 10 * 8
+            cache = DecodeCache(root, max_bytes=entry_bytes * 2)
+            list(cache.store_blocks(_SHA_A, None, iter(_blocks(10, 1)), channels=1))
+            list(cache.store_blocks(_SHA_B, None, iter(_blocks(10, 1)), channels=1))
+            os.utime(root / f"{cache.entry_key(_SHA_A, None, channels=1)}.pcm", ns=(1, 1))
+            self.assertIsNotNone(cache.load(_SHA_B, channels=1))
+
+            list(cache.store_blocks(_SHA_A, 48000, iter(_blocks(10, 1)), channels=1))
+
+            self.assertIsNone(cache.load(_SHA_A, channels=1))
+            self.assertIsNotNone(cache.load(_SHA_B, channels=1))
+            self.assertIsNotNone(cache.load(_SHA_A, 48000, channels=1))
+
+            # An entry larger than the whole cache is streamed but never kept.
+            oversized = list(cache.store_blocks("c" * 64, None, iter(_blocks(30, 1)), channels=1))
+            self.assertEqual(sum(block.shape[0] for block in oversized), 30)
+            self.assertIsNone(cache.load("c" * 64, channels=1))
+
+    def test_dispatcher_reuses_cached_decode_without_ffmpeg(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            fake_ffmpeg = temp_path / "fake_ffmpeg.py"
+            _write_fake_ffmpeg(fake_ffmpeg)
+            flac_path = temp_path / "stem.flac"
+            flac_path.write_bytes(b"not really flac")
+            metadata = {"channels": 2, "sample_rate_hz": 48000}
+
+            env = {
+                "MMO_DECODE_CACHE": "1",
+                "MMO_CACHE_DIR": str(temp_path / "cache"),
+                "MMO_FFMPEG_PATH": str(fake_ffmpeg),
+            }
+            with mock.patch.dict(os.environ, env, clear=False):
+                before = decode_cache_stats()
+                first = list(
+                    iter_audio_float64_samples(
+                        flac_path, error_context="decode cache test", metadata=metadata
+                    )
+                )
+                fake_ffmpeg.unlink()
+                second = list(
+                    iter_audio_float64_samples(
+                        flac_path, error_context="decode cache test", metadata=metadata
+                    )
+                )
+                receipt = decode_cache_module.build_decode_cache_receipt(before)
+
+        flat_first = [sample for chunk in first for sample in chunk]
+        flat_second = [sample for chunk in second for sample in chunk]
+        self.assertEqual(len(flat_first), 96)
+        self.assertEqual(flat_first, flat_second)
+        self.assertIsNotNone(receipt)
+        self.assertEqual(receipt["hits"], 1)
+        self.assertEqual(receipt["misses"], 1)
+        self.assertEqual(receipt["stores"], 1)
+
+    def test_cache_is_off_by_default(self) -> None:
+        with mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("MMO_DECODE_CACHE", None)
+            self.assertIsNone(decode_cache_module.active_decode_cache())
+            self.assertIsNone(decode_cache_module.build_decode_cache_receipt(decode_cache_stats()))
+
+
+if __name__ == "__main__":
+    unittest.main()
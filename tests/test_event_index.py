@@ -0,0 +1,75 @@
+import os
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from mmo.dsp.event_index import EventRunIndex, MeterEvent
+from mmo.dsp.meters import BasicStatsAccumulator
+
+
+class TestEventRunIndex(unittest.TestCase):
+    def _skip_if_no_numpy(self) -> None:
+        if os.getenv("SKIP_NUMPY_TESTS"):
+            self.skipTest("Skipping numpy-dependent test via SKIP_NUMPY_TESTS.")
+        if np is None:
+            self.skipTest("numpy not available")
+
+    def _frames(self):
+        frames = np.full((1000, 2), 0.25, dtype=np.float64)
+        frames[10:13, 0] = [1.0, -1.0, 1.0]
+        frames[498:503, 1] = [1.0, 1.0, -1.25, 1.0, 1.0]
+        frames[999, 0] = 1.0
+        return frames
+
+    def test_runs_are_chunk_independent(self) -> None:
+        self._skip_if_no_numpy()
+        frames = self._frames()
+        expected = (
+            MeterEvent(start_frame=10, length=3, channel=0, peak=1.0),
+            MeterEvent(start_frame=498, length=5, channel=1, peak=1.25),
+            MeterEvent(start_frame=999, length=1, channel=0, peak=1.0),
+        )
+        for chunk in (1, 7, 250, 499, 1000):
+            accumulator = BasicStatsAccumulator(clip_event_channels=2)
+            for start in range(0, frames.shape[0], chunk):
+                accumulator.update(frames[start : start + chunk].ravel())
+            events = accumulator.clip_events()
+            self.assertEqual(events.events, expected, msg=f"chunk={chunk}")
+            self.assertEqual(events.event_count, 3)
+            self.assertEqual(events.flagged_count, accumulator.clip_count)
+            self.assertFalse(events.truncated)
+
+    def test_cap_keeps_earliest_events(self) -> None:
+        self._skip_if_no_numpy()
+        flagged = np.zeros((400, 1), dtype=bool)
+        flagged[::4, 0] = True
+        magnitude = flagged.astype(np.float64)
+        index = EventRunIndex(1, max_events=5)
+        for start in range(0, 400, 64):
+            index.update(magnitude[start : start + 64], flagged[start : start + 64], start)
+        result = index.finalize()
+        self.assertEqual([event.start_frame for event in result.events], [0, 4, 8, 12, 16])
+        self.assertEqual(result.event_count, 100)
+        self.assertEqual(result.flagged_count, 100)
+        self.assertTrue(result.truncated)
+
+    def test_position_gap_closes_open_runs(self) -> None:
+        self._skip_if_no_numpy()
+        flagged = np.ones((4, 1), dtype=bool)
+        index = EventRunIndex(1)
+        index.update(flagged.astype(np.float64), flagged, 0)
+        index.update(flagged.astype(np.float64), flagged, 10)
+        result = index.finalize()
+        self.assertEqual(
+            [(event.start_frame, event.length) for event in result.events],
+            [(0, 4), (10, 4)],
+        )
+        with self.assertRaises(ValueError):
+            index.update(flagged.astype(np.float64), flagged, 14)
+
+
+if __name__ == "__main__":
+    unittest.main()
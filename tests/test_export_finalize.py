@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import math
 import unittest
+from unittest import mock
 
+import numpy as np
+
+from mmo.dsp import export_finalize as export_finalize_module
 from mmo.dsp.export_finalize import (
     StreamingExportFinalizer,
     export_finalize_interleaved_f64,
@@ -84,5 +89,74 @@ class TestExportFinalize(unittest.TestCase):
         self.assertEqual(chunked, one_shot)
 
 
+def _golden_samples(frames: int, channels: int) -> list[float]:
+    # Includes out-of-range peaks, exact full scale, and half-LSB ties.
+    samples = [
+        1.7 * math.sin(0.013 * index) * math.cos(0.0021 * index)
+        for index in range(frames * channels)
+    ]
+    samples[:6] = [1.0, -1.0, 0.5 / 32768.0, -1.5 / 32768.0, 2.5 / 8388608.0, 0.0]
+    return samples
+
+
+def _stream(samples, *, bit_depth: int, dither_policy: str, splits: list[int]) -> bytes:
+    finalizer = StreamingExportFinalizer(
+        channels=3,
+        bit_depth=bit_depth,
+        dither_policy=dither_policy,
+        seed=4242,
+    )
+    bounds = [0, *splits, len(samples)]
+    return b"".join(
+        finalizer.finalize_chunk(samples[start:end])
+        for start, end in zip(bounds, bounds[1:])
+    )
+
+
+class TestVectorizedExportFinalize(unittest.TestCase):
+    def test_ndarray_path_is_bit_identical_to_scalar_reference(self) -> None:
+        samples = _golden_samples(frames=701, channels=3)
+        splits = [3, 300, 1203, 1800]
+        for bit_depth in (16, 24, 32):
+            for dither_policy in ("none", "tpdf", "tpdf_hp"):
+                with self.subTest(bit_depth=bit_depth, dither_policy=dither_policy):
+                    with mock.patch.object(
+                        export_finalize_module, "_optional_numpy", return_value=None
+                    ):
+                        reference = _stream(
+                            samples,
+                            bit_depth=bit_depth,
+                            dither_policy=dither_policy,
+                            splits=splits,
+                        )
+                    vectorized = _stream(
+                        np.asarray(samples, dtype=np.float64),
+                        bit_depth=bit_depth,
+                        dither_policy=dither_policy,
+                        splits=[1200],
+                    )
+                    self.assertEqual(vectorized, reference)
+
+    def test_random_block_continues_the_scalar_stream(self) -> None:
+        scalar = export_finalize_module._DeterministicRng(7)
+        block = export_finalize_module._DeterministicRng(7)
+        expected = [scalar.random() for _ in range(9)]
+
+        drawn = block.random_block(np, 4).tolist() + [block.random()]
+        drawn += block.random_block(np, 4).tolist()
+
+        self.assertEqual(drawn, expected)
+
+    def test_nan_input_still_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            export_finalize_interleaved_f64(
+                [0.0, float("nan")],
+                channels=2,
+                bit_depth=16,
+                dither_policy="none",
+                seed=1,
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
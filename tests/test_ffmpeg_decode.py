@@ -6,7 +6,10 @@ from itertools import chain
 from pathlib import Path
 from unittest import mock
 
-from mmo.dsp.backends.ffmpeg_decode import iter_ffmpeg_float64_samples
+from mmo.dsp.backends.ffmpeg_decode import (
+    iter_ffmpeg_float64_samples,
+    iter_ffmpeg_frames_ndarray,
+)
 from mmo.dsp.backends.ffmpeg_discovery import resolve_ffmpeg_cmd
 
 
@@ -45,6 +48,44 @@ class TestFfmpegDecode(unittest.TestCase):
         for value, target in zip(flattened, samples):
             self.assertAlmostEqual(value, target, places=12)
 
+    def test_iter_ffmpeg_frames_ndarray_is_frame_aligned(self) -> None:
+        samples = [index / 64.0 for index in range(-30, 30)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            ffmpeg_path = self._write_fake_ffmpeg(temp_path, samples)
+            dummy = temp_path / "dummy.flac"
+            dummy.write_bytes(b"")
+            with mock.patch.dict(os.environ, {"MMO_FFMPEG_PATH": str(ffmpeg_path)}):
+                ffmpeg_cmd = resolve_ffmpeg_cmd()
+                self.assertIsNotNone(ffmpeg_cmd)
+                # 7 * 8 bytes is not a whole 3-channel frame, so every read
+                # has to carry a partial frame into the next block.
+                blocks = [
+                    block.copy()
+                    for block in iter_ffmpeg_frames_ndarray(
+                        dummy, ffmpeg_cmd, channels=3, read_size_bytes=7 * 8
+                    )
+                ]
+        self.assertTrue(blocks)
+        for block in blocks:
+            self.assertEqual(block.ndim, 2)
+            self.assertEqual(block.shape[1], 3)
+        flattened = [value for block in blocks for value in block.ravel().tolist()]
+        self.assertEqual(flattened, samples)
+
+    def test_iter_ffmpeg_frames_ndarray_rejects_partial_tail(self) -> None:
+        samples = [0.0, 0.5, -0.25, 1.0, -1.0]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            ffmpeg_path = self._write_fake_ffmpeg(temp_path, samples)
+            dummy = temp_path / "dummy.flac"
+            dummy.write_bytes(b"")
+            with mock.patch.dict(os.environ, {"MMO_FFMPEG_PATH": str(ffmpeg_path)}):
+                ffmpeg_cmd = resolve_ffmpeg_cmd()
+                self.assertIsNotNone(ffmpeg_cmd)
+                with self.assertRaises(ValueError):
+                    list(iter_ffmpeg_frames_ndarray(dummy, ffmpeg_cmd, channels=2))
+
 
 if __name__ == "__main__":
     unittest.main()
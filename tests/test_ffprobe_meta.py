@@ -6,7 +6,7 @@ import unittest
 from pathlib import Path
 from unittest import mock
 
-from mmo.dsp.decoders import read_metadata
+from mmo.dsp.decoders import read_metadata, read_metadata_many, resolve_probe_workers
 
 
 class TestFfprobeMetadata(unittest.TestCase):
@@ -119,6 +119,36 @@ if __name__ == "__main__":
                 {"raw": [], "normalized": {}, "warnings": []},
             )
 
+    def test_read_metadata_many_keeps_input_order_and_error_slots(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            ffprobe_path = self._write_fake_ffprobe(temp_path)
+            paths = []
+            for name in ("a.m4a", "b.flac", "c.ogg", "d.m4a", "e.flac"):
+                paths.append(temp_path / name)
+                paths[-1].write_bytes(name.encode("ascii"))
+
+            with mock.patch.dict(os.environ, {"MMO_FFPROBE_PATH": str(ffprobe_path)}):
+                pooled = read_metadata_many(paths, max_workers=4)
+                serial = read_metadata_many(paths, max_workers=1)
+
+        self.assertEqual(len(pooled), len(paths))
+        self.assertIsInstance(pooled[2], ValueError)
+        self.assertIsInstance(serial[2], ValueError)
+        self.assertEqual(
+            [item["channels"] for index, item in enumerate(pooled) if index != 2],
+            [1, 2, 1, 2],
+        )
+        self.assertEqual(pooled[:2] + pooled[3:], serial[:2] + serial[3:])
+
+    def test_resolve_probe_workers_prefers_argument_then_env(self) -> None:
+        with mock.patch.dict(os.environ, {"MMO_PROBE_WORKERS": "3"}):
+            self.assertEqual(resolve_probe_workers(), 3)
+            self.assertEqual(resolve_probe_workers(0), 1)
+            self.assertEqual(resolve_probe_workers(12), 12)
+        with mock.patch.dict(os.environ, {"MMO_PROBE_WORKERS": "many"}):
+            self.assertEqual(resolve_probe_workers(), 8)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,15 +8,21 @@ from pathlib import Path
 from mmo.dsp.float64 import (
     bytes_to_float_samples_ieee,
     bytes_to_int_samples_pcm,
+    ieee_bytes_to_ndarray,
+    interleaved_to_mono_peak,
+    pcm_bytes_to_ndarray,
     pcm_int_to_float64,
 )
 from mmo.dsp.io import read_wav_metadata
 from mmo.dsp.meters import (
+    BasicStatsAccumulator,
+    OnlineBasicStats,
     compute_clip_sample_count_wav,
     compute_crest_factor_db_wav,
     compute_dc_offset_wav,
     compute_rms_dbfs_wav,
     compute_sample_peak_dbfs_wav,
+    iter_wav_frames_ndarray,
 )
 
 
@@ -168,6 +174,104 @@ class TestFloat64Conversion(unittest.TestCase):
         finally:
             path.unlink(missing_ok=True)
 
+    def test_pcm_bytes_to_ndarray_matches_list_path(self) -> None:
+        for bits in (16, 24, 32):
+            lo = -(2 ** (bits - 1))
+            hi = 2 ** (bits - 1) - 1
+            ints = [lo, lo + 1, -1, 0, 1, hi // 3, hi - 1, hi]
+            if bits == 24:
+                frames = b"".join(
+                    (value & 0xFFFFFF).to_bytes(3, "little") for value in ints
+                )
+            else:
+                fmt = "h" if bits == 16 else "i"
+                frames = struct.pack(f"<{len(ints)}{fmt}", *ints)
+            expected = pcm_int_to_float64(
+                bytes_to_int_samples_pcm(frames, bits, 2), bits
+            )
+            block = pcm_bytes_to_ndarray(frames, bits, 2)
+            self.assertEqual(block.shape, (len(ints) // 2, 2))
+            self.assertEqual(block.dtype.name, "float64")
+            self.assertEqual(block.ravel().tolist(), expected)
+
+    def test_pcm_bytes_to_ndarray_drops_partial_frame(self) -> None:
+        frames = b"\xff\xff\xff" + b"\x00\x00\x80" + b"\xff\xff"
+        block = pcm_bytes_to_ndarray(frames, 24, 2)
+        self.assertEqual(block.shape, (1, 2))
+        self.assertEqual(block.ravel().tolist(), [-1.0 / 8388608.0, -1.0])
+
+    def test_ieee_bytes_to_ndarray_matches_list_path_and_clamps(self) -> None:
+        samples = [1.5, -1.25, 0.25, 1.0, -0.5, 0.0]
+        for bits, fmt in ((32, "f"), (64, "d")):
+            frames = struct.pack(f"<{len(samples)}{fmt}", *samples)
+            expected = bytes_to_float_samples_ieee(frames, bits, 3)
+            block = ieee_bytes_to_ndarray(frames, bits, 3)
+            self.assertEqual(block.shape, (2, 3))
+            self.assertEqual(block.ravel().tolist(), expected)
+
+        frames = struct.pack(f"<{len(samples)}d", *samples)
+        block32 = ieee_bytes_to_ndarray(frames, 64, 3, dtype="float32")
+        self.assertEqual(block32.dtype.name, "float32")
+        self.assertLess(float(block32.max()), 1.0)
+        self.assertEqual(float(block32.min()), -1.0)
+
+    def test_iter_wav_frames_ndarray_matches_float64_iterator(self) -> None:
+        samples = [(index * 7919) % 65536 - 32768 for index in range(5000 * 2)]
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as handle:
+            path = Path(handle.name)
+
+        try:
+            with wave.open(str(path), "wb") as wav_handle:
+                wav_handle.setnchannels(2)
+                wav_handle.setsampwidth(2)
+                wav_handle.setframerate(48000)
+                wav_handle.writeframes(struct.pack(f"<{len(samples)}h", *samples))
+
+            blocks = list(
+                iter_wav_frames_ndarray(path, error_context="test", chunk_frames=1024)
+            )
+            self.assertEqual([block.shape[0] for block in blocks], [1024] * 4 + [904])
+            flattened = [value for block in blocks for value in block.ravel().tolist()]
+            expected = pcm_int_to_float64(samples, 16)
+            self.assertEqual(flattened, expected)
+        finally:
+            path.unlink(missing_ok=True)
+
+    def test_basic_stats_accumulator_is_chunk_independent(self) -> None:
+        import numpy as np
+
+        rng = np.random.default_rng(9)
+        frames = rng.uniform(-0.5, 0.5, size=(150001, 2)) + 0.01
+        frames[10, 0] = 1.0
+        frames[20, 1] = -1.5
+        frames[30, 0] = 1.0 - 1e-13
+
+        reference = OnlineBasicStats()
+        reference.update(frames.ravel().tolist())
+        expected = reference.finalize()
+
+        results = []
+        for chunk_frames in (1, 1000, 4096, 150001):
+            stats = BasicStatsAccumulator(block_samples=8192)
+            for start in range(0, frames.shape[0], chunk_frames):
+                stats.update(frames[start : start + chunk_frames])
+            results.append(stats.finalize())
+        list_stats = BasicStatsAccumulator(block_samples=8192)
+        list_stats.update(frames.ravel().tolist())
+        results.append(list_stats.finalize())
+
+        for result in results:
+            self.assertEqual(result, results[0])
+        self.assertEqual(results[0][:2], (1.5, 3))
+        for actual, reference_value in zip(results[0][2:], expected[2:]):
+            self.assertAlmostEqual(actual, reference_value, places=10)
+        self.assertEqual(BasicStatsAccumulator().finalize(), OnlineBasicStats().finalize())
+        self.assertEqual(interleaved_to_mono_peak(frames, channels=2), 1.5)
+        self.assertEqual(
+            interleaved_to_mono_peak(frames, channels=2),
+            interleaved_to_mono_peak(frames.ravel().tolist(), channels=2),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+from unittest import mock
+
+from mmo.core.lockfile import build_lockfile
+from mmo.tools.scan_session import _ScanWorkerPool, build_report
+
+_GENERATED_AT = "2000-01-01T00:00:00Z"
+
+
+def _write_sine_wav(path: Path, freq_hz: float, amplitude: float) -> None:
+    sample_rate = 48000
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(2)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        raw = bytearray()
+        for i in range(sample_rate // 2):
+            iv = int(32767 * amplitude * math.sin(2 * math.pi * freq_hz * i / sample_rate))
+            raw += struct.pack("<hh", iv, iv)
+        wf.writeframes(bytes(raw))
+
+
+def _without_receipt(report: dict) -> dict:
+    # scan_receipt records per-run peak RSS, which no two scans share.
+    return {
+        key: value
+        for key, value in report.items()
+        if key not in {"incremental_scan", "scan_receipt"}
+    }
+
+
+def _stem_id_for(report: dict, file_name: str) -> str:
+    for stem in report["session"]["stems"]:
+        if stem["file_path"].endswith(file_name):
+            return stem["stem_id"]
+    raise AssertionError(f"no stem for {file_name}")
+
+
+class TestIncrementalScan(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        env = mock.patch.dict(
+            os.environ, {"MMO_CACHE_DIR": str(Path(self._temp_dir.name) / "cache")}
+        )
+        env.start()
+        self.addCleanup(env.stop)
+        self.stems_dir = Path(self._temp_dir.name) / "stems"
+        self.stems_dir.mkdir()
+        _write_sine_wav(self.stems_dir / "bass.wav", 110.0, 0.5)
+        _write_sine_wav(self.stems_dir / "vox.wav", 440.0, 0.25)
+        _write_sine_wav(self.stems_dir / "pad.wav", 220.0, 0.2)
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def test_rescan_matches_full_scan_and_reuses_unchanged_stems(self) -> None:
+        previous = build_report(self.stems_dir, _GENERATED_AT, include_peak=True, meters="truth")
+        _write_sine_wav(self.stems_dir / "vox.wav", 440.0, 0.5)
+        (self.stems_dir / "pad.wav").unlink()
+        _write_sine_wav(self.stems_dir / "keys.wav", 330.0, 0.3)
+
+        full = build_report(self.stems_dir, _GENERATED_AT, include_peak=True, meters="truth")
+        incremental = build_report(
+            self.stems_dir,
+            _GENERATED_AT,
+            include_peak=True,
+            meters="truth",
+            previous_report=previous,
+            previous_lock=build_lockfile(self.stems_dir),
+        )
+
+        self.assertNotIn("incremental_scan", full)
+        self.assertEqual(_without_receipt(incremental), _without_receipt(full))
+        receipt = incremental["incremental_scan"]
+        self.assertEqual(receipt["previous_report_id"], previous["report_id"])
+        self.assertTrue(receipt["lockfile_checked"])
+        self.assertEqual(receipt["reused_stem_ids"], [_stem_id_for(full, "bass.wav")])
+        self.assertEqual(
+            receipt["rescanned_stem_ids"],
+            sorted([_stem_id_for(full, "vox.wav"), _stem_id_for(full, "keys.wav")]),
+        )
+        self.assertEqual(receipt["removed_stem_ids"], [_stem_id_for(previous, "pad.wav")])
+
+    def test_unchanged_stems_are_never_decoded(self) -> None:
+        previous = build_report(self.stems_dir, _GENERATED_AT, meters="truth")
+        # The first rescan stores every stem's mix-complexity features.
+        seeded = build_report(
+            self.stems_dir, _GENERATED_AT, meters="truth", previous_report=previous
+        )
+        _write_sine_wav(self.stems_dir / "vox.wav", 440.0, 0.5)
+
+        submitted: list[str] = []
+        run_phase = _ScanWorkerPool.run_phase
+
+        def _recording_run_phase(pool, phase, jobs, **kwargs):
+            submitted.extend(job[1] for job in jobs)
+            return run_phase(pool, phase, jobs, **kwargs)
+
+        with mock.patch.object(_ScanWorkerPool, "run_phase", _recording_run_phase):
+            incremental = build_report(
+                self.stems_dir, _GENERATED_AT, meters="truth", previous_report=seeded
+            )
+
+        full = build_report(self.stems_dir, _GENERATED_AT, meters="truth")
+        self.assertEqual(submitted, [_stem_id_for(full, "vox.wav")])
+        self.assertEqual(_without_receipt(incremental), _without_receipt(full))
+        self.assertEqual(len(incremental["incremental_scan"]["reused_stem_ids"]), 2)
+
+    def test_lockfile_mismatch_forces_rescan(self) -> None:
+        previous = build_report(self.stems_dir, _GENERATED_AT, meters="basic")
+        lock = build_lockfile(self.stems_dir)
+        for entry in lock["files"]:
+            if entry["rel_path"] == "bass.wav":
+                entry["sha256"] = "0" * 64
+
+        incremental = build_report(
+            self.stems_dir,
+            _GENERATED_AT,
+            meters="basic",
+            previous_report=previous,
+            previous_lock=lock,
+        )
+
+        receipt = incremental["incremental_scan"]
+        self.assertEqual(receipt["rescanned_stem_ids"], [_stem_id_for(previous, "bass.wav")])
+        self.assertEqual(len(receipt["reused_stem_ids"]), 2)
+
+    def test_changed_meter_settings_rescan_every_stem(self) -> None:
+        previous = build_report(self.stems_dir, _GENERATED_AT, meters="basic")
+
+        for kwargs in ({"meters": "truth"}, {"meters": "basic", "include_peak": True}):
+            incremental = build_report(
+                self.stems_dir, _GENERATED_AT, previous_report=previous, **kwargs
+            )
+            full = build_report(self.stems_dir, _GENERATED_AT, **kwargs)
+            self.assertEqual(incremental["incremental_scan"]["reused_stem_ids"], [])
+            self.assertEqual(_without_receipt(incremental), _without_receipt(full))
+
+    def test_cli_rejects_lock_without_previous_report(self) -> None:
+        lock_path = Path(self._temp_dir.name) / "stems.lock.json"
+        lock_path.write_text(json.dumps(build_lockfile(self.stems_dir)), encoding="utf-8")
+        repo_src = Path(__file__).resolve().parents[1] / "src"
+        env = dict(os.environ)
+        env["PYTHONPATH"] = str(repo_src)
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "mmo.tools.scan_session",
+                str(self.stems_dir),
+                "--previous-lock",
+                str(lock_path),
+            ],
+            check=False,
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        self.assertEqual(result.returncode, 2)
+        self.assertIn("--previous-report", result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
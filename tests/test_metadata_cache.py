@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import os
+import struct
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+from unittest import mock
+
+from mmo.dsp import metadata_cache as metadata_cache_module
+from mmo.dsp.decoders import read_audio_metadata
+from mmo.dsp.io import read_wav_metadata
+from mmo.dsp.metadata_cache import invalidate_metadata_cache, metadata_cache_stats
+
+
+def _write_wav(path: Path, *, frames: int, sample_rate_hz: int = 48000) -> None:
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(sample_rate_hz)
+        handle.writeframes(struct.pack(f"<{frames}h", *([1000] * frames)))
+
+
+def _stats_delta(before: dict, after: dict) -> dict:
+    return {key: after[key] - before[key] for key in ("hits", "misses", "persistent_hits")}
+
+
+class TestMetadataCache(unittest.TestCase):
+    def test_repeat_reads_hit_until_the_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "kick.wav"
+            _write_wav(path, frames=64)
+            before = metadata_cache_stats()
+
+            first = read_wav_metadata(path)
+            first["channels"] = 99
+            second = read_audio_metadata(path)
+            self.assertEqual(second["channels"], 1)
+            self.assertEqual(second["num_frames"], 64)
+            self.assertEqual(_stats_delta(before, metadata_cache_stats())["hits"], 1)
+
+            _write_wav(path, frames=96, sample_rate_hz=44100)
+            rewritten = read_wav_metadata(path)
+
+        self.assertEqual(rewritten["num_frames"], 96)
+        self.assertEqual(rewritten["sample_rate_hz"], 44100)
+        delta = _stats_delta(before, metadata_cache_stats())
+        self.assertEqual(delta["hits"], 1)
+        self.assertEqual(delta["misses"], 2)
+
+    def test_invalidate_forces_a_fresh_read(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "snare.wav"
+            _write_wav(path, frames=32)
+            read_wav_metadata(path)
+            before = metadata_cache_stats()
+
+            self.assertEqual(invalidate_metadata_cache(path), 1)
+            self.assertEqual(invalidate_metadata_cache(path), 0)
+            read_wav_metadata(path)
+
+        delta = _stats_delta(before, metadata_cache_stats())
+        self.assertEqual(delta["hits"], 0)
+        self.assertEqual(delta["misses"], 1)
+
+    def test_reader_errors_are_not_cached(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "broken.wav"
+            path.write_bytes(b"RIFF")
+            for _ in range(2):
+                with self.assertRaisesRegex(ValueError, "too small"):
+                    read_wav_metadata(path)
+            before = metadata_cache_stats()
+            with self.assertRaisesRegex(ValueError, "Failed to stat"):
+                read_wav_metadata(Path(temp_dir) / "missing.wav")
+
+        self.assertEqual(_stats_delta(before, metadata_cache_stats())["hits"], 0)
+
+    def test_persistent_store_survives_a_fresh_process(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            path = temp_path / "pad.wav"
+            _write_wav(path, frames=48)
+            env = {
+                "MMO_CACHE_DIR": str(temp_path / "cache"),
+                "MMO_METADATA_CACHE_PERSIST": "1",
+            }
+            with mock.patch.dict(os.environ, env, clear=False):
+                invalidate_metadata_cache(path)
+                expected = read_wav_metadata(path)
+                stored = list((temp_path / "cache" / "audio_metadata").glob("*.json"))
+                self.assertEqual(len(stored), 1)
+
+                # An empty in-process table stands in for a later CLI run.
+                with mock.patch.dict(metadata_cache_module._ENTRIES, clear=True):
+                    before = metadata_cache_stats()
+                    reloaded = read_wav_metadata(path)
+                    delta = _stats_delta(before, metadata_cache_stats())
+
+                invalidate_metadata_cache(path)
+                remaining = list((temp_path / "cache" / "audio_metadata").glob("*.json"))
+
+        self.assertEqual(reloaded, expected)
+        self.assertIsInstance(reloaded["fmt_chunk"], bytes)
+        self.assertEqual(delta["persistent_hits"], 1)
+        self.assertEqual(delta["misses"], 0)
+        self.assertEqual(remaining, [])
+
+    def test_cache_can_be_disabled(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "hat.wav"
+            _write_wav(path, frames=16)
+            with mock.patch.dict(os.environ, {"MMO_METADATA_CACHE": "0"}, clear=False):
+                before = metadata_cache_stats()
+                read_wav_metadata(path)
+                read_wav_metadata(path)
+                after = metadata_cache_stats()
+
+        self.assertEqual(after, before)
+
+
+if __name__ == "__main__":
+    unittest.main()
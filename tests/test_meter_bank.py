@@ -0,0 +1,173 @@
+import math
+import os
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from mmo.dsp.meter_bank import MeterBank
+from mmo.dsp.meters import compute_basic_stats_from_float64
+
+
+class TestMeterBank(unittest.TestCase):
+    def _skip_if_no_numpy(self) -> None:
+        if os.getenv("SKIP_NUMPY_TESTS"):
+            self.skipTest("Skipping numpy-dependent test via SKIP_NUMPY_TESTS.")
+        if np is None:
+            self.skipTest("numpy not available")
+
+    def _stereo_signal(self, sample_rate: int) -> "np.ndarray":
+        rng = np.random.default_rng(3)
+        t = np.arange(sample_rate * 4, dtype=np.float64) / sample_rate
+        left = 0.4 * np.sin(2.0 * math.pi * 220.0 * t) + rng.normal(0.0, 0.02, t.shape)
+        right = 0.3 * np.sin(2.0 * math.pi * 220.0 * t + 0.5) + rng.normal(0.0, 0.02, t.shape)
+        return np.stack([left, right], axis=1)
+
+    def test_single_pass_matches_standalone_meters(self) -> None:
+        self._skip_if_no_numpy()
+        from mmo.dsp.meters_truth import (
+            compute_lufs_integrated_float64,
+            compute_lufs_shortterm_float64,
+            compute_true_peak_dbtp_float64,
+        )
+        from mmo.dsp.stereo import compute_stereo_correlation_wav
+
+        sample_rate = 48000
+        samples = self._stereo_signal(sample_rate)
+        bank = MeterBank(
+            sample_rate,
+            2,
+            stereo_correlation=True,
+            correlation_pairs={"FL_FR": (0, 1)},
+            truth=True,
+            mono_downmix=True,
+        )
+        for start in range(0, samples.shape[0], 4096):
+            bank.update(samples[start : start + 4096])
+        result = bank.result()
+
+        expected_basic = compute_basic_stats_from_float64(
+            samples[start : start + 4096].ravel().tolist()
+            for start in range(0, samples.shape[0], 4096)
+        )
+        self.assertEqual(
+            (
+                result.peak,
+                result.clip_count,
+                result.dc_offset,
+                result.rms_dbfs,
+                result.crest_factor_db,
+            ),
+            expected_basic,
+        )
+
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as handle:
+            path = Path(handle.name)
+        try:
+            int_samples = np.round(samples * 32767.0).astype(np.int16)
+            with wave.open(str(path), "wb") as wav_handle:
+                wav_handle.setnchannels(2)
+                wav_handle.setsampwidth(2)
+                wav_handle.setframerate(sample_rate)
+                wav_handle.writeframes(int_samples.tobytes())
+            expected_corr = compute_stereo_correlation_wav(path)
+        finally:
+            path.unlink(missing_ok=True)
+        self.assertAlmostEqual(result.stereo_correlation, expected_corr, places=3)
+        self.assertEqual(result.pair_correlations["FL_FR"], result.stereo_correlation)
+
+        self.assertAlmostEqual(
+            result.lufs_i,
+            compute_lufs_integrated_float64(
+                samples, sample_rate, 2, channel_mask=None, channel_layout=None
+            ),
+            places=9,
+        )
+        self.assertAlmostEqual(
+            result.lufs_s,
+            compute_lufs_shortterm_float64(
+                samples, sample_rate, 2, channel_mask=None, channel_layout=None
+            ),
+            places=9,
+        )
+        self.assertAlmostEqual(
+            result.true_peak_dbtp,
+            compute_true_peak_dbtp_float64(samples, sample_rate),
+            places=9,
+        )
+        self.assertTrue(np.array_equal(result.mono, samples.sum(axis=1) * 0.5))
+
+    def test_truth_failure_keeps_basic_meters(self) -> None:
+        self._skip_if_no_numpy()
+        from unittest import mock
+
+        from mmo.dsp.meters_truth import OnlineLufsIntegrated
+
+        samples = self._stereo_signal(48000)
+        plain = MeterBank(48000, 2)
+        plain.update(samples)
+        expected = plain.result()
+
+        bank = MeterBank(48000, 2, truth=True)
+        with mock.patch.object(
+            OnlineLufsIntegrated, "update", side_effect=ValueError("bad channel layout")
+        ):
+            bank.update(samples[:4096])
+            bank.update(samples[4096:])
+        result = bank.result()
+
+        self.assertEqual(result.truth_error, "bad channel layout")
+        self.assertIsNone(result.lufs_i)
+        self.assertIsNone(result.true_peak_dbtp)
+        self.assertEqual(result.peak, expected.peak)
+        self.assertEqual(result.rms_dbfs, expected.rms_dbfs)
+        self.assertEqual(result.crest_factor_db, expected.crest_factor_db)
+        self.assertIsNone(expected.truth_error)
+
+    def test_scan_worker_keeps_basic_rows_when_truth_fails(self) -> None:
+        self._skip_if_no_numpy()
+        import time
+        from unittest import mock
+
+        from mmo.core.loudness_methods import DEFAULT_LOUDNESS_METHOD_ID
+        from mmo.core.session import build_session_from_stems_dir
+        from mmo.dsp.meters_truth import OnlineLufsIntegrated
+        from mmo.tools.scan_session import _worker_stem_meters
+
+        samples = self._stereo_signal(8000)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            stems_dir = Path(temp_dir)
+            with wave.open(str(stems_dir / "pad.wav"), "wb") as handle:
+                handle.setnchannels(2)
+                handle.setsampwidth(2)
+                handle.setframerate(8000)
+                handle.writeframes((samples * 32767.0).astype("<i2").tobytes())
+            stem = build_session_from_stems_dir(stems_dir)["stems"][0]
+            with mock.patch.object(
+                OnlineLufsIntegrated, "update", side_effect=ValueError("bad channel layout")
+            ):
+                result = _worker_stem_meters(
+                    stem,
+                    str(stems_dir),
+                    DEFAULT_LOUDNESS_METHOD_ID,
+                    True,
+                    False,
+                    0,
+                    1,
+                    time.perf_counter(),
+                )
+
+        evidence_ids = {row["evidence_id"] for row in result["basic_measurements"]}
+        self.assertIn("EVID.METER.RMS_DBFS", evidence_ids)
+        self.assertIn("EVID.METER.CREST_FACTOR_DB", evidence_ids)
+        self.assertEqual(result["truth_measurements"], [])
+        self.assertEqual(result["computed_meters"], ["basic"])
+
+
+if __name__ == "__main__":
+    unittest.main()
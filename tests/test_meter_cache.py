@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import math
+import os
+import struct
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from mmo.dsp.meter_cache import MeterCache, meter_cache_stats, meter_cache_stats_since
+
+_SHA_A = "a" * 64
+
+
+def _write_sine_wav(path: Path, freq_hz: float, amplitude: float) -> None:
+    sample_rate = 48000
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(2)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        raw = bytearray()
+        for i in range(sample_rate // 2):
+            iv = int(32767 * amplitude * math.sin(2 * math.pi * freq_hz * i / sample_rate))
+            raw += struct.pack("<hh", iv, iv)
+        wf.writeframes(bytes(raw))
+
+
+class TestMeterCache(unittest.TestCase):
+    def test_store_then_load_round_trips_payload_and_arrays(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = MeterCache(Path(temp_dir))
+            options = {"format_id": "wav", "channels": 2}
+            payload = {
+                "basic_measurements": [
+                    {"evidence_id": "EVID.METER.PEAK_DBFS", "value": -6.02, "unit_id": "UNIT.DBFS"}
+                ],
+                "mono": np.linspace(-1.0, 1.0, 7),
+            }
+            before = meter_cache_stats()
+
+            self.assertIsNone(cache.load(_SHA_A, "basic", "v1", options))
+            self.assertTrue(cache.store(_SHA_A, "basic", "v1", options, payload))
+            loaded = cache.load(_SHA_A, "basic", "v1", options)
+
+            self.assertEqual(loaded["basic_measurements"], payload["basic_measurements"])
+            np.testing.assert_array_equal(loaded["mono"], payload["mono"])
+            self.assertIsNone(cache.load(_SHA_A, "basic", "v2", options))
+            self.assertIsNone(cache.load(_SHA_A, "basic", "v1", {**options, "channels": 1}))
+            self.assertIsNone(cache.load(_SHA_A, "truth", "v1", options))
+
+        stats = meter_cache_stats_since(before)
+        self.assertEqual(stats["stores"], 1)
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 4)
+
+    def test_scan_reuses_unchanged_stems_and_records_provenance(self) -> None:
+        from mmo.tools.scan_session import build_report
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            stems_dir = Path(temp_dir) / "stems"
+            stems_dir.mkdir()
+            _write_sine_wav(stems_dir / "bass.wav", 110.0, 0.5)
+            _write_sine_wav(stems_dir / "vox.wav", 440.0, 0.25)
+            env = {"MMO_METER_CACHE": "1", "MMO_CACHE_DIR": str(Path(temp_dir) / "cache")}
+
+            with mock.patch.dict(os.environ, env, clear=False):
+                cold = build_report(stems_dir, "2000-01-01T00:00:00Z", meters="truth")
+                warm = build_report(stems_dir, "2000-01-01T00:00:00Z", meters="truth")
+                _write_sine_wav(stems_dir / "vox.wav", 440.0, 0.5)
+                changed = build_report(stems_dir, "2000-01-01T00:00:00Z", meters="truth")
+
+            self.assertEqual(cold["meter_cache"]["hits"], 0)
+            self.assertTrue(all(row["cached"] == [] for row in cold["meter_cache"]["stems"]))
+            self.assertTrue(all(row["computed"] == [] for row in warm["meter_cache"]["stems"]))
+            self.assertEqual(warm["meter_cache"]["stores"], 0)
+            volatile = {"meter_cache", "scan_receipt"}
+            cold_body = {key: value for key, value in cold.items() if key not in volatile}
+            warm_body = {key: value for key, value in warm.items() if key not in volatile}
+            self.assertEqual(warm_body, cold_body)
+
+            rows = {row["stem_id"]: row for row in changed["meter_cache"]["stems"]}
+            computed = sorted(stem_id for stem_id, row in rows.items() if row["computed"])
+            self.assertEqual(len(computed), 1)
+            self.assertIn("vox", computed[0])
+            self.assertEqual(
+                rows[computed[0]]["computed"], ["basic", "truth", "mix_features"]
+            )
+
+    def test_scan_report_omits_receipt_when_disabled(self) -> None:
+        from mmo.tools.scan_session import build_report
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _write_sine_wav(Path(temp_dir) / "bass.wav", 110.0, 0.5)
+            with mock.patch.dict(os.environ, {}, clear=False):
+                os.environ.pop("MMO_METER_CACHE", None)
+                report = build_report(Path(temp_dir), "2000-01-01T00:00:00Z", meters="basic")
+        self.assertNotIn("meter_cache", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
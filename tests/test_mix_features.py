@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from mmo.meters.meter_masking_risk import (
+    compute_masking_risk,
+    compute_masking_risk_from_features,
+)
+from mmo.meters.meter_mix_density import (
+    compute_mix_density,
+    compute_mix_density_from_features,
+)
+from mmo.meters.mix_features import MixFeatureAccumulator, estimate_mix_feature_bytes
+from mmo.tools.scan_session import (
+    MIX_FEATURES_MAX_MB_ENV,
+    _mix_features_over_ceiling,
+    build_report,
+)
+
+_SAMPLE_RATE_HZ = 8000
+
+
+def _test_signals() -> dict[str, np.ndarray]:
+    t = np.arange(int(_SAMPLE_RATE_HZ * 1.3)) / _SAMPLE_RATE_HZ
+    gate = (t > 0.4).astype(np.float64)
+    return {
+        "bass": 0.5 * np.sin(2.0 * np.pi * 110.0 * t),
+        "keys": 0.3 * np.sin(2.0 * np.pi * 440.0 * t) * gate,
+        "vox": 0.3 * np.sin(2.0 * np.pi * 460.0 * t)[: int(_SAMPLE_RATE_HZ * 0.9)],
+    }
+
+
+def _features(stem_id: str, samples: np.ndarray, chunk_size: int) -> dict:
+    accumulator = MixFeatureAccumulator(_SAMPLE_RATE_HZ)
+    for start in range(0, samples.size, chunk_size):
+        accumulator.update(samples[start : start + chunk_size])
+    features = accumulator.finalize()
+    return {
+        "stem_id": stem_id,
+        "active": features.active,
+        "mid_band": features.mid_band,
+        "frame_count": features.frame_count,
+    }
+
+
+def _write_mono_wav(path: Path, samples: np.ndarray) -> None:
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(_SAMPLE_RATE_HZ)
+        handle.writeframes((samples * 32767.0).astype("<i2").tobytes())
+
+
+class TestMixFeatures(unittest.TestCase):
+    def test_density_from_features_matches_sample_meter(self) -> None:
+        signals = _test_signals()
+        expected = compute_mix_density(
+            [{"stem_id": stem_id, "samples": samples} for stem_id, samples in signals.items()],
+            sample_rate_hz=_SAMPLE_RATE_HZ,
+        )
+        for chunk_size in (333, 4096, 100000):
+            with self.subTest(chunk_size=chunk_size):
+                features = [
+                    _features(stem_id, samples, chunk_size)
+                    for stem_id, samples in signals.items()
+                ]
+                self.assertEqual(
+                    compute_mix_density_from_features(features, sample_rate_hz=_SAMPLE_RATE_HZ),
+                    expected,
+                )
+
+    def test_masking_from_features_matches_sample_meter(self) -> None:
+        signals = _test_signals()
+        expected = compute_masking_risk(
+            [{"stem_id": stem_id, "samples": samples} for stem_id, samples in signals.items()],
+            sample_rate_hz=_SAMPLE_RATE_HZ,
+        )
+        for chunk_size in (333, 100000):
+            with self.subTest(chunk_size=chunk_size):
+                actual = compute_masking_risk_from_features(
+                    [
+                        _features(stem_id, samples, chunk_size)
+                        for stem_id, samples in signals.items()
+                    ],
+                    sample_rate_hz=_SAMPLE_RATE_HZ,
+                )
+                self.assertEqual(len(actual["top_pairs"]), len(expected["top_pairs"]))
+                for got, want in zip(actual["top_pairs"], expected["top_pairs"]):
+                    self.assertEqual(
+                        (got["stem_a"], got["stem_b"], got["window_count"]),
+                        (want["stem_a"], want["stem_b"], want["window_count"]),
+                    )
+                    self.assertAlmostEqual(got["score"], want["score"], places=6)
+
+    def test_features_are_float32_and_match_size_estimate(self) -> None:
+        samples = _test_signals()["bass"]
+        features = _features("bass", samples, 1000)
+        self.assertEqual(features["mid_band"].dtype, np.float32)
+        self.assertEqual(features["active"].dtype, np.uint8)
+        self.assertEqual(
+            features["active"].nbytes + features["mid_band"].nbytes,
+            estimate_mix_feature_bytes(samples.size, _SAMPLE_RATE_HZ),
+        )
+
+    def test_over_ceiling_admits_stems_in_id_order(self) -> None:
+        stem = {"duration_s": 10.0, "sample_rate_hz": _SAMPLE_RATE_HZ}
+        one_stem = estimate_mix_feature_bytes(10 * _SAMPLE_RATE_HZ, _SAMPLE_RATE_HZ)
+        stems = [
+            {"stem_id": "c", **stem},
+            {"stem_id": "a", **stem},
+            {"stem_id": "no-metadata"},
+            {"stem_id": "b", **stem},
+        ]
+        self.assertEqual(_mix_features_over_ceiling(stems, 2 * one_stem), ["c"])
+        self.assertEqual(_mix_features_over_ceiling(stems, 3 * one_stem), [])
+
+    def test_scan_skips_stems_past_memory_ceiling(self) -> None:
+        t = np.arange(_SAMPLE_RATE_HZ * 40) / _SAMPLE_RATE_HZ
+        with tempfile.TemporaryDirectory() as temp_dir:
+            stems_dir = Path(temp_dir)
+            _write_mono_wav(stems_dir / "a.wav", 0.3 * np.sin(2.0 * np.pi * 440.0 * t))
+            _write_mono_wav(stems_dir / "b.wav", 0.3 * np.sin(2.0 * np.pi * 460.0 * t))
+            stderr = io.StringIO()
+            with mock.patch.dict(os.environ, {MIX_FEATURES_MAX_MB_ENV: "1"}):
+                with contextlib.redirect_stderr(stderr):
+                    report = build_report(stems_dir, "2000-01-01T00:00:00Z", meters="basic")
+
+        mix_complexity = report["mix_complexity"]
+        self.assertEqual(mix_complexity["included_stem_ids"], ["a"])
+        self.assertEqual(mix_complexity["skipped_stem_ids"], ["b"])
+        self.assertEqual(mix_complexity["features"]["over_ceiling_stem_ids"], ["b"])
+        self.assertEqual(mix_complexity["features"]["memory_ceiling_bytes"], 1024 * 1024)
+        self.assertLessEqual(mix_complexity["features"]["resident_bytes"], 1024 * 1024)
+        # Basic meters still cover the stem left out of mix complexity.
+        stem_ids = {stem["stem_id"] for stem in report["session"]["stems"] if stem.get("measurements")}
+        self.assertEqual(stem_ids, {"a", "b"})
+
+        live = [
+            json.loads(line[len("[MMO-LIVE] "):])
+            for line in stderr.getvalue().splitlines()
+            if line.startswith("[MMO-LIVE] ")
+        ]
+        complete = [event for event in live if event["what"] == "scan complete"]
+        self.assertEqual(len(complete), 1)
+        self.assertIn("peak_rss_bytes", complete[0]["evidence"])
+        self.assertIn("worker_peak_rss_bytes", complete[0]["evidence"])
+        self.assertGreater(report["scan_receipt"]["peak_rss_bytes"], 0)
+        self.assertEqual(
+            complete[0]["evidence"]["peak_rss_bytes"], report["scan_receipt"]["peak_rss_bytes"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
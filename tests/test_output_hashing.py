@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import struct
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+from unittest import mock
+
+from mmo.dsp.io import (
+    HashingWriter,
+    hashed_wav_writer,
+    read_wav_metadata,
+    sha256_file,
+    write_wav_ixml_chunk,
+)
+from mmo.dsp.metadata_cache import metadata_cache_stats
+
+
+def _pcm16(frames: int) -> bytes:
+    samples = [(index * 97) % 2000 - 1000 for index in range(frames * 2)]
+    return struct.pack(f"<{len(samples)}h", *samples)
+
+
+def _disk_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class TestOutputHashing(unittest.TestCase):
+    def test_ixml_rewrite_returns_and_records_the_file_digest(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "master.wav"
+            with wave.open(str(path), "wb") as handle:
+                handle.setnchannels(2)
+                handle.setsampwidth(2)
+                handle.setframerate(48000)
+                handle.writeframes(_pcm16(300))
+
+            write_wav_ixml_chunk(path, "<BWFXML><A>1</A></BWFXML>")
+            digest = write_wav_ixml_chunk(path, "<BWFXML><B>22</B></BWFXML>")
+            before = metadata_cache_stats()
+            reported = sha256_file(path)
+            after = metadata_cache_stats()
+
+            self.assertEqual(digest, _disk_sha256(path))
+            self.assertEqual(reported, digest)
+            self.assertEqual(after["hits"] - before["hits"], 1)
+            self.assertEqual(path.read_bytes().count(b"iXML"), 1)
+            self.assertEqual(read_wav_metadata(path)["num_frames"], 300)
+            self.assertEqual(list(Path(temp_dir).iterdir()), [path])
+
+    def test_ixml_rewrite_closes_the_source_before_swapping(self) -> None:
+        # Windows cannot replace a file that still has an open handle.
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "master.wav"
+            with wave.open(str(path), "wb") as handle:
+                handle.setnchannels(1)
+                handle.setsampwidth(2)
+                handle.setframerate(48000)
+                handle.writeframes(_pcm16(50))
+
+            opened: list = []
+            real_open = Path.open
+            real_replace = os.replace
+
+            def tracking_open(self_path: Path, *args, **kwargs):
+                handle = real_open(self_path, *args, **kwargs)
+                if self_path == path:
+                    opened.append(handle)
+                return handle
+
+            def checked_replace(src, dst):
+                self.assertTrue(opened)
+                self.assertTrue(all(handle.closed for handle in opened))
+                return real_replace(src, dst)
+
+            with mock.patch.object(Path, "open", tracking_open):
+                with mock.patch("mmo.dsp.io.os.replace", side_effect=checked_replace) as replace:
+                    write_wav_ixml_chunk(path, "<BWFXML><A>1</A></BWFXML>")
+
+            self.assertEqual(replace.call_count, 1)
+            self.assertEqual(list(Path(temp_dir).iterdir()), [path])
+
+    def test_recorded_digest_is_ignored_once_the_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "preview.wav"
+            with hashed_wav_writer(
+                path, channels=2, sample_width=2, sample_rate_hz=44100, frame_count=64
+            ) as handle:
+                handle.writeframes(_pcm16(64))
+            self.assertEqual(sha256_file(path), _disk_sha256(path))
+
+            with path.open("ab") as handle:
+                handle.write(b"JUNK\x00\x00\x00\x00")
+            self.assertEqual(sha256_file(path), _disk_sha256(path))
+
+    def test_computed_digest_is_reused_for_an_unchanged_file(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "stem.wav"
+            path.write_bytes(_pcm16(64))
+            expected = _disk_sha256(path)
+            self.assertEqual(sha256_file(path), expected)
+
+            with mock.patch("mmo.dsp.io.hashlib.sha256", side_effect=AssertionError):
+                self.assertEqual(sha256_file(path), expected)
+
+            path.write_bytes(_pcm16(65))
+            self.assertEqual(sha256_file(path), _disk_sha256(path))
+
+    def test_header_patch_invalidates_the_running_digest(self) -> None:
+        buffer = io.BytesIO()
+        writer = HashingWriter(buffer)
+        handle = wave.open(writer, "wb")
+        handle.setnchannels(2)
+        handle.setsampwidth(2)
+        handle.setframerate(48000)
+        handle.writeframes(_pcm16(8))
+        handle.writeframes(_pcm16(8))
+        handle.close()
+
+        self.assertIsNone(writer.hexdigest())
+
+        sequential = HashingWriter(io.BytesIO())
+        sequential.write(b"abc")
+        sequential.write(memoryview(b"def"))
+        self.assertEqual(sequential.hexdigest(), hashlib.sha256(b"abcdef").hexdigest())
+
+
+if __name__ == "__main__":
+    unittest.main()
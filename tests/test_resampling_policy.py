@@ -11,7 +11,12 @@ from pathlib import Path
 import jsonschema
 
 from mmo.core.render_reporting import build_render_report_from_plan
-from mmo.dsp.sample_rate import choose_target_rate_for_session, iter_resampled_float64_samples
+from mmo.dsp.sample_rate import (
+    choose_target_rate_for_session,
+    iter_resampled_float64_samples,
+    iter_resampled_frames_ndarray,
+    resolve_resample_method_id,
+)
 from mmo.plugins.renderers.mixdown_renderer import MixdownRenderer
 
 
@@ -432,6 +437,108 @@ class TestResamplingPolicy(unittest.TestCase):
             self.assertEqual(resampling.get("resample_method_id"), "linear_interpolation_v1")
             self.assertEqual(resampling.get("resampled_stem_count"), 2)
 
+    def test_polyphase_sinc_is_chunk_invariant_and_band_limited(self) -> None:
+        import numpy as np
+
+        def resample(signal: "np.ndarray", source: int, target: int, cuts: list[int]) -> "np.ndarray":
+            bounds = [0, *cuts, signal.shape[0]]
+            blocks = [signal[start:stop] for start, stop in zip(bounds, bounds[1:])]
+            return np.concatenate(
+                list(
+                    iter_resampled_frames_ndarray(
+                        iter(blocks),
+                        channels=signal.shape[1],
+                        source_sample_rate_hz=source,
+                        target_sample_rate_hz=target,
+                        chunk_frames=1000,
+                    )
+                )
+            )
+
+        for source, target in ((44_100, 48_000), (48_000, 44_100), (96_000, 192_000)):
+            with self.subTest(source=source, target=target):
+                times = np.arange(source // 4) / source
+                signal = np.stack(
+                    [np.sin(2 * np.pi * 1000 * times), 0.5 * np.cos(2 * np.pi * 3000 * times)],
+                    axis=1,
+                )
+                first = resample(signal, source, target, [1, 777, 5000])
+                second = resample(signal, source, target, [4096, 8192])
+                self.assertTrue(np.array_equal(first, second))
+                self.assertEqual(first.shape[0], -(-signal.shape[0] * target // source))
+
+                out_times = np.arange(first.shape[0]) / target
+                expected = np.stack(
+                    [
+                        np.sin(2 * np.pi * 1000 * out_times),
+                        0.5 * np.cos(2 * np.pi * 3000 * out_times),
+                    ],
+                    axis=1,
+                )
+                self.assertLess(float(np.max(np.abs(first - expected)[200:-200])), 1e-4)
+
+        # A tone above the 44.1k Nyquist must be filtered, not folded back.
+        times = np.arange(48_000) / 48_000
+        alias_tone = np.sin(2 * np.pi * 23_000 * times)
+        sinc_out = resample(alias_tone[:, None], 48_000, 44_100, [9000])
+        linear_out = np.array(
+            [
+                sample
+                for chunk in iter_resampled_float64_samples(
+                    iter([alias_tone.tolist()]),
+                    channels=1,
+                    source_sample_rate_hz=48_000,
+                    target_sample_rate_hz=44_100,
+                )
+                for sample in chunk
+            ]
+        )
+        self.assertLess(float(np.sqrt(np.mean(sinc_out[500:-500] ** 2))), 1e-3)
+        self.assertGreater(float(np.sqrt(np.mean(linear_out[500:-500] ** 2))), 0.1)
+
+    def test_resample_method_id_resolution_defaults_to_linear(self) -> None:
+        self.assertEqual(resolve_resample_method_id(), "linear_interpolation_v1")
+        self.assertEqual(resolve_resample_method_id(None, "bogus"), "linear_interpolation_v1")
+        self.assertEqual(
+            resolve_resample_method_id(None, " Polyphase_Sinc_V1 "),
+            "polyphase_sinc_v1",
+        )
+        with self.assertRaisesRegex(ValueError, "Unsupported resample method"):
+            list(
+                iter_resampled_float64_samples(
+                    iter([[0.0]]),
+                    channels=1,
+                    source_sample_rate_hz=44_100,
+                    target_sample_rate_hz=48_000,
+                    method="cubic",
+                )
+            )
+
+    def test_session_option_selects_polyphase_sinc_for_mixdown(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            stems_dir = temp_path / "stems"
+            _write_mono_wav(stems_dir / "stem_a.wav", sample_rate_hz=44_100, frequency_hz=220.0)
+
+            manifest = MixdownRenderer().render(
+                {
+                    "stems_dir": stems_dir.resolve().as_posix(),
+                    "sample_rate_hz": 48_000,
+                    "options": {"resample_method_id": "polyphase_sinc_v1"},
+                    "stems": [{"stem_id": "STEM.A", "file_path": "stem_a.wav"}],
+                },
+                [],
+                temp_path / "renders",
+            )
+
+        stereo_row = next(
+            row for row in manifest["outputs"] if row.get("layout_id") == "LAYOUT.2_0"
+        )
+        resampling = stereo_row["metadata"]["resampling"]
+        self.assertEqual(resampling.get("resample_method_id"), "polyphase_sinc_v1")
+        self.assertEqual(resampling.get("algorithm"), "polyphase_sinc_v1")
+        self.assertTrue(resampling.get("resample_applied"))
+
 
 if __name__ == "__main__":
     unittest.main()
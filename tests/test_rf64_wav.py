@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import struct
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from mmo.dsp.io import read_wav_metadata, write_wav_ixml_chunk
+from mmo.dsp.meters import iter_wav_float64_samples, iter_wav_frames_ndarray
+from mmo.dsp.wav_memmap import WavMemmap
+from mmo.dsp.wav_writer import Rf64WavWriter
+
+
+def _pcm24_frames(frames: int, channels: int) -> bytes:
+    samples = [((index * 7919) % 65536 - 32768) * 128 for index in range(frames * channels)]
+    return b"".join(struct.pack("<i", value)[:3] for value in samples)
+
+
+def _write(path: Path, payload: bytes, *, channels: int, limit: int | None = None) -> bool:
+    kwargs = {} if limit is None else {"riff_size_limit": limit}
+    with Rf64WavWriter(path, **kwargs) as handle:
+        handle.setnchannels(channels)
+        handle.setsampwidth(3)
+        handle.setframerate(48000)
+        half = len(payload) // (2 * 3 * channels) * 3 * channels
+        handle.writeframes(payload[:half])
+        handle.writeframes(payload[half:])
+        return handle.is_rf64
+
+
+class TestRf64Wav(unittest.TestCase):
+    def test_small_output_stays_riff_and_matches_wave_decoding(self) -> None:
+        payload = _pcm24_frames(101, 3)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "riff.wav"
+            upgraded = _write(path, payload, channels=3)
+
+            with wave.open(str(path), "rb") as handle:
+                self.assertEqual(handle.getnframes(), 101)
+                self.assertEqual(handle.readframes(101), payload)
+            metadata = read_wav_metadata(path)
+
+        self.assertFalse(upgraded)
+        self.assertEqual(metadata["num_frames"], 101)
+        self.assertEqual(metadata["data_offset"], 80)
+
+    def test_output_past_the_limit_upgrades_to_rf64(self) -> None:
+        payload = _pcm24_frames(257, 6)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            riff_path = Path(temp_dir) / "riff.wav"
+            rf64_path = Path(temp_dir) / "rf64.wav"
+            _write(riff_path, payload, channels=6)
+            upgraded = _write(rf64_path, payload, channels=6, limit=len(payload) // 2)
+
+            header = rf64_path.read_bytes()[:16]
+            metadata = read_wav_metadata(rf64_path)
+            expected = np.concatenate(list(iter_wav_frames_ndarray(riff_path, error_context="t")))
+            decoded = np.concatenate(
+                list(iter_wav_frames_ndarray(rf64_path, error_context="t", chunk_frames=50))
+            )
+            flat = [
+                value
+                for chunk in iter_wav_float64_samples(rf64_path, error_context="t")
+                for value in chunk
+            ]
+            with WavMemmap(rf64_path) as wav:
+                window = wav[10:20]
+
+        self.assertTrue(upgraded)
+        self.assertEqual(header, b"RF64\xff\xff\xff\xffWAVEds64")
+        self.assertEqual(metadata["num_frames"], 257)
+        self.assertEqual(metadata["data_bytes"], len(payload))
+        np.testing.assert_array_equal(decoded, expected)
+        self.assertEqual(flat, expected.ravel().tolist())
+        np.testing.assert_array_equal(window, expected[10:20])
+
+    def test_ixml_rewrite_keeps_rf64_sizes_consistent(self) -> None:
+        payload = _pcm24_frames(64, 2)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "bw64.wav"
+            _write(path, payload, channels=2, limit=100)
+            data = bytearray(path.read_bytes())
+            data[:4] = b"BW64"
+            path.write_bytes(bytes(data))
+
+            write_wav_ixml_chunk(path, "<BWFXML><NOTE>rf64</NOTE></BWFXML>")
+            rewritten = path.read_bytes()
+            metadata = read_wav_metadata(path)
+
+        riff_size = struct.unpack("<Q", rewritten[20:28])[0]
+        self.assertEqual(rewritten[:4], b"BW64")
+        self.assertEqual(riff_size + 8, len(rewritten))
+        self.assertEqual(metadata["num_frames"], 64)
+        self.assertEqual(metadata["tags"]["raw"][0]["scope"], "ixml")
+
+    def test_ieee_float_wav_decodes_without_wave(self) -> None:
+        samples = [0.25, -0.5, 0.125, 0.75]
+        data = struct.pack("<4f", *samples)
+        fmt = struct.pack("<HHIIHH", 3, 2, 48000, 48000 * 8, 8, 32)
+        body = b"WAVEfmt " + struct.pack("<I", 16) + fmt + b"data"
+        body += struct.pack("<I", len(data)) + data
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "float.wav"
+            path.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+            blocks = list(iter_wav_frames_ndarray(path, error_context="t"))
+
+        self.assertEqual(blocks[0].shape, (2, 2))
+        self.assertEqual(blocks[0].ravel().tolist(), samples)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from mmo.dsp.backends.ffmpeg_decode import build_ffmpeg_decode_command
+from mmo.dsp.preview_sampling import preview_windows, window_error_bound
+from mmo.tools.scan_session import build_report
+
+_GENERATED_AT = "2000-01-01T00:00:00Z"
+_SAMPLE_RATE_HZ = 8000
+
+
+def _write_stereo_wav(path: Path, duration_s: float, freq_hz: float) -> None:
+    t = np.arange(int(_SAMPLE_RATE_HZ * duration_s)) / _SAMPLE_RATE_HZ
+    # Slow level swings give the windows something to disagree about.
+    level = 0.3 + 0.15 * np.sin(2.0 * np.pi * t / 23.0)
+    mono = level * np.sin(2.0 * np.pi * freq_hz * t)
+    frames = np.stack([mono, 0.8 * mono], axis=1)
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(2)
+        handle.setsampwidth(2)
+        handle.setframerate(_SAMPLE_RATE_HZ)
+        handle.writeframes((frames * 32767.0).astype("<i2").tobytes())
+
+
+def _measurements(report: dict, stem_id: str) -> dict[str, dict]:
+    for stem in report["session"]["stems"]:
+        if stem["stem_id"] == stem_id:
+            return {row["evidence_id"]: row for row in stem["measurements"]}
+    raise AssertionError(f"no stem {stem_id}")
+
+
+class TestPreviewSampling(unittest.TestCase):
+    def test_windows_are_seeded_sorted_and_inside_their_strata(self) -> None:
+        windows = preview_windows(1_000_000, 3000, window_count=32, seed=7, key="vox")
+        self.assertEqual(windows, preview_windows(1_000_000, 3000, window_count=32, seed=7, key="vox"))
+        self.assertNotEqual(windows, preview_windows(1_000_000, 3000, window_count=32, seed=8, key="vox"))
+        self.assertNotEqual(windows, preview_windows(1_000_000, 3000, window_count=32, seed=7, key="bass"))
+        self.assertEqual(len(windows), 32)
+        stride = 1_000_000 / 32
+        for index, (start, length) in enumerate(windows):
+            self.assertEqual(length, 3000)
+            self.assertGreaterEqual(start, int(index * stride))
+            self.assertLessEqual(start + length, int((index + 1) * stride))
+
+    def test_short_stems_are_read_whole(self) -> None:
+        self.assertIsNone(preview_windows(96_000, 3000, window_count=32))
+
+    def test_error_bound_uses_finite_population_correction(self) -> None:
+        values = [1.0, 2.0, 3.0, 4.0]
+        self.assertAlmostEqual(
+            window_error_bound(values, population=1e12),
+            1.959964 * np.std(values, ddof=1) / 2.0,
+            places=6,
+        )
+        self.assertEqual(window_error_bound(values, population=4), 0.0)
+        self.assertIsNone(window_error_bound([1.0, float("-inf")], population=10))
+
+    def test_ffmpeg_window_command_seeks_input_and_limits_output(self) -> None:
+        path = Path("stem.flac")
+        self.assertNotIn("-ss", build_ffmpeg_decode_command(path, ["ffmpeg"]))
+        command = build_ffmpeg_decode_command(path, ["ffmpeg"], start_s=12.5, duration_s=3.0)
+        self.assertLess(command.index("-ss"), command.index("-i"))
+        self.assertGreater(command.index("-t"), command.index("-i"))
+        self.assertEqual(command[command.index("-ss") + 1], "12.5")
+        self.assertEqual(command[command.index("-t") + 1], "3.0")
+
+
+class TestPreviewScan(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.stems_dir = Path(self._temp_dir.name) / "stems"
+        self.stems_dir.mkdir()
+        _write_stereo_wav(self.stems_dir / "pad.wav", 150.0, 220.0)
+        _write_stereo_wav(self.stems_dir / "hit.wav", 2.0, 880.0)
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def test_preview_marks_sampled_measurements_approximate(self) -> None:
+        full = build_report(self.stems_dir, _GENERATED_AT, meters="truth", include_peak=True)
+        preview = build_report(
+            self.stems_dir, _GENERATED_AT, meters="truth", include_peak=True, preview=True
+        )
+
+        self.assertEqual(preview["preview"]["sampled_stem_ids"], ["pad"])
+        self.assertEqual(preview["preview"]["full_read_stem_ids"], ["hit"])
+        self.assertNotIn("mix_complexity", preview)
+        self.assertNotIn("preview", full)
+
+        sampled = _measurements(preview, "pad")
+        exact = _measurements(full, "pad")
+        for evidence_id in ("EVID.METER.RMS_DBFS", "EVID.METER.LUFS_I", "EVID.METER.PEAK_DBFS"):
+            row = sampled[evidence_id]
+            self.assertTrue(row["approximate"])
+            self.assertGreater(row["error_bound"], 0.0)
+            self.assertLessEqual(
+                abs(row["value"] - exact[evidence_id]["value"]), 2.0 * row["error_bound"]
+            )
+        self.assertTrue(sampled["EVID.IMAGE.CORRELATION"]["approximate"])
+        self.assertNotIn("approximate", sampled["EVID.METER.LUFS_WEIGHTING_MODE"])
+        self.assertNotIn("EVID.METER.CLIP_EVENT_INDEX", sampled)
+
+        # Stems shorter than the windows are read whole and reported exactly.
+        self.assertEqual(_measurements(preview, "hit"), _measurements(full, "hit"))
+
+    def test_preview_without_meters_runs_truth_meters(self) -> None:
+        implied = build_report(self.stems_dir, _GENERATED_AT, preview=True)
+        explicit = build_report(self.stems_dir, _GENERATED_AT, meters="truth", preview=True)
+
+        self.assertEqual(implied["preview"]["sampled_stem_ids"], ["pad"])
+        sampled = _measurements(implied, "pad")
+        self.assertTrue(sampled["EVID.METER.LUFS_I"]["approximate"])
+        self.assertTrue(sampled["EVID.METER.RMS_DBFS"]["approximate"])
+        implied.pop("scan_receipt")
+        explicit.pop("scan_receipt")
+        self.assertEqual(implied, explicit)
+
+    def test_preview_is_deterministic_and_ignored_for_reuse(self) -> None:
+        first = build_report(self.stems_dir, _GENERATED_AT, meters="basic", preview=True)
+        second = build_report(self.stems_dir, _GENERATED_AT, meters="basic", preview=True)
+        # Peak RSS in the scan receipt is the only per-run field.
+        self.assertEqual(first.pop("scan_receipt").keys(), second.pop("scan_receipt").keys())
+        self.assertEqual(first, second)
+
+        rescan = build_report(self.stems_dir, _GENERATED_AT, meters="basic", previous_report=first)
+        self.assertEqual(rescan["incremental_scan"]["reused_stem_ids"], [])
+        with self.assertRaises(ValueError):
+            build_report(
+                self.stems_dir, _GENERATED_AT, meters="basic", preview=True, previous_report=first
+            )
+
+    def test_cli_preview_report_is_schema_valid(self) -> None:
+        repo_root = Path(__file__).resolve().parents[1]
+        out_path = Path(self._temp_dir.name) / "report.json"
+        env = dict(os.environ)
+        env["PYTHONPATH"] = str(repo_root / "src")
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "mmo.tools.scan_session",
+                str(self.stems_dir),
+                "--meters",
+                "truth",
+                "--preview",
+                "--preview-seed",
+                "3",
+                "--schema",
+                str(repo_root / "schemas" / "report.schema.json"),
+                "--out",
+                str(out_path),
+            ],
+            check=False,
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        report = json.loads(out_path.read_text(encoding="utf-8"))
+        self.assertEqual(report["preview"]["seed"], 3)
+        self.assertEqual(report["preview"]["window_count"], 32)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from mmo.tools.scan_session import _ScanWorkerPool, _stem_job_cost
+
+
+def _live_events(stderr_text: str) -> list[dict]:
+    return [
+        json.loads(line[len("[MMO-LIVE] "):])
+        for line in stderr_text.splitlines()
+        if line.startswith("[MMO-LIVE] ")
+    ]
+
+
+class TestScanWorkerPool(unittest.TestCase):
+    def test_jobs_run_largest_cost_first_and_failures_are_dropped(self) -> None:
+        jobs = [
+            (1.0, "small", abs, (-1,)),
+            (9.0, "large", abs, (-9,)),
+            (0.0, "broken", abs, ("not a number",)),
+            (4.0, "medium", abs, (-4,)),
+        ]
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            with _ScanWorkerPool(max_workers=1) as pool:
+                finished = list(pool.run_phase("unit", jobs))
+
+        self.assertEqual(finished, [("large", 9), ("medium", 4), ("small", 1)])
+        events = [event for event in _live_events(stderr.getvalue()) if event["what"] == "worker pool: unit"]
+        self.assertEqual(len(events), 1)
+        evidence = events[0]["evidence"]
+        self.assertEqual(evidence["jobs"], 4)
+        self.assertEqual(evidence["workers"], 1)
+        for key in ("queue_wait_ms_mean", "queue_wait_ms_max", "run_ms_total", "run_ms_max", "wall_ms"):
+            self.assertGreaterEqual(evidence[key], 0.0)
+        self.assertGreaterEqual(evidence["utilization"], 0.0)
+        self.assertLessEqual(evidence["utilization"], 1.0)
+
+    def test_workers_persist_across_phases(self) -> None:
+        jobs = [(1.0, "a", os.getpid, ()), (1.0, "b", os.getpid, ())]
+        with contextlib.redirect_stderr(io.StringIO()):
+            with _ScanWorkerPool(max_workers=2) as pool:
+                first = {pid for _, pid in pool.run_phase("first", jobs)}
+                second = {pid for _, pid in pool.run_phase("second", jobs[:1])}
+
+        self.assertNotIn(os.getpid(), first)
+        self.assertTrue(second <= first)
+
+    def test_pool_is_sized_and_warmed_for_the_whole_scan(self) -> None:
+        created: list[dict] = []
+
+        def recording_executor(**kwargs):
+            created.append(kwargs)
+            return ProcessPoolExecutor(**kwargs)
+
+        jobs = [(1.0, "a", abs, (-1,))]
+        with contextlib.redirect_stderr(io.StringIO()):
+            with mock.patch(
+                "mmo.tools.scan_session.ProcessPoolExecutor", side_effect=recording_executor
+            ):
+                with _ScanWorkerPool(
+                    max_workers=4, planned_jobs=3, sample_rates=(44100,)
+                ) as pool:
+                    list(pool.run_phase("first", jobs, sample_rates=(48000,)))
+                    list(pool.run_phase("second", jobs * 3, sample_rates=(96000,)))
+                with _ScanWorkerPool(max_workers=2) as pool:
+                    list(pool.run_phase("unplanned", jobs))
+
+        self.assertEqual(len(created), 2)
+        self.assertEqual(created[0]["max_workers"], 3)
+        self.assertEqual(created[0]["initargs"], ((44100, 48000),))
+        self.assertEqual(created[1]["max_workers"], 2)
+
+    def test_queue_wait_is_measured_in_the_parent(self) -> None:
+        jobs = [(1.0, "a", time.sleep, (0.2,)), (1.0, "b", time.sleep, (0.2,))]
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            with _ScanWorkerPool(max_workers=1) as pool:
+                list(pool.run_phase("sleep", jobs))
+
+        evidence = [
+            event for event in _live_events(stderr.getvalue()) if event["what"] == "worker pool: sleep"
+        ][0]["evidence"]
+        # The second job waits for the first on the only worker.
+        self.assertGreaterEqual(evidence["queue_wait_ms_max"], 150.0)
+        self.assertGreaterEqual(evidence["run_ms_total"], 390.0)
+
+    def test_job_cost_is_frames_times_channels(self) -> None:
+        stem = {"duration_s": 2.0, "sample_rate_hz": 48000, "channel_count": 6}
+        self.assertEqual(_stem_job_cost(stem), 2.0 * 48000 * 6)
+        self.assertEqual(_stem_job_cost({"stem_id": "no-metadata"}), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -121,6 +121,23 @@ class TestStemsIndex(unittest.TestCase):
             tags = source_metadata.get("tags")
             self.assertEqual(tags, {"raw": [], "normalized": {}, "warnings": []})
 
+    def test_build_stems_index_is_independent_of_probe_workers(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / "stems_root"
+            for name in ("kick", "snare", "hat", "bass", "keys", "vox"):
+                _write_tiny_wav(root / "song" / "stems" / f"{name}.wav")
+            (root / "song" / "stems" / "broken.wav").write_bytes(b"RIFF")
+
+            serial = build_stems_index(root, root_dir="demo_input", probe_workers=1)
+            pooled = build_stems_index(root, root_dir="demo_input", probe_workers=4)
+
+        self.assertEqual(serial, pooled)
+        broken = next(item for item in serial["files"] if item["basename"] == "broken")
+        self.assertEqual(
+            broken["source_metadata"]["tags"]["warnings"],
+            ["Source metadata unavailable."],
+        )
+
     def test_tokenization_handles_numeric_prefixes_and_lr_markers(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             root = Path(temp_dir) / "stems_root"
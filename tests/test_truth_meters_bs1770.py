@@ -139,6 +139,231 @@ class TestTruthMetersBS1770(unittest.TestCase):
         finally:
             path.unlink(missing_ok=True)
 
+    def test_k_weighting_filter_chunked_matches_direct_form(self) -> None:
+        self._skip_if_no_numpy()
+        from mmo.dsp.meters_truth import KWeightingFilter, k_weighting_biquads
+
+        sample_rate = 44100
+        rng = np.random.default_rng(7)
+        samples = rng.uniform(-0.5, 0.5, size=(3000, 2))
+
+        expected = samples.copy()
+        pre_b, pre_a, rlb_b, rlb_a = k_weighting_biquads(sample_rate)
+        for b, a in ((pre_b, pre_a), (rlb_b, rlb_a)):
+            for channel_index in range(expected.shape[1]):
+                x1 = x2 = y1 = y2 = 0.0
+                for index, x0 in enumerate(expected[:, channel_index]):
+                    y0 = b[0] * x0 + b[1] * x1 + b[2] * x2 - a[1] * y1 - a[2] * y2
+                    expected[index, channel_index] = y0
+                    x2, x1 = x1, x0
+                    y2, y1 = y1, y0
+
+        for engine in ("numpy", None):
+            weighting = KWeightingFilter(sample_rate, 2, engine=engine)
+            chunks = [
+                weighting.process(samples[start : start + 701])
+                for start in range(0, samples.shape[0], 701)
+            ]
+            filtered = np.concatenate(chunks, axis=0)
+            self.assertTrue(np.allclose(filtered, expected, atol=1e-9, rtol=0.0))
+
+    def test_lufs_integrated_chunked_matches_whole_signal(self) -> None:
+        self._skip_if_no_numpy()
+        from mmo.dsp.meters_truth import (
+            compute_lufs_integrated_float64,
+            compute_lufs_integrated_from_chunks,
+        )
+
+        sample_rate = 48000
+        rng = np.random.default_rng(11)
+        samples = rng.normal(0.0, 0.05, size=(sample_rate * 2 + 123, 2))
+        whole = compute_lufs_integrated_float64(
+            samples, sample_rate, 2, channel_mask=None, channel_layout=None
+        )
+        chunked = compute_lufs_integrated_from_chunks(
+            (samples[start : start + 4097] for start in range(0, samples.shape[0], 4097)),
+            sample_rate,
+            2,
+            channel_mask=None,
+            channel_layout=None,
+        )
+        self.assertTrue(math.isfinite(whole))
+        self.assertAlmostEqual(whole, chunked, places=9)
+
+    def test_true_peak_oversampler_per_channel_and_overs(self) -> None:
+        self._skip_if_no_numpy()
+        from mmo.dsp.meters_truth import (
+            TruePeakOversampler,
+            compute_true_peak_dbtp_float64,
+            compute_true_peak_float64,
+        )
+
+        for sample_rate in (48000, 44100):
+            t = np.arange(sample_rate, dtype=np.float64) / sample_rate
+            loud = np.sin(2.0 * math.pi * (sample_rate / 4.0) * t + math.pi / 4.0)
+            quiet = 0.25 * np.sin(2.0 * math.pi * 1000.0 * t)
+            samples = np.stack([quiet, loud], axis=1)
+
+            result = compute_true_peak_float64(
+                samples, sample_rate, ceiling_dbtp=-1.0, collect_positions=True
+            )
+            for channel_index in range(2):
+                expected = compute_true_peak_dbtp_float64(
+                    samples[:, channel_index : channel_index + 1], sample_rate
+                )
+                self.assertAlmostEqual(
+                    result.channel_peaks_dbtp[channel_index], expected, places=9
+                )
+            self.assertEqual(result.max_dbtp, result.channel_peaks_dbtp[1])
+            self.assertEqual(result.over_positions[0].size, 0)
+            overs = result.over_positions[1]
+            if sample_rate == 48000:
+                self.assertGreater(overs.size, 0)
+            self.assertTrue(np.all(overs >= 0))
+            self.assertTrue(np.all(overs < samples.shape[0] * 4))
+
+            streamed = TruePeakOversampler(
+                sample_rate, 2, ceiling_dbtp=-1.0, collect_positions=True, block_frames=300
+            )
+            for start in range(0, samples.shape[0], 1001):
+                streamed.update(samples[start : start + 1001])
+            streamed_result = streamed.finalize()
+            for channel_index in range(2):
+                self.assertAlmostEqual(
+                    streamed_result.channel_peaks_dbtp[channel_index],
+                    result.channel_peaks_dbtp[channel_index],
+                    places=9,
+                )
+            self.assertTrue(np.array_equal(streamed_result.over_positions[1], overs))
+
+            over_events = result.over_events
+            self.assertEqual(over_events.flagged_count, overs.size)
+            streamed_events = streamed_result.over_events.events
+            self.assertEqual(
+                [(event.start_frame, event.length) for event in streamed_events],
+                [(event.start_frame, event.length) for event in over_events.events],
+            )
+            for streamed_event, event in zip(streamed_events, over_events.events):
+                self.assertAlmostEqual(streamed_event.peak, event.peak, places=9)
+            self.assertTrue(all(event.channel == 1 for event in over_events.events))
+            if over_events.events:
+                first = over_events.events[0]
+                self.assertEqual(first.start_frame, int(overs[0]) // 4)
+                self.assertGreater(first.peak, 10.0 ** (-1.0 / 20.0))
+
+            # Without the opt-in only the bounded event index is kept.
+            events_only = compute_true_peak_float64(samples, sample_rate, ceiling_dbtp=-1.0)
+            self.assertIsNone(events_only.over_positions)
+            self.assertEqual(events_only.over_events, over_events)
+
+    def test_loudness_histogram_matches_exact_gating_and_merges(self) -> None:
+        self._skip_if_no_numpy()
+        from mmo.core.render_qa import _compute_loudness_range
+        from mmo.dsp.meters_truth import (
+            LoudnessHistogram,
+            OnlineLufsIntegrated,
+            compute_lufs_integrated_float64,
+        )
+
+        sample_rate = 48000
+        rng = np.random.default_rng(5)
+        frames = sample_rate * 20
+        envelope = np.repeat(10.0 ** (rng.uniform(-30.0, 0.0, 21) / 20.0), sample_rate)
+        samples = np.stack(
+            [rng.standard_normal(frames) * envelope[:frames] * 0.1] * 2, axis=1
+        )
+        exact = compute_lufs_integrated_float64(
+            samples, sample_rate, 2, channel_mask=None, channel_layout=None
+        )
+        binned = OnlineLufsIntegrated(
+            sample_rate, 2, None, None, histogram_resolution_lu=0.01
+        )
+        for start in range(0, frames, 9600):
+            binned.update(samples[start : start + 9600])
+        self.assertAlmostEqual(binned.finalize(), exact, delta=0.01)
+
+        shortterm_values = list(rng.uniform(-40.0, -10.0, 600)) + list(
+            rng.uniform(-90.0, -60.0, 40)
+        )
+        energies = 10.0 ** ((np.array(shortterm_values) + 0.691) / 10.0)
+        whole = LoudnessHistogram()
+        whole.add_energies(energies)
+        self.assertAlmostEqual(
+            whole.loudness_range(), _compute_loudness_range(shortterm_values), delta=0.02
+        )
+
+        left = LoudnessHistogram()
+        right = LoudnessHistogram()
+        left.add_energies(energies[:250])
+        right.add_energies(energies[250:])
+        left.merge(right)
+        self.assertEqual(left.block_count, whole.block_count)
+        self.assertAlmostEqual(left.integrated_lufs(), whole.integrated_lufs(), places=9)
+        with self.assertRaises(ValueError):
+            left.merge(LoudnessHistogram(resolution_lu=0.1))
+
+    def test_loudness_timeline_series_query_and_sidecar(self) -> None:
+        self._skip_if_no_numpy()
+        from mmo.dsp.loudness_timeline import (
+            load_loudness_timeline,
+            loudness_timeline_path,
+            save_loudness_timeline,
+        )
+        from mmo.dsp.meters_truth import (
+            OnlineLufsIntegrated,
+            compute_lufs_integrated_float64,
+            compute_lufs_shortterm_float64,
+        )
+
+        sample_rate = 48000
+        t = np.arange(sample_rate * 6, dtype=np.float64) / sample_rate
+        tone = 0.25 * np.sin(2.0 * math.pi * 997.0 * t)
+        tone[sample_rate * 3 :] *= 0.1
+        samples = np.stack([tone, tone], axis=1)
+
+        meter = OnlineLufsIntegrated(
+            sample_rate, 2, None, None, include_shortterm=True, timeline=True
+        )
+        for start in range(0, samples.shape[0], 7000):
+            meter.update(samples[start : start + 7000])
+        self.assertAlmostEqual(
+            meter.finalize(),
+            compute_lufs_integrated_float64(
+                samples, sample_rate, 2, channel_mask=None, channel_layout=None
+            ),
+            places=9,
+        )
+        timeline = meter.timeline(source_sha256="AB" * 32)
+        self.assertEqual(timeline.momentary_lufs.dtype, np.float32)
+        self.assertEqual(timeline.momentary_lufs.shape[0], 57)
+        self.assertEqual(timeline.shortterm_lufs.shape[0], 31)
+        self.assertAlmostEqual(
+            float(timeline.shortterm_lufs[0]),
+            compute_lufs_shortterm_float64(
+                samples[: sample_rate * 3], sample_rate, 2, channel_mask=None, channel_layout=None
+            ),
+            places=4,
+        )
+
+        times, values = timeline.momentary(1.0, 2.0)
+        self.assertEqual(times.shape[0], 10)
+        self.assertAlmostEqual(float(times[0]), 1.0)
+        self.assertLess(float(np.max(np.abs(values - values[0]))), 0.01)
+        loud = timeline.momentary(0.5, 3.0)[1]
+        quiet = timeline.momentary(3.5, 6.0)[1]
+        self.assertAlmostEqual(float(np.mean(loud) - np.mean(quiet)), 20.0, delta=0.1)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sidecar = loudness_timeline_path(Path(temp_dir) / "master.wav")
+            self.assertEqual(sidecar.name, "master.wav.loudness_timeline.npz")
+            save_loudness_timeline(timeline, sidecar)
+            loaded = load_loudness_timeline(sidecar, source_sha256="ab" * 32)
+            self.assertIsNotNone(loaded)
+            self.assertTrue(np.array_equal(loaded.shortterm_lufs, timeline.shortterm_lufs))
+            self.assertEqual(loaded.hop_frames, 4800)
+            self.assertIsNone(load_loudness_timeline(sidecar, source_sha256="cd" * 32))
+            self.assertIsNone(load_loudness_timeline(Path(temp_dir) / "missing.npz"))
+
 
 if __name__ == "__main__":
     unittest.main()
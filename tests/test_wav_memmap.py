@@ -0,0 +1,137 @@
+import struct
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from mmo.dsp.float64 import ieee_bytes_to_ndarray, pcm_bytes_to_ndarray
+from mmo.dsp.io import read_wav_metadata
+from mmo.dsp.wav_memmap import WavMemmap
+
+
+def _chunk(chunk_id: bytes, payload: bytes) -> bytes:
+    padding = b"\x00" if len(payload) % 2 else b""
+    return chunk_id + struct.pack("<I", len(payload)) + payload + padding
+
+
+def _write_riff_wav(
+    path: Path,
+    *,
+    audio_format: int,
+    channels: int,
+    bits_per_sample: int,
+    data: bytes,
+    leading_chunks: bytes = b"",
+) -> None:
+    block_align = channels * (bits_per_sample // 8)
+    fmt_payload = struct.pack(
+        "<HHIIHH",
+        audio_format,
+        channels,
+        48000,
+        48000 * block_align,
+        block_align,
+        bits_per_sample,
+    )
+    riff_payload = b"WAVE" + _chunk(b"fmt ", fmt_payload) + leading_chunks + _chunk(b"data", data)
+    path.write_bytes(b"RIFF" + struct.pack("<I", len(riff_payload)) + riff_payload)
+
+
+class TestWavMemmap(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self._temp_dir.name)
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def _pcm_payload(self, bits: int, frames: int, channels: int) -> bytes:
+        lo = -(2 ** (bits - 1))
+        hi = 2 ** (bits - 1) - 1
+        values = [lo + ((index * 104729) % (hi - lo + 1)) for index in range(frames * channels)]
+        values[0] = lo
+        values[-1] = hi
+        if bits == 24:
+            return b"".join((value & 0xFFFFFF).to_bytes(3, "little") for value in values)
+        fmt = "h" if bits == 16 else "i"
+        return struct.pack(f"<{len(values)}{fmt}", *values)
+
+    def test_pcm_slices_match_block_decoder(self) -> None:
+        channels = 3
+        frames = 2000
+        for bits in (16, 24, 32):
+            payload = self._pcm_payload(bits, frames, channels)
+            path = self.temp_path / f"pcm{bits}.wav"
+            # An odd-sized LIST chunk pushes the data chunk off a word boundary.
+            _write_riff_wav(
+                path,
+                audio_format=1,
+                channels=channels,
+                bits_per_sample=bits,
+                data=payload,
+                leading_chunks=_chunk(b"LIST", b"INFOIART" + struct.pack("<I", 3) + b"abc"),
+            )
+            expected = pcm_bytes_to_ndarray(payload, bits, channels)
+            with WavMemmap(path) as wav:
+                self.assertEqual(len(wav), frames)
+                self.assertEqual(wav.channels, channels)
+                np.testing.assert_array_equal(wav[:], expected)
+                np.testing.assert_array_equal(wav[123:457], expected[123:457])
+                np.testing.assert_array_equal(wav[10:400:7], expected[10:400:7])
+                np.testing.assert_array_equal(wav[400:10:-3], expected[400:10:-3])
+                np.testing.assert_array_equal(wav[-1], expected[-1])
+                self.assertEqual(wav[frames:frames + 10].shape, (0, channels))
+                blocks = list(wav.iter_blocks(100, 1100, chunk_frames=300))
+                self.assertEqual([block.shape[0] for block in blocks], [300, 300, 300, 100])
+                np.testing.assert_array_equal(np.concatenate(blocks), expected[100:1100])
+
+    def test_raw_frames_sign_extends_24bit(self) -> None:
+        payload = b"\xff\xff\xff" + b"\x00\x00\x80" + b"\xff\xff\x7f" + b"\x01\x00\x00"
+        path = self.temp_path / "pcm24.wav"
+        with wave.open(str(path), "wb") as handle:
+            handle.setnchannels(2)
+            handle.setsampwidth(3)
+            handle.setframerate(48000)
+            handle.writeframes(payload)
+        with WavMemmap(path) as wav:
+            raw = wav.raw_frames()
+        self.assertEqual(raw.dtype, np.int32)
+        self.assertEqual(raw.tolist(), [[-1, -8388608], [8388607, 1]])
+
+    def test_float_formats_clamp_like_list_decoder(self) -> None:
+        samples = [1.5, -1.25, 0.25, 1.0, -0.5, 0.0]
+        for bits, fmt in ((32, "f"), (64, "d")):
+            payload = struct.pack(f"<{len(samples)}{fmt}", *samples)
+            path = self.temp_path / f"float{bits}.wav"
+            _write_riff_wav(
+                path, audio_format=3, channels=2, bits_per_sample=bits, data=payload
+            )
+            with WavMemmap(path) as wav:
+                np.testing.assert_array_equal(
+                    wav[:], ieee_bytes_to_ndarray(payload, bits, 2)
+                )
+                self.assertEqual(wav.read(0, 2, dtype="float32").dtype, np.float32)
+
+    def test_metadata_records_data_offset(self) -> None:
+        path = self.temp_path / "offset.wav"
+        with wave.open(str(path), "wb") as handle:
+            handle.setnchannels(1)
+            handle.setsampwidth(2)
+            handle.setframerate(48000)
+            handle.writeframes(struct.pack("<2h", 1, -1))
+        metadata = read_wav_metadata(path)
+        self.assertEqual(metadata["data_offset"], 44)
+        self.assertEqual(path.read_bytes()[40:44], struct.pack("<I", 4))
+
+    def test_empty_data_chunk(self) -> None:
+        path = self.temp_path / "empty.wav"
+        _write_riff_wav(path, audio_format=1, channels=2, bits_per_sample=16, data=b"")
+        with WavMemmap(path) as wav:
+            self.assertEqual(len(wav), 0)
+            self.assertEqual(wav[:].shape, (0, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()